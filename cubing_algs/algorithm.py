@@ -5,9 +5,13 @@ sequences of cube moves.
 from collections import UserList
 from collections.abc import Callable
 from collections.abc import Iterable
+from functools import cached_property
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Self
+from typing import SupportsIndex
 
+from cubing_algs.compiled import CompiledAlgorithm
 from cubing_algs.constants import MAX_ITERATIONS
 from cubing_algs.cycles import compute_cycles
 from cubing_algs.ergonomics import ErgonomicsData
@@ -23,8 +27,14 @@ from cubing_algs.structure import compute_structure
 from cubing_algs.visual_cube import visual_cube_algorithm
 
 if TYPE_CHECKING:
+    from cubing_algs.packed import PackedAlgorithm  # pragma: no cover
     from cubing_algs.vcube import VCube  # pragma: no cover
 
+ANALYSIS_PROPERTIES = (
+    'cycles', 'metrics', '_impacts', 'ergonomics', 'structure',
+    'min_cube_size',
+)
+
 
 class Algorithm(UserList[Move]):  # noqa: PLR0904
     """
@@ -32,6 +42,9 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
 
     This class encapsulates a series of moves to be applied to a Rubik's cube,
     providing methods to manipulate and analyze the algorithm.
+
+    The analysis properties are computed once and cached,
+    the methods modifying the moves clear the cache.
     """
 
     def __init__(self, initlist: Iterable[Move] | None = None) -> None:
@@ -81,16 +94,24 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
 
         return move
 
+    def invalidate_analysis(self) -> None:
+        """Clear the cached analysis properties after a modification."""
+        for name in ANALYSIS_PROPERTIES:
+            self.__dict__.pop(name, None)
+
     def append(self, item: Move | str) -> None:
         """Add a move to the end of the algorithm."""
+        self.invalidate_analysis()
         self.data.append(self.parse_move(item))
 
     def insert(self, i: int, item: Move | str) -> None:
         """Insert a move at a specific position in the algorithm."""
+        self.invalidate_analysis()
         self.data.insert(i, self.parse_move(item))
 
     def extend(self, other: Iterable[Move | str] | Move | str) -> None:
         """Extend the algorithm with moves from another sequence."""
+        self.invalidate_analysis()
         if isinstance(other, Algorithm):
             self.data.extend(other)
         else:
@@ -150,11 +171,62 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
 
     def __setitem__(self, i, item) -> None:  # type: ignore[no-untyped-def] # noqa: ANN001
         """Set a move at a specific index in the algorithm."""
+        self.invalidate_analysis()
         if isinstance(item, Move):
             self.data[i] = item
         else:
             self.data[i] = self.parse_moves(item)
 
+    def __delitem__(self, i: SupportsIndex | slice) -> None:
+        """Delete moves at an index or slice of the algorithm."""
+        self.invalidate_analysis()
+        super().__delitem__(i)
+
+    def __imul__(self, n: int) -> Self:
+        """
+        In-place repetition operator (*=) for algorithms.
+
+        Args:
+            n: The number of repetitions.
+
+        Returns:
+            This algorithm object after modification.
+
+        """
+        self.invalidate_analysis()
+        return super().__imul__(n)
+
+    def pop(self, i: int = -1) -> Move:
+        """
+        Remove and return the move at an index of the algorithm.
+
+        Returns:
+            The removed move.
+
+        """
+        self.invalidate_analysis()
+        return super().pop(i)
+
+    def remove(self, item: Move) -> None:
+        """Remove the first occurrence of a move from the algorithm."""
+        self.invalidate_analysis()
+        super().remove(item)
+
+    def clear(self) -> None:
+        """Remove all the moves of the algorithm."""
+        self.invalidate_analysis()
+        super().clear()
+
+    def reverse(self) -> None:
+        """Reverse the order of the moves in place."""
+        self.invalidate_analysis()
+        super().reverse()
+
+    def sort(self, /, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Sort the moves in place."""
+        self.invalidate_analysis()
+        super().sort(*args, **kwargs)
+
     def __str__(self) -> str:
         """
         Convert the algorithm to a human-readable string.
@@ -187,6 +259,12 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
         This method enables chaining multiple transformations together, such as
         simplification, optimization, or conversion between notations.
 
+        Transformation functions receive a copy of the algorithm, never
+        the algorithm itself. They should return their input unchanged
+        when they have nothing to do, so unchanged rounds are detected
+        by identity instead of comparing the moves, and a function is not
+        called again on an algorithm it left unchanged.
+
         Args:
             *processes: One or more transformation functions to apply.
             to_fixpoint: If True, repeat transformations until no changes occur.
@@ -195,24 +273,68 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
             A new Algorithm with all transformations applied.
 
         """
-        new_moves = self.copy()
         mod_moves = self.copy()
+        unchanged: dict[int, Algorithm] = {}
 
         max_iterations = 1
         if to_fixpoint:
             max_iterations = MAX_ITERATIONS
 
         for _ in range(max_iterations):
-            for process in processes:
-                mod_moves = process(mod_moves)
+            new_moves = mod_moves
+
+            for index, process in enumerate(processes):
+                if unchanged.get(index) is mod_moves:
+                    continue
+
+                result = process(mod_moves)
+                if result is mod_moves:
+                    unchanged[index] = mod_moves
+                mod_moves = result
 
-            if new_moves == mod_moves:
+            if mod_moves is new_moves or mod_moves == new_moves:
                 break
-            new_moves = mod_moves
 
         return mod_moves
 
+    def compile(self, size: int = 3) -> CompiledAlgorithm:
+        """
+        Compose the algorithm into a single facelet permutation.
+
+        The compiled algorithm can be applied repeatedly to a cube
+        with a single gather, instead of replaying every move.
+
+        Args:
+            size: Size of the cube the algorithm will be applied to.
+
+        Returns:
+            The compiled algorithm.
+
+        """
+        return CompiledAlgorithm.from_algorithm(self, size)
+
     @property
+    def packed(self) -> 'PackedAlgorithm':
+        """
+        Get a compact copy of the algorithm storing move ids.
+
+        Packed algorithms hold each move as a two bytes id
+        and are processed faster by the optimizing transforms
+        and the metrics. Only untimed algorithms can be packed.
+
+        Example:
+            >>> alg = Algorithm.parse_moves("R U R' U'").packed
+            >>> alg.ids.itemsize
+            2
+            >>> alg[2]
+            "R'"  # Move materialized from its id
+
+        """
+        from cubing_algs.packed import PackedAlgorithm  # noqa: PLC0415
+
+        return PackedAlgorithm(self)
+
+    @cached_property
     def cycles(self) -> int:
         """
         Get the number of times this algorithm must be applied
@@ -233,7 +355,7 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
         """
         return compute_cycles(self)
 
-    @property
+    @cached_property
     def metrics(self) -> MetricsData:
         """
         Calculate comprehensive metrics for analyzing algorithm efficiency
@@ -260,6 +382,11 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
         """
         return compute_metrics(self)
 
+    @cached_property
+    def _impacts(self) -> ImpactData:
+        """Compute the impacts once, shared by the impacts property."""
+        return compute_impacts(self)
+
     @property
     def impacts(self) -> ImpactData:
         """
@@ -269,6 +396,9 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
         individual facelets on the cube, including movement patterns,
         distances, and face-level statistics.
 
+        The impacts are computed once and returned with a copy
+        of their cube, so moving the cube leaves them unchanged.
+
         Example:
             >>> alg = Algorithm.parse_moves("R U R' U'")
             >>> impacts = alg.impacts
@@ -278,9 +408,11 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
             0.33  # About 33% of the cube is scrambled
 
         """
-        return compute_impacts(self)
+        impacts = self._impacts
 
-    @property
+        return impacts._replace(cube=impacts.cube.copy(full=True))
+
+    @cached_property
     def ergonomics(self) -> ErgonomicsData:
         """
         Analyze the ergonomic properties and execution comfort
@@ -308,7 +440,7 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
         """
         return compute_ergonomics(self)
 
-    @property
+    @cached_property
     def structure(self) -> StructureData:
         """
         Analyze the structural composition of this algorithm.
@@ -336,7 +468,7 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
         """
         return compute_structure(self)
 
-    @property
+    @cached_property
     def min_cube_size(self) -> int:
         """
         Compute the minimum cube size required to execute this algorithm.
@@ -404,12 +536,13 @@ class Algorithm(UserList[Move]):  # noqa: PLR0904
             A VCube object with the algorithm applied.
 
         """
-        cube = self.impacts.cube
+        impacts = self.impacts
+        cube = impacts.cube
 
         cube.show(
             mode=mode,
             orientation=orientation,
-            mask=self.impacts.facelets_transformation_mask,
+            mask=impacts.facelets_transformation_mask,
         )
 
         return cube
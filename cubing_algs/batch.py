@@ -0,0 +1,324 @@
+"""
+Batch simulation and analysis of many algorithms.
+
+The rotation extensions release the GIL while applying moves,
+so simulations are spread over a pool of threads without
+the pickling overhead of multiple processes.
+
+The analysis properties of algorithms are computed in pure Python,
+so they are spread over a pool of processes, only exchanging
+the algorithm strings and compact records of plain values.
+"""
+import dataclasses
+import os
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from itertools import starmap
+from typing import Any
+from typing import NamedTuple
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.exceptions import InvalidCubeStateError
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.extensions import rotate_2x2x2
+from cubing_algs.extensions import rotate_3x3x3
+from cubing_algs.extensions import rotate_dynamic
+from cubing_algs.vcube import VCube
+
+ANALYSIS_FIELDS = (
+    'metrics', 'impacts', 'ergonomics', 'structure',
+    'cycles', 'min_cube_size',
+)
+
+DEFAULT_ANALYSIS_FIELDS = ('metrics', 'impacts', 'ergonomics', 'structure')
+
+
+class AnalysisRecord(NamedTuple):
+    """
+    Analysis results of an algorithm, made of plain picklable values.
+
+    Attributes:
+        algorithm: The algorithm string as given.
+        results: The compact value of each analysis field.
+        error: The error message if the algorithm could not be parsed,
+            or if one of its fields could not be computed.
+
+    """
+
+    algorithm: str
+    results: dict[str, Any]
+    error: str | None = None
+
+
+def get_rotate_moves(size: int) -> Callable[[str, str], str]:
+    """
+    Get the extension function applying a sequence of moves.
+
+    Args:
+        size: Size of the cube.
+
+    Returns:
+        A function taking a state and space separated moves,
+        and returning the new state.
+
+    """
+    if size == 2:
+        return rotate_2x2x2.rotate_moves
+    if size == 3:
+        return rotate_3x3x3.rotate_moves
+    return partial(rotate_dynamic.rotate_moves, size=size)
+
+
+def simulate_chunk(rotate_moves: Callable[[str, str], str],
+                   pairs: Sequence[tuple[str, str]]) -> list[str]:
+    """
+    Apply moves on a chunk of states.
+
+    Args:
+        rotate_moves: The extension function applying the moves.
+        pairs: The states paired with the moves to apply on them.
+
+    Returns:
+        The new states, in the same order.
+
+    Raises:
+        InvalidMoveError: If a move is invalid.
+
+    """
+    try:
+        return list(starmap(rotate_moves, pairs))
+    except ValueError as e:
+        raise InvalidMoveError(str(e)) from e
+
+
+def simulate_many(states: Sequence[str],
+                  algorithms: Sequence[Algorithm | str] | Algorithm | str,
+                  *, size: int = 3, workers: int | None = None) -> list[str]:
+    """
+    Apply algorithms on many cube states in parallel threads.
+
+    Args:
+        states: The facelet states to start from.
+        algorithms: The algorithms to apply, one per state,
+            or a single algorithm applied on every state.
+        size: Size of the cubes.
+        workers: Number of threads, defaults to the number of CPUs.
+
+    Returns:
+        The new states, in the same order as the input states.
+
+    Raises:
+        ValueError: If the number of algorithms does not match
+            the number of states.
+
+    """
+    if isinstance(algorithms, (Algorithm, str)):
+        moves = [str(algorithms)] * len(states)
+    else:
+        if len(algorithms) != len(states):
+            msg = (
+                f'Got { len(algorithms) } algorithms '
+                f'for { len(states) } states'
+            )
+            raise ValueError(msg)
+        moves = [str(algorithm) for algorithm in algorithms]
+
+    if not states:
+        return []
+
+    rotate_moves = get_rotate_moves(size)
+    pairs = list(zip(states, moves, strict=True))
+
+    # One chunk per thread, to keep the overhead per state low
+    workers = workers or os.cpu_count() or 1
+    chunk_size = -(-len(pairs) // workers)
+    chunks = [
+        pairs[i:i + chunk_size]
+        for i in range(0, len(pairs), chunk_size)
+    ]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(partial(simulate_chunk, rotate_moves), chunks)
+
+        return [state for chunk in results for state in chunk]
+
+
+def compact_value(value: Any) -> Any:  # noqa: ANN401
+    """
+    Convert an analysis result into plain values.
+
+    Named tuples and dataclasses become dictionaries,
+    algorithms become strings, and virtual cubes are dropped,
+    their state being already part of the results.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The compact value.
+
+    """
+    if isinstance(value, Algorithm):
+        return str(value)
+    if isinstance(value, tuple) and hasattr(value, '_asdict'):
+        return {
+            key: compact_value(item)
+            for key, item in value._asdict().items()
+            if not isinstance(item, VCube)
+        }
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: compact_value(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        return {key: compact_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [compact_value(item) for item in value]
+    return value
+
+
+def analyze_algorithm(notation: str,
+                      fields: Sequence[str]) -> AnalysisRecord:
+    """
+    Parse an algorithm and compute its analysis fields.
+
+    A field failing on the algorithm, like the impacts of moves
+    on big cubes, is left out of the results
+    and its error is reported in the record.
+
+    Args:
+        notation: The algorithm string.
+        fields: The names of the analysis properties to compute.
+
+    Returns:
+        The analysis record of the algorithm.
+
+    """
+    try:
+        algorithm = Algorithm.parse_moves(notation)
+    except InvalidMoveError as e:
+        return AnalysisRecord(notation, {}, str(e))
+
+    results = {}
+    errors = []
+    for field in fields:
+        try:
+            results[field] = compact_value(getattr(algorithm, field))
+        except (InvalidMoveError, InvalidCubeStateError) as e:
+            errors.append(f'{ field }: { e }')
+
+    return AnalysisRecord(notation, results, '; '.join(errors) or None)
+
+
+def analyze_chunk(notations: Sequence[str],
+                  fields: Sequence[str]) -> list[AnalysisRecord]:
+    """
+    Analyze a chunk of algorithm strings.
+
+    Args:
+        notations: The algorithm strings.
+        fields: The names of the analysis properties to compute.
+
+    Returns:
+        The analysis records, in the same order.
+
+    """
+    return [analyze_algorithm(notation, fields) for notation in notations]
+
+
+def analyze_notations(notations: Iterable[str], fields: tuple[str, ...],
+                      processes: int | None,
+                      chunksize: int) -> Iterator[AnalysisRecord]:
+    """
+    Analyze algorithm strings in a pool of processes.
+
+    Only two chunks per process are pending at once,
+    the next chunks being read and submitted as the first ones
+    are yielded, so the algorithms are streamed
+    instead of being read all at once.
+
+    Args:
+        notations: The algorithm strings to analyze.
+        fields: The names of the analysis properties to compute.
+        processes: Number of processes, defaults to the number of CPUs.
+        chunksize: Number of algorithms sent to a process at once.
+
+    Yields:
+        The analysis record of each algorithm.
+
+    """
+    processes = processes or os.cpu_count() or 1
+    notations = iter(notations)
+    pending: deque[Future[list[AnalysisRecord]]] = deque()
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        try:
+            while True:
+                while len(pending) < 2 * processes:
+                    chunk = list(islice(notations, chunksize))
+                    if not chunk:
+                        break
+                    pending.append(
+                        executor.submit(analyze_chunk, chunk, fields),
+                    )
+
+                if not pending:
+                    return
+
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def analyze(algorithms: Iterable[Algorithm | str],
+            fields: Sequence[str] = DEFAULT_ANALYSIS_FIELDS,
+            *, processes: int | None = None,
+            chunksize: int = 64) -> Iterator[AnalysisRecord]:
+    """
+    Analyze many algorithms in parallel processes.
+
+    Only the algorithm strings are sent to the processes,
+    which parse them and send back compact records of plain values,
+    yielded in the same order as the algorithms as soon as available.
+    Algorithms that cannot be parsed or analyzed are reported
+    in their record.
+
+    The fields are validated when called,
+    the processes are started on the first record requested.
+
+    Args:
+        algorithms: The algorithms to analyze.
+        fields: The names of the analysis properties to compute,
+            among metrics, impacts, ergonomics, structure,
+            cycles and min_cube_size.
+        processes: Number of processes, defaults to the number of CPUs.
+        chunksize: Number of algorithms sent to a process at once.
+
+    Returns:
+        An iterator over the analysis record of each algorithm.
+
+    Raises:
+        ValueError: If a field is unknown.
+
+    """
+    unknown = [field for field in fields if field not in ANALYSIS_FIELDS]
+    if unknown:
+        msg = f'Unknown analysis fields: { ", ".join(unknown) }'
+        raise ValueError(msg)
+
+    return analyze_notations(
+        (str(algorithm) for algorithm in algorithms),
+        tuple(fields),
+        processes,
+        chunksize,
+    )
@@ -0,0 +1,218 @@
+"""
+Compiled algorithms for fast repeated application.
+
+An algorithm is composed once into a single facelet permutation,
+so applying it to a cube state is a single gather whatever
+the number of moves, and its cycle structure is known
+without any simulation.
+"""
+import math
+from collections.abc import Sequence
+from functools import cached_property
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.extensions import rotate_2x2x2
+from cubing_algs.extensions import rotate_3x3x3
+from cubing_algs.extensions import rotate_dynamic
+
+if TYPE_CHECKING:
+    from cubing_algs.algorithm import Algorithm  # pragma: no cover
+
+
+def compute_permutation(moves: str, size: int = 3) -> list[int]:
+    """
+    Compose a sequence of moves into a single facelet permutation.
+
+    Args:
+        moves: Space separated moves to compose.
+        size: Size of the cube.
+
+    Returns:
+        The permutation as a list of indexes, facelet i of the new state
+        comes from facelet permutation[i] of the previous state.
+
+    Raises:
+        InvalidMoveError: If a move is invalid for this cube size.
+
+    """
+    try:
+        if size == 2:
+            return rotate_2x2x2.compute_permutation(moves)
+        if size == 3:
+            return rotate_3x3x3.compute_permutation(moves)
+        return rotate_dynamic.compute_permutation(moves, size=size)
+    except ValueError as e:
+        raise InvalidMoveError(str(e)) from e
+
+
+class CompiledAlgorithm:
+    """
+    Algorithm composed into a single facelet permutation.
+
+    Facelet i of the resulting state comes from facelet permutation[i]
+    of the initial state.
+    """
+
+    def __init__(self, permutation: Sequence[int], *,
+                 size: int = 3, moves: str = '') -> None:
+        """
+        Initialize a compiled algorithm from a facelet permutation.
+
+        Args:
+            permutation: The gather permutation of the facelets.
+            size: Size of the cube the permutation applies to.
+            moves: Space separated moves the permutation was built from.
+
+        """
+        self.permutation = tuple(permutation)
+        self.size = size
+        self.moves = moves
+        self._gather = itemgetter(*self.permutation)
+
+    @staticmethod
+    def from_algorithm(algorithm: 'Algorithm',
+                       size: int = 3) -> 'CompiledAlgorithm':
+        """
+        Compile an algorithm, ignoring its pauses and timings.
+
+        Args:
+            algorithm: The algorithm to compile.
+            size: Size of the cube.
+
+        Returns:
+            The compiled algorithm.
+
+        """
+        from cubing_algs.transform.pause import unpause_moves  # noqa: PLC0415
+        from cubing_algs.transform.timing import untime_moves  # noqa: PLC0415
+
+        moves = str(algorithm.transform(unpause_moves, untime_moves))
+
+        return CompiledAlgorithm(
+            compute_permutation(moves, size),
+            size=size,
+            moves=moves,
+        )
+
+    def apply(self, state: str) -> str:
+        """
+        Apply the permutation to a cube state.
+
+        Args:
+            state: The facelets state to permute.
+
+        Returns:
+            The new facelets state.
+
+        Raises:
+            ValueError: If the state does not match the cube size.
+
+        """
+        if len(state) != len(self.permutation):
+            msg = (
+                f'State length { len(state) } does not match expected '
+                f'{ len(self.permutation) } for size { self.size }'
+            )
+            raise ValueError(msg)
+
+        return ''.join(self._gather(state))
+
+    @cached_property
+    def facelet_cycles(self) -> list[list[int]]:
+        """
+        Cycles of the facelets moved by the permutation.
+
+        Each cycle lists the facelets in the order the permutation
+        walks through them, fixed facelets are not included.
+        """
+        permutation = self.permutation
+        visited = [False] * len(permutation)
+        cycles = []
+
+        for start, target in enumerate(permutation):
+            if visited[start] or target == start:
+                continue
+
+            cycle = []
+            index = start
+            while not visited[index]:
+                visited[index] = True
+                cycle.append(index)
+                index = permutation[index]
+            cycles.append(cycle)
+
+        return cycles
+
+    @cached_property
+    def order(self) -> int:
+        """
+        Number of applications needed to restore every facelet.
+
+        Computed as the least common multiple of the cycle lengths.
+        """
+        return math.lcm(*[len(cycle) for cycle in self.facelet_cycles])
+
+    @property
+    def is_identity(self) -> bool:
+        """Whether the permutation leaves every facelet in place."""
+        return not self.facelet_cycles
+
+    def power(self, exponent: int) -> 'CompiledAlgorithm':
+        """
+        Compose the permutation with itself.
+
+        Args:
+            exponent: Number of applications, negative values
+                give the inverse permutation.
+
+        Returns:
+            The compiled algorithm equivalent to applying
+            this one exponent times.
+
+        """
+        permutation = list(range(len(self.permutation)))
+
+        for cycle in self.facelet_cycles:
+            length = len(cycle)
+            shift = exponent % length
+            for position, index in enumerate(cycle):
+                permutation[index] = cycle[(position + shift) % length]
+
+        return CompiledAlgorithm(permutation, size=self.size)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare compiled algorithms by their effect on the cube.
+
+        Returns:
+            True if both permutations are identical for the same size.
+
+        """
+        if not isinstance(other, CompiledAlgorithm):
+            return NotImplemented
+        return (
+            self.size == other.size
+            and self.permutation == other.permutation
+        )
+
+    def __hash__(self) -> int:
+        """
+        Hash the compiled algorithm by its effect on the cube.
+
+        Returns:
+            The hash of the size and the permutation.
+
+        """
+        return hash((self.size, self.permutation))
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the compiled algorithm.
+
+        Returns:
+            The moves and the size of the compiled algorithm.
+
+        """
+        return f"CompiledAlgorithm('{ self.moves }', size={ self.size })"
@@ -46,6 +46,12 @@ OUTER_MOVES = OUTER_BASIC_MOVES + OUTER_WIDE_MOVES
 
 ALL_BASIC_MOVES = OUTER_MOVES + INNER_MOVES + ROTATIONS
 
+AXIS_MOVES = {
+    'x': ('R', 'L', 'M', 'x'),
+    'y': ('U', 'D', 'E', 'y'),
+    'z': ('F', 'B', 'S', 'z'),
+}
+
 OFFSET_X_CW = {
     'U': 'F',
     'D': 'B',
@@ -0,0 +1,404 @@
+"""
+Cubie level simulation of the 3x3x3 cube.
+
+The cube is represented by the permutations and orientations of its
+corners and edges, and the permutation of its centers, instead of its
+54 facelets, so analyses needing only the cubies do not pay for
+a conversion of the facelets after each algorithm.
+
+The cubie representation of the moves is computed once at import,
+from the facelet permutation of each move composed by the rotation
+extension. A sequence is split into its moves, then the multiply
+extension multiplies the cubies by the table of each move.
+
+Unlike the cubies of a VCube, which are relative to its centers,
+the cubies of a CubieCube keep the colors of the pieces,
+whole cube rotations and slice moves moving the centers.
+"""
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from cubing_algs.compiled import compute_permutation
+from cubing_algs.constants import FACES
+from cubing_algs.extensions import multiply_3x3x3
+from cubing_algs.facelets import cubies_to_facelets
+from cubing_algs.facelets import facelets_to_cubies
+from cubing_algs.initial_state import get_initial_state
+
+if TYPE_CHECKING:
+    from cubing_algs.algorithm import Algorithm  # pragma: no cover
+    from cubing_algs.move import Move  # pragma: no cover
+    from cubing_algs.vcube import VCube  # pragma: no cover
+
+CENTER_INDEXES = tuple(9 * face + 4 for face in range(6))
+
+SOLVED_CENTERS = list(range(6))
+
+# Offsets of the cp, co, ep, eo and so arrays in the packed cubies
+CO_OFFSET = 8
+EP_OFFSET = 16
+EO_OFFSET = 28
+SO_OFFSET = 40
+
+SOLVED_CUBIES = bytes([*range(8), *[0] * 8, *range(12), *[0] * 12, *range(6)])
+
+# Faces, wide moves, slices and rotations known to the rotation extension
+BASIC_MOVES = tuple(
+    f'{ base }{ modifier }'
+    for base in (
+        *FACES, *FACES.lower(), *(f'{ face }w' for face in FACES),
+        'M', 'E', 'S', 'x', 'y', 'z',
+    )
+    for modifier in ('', "'", '2')
+)
+
+type Cubies = tuple[
+    tuple[int, ...], tuple[int, ...], tuple[int, ...],
+    tuple[int, ...], tuple[int, ...],
+]
+
+
+def absolute_cubies(facelets: str) -> tuple[
+        list[int], list[int], list[int], list[int], list[int],
+]:
+    """
+    Convert a facelets state into cubies keeping the colors of the pieces.
+
+    Args:
+        facelets: 54-character string of a 3x3x3 state.
+
+    Returns:
+        The corner and edge permutations and orientations,
+        and the permutation of the centers.
+
+    """
+    centers = [FACES.index(facelets[index]) for index in CENTER_INDEXES]
+
+    if centers == SOLVED_CENTERS:
+        return facelets_to_cubies(facelets)
+
+    # With solved centers the colors are not relabeled
+    solved = list(facelets)
+    for face, index in enumerate(CENTER_INDEXES):
+        solved[index] = FACES[face]
+
+    cp, co, ep, eo, _so = facelets_to_cubies(''.join(solved))
+
+    return cp, co, ep, eo, centers
+
+
+@lru_cache(maxsize=1024)
+def compute_moves_cubies(moves: str) -> Cubies:
+    """
+    Compute the cubie representation of moves on the solved cube.
+
+    Args:
+        moves: Space separated moves.
+
+    Returns:
+        The corner and edge permutations and orientations,
+        and the permutation of the centers, of the moves.
+
+    """
+    initial_state = get_initial_state(3)
+    facelets = ''.join(
+        [initial_state[origin] for origin in compute_permutation(moves)],
+    )
+
+    cp, co, ep, eo, so = absolute_cubies(facelets)
+
+    return tuple(cp), tuple(co), tuple(ep), tuple(eo), tuple(so)
+
+
+def pack_cubies(cubies: Iterable[Iterable[int]]) -> bytes:
+    """
+    Pack cubies into the bytes used by the multiply extension.
+
+    Args:
+        cubies: The corner and edge permutations and orientations,
+            and the permutation of the centers.
+
+    Returns:
+        The arrays one after the other, one byte per value.
+
+    """
+    return bytes([value for values in cubies for value in values])
+
+
+def build_move_tables() -> tuple[dict[str, bytes], bytes]:
+    """
+    Build the packed cubies of the basic moves.
+
+    Returns:
+        The index of each basic move, as a single byte,
+        and the packed cubies of the moves one after the other.
+
+    """
+    return (
+        {move: bytes([index]) for index, move in enumerate(BASIC_MOVES)},
+        b''.join(
+            [pack_cubies(compute_moves_cubies(move)) for move in BASIC_MOVES],
+        ),
+    )
+
+
+MOVE_CODES, MOVE_TABLES = build_move_tables()
+
+TABLE_CODES = {
+    MOVE_TABLES[index:index + len(SOLVED_CUBIES)]: code
+    for index, code in zip(
+        range(0, len(MOVE_TABLES), len(SOLVED_CUBIES)),
+        MOVE_CODES.values(),
+        strict=True,
+    )
+}
+
+
+@lru_cache(maxsize=1024)
+def get_move_code(move: str) -> bytes:
+    """
+    Get the index in the move tables of any spelling of a move.
+
+    The rotation extension accepts spellings of the basic moves
+    left out of MOVE_CODES, like R2', they share the table of their move.
+    Invalid moves raise the InvalidMoveError of the rotation extension.
+
+    Args:
+        move: A single move.
+
+    Returns:
+        The index of the move in MOVE_TABLES, as a single byte.
+
+    """
+    if move in MOVE_CODES:
+        return MOVE_CODES[move]
+
+    return TABLE_CODES[pack_cubies(compute_moves_cubies(move))]
+
+
+class CubieCube:
+    """
+    Virtual 3x3x3 cube tracking moves on its cubies.
+
+    Position i of the corners holds the corner cp[i] twisted by co[i],
+    position i of the edges holds the edge ep[i] flipped by eo[i],
+    and face i holds the center of the face so[i].
+    The arrays are packed in the cubies bytes, one byte per value.
+    """
+
+    def __init__(self, cp: list[int] | None = None,
+                 co: list[int] | None = None,
+                 ep: list[int] | None = None,
+                 eo: list[int] | None = None,
+                 so: list[int] | None = None) -> None:
+        """Initialize a cubie cube, solved by default."""
+        if cp is co is ep is eo is so is None:
+            self.cubies = SOLVED_CUBIES
+            return
+
+        self.cubies = pack_cubies((
+            range(8) if cp is None else cp,
+            [0] * 8 if co is None else co,
+            range(12) if ep is None else ep,
+            [0] * 12 if eo is None else eo,
+            SOLVED_CENTERS if so is None else so,
+        ))
+
+    @staticmethod
+    def from_facelets(facelets: str) -> 'CubieCube':
+        """
+        Create a cubie cube from a facelets state.
+
+        Args:
+            facelets: 54-character string of a 3x3x3 state.
+
+        Returns:
+            A new CubieCube in the same state.
+
+        """
+        return CubieCube(*absolute_cubies(facelets))
+
+    @staticmethod
+    def from_vcube(cube: 'VCube') -> 'CubieCube':
+        """
+        Create a cubie cube from a virtual cube.
+
+        Args:
+            cube: The 3x3x3 virtual cube.
+
+        Returns:
+            A new CubieCube in the same state.
+
+        Raises:
+            ValueError: If the cube is not a 3x3x3.
+
+        """
+        if cube.size != 3:
+            msg = 'CubieCube only supports 3x3x3 cubes'
+            raise ValueError(msg)
+
+        return CubieCube.from_facelets(cube.state)
+
+    @property
+    def cp(self) -> list[int]:
+        """Corner permutation."""
+        return list(self.cubies[:CO_OFFSET])
+
+    @property
+    def co(self) -> list[int]:
+        """Corner orientation."""
+        return list(self.cubies[CO_OFFSET:EP_OFFSET])
+
+    @property
+    def ep(self) -> list[int]:
+        """Edge permutation."""
+        return list(self.cubies[EP_OFFSET:EO_OFFSET])
+
+    @property
+    def eo(self) -> list[int]:
+        """Edge orientation."""
+        return list(self.cubies[EO_OFFSET:SO_OFFSET])
+
+    @property
+    def so(self) -> list[int]:
+        """Center permutation."""
+        return list(self.cubies[SO_OFFSET:])
+
+    @property
+    def state(self) -> str:
+        """Facelets state of the cube."""
+        facelets = list(
+            cubies_to_facelets(
+                self.cp, self.co, self.ep, self.eo, SOLVED_CENTERS,
+            ),
+        )
+        for face, index in enumerate(CENTER_INDEXES):
+            facelets[index] = FACES[self.cubies[SO_OFFSET + face]]
+
+        return ''.join(facelets)
+
+    def to_vcube(self) -> 'VCube':
+        """
+        Convert the cubie cube to a virtual cube.
+
+        Returns:
+            A new VCube in the same state.
+
+        """
+        from cubing_algs.vcube import VCube  # noqa: PLC0415
+
+        return VCube(self.state, check=False)
+
+    @property
+    def to_cubies(self) -> tuple[
+            list[int], list[int], list[int], list[int], list[int],
+    ]:
+        """
+        Cubies of the cube relative to its centers, as VCube.to_cubies.
+
+        Returns:
+            A tuple of (corner_permutation, corner_orientation,
+            edge_permutation, edge_orientation, center_orientation).
+
+        """
+        if self.cubies[SO_OFFSET:] == SOLVED_CUBIES[SO_OFFSET:]:
+            values = list(self.cubies)
+            return (
+                values[:CO_OFFSET], values[CO_OFFSET:EP_OFFSET],
+                values[EP_OFFSET:EO_OFFSET], values[EO_OFFSET:SO_OFFSET],
+                values[SO_OFFSET:],
+            )
+
+        return facelets_to_cubies(self.state)
+
+    @property
+    def is_solved(self) -> bool:
+        """Check if the cube is solved, whatever its orientation."""
+        if self.cubies[SO_OFFSET:] == SOLVED_CUBIES[SO_OFFSET:]:
+            return self.cubies == SOLVED_CUBIES
+
+        state = self.state
+
+        return all(
+            state[start:start + 9] == state[start + 4] * 9
+            for start in range(0, len(state), 9)
+        )
+
+    def multiply(self, cubies: Cubies) -> None:
+        """
+        Apply the cubie representation of moves to the cubies.
+
+        Args:
+            cubies: The cubies of the moves on the solved cube.
+
+        """
+        self.cubies = multiply_3x3x3.multiply_moves(
+            self.cubies, pack_cubies(cubies), b'\0',
+        )
+
+    def rotate(self, moves: 'Algorithm | Move | str') -> None:
+        """
+        Apply a sequence of moves to the cubies.
+
+        The indexes of all the moves are looked up before
+        multiplying the cubies by their tables, so the cube is left
+        untouched if any of the moves is invalid.
+
+        Args:
+            moves: The moves to apply.
+
+        """
+        notation = str(moves)
+        codes = MOVE_CODES.get(notation)
+
+        if codes is None:
+            names = notation.split()
+            try:
+                codes = b''.join([MOVE_CODES[name] for name in names])
+            except KeyError:
+                codes = b''.join([get_move_code(name) for name in names])
+
+        self.cubies = multiply_3x3x3.multiply_moves(
+            self.cubies, MOVE_TABLES, codes,
+        )
+
+    def copy(self) -> 'CubieCube':
+        """
+        Create a copy of the cube.
+
+        Returns:
+            A new CubieCube with the same cubies.
+
+        """
+        cube = CubieCube()
+        cube.cubies = self.cubies
+
+        return cube
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the cubies of two cubes.
+
+        Returns:
+            True if both cubes are in the same state.
+
+        """
+        if not isinstance(other, CubieCube):
+            return NotImplemented
+        return self.cubies == other.cubies
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the cubie cube.
+
+        Returns:
+            The cubies of the cube.
+
+        """
+        return (
+            f'CubieCube(cp={ self.cp }, co={ self.co }, '
+            f'ep={ self.ep }, eo={ self.eo }, so={ self.so })'
+        )
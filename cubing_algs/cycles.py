@@ -5,15 +5,19 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from cubing_algs.algorithm import Algorithm  # pragma: no cover
 
+MAX_CYCLES = 100
+
 
 def compute_cycles(algorithm: 'Algorithm') -> int:
     """
     Calculate the number of times an algorithm must be applied
     to return a cube to its solved state.
 
-    This function simulates applying the given sequence of moves
-    repeatedly on a solved cube until the cube returns to
-    its original solved state, counting how many applications are needed.
+    The algorithm is compiled into a single facelet permutation,
+    whose order bounds the answer: the cube is back to a solved state,
+    in any orientation, after a number of applications dividing the order.
+    Only these divisors are checked, each with a single permutation
+    of the solved state, instead of replaying the moves.
 
     This is also known as the "order" of the algorithm in group theory.
 
@@ -25,30 +29,27 @@ def compute_cycles(algorithm: 'Algorithm') -> int:
         solved state.
 
     Note:
-        The function has a safety limit of 100 iterations to prevent
-        infinite loops for algorithms that may have very high order
-        or don't return to solved state.
+        The result is capped at 100 for algorithms with a very high order.
 
     """
-    from cubing_algs.transform.pause import unpause_moves  # noqa: PLC0415
-    from cubing_algs.transform.timing import untime_moves  # noqa: PLC0415
     from cubing_algs.vcube import VCube  # noqa: PLC0415
 
-    algorithm = algorithm.transform(
-        unpause_moves,
-        untime_moves,
-    )
+    compiled = algorithm.compile()
 
-    if len(algorithm) == 0:
+    if not compiled.moves:
         return 0
 
-    cube = VCube()
+    solved = VCube().state
+
+    for divisor in range(1, compiled.order + 1):
+        if divisor >= MAX_CYCLES:
+            return MAX_CYCLES
 
-    cycles = 1
-    cube.rotate(algorithm)
+        if compiled.order % divisor:
+            continue
 
-    while not cube.is_solved and cycles < 100:
-        cube.rotate(algorithm)
-        cycles += 1
+        cube = VCube(compiled.power(divisor).apply(solved), check=False)
+        if cube.is_solved:
+            return divisor
 
-    return cycles
+    return MAX_CYCLES  # pragma: no cover
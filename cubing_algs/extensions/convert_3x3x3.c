@@ -0,0 +1,347 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+#define STATE_SIZE 54
+#define FACE_COUNT 6
+#define CORNER_COUNT 8
+#define EDGE_COUNT 12
+#define UNKNOWN -1
+
+// Facelet indexes of each corner, starting with its U or D facelet
+static const int CORNER_FACELET_MAP[CORNER_COUNT][3] = {
+    {8, 9, 20},    // URF
+    {6, 18, 38},   // UFL
+    {0, 36, 47},   // ULB
+    {2, 45, 11},   // UBR
+    {29, 26, 15},  // DFR
+    {27, 44, 24},  // DLF
+    {33, 53, 42},  // DBL
+    {35, 17, 51},  // DRB
+};
+
+// Facelet indexes of each edge
+static const int EDGE_FACELET_MAP[EDGE_COUNT][2] = {
+    {5, 10},   // UR
+    {7, 19},   // UF
+    {3, 37},   // UL
+    {1, 46},   // UB
+    {32, 16},  // DR
+    {28, 25},  // DF
+    {30, 43},  // DL
+    {34, 52},  // DB
+    {23, 12},  // FR
+    {21, 41},  // FL
+    {50, 39},  // BL
+    {48, 14},  // BR
+};
+
+// Corner identified by the colors following its U or D color
+static int corner_lookup[FACE_COUNT][FACE_COUNT];
+
+// Edge identified by its two colors, and its orientation
+static int edge_lookup[FACE_COUNT][FACE_COUNT];
+static int edge_orientation_lookup[FACE_COUNT][FACE_COUNT];
+
+static void build_lookup_tables(void) {
+    for (int i = 0; i < FACE_COUNT; i++) {
+        for (int j = 0; j < FACE_COUNT; j++) {
+            corner_lookup[i][j] = UNKNOWN;
+            edge_lookup[i][j] = UNKNOWN;
+            edge_orientation_lookup[i][j] = 0;
+        }
+    }
+
+    for (int j = 0; j < CORNER_COUNT; j++) {
+        int color1 = CORNER_FACELET_MAP[j][1] / 9;
+        int color2 = CORNER_FACELET_MAP[j][2] / 9;
+        corner_lookup[color1][color2] = j;
+    }
+
+    for (int j = 0; j < EDGE_COUNT; j++) {
+        int color1 = EDGE_FACELET_MAP[j][0] / 9;
+        int color2 = EDGE_FACELET_MAP[j][1] / 9;
+        edge_lookup[color1][color2] = j;
+        edge_lookup[color2][color1] = j;
+        edge_orientation_lookup[color2][color1] = 1;
+    }
+}
+
+/**
+ * Get the index of a face color in URFDLB order, or UNKNOWN.
+ */
+static int face_index(char color) {
+    switch (color) {
+        case 'U': return 0;
+        case 'R': return 1;
+        case 'F': return 2;
+        case 'D': return 3;
+        case 'L': return 4;
+        case 'B': return 5;
+        default: return UNKNOWN;
+    }
+}
+
+/**
+ * Build a Python list from an array of integers.
+ */
+static PyObject* build_list(const int* values, int count) {
+    PyObject* list = PyList_New(count);
+    if (list == NULL) {
+        return NULL;
+    }
+
+    for (int i = 0; i < count; i++) {
+        PyObject* value = PyLong_FromLong(values[i]);
+        if (value == NULL) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyList_SET_ITEM(list, i, value);
+    }
+
+    return list;
+}
+
+/**
+ * Read a sequence of integers into an array.
+ *
+ * With a modulo, the values are orientations reduced with Python
+ * modulo semantics, whatever their size.
+ * Without, they are indexes in [-count, count), negative indexes
+ * counting from the end as in Python, other values raise IndexError.
+ *
+ * Returns 0 on success, -1 with a Python error set otherwise.
+ */
+static int read_ints(PyObject* sequence, int* values, int count,
+                     const char* name, int modulo) {
+    PyObject* fast = PySequence_Fast(sequence, "cubies must be sequences");
+    if (fast == NULL) {
+        return -1;
+    }
+
+    if (PySequence_Fast_GET_SIZE(fast) < count) {
+        Py_DECREF(fast);
+        PyErr_Format(PyExc_IndexError, "%s must have %d values", name, count);
+        return -1;
+    }
+
+    PyObject** items = PySequence_Fast_ITEMS(fast);
+    for (int i = 0; i < count; i++) {
+        int overflow;
+        long value = PyLong_AsLongAndOverflow(items[i], &overflow);
+        if (value == -1 && PyErr_Occurred()) {
+            Py_DECREF(fast);
+            return -1;
+        }
+
+        if (modulo) {
+            if (overflow) {
+                // Reduced by Python, the remainder always fits
+                PyObject* divisor = PyLong_FromLong(modulo);
+                PyObject* remainder = divisor
+                    ? PyNumber_Remainder(items[i], divisor) : NULL;
+                Py_XDECREF(divisor);
+                if (remainder == NULL) {
+                    Py_DECREF(fast);
+                    return -1;
+                }
+                value = PyLong_AsLong(remainder);
+                Py_DECREF(remainder);
+            }
+            values[i] = (int)(((value % modulo) + modulo) % modulo);
+            continue;
+        }
+
+        // Checked on the long, before any narrowing
+        if (overflow || value < -count || value >= count) {
+            Py_DECREF(fast);
+            PyErr_Format(PyExc_IndexError, "%s index out of range", name);
+            return -1;
+        }
+        values[i] = (int)((value + count) % count);
+    }
+
+    Py_DECREF(fast);
+    return 0;
+}
+
+// Convert a facelets state to cubies
+static PyObject* facelets_to_cubies(PyObject* self, PyObject* args) {
+    const char* facelets;
+    Py_ssize_t length;
+
+    if (!PyArg_ParseTuple(args, "s#", &facelets, &length)) {
+        return NULL;
+    }
+
+    if (length != STATE_SIZE) {
+        PyErr_Format(PyExc_ValueError,
+                     "Facelets must be %d characters long", STATE_SIZE);
+        return NULL;
+    }
+
+    int colors[STATE_SIZE];
+    for (int i = 0; i < STATE_SIZE; i++) {
+        colors[i] = face_index(facelets[i]);
+        if (colors[i] == UNKNOWN) {
+            PyObject* key = PyUnicode_FromStringAndSize(&facelets[i], 1);
+            if (key != NULL) {
+                PyErr_SetObject(PyExc_KeyError, key);
+                Py_DECREF(key);
+            }
+            return NULL;
+        }
+    }
+
+    int so[FACE_COUNT];
+    int so_inv[FACE_COUNT] = {0};
+    for (int i = 0; i < FACE_COUNT; i++) {
+        so[i] = colors[9 * i + 4];
+    }
+    for (int i = 0; i < FACE_COUNT; i++) {
+        so_inv[so[i]] = i;
+    }
+
+    // Colors relative to the centers
+    int f[STATE_SIZE];
+    for (int i = 0; i < STATE_SIZE; i++) {
+        f[i] = so_inv[colors[i]];
+    }
+
+    int cp[CORNER_COUNT] = {0};
+    int co[CORNER_COUNT] = {0};
+    int ep[EDGE_COUNT] = {0};
+    int eo[EDGE_COUNT] = {0};
+
+    for (int i = 0; i < CORNER_COUNT; i++) {
+        // Find the orientation by looking for the U or D color
+        int ori = 0;
+        while (ori < 2) {
+            int color = f[CORNER_FACELET_MAP[i][ori]];
+            if (color == 0 || color == 3) {
+                break;
+            }
+            ori++;
+        }
+
+        int color1 = f[CORNER_FACELET_MAP[i][(ori + 1) % 3]];
+        int color2 = f[CORNER_FACELET_MAP[i][(ori + 2) % 3]];
+        int corner = corner_lookup[color1][color2];
+        if (corner != UNKNOWN) {
+            cp[i] = corner;
+            co[i] = ori;
+        }
+    }
+
+    for (int i = 0; i < EDGE_COUNT; i++) {
+        int color1 = f[EDGE_FACELET_MAP[i][0]];
+        int color2 = f[EDGE_FACELET_MAP[i][1]];
+        int edge = edge_lookup[color1][color2];
+        if (edge != UNKNOWN) {
+            ep[i] = edge;
+            eo[i] = edge_orientation_lookup[color1][color2];
+        }
+    }
+
+    PyObject* result = PyTuple_New(5);
+    if (result == NULL) {
+        return NULL;
+    }
+
+    const int* arrays[5] = {cp, co, ep, eo, so};
+    const int counts[5] = {
+        CORNER_COUNT, CORNER_COUNT, EDGE_COUNT, EDGE_COUNT, FACE_COUNT,
+    };
+    for (int i = 0; i < 5; i++) {
+        PyObject* list = build_list(arrays[i], counts[i]);
+        if (list == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(result, i, list);
+    }
+
+    return result;
+}
+
+// Convert cubies to a facelets state colored by a scheme
+static PyObject* cubies_to_facelets(PyObject* self, PyObject* args) {
+    PyObject *cp_obj, *co_obj, *ep_obj, *eo_obj;
+    const char* scheme;
+    Py_ssize_t length;
+
+    if (!PyArg_ParseTuple(args, "OOOOs#", &cp_obj, &co_obj, &ep_obj, &eo_obj,
+                          &scheme, &length)) {
+        return NULL;
+    }
+
+    if (length != STATE_SIZE) {
+        PyErr_Format(PyExc_ValueError,
+                     "Scheme must be %d characters long", STATE_SIZE);
+        return NULL;
+    }
+
+    int cp[CORNER_COUNT], co[CORNER_COUNT], ep[EDGE_COUNT], eo[EDGE_COUNT];
+    if (read_ints(cp_obj, cp, CORNER_COUNT, "cp", 0) < 0
+            || read_ints(co_obj, co, CORNER_COUNT, "co", 3) < 0
+            || read_ints(ep_obj, ep, EDGE_COUNT, "ep", 0) < 0
+            || read_ints(eo_obj, eo, EDGE_COUNT, "eo", 2) < 0) {
+        return NULL;
+    }
+
+    // Facelets left unset by invalid cubies are dropped, as in Python
+    char facelets[STATE_SIZE];
+    memset(facelets, 0, STATE_SIZE);
+
+    for (int i = 0; i < FACE_COUNT; i++) {
+        facelets[9 * i + 4] = scheme[9 * i + 4];
+    }
+
+    for (int i = 0; i < CORNER_COUNT; i++) {
+        int twist = co[i];
+        for (int p = 0; p < 3; p++) {
+            facelets[CORNER_FACELET_MAP[i][(p + twist) % 3]] =
+                scheme[CORNER_FACELET_MAP[cp[i]][p]];
+        }
+    }
+
+    for (int i = 0; i < EDGE_COUNT; i++) {
+        int flip = eo[i];
+        for (int p = 0; p < 2; p++) {
+            facelets[EDGE_FACELET_MAP[i][(p + flip) % 2]] =
+                scheme[EDGE_FACELET_MAP[ep[i]][p]];
+        }
+    }
+
+    Py_ssize_t size = 0;
+    for (int i = 0; i < STATE_SIZE; i++) {
+        if (facelets[i] != '\0') {
+            facelets[size++] = facelets[i];
+        }
+    }
+
+    return PyUnicode_FromStringAndSize(facelets, size);
+}
+
+// Module method definitions
+static PyMethodDef ConvertMethods[] = {
+    {"facelets_to_cubies", facelets_to_cubies, METH_VARARGS, "Convert a 3x3x3 facelets state to cubies"},
+    {"cubies_to_facelets", cubies_to_facelets, METH_VARARGS, "Convert 3x3x3 cubies to a facelets state colored by a scheme"},
+    {NULL, NULL, 0, NULL}
+};
+
+// Module definition
+static struct PyModuleDef convertmodule = {
+    PyModuleDef_HEAD_INIT,
+    "convert_3x3x3",
+    "Fast 3x3x3 conversions between facelets and cubies",
+    -1,
+    ConvertMethods
+};
+
+// Module initialization function
+PyMODINIT_FUNC PyInit_convert_3x3x3(void) {
+    build_lookup_tables();
+    return PyModule_Create(&convertmodule);
+}
@@ -0,0 +1,10 @@
+from collections.abc import Sequence
+
+def facelets_to_cubies(facelets: str) -> tuple[
+        list[int], list[int], list[int], list[int], list[int],
+]:
+    ...
+def cubies_to_facelets(cp: Sequence[int], co: Sequence[int],
+                       ep: Sequence[int], eo: Sequence[int],
+                       scheme: str) -> str:
+    ...
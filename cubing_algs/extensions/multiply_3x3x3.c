@@ -0,0 +1,134 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+#define CORNER_COUNT 8
+#define EDGE_COUNT 12
+#define CENTER_COUNT 6
+
+// Offsets of the cp, co, ep, eo and so arrays in the cubies
+#define CP 0
+#define CO (CP + CORNER_COUNT)
+#define EP (CO + CORNER_COUNT)
+#define EO (EP + EDGE_COUNT)
+#define SO (EO + EDGE_COUNT)
+#define CUBIES_SIZE (SO + CENTER_COUNT)
+
+/**
+ * Multiply cubies by the cubies of a move.
+ *
+ * Position i receives the piece at position move[i],
+ * with the orientation of the move added.
+ *
+ * Returns 0, or -1 if the move holds a position out of range.
+ */
+static int multiply(unsigned char* cubies, const unsigned char* move) {
+    unsigned char previous[CUBIES_SIZE];
+    memcpy(previous, cubies, CUBIES_SIZE);
+
+    for (int i = 0; i < CORNER_COUNT; i++) {
+        unsigned char origin = move[CP + i];
+        if (origin >= CORNER_COUNT) {
+            return -1;
+        }
+        cubies[CP + i] = previous[CP + origin];
+        cubies[CO + i] = (previous[CO + origin] + move[CO + i]) % 3;
+    }
+
+    for (int i = 0; i < EDGE_COUNT; i++) {
+        unsigned char origin = move[EP + i];
+        if (origin >= EDGE_COUNT) {
+            return -1;
+        }
+        cubies[EP + i] = previous[EP + origin];
+        cubies[EO + i] = previous[EO + origin] ^ move[EO + i];
+    }
+
+    for (int i = 0; i < CENTER_COUNT; i++) {
+        unsigned char origin = move[SO + i];
+        if (origin >= CENTER_COUNT) {
+            return -1;
+        }
+        cubies[SO + i] = previous[SO + origin];
+    }
+
+    return 0;
+}
+
+// Apply a sequence of moves, given by their index in the move tables
+static PyObject* multiply_moves(PyObject* self, PyObject* args) {
+    Py_buffer cubies, tables, moves;
+
+    if (!PyArg_ParseTuple(args, "y*y*y*", &cubies, &tables, &moves)) {
+        return NULL;
+    }
+
+    PyObject* result = NULL;
+
+    if (cubies.len != CUBIES_SIZE) {
+        PyErr_Format(PyExc_ValueError, "cubies must be %d bytes long", CUBIES_SIZE);
+        goto done;
+    }
+
+    if (tables.len % CUBIES_SIZE) {
+        PyErr_Format(PyExc_ValueError, "tables must hold cubies of %d bytes", CUBIES_SIZE);
+        goto done;
+    }
+
+    Py_ssize_t count = tables.len / CUBIES_SIZE;
+    const unsigned char* table = tables.buf;
+    const unsigned char* indexes = moves.buf;
+
+    for (Py_ssize_t i = 0; i < moves.len; i++) {
+        if (indexes[i] >= count) {
+            PyErr_Format(PyExc_ValueError, "Move %d is not in the tables", indexes[i]);
+            goto done;
+        }
+    }
+
+    result = PyBytes_FromStringAndSize(cubies.buf, CUBIES_SIZE);
+    if (result == NULL) {
+        goto done;
+    }
+
+    // Moves are applied without Python objects, let other threads run
+    unsigned char* new_cubies = (unsigned char*)PyBytes_AS_STRING(result);
+    int status = 0;
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < moves.len && status == 0; i++) {
+        status = multiply(new_cubies, table + indexes[i] * CUBIES_SIZE);
+    }
+    Py_END_ALLOW_THREADS
+
+    if (status < 0) {
+        PyErr_SetString(PyExc_ValueError, "Move tables hold positions out of range");
+        Py_CLEAR(result);
+    }
+
+done:
+    PyBuffer_Release(&cubies);
+    PyBuffer_Release(&tables);
+    PyBuffer_Release(&moves);
+
+    return result;
+}
+
+// Module method definitions
+static PyMethodDef MultiplyMethods[] = {
+    {"multiply_moves", multiply_moves, METH_VARARGS, "Apply a sequence of moves to 3x3x3 cubies with move tables"},
+    {NULL, NULL, 0, NULL}
+};
+
+// Module definition
+static struct PyModuleDef multiplymodule = {
+    PyModuleDef_HEAD_INIT,
+    "multiply_3x3x3",
+    "Fast 3x3x3 cubie multiplications",
+    -1,
+    MultiplyMethods
+};
+
+// Module initialization function
+PyMODINIT_FUNC PyInit_multiply_3x3x3(void) {
+    return PyModule_Create(&multiplymodule);
+}
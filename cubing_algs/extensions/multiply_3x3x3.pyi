@@ -0,0 +1,5 @@
+from _typeshed import ReadableBuffer
+
+def multiply_moves(cubies: ReadableBuffer, tables: ReadableBuffer,
+                   moves: ReadableBuffer) -> bytes:
+    ...
@@ -1,2 +1,9 @@
+from collections import UserString
+from collections.abc import Iterable
+
 def rotate_move(state: str, move: str) -> str:
     ...
+def rotate_moves(state: str, moves: str | Iterable[str | UserString]) -> str:
+    ...
+def compute_permutation(moves: str | Iterable[str | UserString]) -> list[int]:
+    ...
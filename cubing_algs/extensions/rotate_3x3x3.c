@@ -1,21 +1,24 @@
 #include <Python.h>
+#include <ctype.h>
 #include <string.h>
 
-// Main function for rotating a move
-static PyObject* rotate_move(PyObject* self, PyObject* args) {
-    const char* state;
-    const char* move;
-
-    if (!PyArg_ParseTuple(args, "ss", &state, &move)) {
-        return NULL;
-    }
+#define STATE_SIZE 54
+#define MOVE_TOKEN_SIZE 4
 
-    // Copy state for modification
-    char new_state[55];
-    strcpy(new_state, state);
+// Status codes returned by apply_move
+#define MOVE_OK 0
+#define MOVE_INVALID_MODIFIER 1
+#define MOVE_INVALID_FACE 2
 
-    char temp_state[55];
-    strcpy(temp_state, new_state);
+/**
+ * Apply a single move in place on a 3x3x3 state.
+ *
+ * Returns MOVE_OK, or an error status with the offending character
+ * stored in invalid.
+ */
+static int apply_move(char* new_state, const char* move, char* invalid) {
+    char temp_state[STATE_SIZE];
+    memcpy(temp_state, new_state, STATE_SIZE);
 
     // Parse the move - optimized for speed
     char face = move[0];
@@ -43,16 +46,16 @@ static PyObject* rotate_move(PyObject* self, PyObject* args) {
         } else if (third == '2') {
             direction = 2; // 180°
         } else if (third != '\0') {
-            PyErr_Format(PyExc_ValueError, "Invalid move modifier: '%c'", third);
-            return NULL;
+            *invalid = third;
+            return MOVE_INVALID_MODIFIER;
         }
     } else if (second == '\'') {
         direction = 3; // Anticlockwise
     } else if (second == '2') {
         direction = 2; // 180°
     } else if (second != '\0') {
-        PyErr_Format(PyExc_ValueError, "Invalid move modifier: '%c'", second);
-        return NULL;
+        *invalid = second;
+        return MOVE_INVALID_MODIFIER;
     }
 
     switch (face) {
@@ -2028,16 +2031,263 @@ static PyObject* rotate_move(PyObject* self, PyObject* args) {
         }
 
         default:
-            PyErr_Format(PyExc_ValueError, "Invalid move face: '%c'", face);
+            *invalid = face;
+            return MOVE_INVALID_FACE;
+    }
+
+    return MOVE_OK;
+}
+
+/**
+ * Set the Python exception matching an apply_move error status.
+ */
+static void set_move_error(int status, char invalid) {
+    switch (status) {
+        case MOVE_INVALID_MODIFIER:
+            PyErr_Format(PyExc_ValueError, "Invalid move modifier: '%c'", invalid);
+            break;
+        default:
+            PyErr_Format(PyExc_ValueError, "Invalid move face: '%c'", invalid);
+            break;
+    }
+}
+
+/**
+ * Check that a state has the expected number of facelets.
+ */
+static int check_state(const char* state) {
+    size_t state_len = strlen(state);
+
+    if (state_len != STATE_SIZE) {
+        PyErr_Format(PyExc_ValueError, "State length %zu doesn't match expected %d for size 3",
+                     state_len, STATE_SIZE);
+        return -1;
+    }
+
+    return 0;
+}
+
+// Main function for rotating a move
+static PyObject* rotate_move(PyObject* self, PyObject* args) {
+    const char* state;
+    const char* move;
+
+    if (!PyArg_ParseTuple(args, "ss", &state, &move)) {
+        return NULL;
+    }
+
+    if (check_state(state) < 0) {
+        return NULL;
+    }
+
+    // Copy state for modification
+    char new_state[STATE_SIZE];
+    memcpy(new_state, state, STATE_SIZE);
+
+    char invalid = '\0';
+    int status = apply_move(new_state, move, &invalid);
+    if (status != MOVE_OK) {
+        set_move_error(status, invalid);
+        return NULL;
+    }
+
+    return PyUnicode_FromStringAndSize(new_state, STATE_SIZE);
+}
+
+/**
+ * Moves collected from a sequence, truncated to the characters
+ * read by apply_move.
+ */
+typedef struct {
+    char (*moves)[MOVE_TOKEN_SIZE];
+    Py_ssize_t count;
+    Py_ssize_t capacity;
+} MoveList;
+
+typedef int (*move_callback)(const char* move, Py_ssize_t length, void* context);
+
+/**
+ * Split a string on whitespace and call callback on each move.
+ */
+static int for_each_move_in_string(const char* moves, Py_ssize_t length,
+                                   move_callback callback, void* context) {
+    Py_ssize_t i = 0;
+
+    while (i < length) {
+        while (i < length && isspace((unsigned char)moves[i])) i++;
+        Py_ssize_t start = i;
+        while (i < length && !isspace((unsigned char)moves[i])) i++;
+
+        if (i > start && callback(moves + start, i - start, context) < 0) {
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+/**
+ * Call callback on each move of a sequence, either a string of
+ * space separated moves, or an iterable of moves.
+ */
+static int for_each_move(PyObject* moves, move_callback callback, void* context) {
+    Py_ssize_t length;
+
+    if (PyUnicode_Check(moves)) {
+        const char* data = PyUnicode_AsUTF8AndSize(moves, &length);
+        if (data == NULL) {
+            return -1;
+        }
+        return for_each_move_in_string(data, length, callback, context);
+    }
+
+    PyObject* iterator = PyObject_GetIter(moves);
+    if (iterator == NULL) {
+        return -1;
+    }
+
+    PyObject* item;
+    while ((item = PyIter_Next(iterator)) != NULL) {
+        PyObject* text = PyObject_Str(item);
+        Py_DECREF(item);
+        if (text == NULL) {
+            Py_DECREF(iterator);
+            return -1;
+        }
+
+        const char* data = PyUnicode_AsUTF8AndSize(text, &length);
+        int status = (data == NULL) ? -1 : for_each_move_in_string(data, length, callback, context);
+        Py_DECREF(text);
+
+        if (status < 0) {
+            Py_DECREF(iterator);
+            return -1;
+        }
+    }
+    Py_DECREF(iterator);
+
+    return PyErr_Occurred() ? -1 : 0;
+}
+
+static int append_move(const char* move, Py_ssize_t length, void* context) {
+    MoveList* list = (MoveList*)context;
+
+    if (list->count == list->capacity) {
+        Py_ssize_t capacity = list->capacity ? list->capacity * 2 : 64;
+        void* moves = PyMem_Realloc(list->moves, capacity * MOVE_TOKEN_SIZE);
+        if (moves == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        list->moves = moves;
+        list->capacity = capacity;
+    }
+
+    char* token = list->moves[list->count++];
+    memset(token, 0, MOVE_TOKEN_SIZE);
+    memcpy(token, move, length < MOVE_TOKEN_SIZE - 1 ? length : MOVE_TOKEN_SIZE - 1);
+
+    return 0;
+}
+
+// Apply a whole sequence of moves and return the final state
+static PyObject* rotate_moves(PyObject* self, PyObject* args) {
+    const char* state;
+    PyObject* moves;
+
+    if (!PyArg_ParseTuple(args, "sO", &state, &moves)) {
+        return NULL;
+    }
+
+    if (check_state(state) < 0) {
+        return NULL;
+    }
+
+    MoveList list = {NULL, 0, 0};
+    if (for_each_move(moves, append_move, &list) < 0) {
+        PyMem_Free(list.moves);
+        return NULL;
+    }
+
+    char new_state[STATE_SIZE];
+    memcpy(new_state, state, STATE_SIZE);
+
+    // Moves are applied without Python objects, let other threads run
+    char invalid = '\0';
+    int status = MOVE_OK;
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < list.count && status == MOVE_OK; i++) {
+        status = apply_move(new_state, list.moves[i], &invalid);
+    }
+    Py_END_ALLOW_THREADS
+    PyMem_Free(list.moves);
+
+    if (status != MOVE_OK) {
+        set_move_error(status, invalid);
+        return NULL;
+    }
+
+    return PyUnicode_FromStringAndSize(new_state, STATE_SIZE);
+}
+
+// Compose a sequence of moves into a single facelet permutation,
+// where facelet i of the new state comes from facelet permutation[i]
+static PyObject* compute_permutation(PyObject* self, PyObject* args) {
+    PyObject* moves;
+
+    if (!PyArg_ParseTuple(args, "O", &moves)) {
+        return NULL;
+    }
+
+    MoveList list = {NULL, 0, 0};
+    if (for_each_move(moves, append_move, &list) < 0) {
+        PyMem_Free(list.moves);
+        return NULL;
+    }
+
+    // Track facelet indexes instead of colors
+    char new_state[STATE_SIZE];
+    for (int i = 0; i < STATE_SIZE; i++) {
+        new_state[i] = (char)i;
+    }
+
+    // Moves are applied without Python objects, let other threads run
+    char invalid = '\0';
+    int status = MOVE_OK;
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < list.count && status == MOVE_OK; i++) {
+        status = apply_move(new_state, list.moves[i], &invalid);
+    }
+    Py_END_ALLOW_THREADS
+    PyMem_Free(list.moves);
+
+    if (status != MOVE_OK) {
+        set_move_error(status, invalid);
+        return NULL;
+    }
+
+    PyObject* permutation = PyList_New(STATE_SIZE);
+    if (permutation == NULL) {
+        return NULL;
+    }
+
+    for (int i = 0; i < STATE_SIZE; i++) {
+        PyObject* index = PyLong_FromLong((unsigned char)new_state[i]);
+        if (index == NULL) {
+            Py_DECREF(permutation);
             return NULL;
+        }
+        PyList_SET_ITEM(permutation, i, index);
     }
 
-    return PyUnicode_FromString(new_state);
+    return permutation;
 }
 
 // Module method definitions
 static PyMethodDef RotateMethods[] = {
     {"rotate_move", rotate_move, METH_VARARGS, "Rotate 3x3x3 cube state with given move"},
+    {"rotate_moves", rotate_moves, METH_VARARGS, "Rotate 3x3x3 cube state with a sequence of moves"},
+    {"compute_permutation", compute_permutation, METH_VARARGS, "Compose a sequence of moves into a 3x3x3 facelet permutation"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -13,6 +13,7 @@
  */
 
 #include <Python.h>
+#include <ctype.h>
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
@@ -21,6 +22,7 @@
 #define MAX_CUBE_SIZE 20
 #define MAX_STATE_SIZE (6 * MAX_CUBE_SIZE * MAX_CUBE_SIZE + 1)
 #define MAX_COORDS (MAX_CUBE_SIZE * MAX_CUBE_SIZE * MAX_CUBE_SIZE)
+#define MAX_MOVE_LENGTH 32
 
 // Compiler optimization hints
 #ifdef __GNUC__
@@ -579,34 +581,216 @@ static void build_coord_to_facelets_map(int size, CoordFacelets coord_facelets[M
 }
 
 /**
- * Main rotate_move function.
+ * Compute the scatter permutation of a move.
+ *
+ * Rotates every affected coordinate and maps its facelets to their new
+ * position, so that new_state[permutation[i]] = state[i].
+ *
+ * Returns:
+ *     0 on success, -1 if the move is a slice move on an even cube,
+ *     -2 on memory allocation failure
  */
-static PyObject* rotate_move(PyObject* self, PyObject* args, PyObject* kwargs) {
-    const char* state;
-    const char* move;
-    int size = 3;  // Default size
+static int compute_move_permutation(char base_move, int size, int* layers, int num_layers,
+                                    int axis, int direction, int num_rotations,
+                                    int* RESTRICT permutation) {
+    const int total_facelets = 6 * size * size;
 
-    static char* kwlist[] = {"state", "move", "size", NULL};
+    // Coordinate tables are large, keep them off the stack
+    Coord3D* affected_coords = malloc(sizeof(Coord3D) * MAX_COORDS);
+    CoordFacelets (*coord_facelets)[MAX_CUBE_SIZE][MAX_CUBE_SIZE] =
+        malloc(sizeof(CoordFacelets) * MAX_COORDS);
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "ss|i", kwlist, &state, &move, &size)) {
+    if (UNLIKELY(affected_coords == NULL || coord_facelets == NULL)) {
+        free(affected_coords);
+        free(coord_facelets);
+        return -2;
+    }
+
+    int num_affected = get_affected_coords(base_move, size, layers, num_layers, affected_coords);
+
+    if (num_affected < 0) {
+        free(affected_coords);
+        free(coord_facelets);
+        return -1;
+    }
+
+    build_coord_to_facelets_map(size, coord_facelets);
+
+    for (int i = 0; i < total_facelets; i++) {
+        permutation[i] = i;
+    }
+
+    // Apply rotations
+    for (int rot = 0; rot < num_rotations; rot++) {
+        int temp_perm[MAX_STATE_SIZE];
+
+        for (int i = 0; i < total_facelets; i++) {
+            temp_perm[i] = i;
+        }
+
+        // Rotate each affected coordinate
+        for (int i = 0; i < num_affected; i++) {
+            const Coord3D orig = affected_coords[i];
+            const Coord3D rotated = rotate_coord_90(orig, axis, size, direction);
+
+            CoordFacelets* RESTRICT orig_cf = &coord_facelets[orig.x][orig.y][orig.z];
+            CoordFacelets* RESTRICT new_cf = &coord_facelets[rotated.x][rotated.y][rotated.z];
+
+            const int num_axes = orig_cf->count;
+            if (UNLIKELY(num_axes != new_cf->count)) continue;
+
+            // Get original axes
+            int orig_axes[3];
+            for (int j = 0; j < num_axes; j++) {
+                orig_axes[j] = orig_cf->facelets[j].axis;
+            }
+
+            // Rotate axes
+            int rotated_axes[3];
+            rotate_piece_orientation(orig_axes, num_axes, axis, rotated_axes);
+
+            // Map each facelet to the facelet with the matching axis
+            for (int j = 0; j < num_axes; j++) {
+                const int orig_idx = orig_cf->facelets[j].facelet_idx;
+                const int target_axis = rotated_axes[j];
+
+                for (int k = 0; k < num_axes; k++) {
+                    if (new_cf->facelets[k].axis == target_axis) {
+                        temp_perm[orig_idx] = new_cf->facelets[k].facelet_idx;
+                        break;
+                    }
+                }
+            }
+        }
+
+        // Compose permutations
+        int composed[MAX_STATE_SIZE];
+        for (int i = 0; i < total_facelets; i++) {
+            composed[i] = temp_perm[permutation[i]];
+        }
+        memcpy(permutation, composed, total_facelets * sizeof(int));
+    }
+
+    free(affected_coords);
+    free(coord_facelets);
+
+    return 0;
+}
+
+/**
+ * Per-size permutation cache.
+ *
+ * Each distinct move (base move, turn amount and impacted layers) is
+ * computed once per cube size and stored as a gather table, so that
+ * new_state[i] = state[source[i]].
+ * Entries live for the lifetime of the module.
+ */
+#define CACHE_BUCKETS 64
+
+typedef struct CachedPermutation {
+    char base_move;
+    int amount;                       // 1 = clockwise, 2 = double, 3 = counter-clockwise
+    unsigned int layer_mask;
+    struct CachedPermutation* next;
+    int source[];                     // 6 * size * size entries
+} CachedPermutation;
+
+static CachedPermutation* permutation_cache[MAX_CUBE_SIZE + 1][CACHE_BUCKETS];
+
+INLINE unsigned int cache_bucket(char base_move, int amount, unsigned int layer_mask) {
+    unsigned int hash = (unsigned char)base_move * 31u + (unsigned int)amount;
+    hash = hash * 2654435761u ^ layer_mask * 40503u;
+    return (hash ^ (hash >> 16)) % CACHE_BUCKETS;
+}
+
+/**
+ * Get the gather table for a parsed move, computing it on first use.
+ *
+ * Sets a Python exception and returns NULL on error.
+ */
+static const int* get_move_source(char base_move, int size, int* layers, int num_layers,
+                                  int num_rotations, int counter_clockwise) {
+    // Get axis and direction
+    int axis, direction;
+    get_move_axis_and_direction(base_move, &axis, &direction);
+
+    if (axis < 0) {
+        PyErr_Format(PyExc_ValueError, "Unsupported move type: %c", base_move);
         return NULL;
     }
 
-    // Validate size
-    if (size < 2 || size > MAX_CUBE_SIZE) {
-        PyErr_Format(PyExc_ValueError, "Cube size must be between 2 and %d", MAX_CUBE_SIZE);
+    const int is_slice = (base_move == 'M' || base_move == 'E' || base_move == 'S');
+    const int is_rotation = (base_move == 'x' || base_move == 'y' || base_move == 'z');
+
+    if (is_slice && size % 2 == 0) {
+        PyErr_Format(PyExc_ValueError, "%c moves are only allowed on odd-sized cubes. Current cube size is %dx%dx%d.",
+                     base_move, size, size, size);
         return NULL;
     }
 
-    int state_len = strlen(state);
-    int expected_len = 6 * size * size;
-    if (state_len != expected_len) {
-        PyErr_Format(PyExc_ValueError, "State length %d doesn't match expected %d for size %d",
-                     state_len, expected_len, size);
+    // Slices and rotations ignore the layers, share a single entry
+    unsigned int layer_mask = 0;
+    if (!is_slice && !is_rotation) {
+        for (int i = 0; i < num_layers; i++) {
+            layer_mask |= 1u << layers[i];
+        }
+    }
+
+    const int amount = (num_rotations == 2) ? 2 : (counter_clockwise ? 3 : 1);
+    const unsigned int bucket = cache_bucket(base_move, amount, layer_mask);
+
+    for (CachedPermutation* entry = permutation_cache[size][bucket]; entry != NULL; entry = entry->next) {
+        if (entry->base_move == base_move && entry->amount == amount && entry->layer_mask == layer_mask) {
+            return entry->source;
+        }
+    }
+
+    const int total_facelets = 6 * size * size;
+    CachedPermutation* entry = malloc(sizeof(CachedPermutation) + total_facelets * sizeof(int));
+    if (entry == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    if (counter_clockwise) {
+        direction *= -1;
+    }
+
+    int permutation[MAX_STATE_SIZE];
+    int status = compute_move_permutation(base_move, size, layers, num_layers,
+                                          axis, direction, num_rotations, permutation);
+    if (status < 0) {
+        free(entry);
+        if (status == -2) {
+            PyErr_NoMemory();
+        }
+        else {
+            PyErr_Format(PyExc_ValueError, "%c moves are only allowed on odd-sized cubes. Current cube size is %dx%dx%d.",
+                         base_move, size, size, size);
+        }
         return NULL;
     }
 
-    // Parse move
+    // Invert the scatter permutation into a gather table
+    for (int i = 0; i < total_facelets; i++) {
+        entry->source[permutation[i]] = i;
+    }
+
+    entry->base_move = base_move;
+    entry->amount = amount;
+    entry->layer_mask = layer_mask;
+    entry->next = permutation_cache[size][bucket];
+    permutation_cache[size][bucket] = entry;
+
+    return entry->source;
+}
+
+/**
+ * Parse and validate a move, then return its gather table.
+ *
+ * Sets a Python exception and returns NULL on error.
+ */
+static const int* lookup_move(const char* move, int size) {
     char base_move;
     int layers[MAX_CUBE_SIZE];
     int num_rotations, counter_clockwise;
@@ -625,165 +809,284 @@ static PyObject* rotate_move(PyObject* self, PyObject* args, PyObject* kwargs) {
         }
     }
 
-    // Get axis and direction
-    int axis, base_direction;
-    get_move_axis_and_direction(base_move, &axis, &base_direction);
+    return get_move_source(base_move, size, layers, num_layers, num_rotations, counter_clockwise);
+}
 
-    if (axis < 0) {
-        PyErr_Format(PyExc_ValueError, "Unsupported move type: %c", base_move);
+/**
+ * Main rotate_move function.
+ */
+static PyObject* rotate_move(PyObject* self, PyObject* args, PyObject* kwargs) {
+    const char* state;
+    const char* move;
+    int size = 3;  // Default size
+
+    static char* kwlist[] = {"state", "move", "size", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "ss|i", kwlist, &state, &move, &size)) {
         return NULL;
     }
 
-    if (counter_clockwise) {
-        base_direction *= -1;
+    // Validate size
+    if (size < 2 || size > MAX_CUBE_SIZE) {
+        PyErr_Format(PyExc_ValueError, "Cube size must be between 2 and %d", MAX_CUBE_SIZE);
+        return NULL;
     }
 
-    // Get affected coordinates
-    Coord3D affected_coords[MAX_COORDS];
-    int num_affected = get_affected_coords(base_move, size, layers, num_layers, affected_coords);
+    int state_len = strlen(state);
+    int expected_len = 6 * size * size;
+    if (state_len != expected_len) {
+        PyErr_Format(PyExc_ValueError, "State length %d doesn't match expected %d for size %d",
+                     state_len, expected_len, size);
+        return NULL;
+    }
 
-    if (num_affected < 0) {
-        PyErr_Format(PyExc_ValueError, "%c moves are only allowed on odd-sized cubes. Current cube size is %dx%dx%d.",
-                     base_move, size, size, size);
+    const int* source = lookup_move(move, size);
+    if (source == NULL) {
         return NULL;
     }
 
-    // Build coordinate mappings
-    CoordFacelets coord_facelets[MAX_CUBE_SIZE][MAX_CUBE_SIZE][MAX_CUBE_SIZE];
-    build_coord_to_facelets_map(size, coord_facelets);
+    // Apply permutation to state with a single gather
+    char new_state[MAX_STATE_SIZE];
+    const char* RESTRICT state_read = state;
+    char* RESTRICT new_state_write = new_state;
 
-    // Initialize permutation (identity) - optimized
-    const int total_facelets = 6 * size * size;
-    int permutation[MAX_STATE_SIZE];
+    for (int i = 0; i < expected_len; i++) {
+        new_state_write[i] = state_read[source[i]];
+    }
+
+    return PyUnicode_FromStringAndSize(new_state, expected_len);
+}
+
+/**
+ * Gather tables of the moves collected from a sequence.
+ */
+typedef struct {
+    const int** sources;
+    Py_ssize_t count;
+    Py_ssize_t capacity;
+    int size;
+} MoveList;
+
+typedef int (*move_callback)(const char* move, Py_ssize_t length, void* context);
 
-    // Unrolled loop for common sizes
-    if (LIKELY(total_facelets == 54)) {  // 3x3x3
-        for (int i = 0; i < 54; i += 6) {
-            permutation[i] = i;
-            permutation[i+1] = i+1;
-            permutation[i+2] = i+2;
-            permutation[i+3] = i+3;
-            permutation[i+4] = i+4;
-            permutation[i+5] = i+5;
+/**
+ * Split a string on whitespace and call callback on each move.
+ */
+static int for_each_move_in_string(const char* moves, Py_ssize_t length,
+                                   move_callback callback, void* context) {
+    Py_ssize_t i = 0;
+
+    while (i < length) {
+        while (i < length && isspace((unsigned char)moves[i])) i++;
+        Py_ssize_t start = i;
+        while (i < length && !isspace((unsigned char)moves[i])) i++;
+
+        if (i > start && callback(moves + start, i - start, context) < 0) {
+            return -1;
         }
-    } else if (total_facelets == 24) {  // 2x2x2
-        for (int i = 0; i < 24; i += 4) {
-            permutation[i] = i;
-            permutation[i+1] = i+1;
-            permutation[i+2] = i+2;
-            permutation[i+3] = i+3;
+    }
+
+    return 0;
+}
+
+/**
+ * Call callback on each move of a sequence, either a string of
+ * space separated moves, or an iterable of moves.
+ */
+static int for_each_move(PyObject* moves, move_callback callback, void* context) {
+    Py_ssize_t length;
+
+    if (PyUnicode_Check(moves)) {
+        const char* data = PyUnicode_AsUTF8AndSize(moves, &length);
+        if (data == NULL) {
+            return -1;
         }
-    } else {
-        // Generic case
-        for (int i = 0; i < total_facelets; i++) {
-            permutation[i] = i;
+        return for_each_move_in_string(data, length, callback, context);
+    }
+
+    PyObject* iterator = PyObject_GetIter(moves);
+    if (iterator == NULL) {
+        return -1;
+    }
+
+    PyObject* item;
+    while ((item = PyIter_Next(iterator)) != NULL) {
+        PyObject* text = PyObject_Str(item);
+        Py_DECREF(item);
+        if (text == NULL) {
+            Py_DECREF(iterator);
+            return -1;
+        }
+
+        const char* data = PyUnicode_AsUTF8AndSize(text, &length);
+        int status = (data == NULL) ? -1 : for_each_move_in_string(data, length, callback, context);
+        Py_DECREF(text);
+
+        if (status < 0) {
+            Py_DECREF(iterator);
+            return -1;
         }
     }
+    Py_DECREF(iterator);
 
-    // Apply rotations
-    for (int rot = 0; rot < num_rotations; rot++) {
-        int temp_perm[MAX_STATE_SIZE];
+    return PyErr_Occurred() ? -1 : 0;
+}
 
-        // Initialize identity permutation - optimized for common sizes
-        if (LIKELY(total_facelets == 54)) {  // 3x3x3
-            for (int i = 0; i < 54; i += 6) {
-                temp_perm[i] = i;
-                temp_perm[i+1] = i+1;
-                temp_perm[i+2] = i+2;
-                temp_perm[i+3] = i+3;
-                temp_perm[i+4] = i+4;
-                temp_perm[i+5] = i+5;
-            }
-        } else if (total_facelets == 24) {  // 2x2x2
-            for (int i = 0; i < 24; i += 4) {
-                temp_perm[i] = i;
-                temp_perm[i+1] = i+1;
-                temp_perm[i+2] = i+2;
-                temp_perm[i+3] = i+3;
-            }
-        } else {
-            for (int i = 0; i < total_facelets; i++) {
-                temp_perm[i] = i;
-            }
+static int append_move(const char* move, Py_ssize_t length, void* context) {
+    MoveList* list = (MoveList*)context;
+
+    // Longer strings can not be valid moves, keep them for the error message
+    char buffer[MAX_MOVE_LENGTH];
+    Py_ssize_t kept = length < MAX_MOVE_LENGTH - 1 ? length : MAX_MOVE_LENGTH - 1;
+    memcpy(buffer, move, kept);
+    buffer[kept] = '\0';
+
+    if (length != kept) {
+        PyErr_Format(PyExc_ValueError, "Invalid move: %s", buffer);
+        return -1;
+    }
+
+    const int* source = lookup_move(buffer, list->size);
+    if (source == NULL) {
+        return -1;
+    }
+
+    if (list->count == list->capacity) {
+        Py_ssize_t capacity = list->capacity ? list->capacity * 2 : 64;
+        const int** sources = PyMem_Realloc(list->sources, capacity * sizeof(int*));
+        if (sources == NULL) {
+            PyErr_NoMemory();
+            return -1;
         }
+        list->sources = sources;
+        list->capacity = capacity;
+    }
 
-        // Rotate each affected coordinate
-        for (int i = 0; i < num_affected; i++) {
-            const Coord3D orig = affected_coords[i];
-            const Coord3D rotated = rotate_coord_90(orig, axis, size, base_direction);
+    list->sources[list->count++] = source;
 
-            CoordFacelets* RESTRICT orig_cf = &coord_facelets[orig.x][orig.y][orig.z];
-            CoordFacelets* RESTRICT new_cf = &coord_facelets[rotated.x][rotated.y][rotated.z];
+    return 0;
+}
 
-            const int num_axes = orig_cf->count;
-            if (UNLIKELY(num_axes != new_cf->count)) continue;
+/**
+ * Apply a whole sequence of moves and return the final state.
+ */
+static PyObject* rotate_moves(PyObject* self, PyObject* args, PyObject* kwargs) {
+    const char* state;
+    PyObject* moves;
+    int size = 3;  // Default size
 
-            // Get original axes
-            int orig_axes[3];
-            for (int j = 0; j < num_axes; j++) {
-                orig_axes[j] = orig_cf->facelets[j].axis;
-            }
+    static char* kwlist[] = {"state", "moves", "size", NULL};
 
-            // Rotate axes
-            int rotated_axes[3];
-            rotate_piece_orientation(orig_axes, num_axes, axis, rotated_axes);
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "sO|i", kwlist, &state, &moves, &size)) {
+        return NULL;
+    }
 
-            // Map facelets - optimized for common cases (1-3 facelets)
-            if (LIKELY(num_axes == 2)) {
-                // Edge piece (most common case for 3x3x3)
-                const int orig_idx0 = orig_cf->facelets[0].facelet_idx;
-                const int orig_idx1 = orig_cf->facelets[1].facelet_idx;
-                const int target_axis0 = rotated_axes[0];
-                const int target_axis1 = rotated_axes[1];
-
-                if (new_cf->facelets[0].axis == target_axis0) {
-                    temp_perm[orig_idx0] = new_cf->facelets[0].facelet_idx;
-                    temp_perm[orig_idx1] = new_cf->facelets[1].facelet_idx;
-                } else {
-                    temp_perm[orig_idx0] = new_cf->facelets[1].facelet_idx;
-                    temp_perm[orig_idx1] = new_cf->facelets[0].facelet_idx;
-                }
-            } else {
-                // Corner (3) or center (1) - less common
-                for (int j = 0; j < num_axes; j++) {
-                    const int orig_idx = orig_cf->facelets[j].facelet_idx;
-                    const int target_axis = rotated_axes[j];
-
-                    // Find matching axis in new position
-                    for (int k = 0; k < num_axes; k++) {
-                        if (new_cf->facelets[k].axis == target_axis) {
-                            temp_perm[orig_idx] = new_cf->facelets[k].facelet_idx;
-                            break;
-                        }
-                    }
-                }
-            }
+    // Validate size
+    if (size < 2 || size > MAX_CUBE_SIZE) {
+        PyErr_Format(PyExc_ValueError, "Cube size must be between 2 and %d", MAX_CUBE_SIZE);
+        return NULL;
+    }
+
+    int state_len = strlen(state);
+    int expected_len = 6 * size * size;
+    if (state_len != expected_len) {
+        PyErr_Format(PyExc_ValueError, "State length %d doesn't match expected %d for size %d",
+                     state_len, expected_len, size);
+        return NULL;
+    }
+
+    MoveList list = {NULL, 0, 0, size};
+    if (for_each_move(moves, append_move, &list) < 0) {
+        PyMem_Free(list.sources);
+        return NULL;
+    }
+
+    // Gather back and forth between two buffers
+    char buffers[2][MAX_STATE_SIZE];
+    memcpy(buffers[0], state, expected_len);
+    int current = 0;
+
+    // Cached tables are never freed, let other threads run while gathering
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t m = 0; m < list.count; m++) {
+        const int* RESTRICT source = list.sources[m];
+        const char* RESTRICT state_read = buffers[current];
+        char* RESTRICT new_state_write = buffers[1 - current];
+
+        for (int i = 0; i < expected_len; i++) {
+            new_state_write[i] = state_read[source[i]];
         }
+        current = 1 - current;
+    }
+    Py_END_ALLOW_THREADS
+    PyMem_Free(list.sources);
 
-        // Compose permutations - use direct assignment for better performance
-        int composed[MAX_STATE_SIZE];
-        const int* RESTRICT perm_read = permutation;
-        const int* RESTRICT temp_read = temp_perm;
-        int* RESTRICT comp_write = composed;
+    return PyUnicode_FromStringAndSize(buffers[current], expected_len);
+}
+
+/**
+ * Compose a sequence of moves into a single facelet permutation,
+ * where facelet i of the new state comes from facelet permutation[i].
+ */
+static PyObject* compute_permutation(PyObject* self, PyObject* args, PyObject* kwargs) {
+    PyObject* moves;
+    int size = 3;  // Default size
+
+    static char* kwlist[] = {"moves", "size", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|i", kwlist, &moves, &size)) {
+        return NULL;
+    }
+
+    // Validate size
+    if (size < 2 || size > MAX_CUBE_SIZE) {
+        PyErr_Format(PyExc_ValueError, "Cube size must be between 2 and %d", MAX_CUBE_SIZE);
+        return NULL;
+    }
+
+    MoveList list = {NULL, 0, 0, size};
+    if (for_each_move(moves, append_move, &list) < 0) {
+        PyMem_Free(list.sources);
+        return NULL;
+    }
+
+    const int total_facelets = 6 * size * size;
+    int buffers[2][MAX_STATE_SIZE];
+    for (int i = 0; i < total_facelets; i++) {
+        buffers[0][i] = i;
+    }
+    int current = 0;
+
+    // Compose the gather tables back and forth between two buffers
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t m = 0; m < list.count; m++) {
+        const int* RESTRICT source = list.sources[m];
+        const int* RESTRICT permutation_read = buffers[current];
+        int* RESTRICT permutation_write = buffers[1 - current];
 
         for (int i = 0; i < total_facelets; i++) {
-            comp_write[i] = temp_read[perm_read[i]];
+            permutation_write[i] = permutation_read[source[i]];
         }
-        memcpy(permutation, composed, total_facelets * sizeof(int));
+        current = 1 - current;
     }
+    Py_END_ALLOW_THREADS
+    PyMem_Free(list.sources);
 
-    // Apply permutation to state - optimized with restrict pointers
-    char new_state[MAX_STATE_SIZE];
-    const char* RESTRICT state_read = state;
-    char* RESTRICT new_state_write = new_state;
-    const int* RESTRICT perm_read = permutation;
+    PyObject* permutation = PyList_New(total_facelets);
+    if (permutation == NULL) {
+        return NULL;
+    }
 
     for (int i = 0; i < total_facelets; i++) {
-        new_state_write[perm_read[i]] = state_read[i];
+        PyObject* index = PyLong_FromLong(buffers[current][i]);
+        if (index == NULL) {
+            Py_DECREF(permutation);
+            return NULL;
+        }
+        PyList_SET_ITEM(permutation, i, index);
     }
-    new_state_write[total_facelets] = '\0';
 
-    return PyUnicode_FromString(new_state);
+    return permutation;
 }
 
 // Method definitions
@@ -796,6 +1099,22 @@ static PyMethodDef RotateDynamicMethods[] = {
      "    size: Size of the cube (default 3)\n\n"
      "Returns:\n"
      "    New cube state after applying the move"},
+    {"rotate_moves", (PyCFunction)rotate_moves, METH_VARARGS | METH_KEYWORDS,
+     "Apply a sequence of moves to a cube state.\n\n"
+     "Args:\n"
+     "    state: Current cube state as facelet string\n"
+     "    moves: Space separated moves string, or iterable of moves\n"
+     "    size: Size of the cube (default 3)\n\n"
+     "Returns:\n"
+     "    New cube state after applying all the moves"},
+    {"compute_permutation", (PyCFunction)compute_permutation, METH_VARARGS | METH_KEYWORDS,
+     "Compose a sequence of moves into a single facelet permutation.\n\n"
+     "Args:\n"
+     "    moves: Space separated moves string, or iterable of moves\n"
+     "    size: Size of the cube (default 3)\n\n"
+     "Returns:\n"
+     "    List of indexes, facelet i of the new state comes from\n"
+     "    facelet permutation[i] of the previous state"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -1,2 +1,11 @@
+from collections import UserString
+from collections.abc import Iterable
+
 def rotate_move(state: str, move: str, size: int) -> str:
     ...
+def rotate_moves(state: str, moves: str | Iterable[str | UserString],
+                 size: int) -> str:
+    ...
+def compute_permutation(moves: str | Iterable[str | UserString],
+                        size: int) -> list[int]:
+    ...
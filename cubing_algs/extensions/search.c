@@ -0,0 +1,1013 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+#define EMPTY 255
+#define MAX_DEPTH 64
+
+#define FACE_MOVES 18
+#define CORNER_COUNT 8
+#define EDGE_COUNT 12
+#define SLICE_EDGES 8
+#define TWIST_COUNT 2187
+#define FLIP_COUNT 2048
+#define SLICE_COUNT 495
+#define PERMUTATION_COUNT 40320
+#define SLICE_PERMUTATION_COUNT 24
+#define PHASE2_MOVES 10
+#define TWO_PHASE_TABLES 10
+
+#define GROUP_COUNT 5
+#define CORNER_GROUPS 2
+#define MAX_GENERATORS 27
+
+#define SEARCH_FOUND 1
+#define SEARCH_NONE 0
+#define SEARCH_ERROR -1
+#define SEARCH_INTERRUPTED -4
+
+// Nodes searched between two checks of the signals
+#define SIGNAL_INTERVAL (1 << 20)
+
+/**
+ * Get a read-only view of a table, checking the typecode of its items
+ * among accepted ones, and its number of items unless length is -1.
+ */
+static int get_table(PyObject* object, Py_buffer* view, const char* accepted,
+                     Py_ssize_t length, const char* name) {
+    if (PyObject_GetBuffer(object, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        return -1;
+    }
+
+    const char* format = view->format == NULL ? "B" : view->format;
+    if (format[0] == '@') {
+        format++;
+    }
+
+    Py_ssize_t itemsize = format[0] == 'B' ? 1 : format[0] == 'H' ? 2 : 4;
+    if (format[0] == '\0' || format[1] != '\0'
+            || strchr(accepted, format[0]) == NULL
+            || view->itemsize != itemsize) {
+        PyErr_Format(PyExc_TypeError, "The %s table must hold items of typecode %s",
+                     name, accepted);
+        PyBuffer_Release(view);
+        return -1;
+    }
+
+    if (length >= 0 && view->len != length * itemsize) {
+        PyErr_Format(PyExc_ValueError, "The %s table must have %zd items",
+                     name, length);
+        PyBuffer_Release(view);
+        return -1;
+    }
+
+    return 0;
+}
+
+/**
+ * Read an item of a table of typecode B, H or I.
+ */
+static inline Py_ssize_t table_item(const Py_buffer* view, Py_ssize_t index) {
+    switch (view->itemsize) {
+        case 1: return ((const uint8_t*)view->buf)[index];
+        case 2: return ((const uint16_t*)view->buf)[index];
+        default: return ((const uint32_t*)view->buf)[index];
+    }
+}
+
+/**
+ * Fill a distance table breadth first, from the entries already at 0.
+ *
+ * The entries at each depth are found by scanning the table,
+ * which needs no frontier and is fast enough for a few million entries.
+ * Returns -1 if a move table leads out of the table.
+ */
+static int fill_distances(uint8_t* table, Py_ssize_t size,
+                          const Py_buffer* moves_a, const Py_buffer* moves_b,
+                          Py_ssize_t count_b, Py_ssize_t moves_count,
+                          Py_ssize_t stride) {
+    Py_ssize_t count_a = size / count_b;
+
+    for (int depth = 0; depth < EMPTY - 1; depth++) {
+        int found = 0;
+
+        for (Py_ssize_t index = 0; index < size; index++) {
+            if (table[index] != depth) {
+                continue;
+            }
+
+            Py_ssize_t row_a = (index / count_b) * stride;
+            Py_ssize_t row_b = (index % count_b) * stride;
+            for (Py_ssize_t move = 0; move < moves_count; move++) {
+                Py_ssize_t a = table_item(moves_a, row_a + move);
+                Py_ssize_t b = moves_b == NULL ? 0 : table_item(moves_b, row_b + move);
+                if (a >= count_a || b >= count_b) {
+                    return -1;
+                }
+
+                Py_ssize_t moved = a * count_b + b;
+                if (table[moved] == EMPTY) {
+                    table[moved] = (uint8_t)(depth + 1);
+                    found = 1;
+                }
+            }
+        }
+
+        if (!found) {
+            break;
+        }
+    }
+
+    return 0;
+}
+
+/**
+ * Build the distance table of a pair of coordinates, from the solved pair.
+ */
+static PyObject* pair_distances(PyObject* self, PyObject* args) {
+    PyObject* moves_a_object;
+    PyObject* moves_b_object;
+    Py_ssize_t count_b;
+    Py_ssize_t moves_count;
+
+    if (!PyArg_ParseTuple(args, "OOnn", &moves_a_object, &moves_b_object,
+                          &count_b, &moves_count)) {
+        return NULL;
+    }
+
+    if (count_b < 1 || moves_count < 1) {
+        PyErr_SetString(PyExc_ValueError, "The counts must be positive");
+        return NULL;
+    }
+
+    Py_buffer moves_a;
+    Py_buffer moves_b;
+    if (get_table(moves_a_object, &moves_a, "HI", -1, "first move") < 0) {
+        return NULL;
+    }
+    if (get_table(moves_b_object, &moves_b, "HI", count_b * moves_count,
+                  "second move") < 0) {
+        PyBuffer_Release(&moves_a);
+        return NULL;
+    }
+
+    if (moves_a.len / moves_a.itemsize % moves_count) {
+        PyErr_SetString(PyExc_ValueError, "The first move table must have rows of all the moves");
+        PyBuffer_Release(&moves_a);
+        PyBuffer_Release(&moves_b);
+        return NULL;
+    }
+
+    Py_ssize_t size = moves_a.len / moves_a.itemsize / moves_count * count_b;
+    PyObject* table = PyByteArray_FromStringAndSize(NULL, size);
+    if (table == NULL || size == 0) {
+        PyBuffer_Release(&moves_a);
+        PyBuffer_Release(&moves_b);
+        return table;
+    }
+
+    uint8_t* items = (uint8_t*)PyByteArray_AS_STRING(table);
+    int status;
+
+    // The new table is not shared yet, let other threads run
+    Py_BEGIN_ALLOW_THREADS
+    memset(items, EMPTY, size);
+    items[0] = 0;
+    status = fill_distances(items, size, &moves_a, &moves_b,
+                            count_b, moves_count, moves_count);
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&moves_a);
+    PyBuffer_Release(&moves_b);
+
+    if (status < 0) {
+        Py_DECREF(table);
+        PyErr_SetString(PyExc_ValueError, "The move tables lead out of the table");
+        return NULL;
+    }
+
+    return table;
+}
+
+/**
+ * Build the distance table of a coordinate, from its goal coordinates.
+ */
+static PyObject* goal_distances(PyObject* self, PyObject* args) {
+    PyObject* moves_object;
+    Py_ssize_t stride;
+    Py_ssize_t moves_count;
+    PyObject* sources;
+
+    if (!PyArg_ParseTuple(args, "OnnO", &moves_object, &stride,
+                          &moves_count, &sources)) {
+        return NULL;
+    }
+
+    if (moves_count < 1 || stride < moves_count) {
+        PyErr_SetString(PyExc_ValueError,
+                        "The stride must be at least the positive number of moves");
+        return NULL;
+    }
+
+    Py_buffer moves;
+    if (get_table(moves_object, &moves, "HI", -1, "move") < 0) {
+        return NULL;
+    }
+
+    if (moves.len / moves.itemsize % stride) {
+        PyErr_SetString(PyExc_ValueError, "The move table must have rows of stride items");
+        PyBuffer_Release(&moves);
+        return NULL;
+    }
+
+    Py_ssize_t size = moves.len / moves.itemsize / stride;
+    PyObject* table = PyByteArray_FromStringAndSize(NULL, size);
+    if (table == NULL) {
+        PyBuffer_Release(&moves);
+        return NULL;
+    }
+
+    uint8_t* items = (uint8_t*)PyByteArray_AS_STRING(table);
+    memset(items, EMPTY, size);
+
+    PyObject* iterator = PyObject_GetIter(sources);
+    if (iterator == NULL) {
+        goto error;
+    }
+
+    PyObject* source;
+    while ((source = PyIter_Next(iterator)) != NULL) {
+        Py_ssize_t index = PyLong_AsSsize_t(source);
+        Py_DECREF(source);
+        if (index == -1 && PyErr_Occurred()) {
+            Py_DECREF(iterator);
+            goto error;
+        }
+        if (index < 0 || index >= size) {
+            Py_DECREF(iterator);
+            PyErr_SetString(PyExc_IndexError, "source index out of range");
+            goto error;
+        }
+        items[index] = 0;
+    }
+    Py_DECREF(iterator);
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+
+    int status;
+    Py_BEGIN_ALLOW_THREADS
+    status = fill_distances(items, size, &moves, NULL, 1, moves_count, stride);
+    Py_END_ALLOW_THREADS
+
+    if (status < 0) {
+        PyErr_SetString(PyExc_ValueError, "The move table leads out of the table");
+        goto error;
+    }
+
+    PyBuffer_Release(&moves);
+    return table;
+
+error:
+    PyBuffer_Release(&moves);
+    Py_DECREF(table);
+    return NULL;
+}
+
+/**
+ * Tables and state of the two-phase search.
+ */
+typedef struct {
+    const uint16_t* twist_moves;
+    const uint16_t* flip_moves;
+    const uint16_t* slice_moves;
+    const uint16_t* corner_moves;
+    const uint16_t* edge_moves;
+    const uint16_t* slice_permutation_moves;
+    const uint8_t* twist_slice_pruning;
+    const uint8_t* flip_slice_pruning;
+    const uint8_t* corner_slice_pruning;
+    const uint8_t* edge_slice_pruning;
+    const uint8_t* corners;
+    const uint8_t* edges;
+    const uint8_t* corner_permutations;
+    const uint8_t* edge_permutations;
+    const uint8_t* phase2_moves;
+    int phase2_move[FACE_MOVES];
+    int max_length;
+    int phase1[MAX_DEPTH];
+    int phase1_length;
+    int phase2[MAX_DEPTH];
+    int phase2_length;
+    Py_ssize_t nodes;
+} TwoPhaseSearch;
+
+/**
+ * Count a searched node, taking the GIL back every SIGNAL_INTERVAL
+ * nodes to run the signal handlers, so a search can be interrupted.
+ *
+ * Returns 0, or -1 with the exception set if a handler raised.
+ */
+static int count_node(Py_ssize_t* nodes) {
+    if (++*nodes % SIGNAL_INTERVAL) {
+        return 0;
+    }
+
+    PyGILState_STATE state = PyGILState_Ensure();
+    int status = PyErr_CheckSignals();
+    PyGILState_Release(state);
+
+    return status;
+}
+
+/**
+ * Rank a permutation of distinct values in lexicographic order.
+ */
+static int permutation_coordinate(const int* permutation, int size) {
+    int coordinate = 0;
+
+    for (int i = 0; i < size; i++) {
+        int smaller = 0;
+        for (int j = i + 1; j < size; j++) {
+            smaller += permutation[j] < permutation[i];
+        }
+        coordinate = coordinate * (size - i) + smaller;
+    }
+
+    return coordinate;
+}
+
+static int search_phase2(TwoPhaseSearch* search, int corner, int edge,
+                         int slice_permutation, int depth, int last_face) {
+    if (count_node(&search->nodes) < 0) {
+        return SEARCH_INTERRUPTED;
+    }
+
+    if (depth == 0) {
+        return corner || edge || slice_permutation ? SEARCH_NONE : SEARCH_FOUND;
+    }
+
+    const uint16_t* corner_row = search->corner_moves + corner * PHASE2_MOVES;
+    const uint16_t* edge_row = search->edge_moves + edge * PHASE2_MOVES;
+    const uint16_t* slice_row = search->slice_permutation_moves
+        + slice_permutation * PHASE2_MOVES;
+
+    for (int position = 0; position < PHASE2_MOVES; position++) {
+        int move = search->phase2_moves[position];
+        int face = move / 3;
+        if (face == last_face || face == last_face - 3) {
+            continue;
+        }
+
+        int moved_slice = slice_row[position];
+        int moved_corner = corner_row[position];
+        if (moved_slice >= SLICE_PERMUTATION_COUNT || moved_corner >= PERMUTATION_COUNT) {
+            return SEARCH_ERROR;
+        }
+        if (search->corner_slice_pruning[
+                moved_corner * SLICE_PERMUTATION_COUNT + moved_slice] >= depth) {
+            continue;
+        }
+
+        int moved_edge = edge_row[position];
+        if (moved_edge >= PERMUTATION_COUNT) {
+            return SEARCH_ERROR;
+        }
+        if (search->edge_slice_pruning[
+                moved_edge * SLICE_PERMUTATION_COUNT + moved_slice] >= depth) {
+            continue;
+        }
+
+        search->phase2[search->phase2_length++] = move;
+        int status = search_phase2(search, moved_corner, moved_edge,
+                                   moved_slice, depth - 1, face);
+        if (status != SEARCH_NONE) {
+            return status;
+        }
+        search->phase2_length--;
+    }
+
+    return SEARCH_NONE;
+}
+
+/**
+ * Search the shortest phase 2 solution after the phase 1 moves.
+ */
+static int start_phase2(TwoPhaseSearch* search) {
+    int corners[CORNER_COUNT];
+    int edges[EDGE_COUNT];
+    int moved[EDGE_COUNT];
+
+    for (int i = 0; i < CORNER_COUNT; i++) {
+        corners[i] = search->corners[i];
+    }
+    for (int i = 0; i < EDGE_COUNT; i++) {
+        edges[i] = search->edges[i];
+    }
+
+    for (int m = 0; m < search->phase1_length; m++) {
+        const uint8_t* corner_permutation =
+            search->corner_permutations + search->phase1[m] * CORNER_COUNT;
+        const uint8_t* edge_permutation =
+            search->edge_permutations + search->phase1[m] * EDGE_COUNT;
+
+        for (int i = 0; i < CORNER_COUNT; i++) {
+            moved[i] = corners[corner_permutation[i]];
+        }
+        memcpy(corners, moved, sizeof(corners));
+        for (int i = 0; i < EDGE_COUNT; i++) {
+            moved[i] = edges[edge_permutation[i]];
+        }
+        memcpy(edges, moved, sizeof(edges));
+    }
+
+    // Ranks stay below the number of permutations, even if the state is wrong
+    int corner = permutation_coordinate(corners, CORNER_COUNT);
+    int edge = permutation_coordinate(edges, SLICE_EDGES);
+    int slice_permutation = permutation_coordinate(
+        edges + SLICE_EDGES, EDGE_COUNT - SLICE_EDGES);
+
+    int corner_distance = search->corner_slice_pruning[
+        corner * SLICE_PERMUTATION_COUNT + slice_permutation];
+    int edge_distance = search->edge_slice_pruning[
+        edge * SLICE_PERMUTATION_COUNT + slice_permutation];
+    int distance = corner_distance > edge_distance ? corner_distance : edge_distance;
+
+    for (int depth = distance; depth <= search->max_length - search->phase1_length; depth++) {
+        // Phase 2 may start on the face ending phase 1, merging them
+        search->phase2_length = 0;
+        int status = search_phase2(search, corner, edge, slice_permutation, depth, -1);
+        if (status != SEARCH_NONE) {
+            return status;
+        }
+    }
+
+    return SEARCH_NONE;
+}
+
+static int search_phase1(TwoPhaseSearch* search, int twist, int flip,
+                         int slice, int depth, int last_face) {
+    if (count_node(&search->nodes) < 0) {
+        return SEARCH_INTERRUPTED;
+    }
+
+    if (depth == 0) {
+        // Solutions ending by a phase 2 move were already tried shorter
+        if (search->phase1_length
+                && search->phase2_move[search->phase1[search->phase1_length - 1]]) {
+            return SEARCH_NONE;
+        }
+        return start_phase2(search);
+    }
+
+    const uint16_t* twist_row = search->twist_moves + twist * FACE_MOVES;
+    const uint16_t* flip_row = search->flip_moves + flip * FACE_MOVES;
+    const uint16_t* slice_row = search->slice_moves + slice * FACE_MOVES;
+
+    for (int move = 0; move < FACE_MOVES; move++) {
+        int face = move / 3;
+        if (face == last_face || face == last_face - 3) {
+            continue;
+        }
+
+        int moved_slice = slice_row[move];
+        int moved_twist = twist_row[move];
+        if (moved_slice >= SLICE_COUNT || moved_twist >= TWIST_COUNT) {
+            return SEARCH_ERROR;
+        }
+        if (search->twist_slice_pruning[moved_twist * SLICE_COUNT + moved_slice] >= depth) {
+            continue;
+        }
+
+        int moved_flip = flip_row[move];
+        if (moved_flip >= FLIP_COUNT) {
+            return SEARCH_ERROR;
+        }
+        if (search->flip_slice_pruning[moved_flip * SLICE_COUNT + moved_slice] >= depth) {
+            continue;
+        }
+
+        search->phase1[search->phase1_length++] = move;
+        int status = search_phase1(search, moved_twist, moved_flip,
+                                   moved_slice, depth - 1, face);
+        if (status != SEARCH_NONE) {
+            return status;
+        }
+        search->phase1_length--;
+    }
+
+    return SEARCH_NONE;
+}
+
+/**
+ * Build a list of Python integers from C integers.
+ */
+static PyObject* int_list(const int* values, int count) {
+    PyObject* list = PyList_New(count);
+    if (list == NULL) {
+        return NULL;
+    }
+
+    for (int i = 0; i < count; i++) {
+        PyObject* value = PyLong_FromLong(values[i]);
+        if (value == NULL) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyList_SET_ITEM(list, i, value);
+    }
+
+    return list;
+}
+
+/**
+ * Check that the bytes of a permutation table are below a count.
+ */
+static int check_values(const char* values, Py_ssize_t length,
+                        Py_ssize_t expected, int count, const char* name) {
+    if (length != expected) {
+        PyErr_Format(PyExc_ValueError, "The %s must have %zd items", name, expected);
+        return -1;
+    }
+
+    for (Py_ssize_t i = 0; i < length; i++) {
+        if ((uint8_t)values[i] >= count) {
+            PyErr_Format(PyExc_ValueError, "The %s must be below %d", name, count);
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+/**
+ * Search a two-phase solution, returning the moves of both phases.
+ */
+static PyObject* two_phase(PyObject* self, PyObject* args) {
+    static const char* names[TWO_PHASE_TABLES] = {
+        "twist move", "flip move", "slice move",
+        "corner move", "edge move", "slice permutation move",
+        "twist slice pruning", "flip slice pruning",
+        "corner slice pruning", "edge slice pruning",
+    };
+    static const Py_ssize_t lengths[TWO_PHASE_TABLES] = {
+        TWIST_COUNT * FACE_MOVES, FLIP_COUNT * FACE_MOVES, SLICE_COUNT * FACE_MOVES,
+        PERMUTATION_COUNT * PHASE2_MOVES, PERMUTATION_COUNT * PHASE2_MOVES,
+        SLICE_PERMUTATION_COUNT * PHASE2_MOVES,
+        TWIST_COUNT * SLICE_COUNT, FLIP_COUNT * SLICE_COUNT,
+        PERMUTATION_COUNT * SLICE_PERMUTATION_COUNT,
+        PERMUTATION_COUNT * SLICE_PERMUTATION_COUNT,
+    };
+
+    PyObject* tables;
+    int twist, flip, slice, max_length;
+    const char *corners, *edges, *corner_permutations, *edge_permutations, *phase2_moves;
+    Py_ssize_t corners_length, edges_length, corner_permutations_length,
+        edge_permutations_length, phase2_moves_length;
+
+    if (!PyArg_ParseTuple(args, "Oiiiy#y#y#y#y#i", &tables, &twist, &flip, &slice,
+                          &corners, &corners_length, &edges, &edges_length,
+                          &corner_permutations, &corner_permutations_length,
+                          &edge_permutations, &edge_permutations_length,
+                          &phase2_moves, &phase2_moves_length, &max_length)) {
+        return NULL;
+    }
+
+    if (twist < 0 || twist >= TWIST_COUNT || flip < 0 || flip >= FLIP_COUNT
+            || slice < 0 || slice >= SLICE_COUNT) {
+        PyErr_SetString(PyExc_ValueError, "Phase 1 coordinate out of range");
+        return NULL;
+    }
+
+    if (check_values(corners, corners_length, CORNER_COUNT, CORNER_COUNT, "corners") < 0
+            || check_values(edges, edges_length, EDGE_COUNT, EDGE_COUNT, "edges") < 0
+            || check_values(corner_permutations, corner_permutations_length,
+                            FACE_MOVES * CORNER_COUNT, CORNER_COUNT,
+                            "corner permutations") < 0
+            || check_values(edge_permutations, edge_permutations_length,
+                            FACE_MOVES * EDGE_COUNT, EDGE_COUNT,
+                            "edge permutations") < 0
+            || check_values(phase2_moves, phase2_moves_length,
+                            PHASE2_MOVES, FACE_MOVES, "phase 2 moves") < 0) {
+        return NULL;
+    }
+
+    PyObject* sequence = PySequence_Fast(tables, "The tables must be a sequence");
+    if (sequence == NULL) {
+        return NULL;
+    }
+    if (PySequence_Fast_GET_SIZE(sequence) != TWO_PHASE_TABLES) {
+        PyErr_Format(PyExc_ValueError, "The tables must be %d tables", TWO_PHASE_TABLES);
+        Py_DECREF(sequence);
+        return NULL;
+    }
+
+    Py_buffer views[TWO_PHASE_TABLES];
+    int loaded = 0;
+    for (; loaded < TWO_PHASE_TABLES; loaded++) {
+        if (get_table(PySequence_Fast_GET_ITEM(sequence, loaded), &views[loaded],
+                      loaded < 6 ? "H" : "B", lengths[loaded], names[loaded]) < 0) {
+            break;
+        }
+    }
+    Py_DECREF(sequence);
+
+    PyObject* result = NULL;
+    if (loaded < TWO_PHASE_TABLES) {
+        goto release;
+    }
+
+    TwoPhaseSearch search = {
+        .twist_moves = views[0].buf,
+        .flip_moves = views[1].buf,
+        .slice_moves = views[2].buf,
+        .corner_moves = views[3].buf,
+        .edge_moves = views[4].buf,
+        .slice_permutation_moves = views[5].buf,
+        .twist_slice_pruning = views[6].buf,
+        .flip_slice_pruning = views[7].buf,
+        .corner_slice_pruning = views[8].buf,
+        .edge_slice_pruning = views[9].buf,
+        .corners = (const uint8_t*)corners,
+        .edges = (const uint8_t*)edges,
+        .corner_permutations = (const uint8_t*)corner_permutations,
+        .edge_permutations = (const uint8_t*)edge_permutations,
+        .phase2_moves = (const uint8_t*)phase2_moves,
+        // Solutions are found well below, longer ones are never searched
+        .max_length = max_length < MAX_DEPTH ? max_length : MAX_DEPTH,
+    };
+    for (int i = 0; i < PHASE2_MOVES; i++) {
+        search.phase2_move[search.phase2_moves[i]] = 1;
+    }
+
+    int distance = search.twist_slice_pruning[twist * SLICE_COUNT + slice];
+    if (search.flip_slice_pruning[flip * SLICE_COUNT + slice] > distance) {
+        distance = search.flip_slice_pruning[flip * SLICE_COUNT + slice];
+    }
+
+    int status = SEARCH_NONE;
+    Py_BEGIN_ALLOW_THREADS
+    for (int depth = distance; depth <= search.max_length && status == SEARCH_NONE; depth++) {
+        search.phase1_length = 0;
+        status = search_phase1(&search, twist, flip, slice, depth, -1);
+    }
+    Py_END_ALLOW_THREADS
+
+    if (status == SEARCH_ERROR) {
+        PyErr_SetString(PyExc_ValueError, "The move tables lead out of the tables");
+    }
+    else if (status == SEARCH_NONE) {
+        result = Py_NewRef(Py_None);
+    }
+    else if (status == SEARCH_FOUND) {
+        PyObject* phase1 = int_list(search.phase1, search.phase1_length);
+        PyObject* phase2 = int_list(search.phase2, search.phase2_length);
+        if (phase1 != NULL && phase2 != NULL) {
+            result = PyTuple_Pack(2, phase1, phase2);
+        }
+        Py_XDECREF(phase1);
+        Py_XDECREF(phase2);
+    }
+
+release:
+    for (int i = 0; i < loaded; i++) {
+        PyBuffer_Release(&views[i]);
+    }
+
+    return result;
+}
+
+/**
+ * Tables and state of the search of a last layer case.
+ */
+typedef struct {
+    const uint32_t* moves[GROUP_COUNT];
+    Py_ssize_t counts[GROUP_COUNT];
+    const uint8_t* pruning[GROUP_COUNT];
+    Py_ssize_t stride;
+    const uint8_t* frame_moves;
+    Py_ssize_t move_count;
+    const uint8_t* successors;
+    const uint32_t* goals;
+    Py_ssize_t goal_count;
+    Py_ssize_t max_nodes;
+    Py_ssize_t nodes;
+    int depth;
+    int path[MAX_DEPTH];
+    int length;
+    int* solutions;
+    Py_ssize_t solution_count;
+    Py_ssize_t capacity;
+} LastLayerSearch;
+
+#define SEARCH_MEMORY -2
+#define SEARCH_EXHAUSTED -3
+
+/**
+ * Check if the U corners and U edges are a goal pair.
+ */
+static int is_goal(const LastLayerSearch* search, const uint32_t* coordinates) {
+    for (int g = 0; g < GROUP_COUNT; g++) {
+        if (search->pruning[g][coordinates[g]]) {
+            return 0;
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < search->goal_count; i++) {
+        if (search->goals[2 * i] == coordinates[0]
+                && search->goals[2 * i + 1] == coordinates[2]) {
+            return 1;
+        }
+    }
+
+    return 0;
+}
+
+/**
+ * Append the path to the solutions, without the GIL.
+ */
+static int record_path(LastLayerSearch* search) {
+    if (search->solution_count == search->capacity) {
+        Py_ssize_t capacity = search->capacity ? search->capacity * 2 : 64;
+        int* solutions = PyMem_RawRealloc(
+            search->solutions, capacity * search->depth * sizeof(int));
+        if (solutions == NULL) {
+            return SEARCH_MEMORY;
+        }
+        search->solutions = solutions;
+        search->capacity = capacity;
+    }
+
+    memcpy(search->solutions + search->solution_count * search->depth,
+           search->path, search->depth * sizeof(int));
+    search->solution_count++;
+
+    return SEARCH_NONE;
+}
+
+// The U groups, usually the furthest from their goal, are checked first
+static const int PRUNING_ORDER[GROUP_COUNT] = {0, 2, 1, 3, 4};
+
+static int search_last_layer(LastLayerSearch* search, const uint32_t* coordinates,
+                             int frame, int depth, int last) {
+    // The longer algorithms going through a goal are redundant
+    if (is_goal(search, coordinates)) {
+        return depth ? SEARCH_NONE : record_path(search);
+    }
+
+    if (!depth) {
+        return SEARCH_NONE;
+    }
+
+    if (++search->nodes > search->max_nodes && search->max_nodes >= 0) {
+        return SEARCH_EXHAUSTED;
+    }
+
+    const uint8_t* allowed = search->successors
+        + (last < 0 ? search->move_count : last) * search->move_count;
+    const uint8_t* frame_moves = search->frame_moves + frame * search->move_count * 2;
+
+    for (int position = 0; position < search->move_count; position++) {
+        if (!allowed[position]) {
+            continue;
+        }
+
+        int move = frame_moves[2 * position];
+        uint32_t moved[GROUP_COUNT];
+        int pruned = 0;
+        for (int i = 0; i < GROUP_COUNT && !pruned; i++) {
+            int g = PRUNING_ORDER[i];
+            moved[g] = search->moves[g][coordinates[g] * search->stride + move];
+            if (moved[g] >= search->counts[g]) {
+                return SEARCH_ERROR;
+            }
+            pruned = search->pruning[g][moved[g]] >= depth;
+        }
+        if (pruned) {
+            continue;
+        }
+
+        search->path[search->length++] = position;
+        int status = search_last_layer(search, moved, frame_moves[2 * position + 1],
+                                       depth - 1, position);
+        search->length--;
+        if (status != SEARCH_NONE) {
+            return status;
+        }
+    }
+
+    return SEARCH_NONE;
+}
+
+/**
+ * Get the items of a sequence of one item per group.
+ */
+static PyObject* group_items(PyObject* object, const char* name) {
+    PyObject* sequence = PySequence_Fast(object, name);
+    if (sequence != NULL && PySequence_Fast_GET_SIZE(sequence) != GROUP_COUNT) {
+        PyErr_Format(PyExc_ValueError, "%s: expected %d items", name, GROUP_COUNT);
+        Py_CLEAR(sequence);
+    }
+
+    return sequence;
+}
+
+/**
+ * Search the algorithms of a given length solving a last layer case.
+ *
+ * Returns the paths of the algorithms, or None if the search needs
+ * more than max_nodes nodes, unless it is -1, and the searched nodes.
+ */
+static PyObject* last_layer(PyObject* self, PyObject* args) {
+    PyObject *corner_moves_object, *edge_moves_object, *pruning_objects,
+        *goals_object, *coordinates_object;
+    Py_ssize_t stride, max_nodes;
+    const char *frame_moves, *successors;
+    Py_ssize_t frame_moves_length, successors_length;
+    int depth;
+
+    if (!PyArg_ParseTuple(args, "OOOny#y#OOin", &corner_moves_object,
+                          &edge_moves_object, &pruning_objects, &stride,
+                          &frame_moves, &frame_moves_length,
+                          &successors, &successors_length, &goals_object,
+                          &coordinates_object, &depth, &max_nodes)) {
+        return NULL;
+    }
+
+    if (depth < 0 || depth > MAX_DEPTH) {
+        PyErr_Format(PyExc_ValueError, "The depth must be between 0 and %d", MAX_DEPTH);
+        return NULL;
+    }
+
+    // Successors of each move, then of the start, for each move
+    Py_ssize_t move_count = 0;
+    while ((move_count + 1) * move_count < successors_length) {
+        move_count++;
+    }
+    if (move_count < 1 || move_count > MAX_GENERATORS
+            || (move_count + 1) * move_count != successors_length
+            || frame_moves_length % (2 * move_count)) {
+        PyErr_SetString(PyExc_ValueError, "The successors do not match the frame moves");
+        return NULL;
+    }
+    Py_ssize_t frame_count = frame_moves_length / (2 * move_count);
+    for (Py_ssize_t i = 0; i < frame_moves_length; i += 2) {
+        if ((uint8_t)frame_moves[i] >= stride || (uint8_t)frame_moves[i + 1] >= frame_count) {
+            PyErr_SetString(PyExc_ValueError, "Frame move out of range");
+            return NULL;
+        }
+    }
+
+    PyObject* prunings = group_items(pruning_objects, "The pruning tables");
+    if (prunings == NULL) {
+        return NULL;
+    }
+    PyObject* coordinates = group_items(coordinates_object, "The coordinates");
+    if (coordinates == NULL) {
+        Py_DECREF(prunings);
+        return NULL;
+    }
+
+    PyObject* result = NULL;
+    Py_buffer move_views[CORNER_GROUPS];
+    Py_buffer pruning_views[GROUP_COUNT];
+    Py_buffer goals_view;
+    int moves_loaded = 0;
+    int prunings_loaded = 0;
+    int goals_loaded = 0;
+    LastLayerSearch search = {
+        .stride = stride,
+        .frame_moves = (const uint8_t*)frame_moves,
+        .move_count = move_count,
+        .successors = (const uint8_t*)successors,
+        .max_nodes = max_nodes,
+        .depth = depth,
+    };
+    uint32_t start[GROUP_COUNT];
+
+    if (stride < 1) {
+        PyErr_SetString(PyExc_ValueError, "The stride must be positive");
+        goto release;
+    }
+
+    PyObject* move_objects[CORNER_GROUPS] = {corner_moves_object, edge_moves_object};
+    for (; moves_loaded < CORNER_GROUPS; moves_loaded++) {
+        if (get_table(move_objects[moves_loaded], &move_views[moves_loaded], "I", -1,
+                      moves_loaded ? "edge move" : "corner move") < 0) {
+            goto release;
+        }
+    }
+
+    // The corner groups come first, then the edge groups
+    for (; prunings_loaded < GROUP_COUNT; prunings_loaded++) {
+        int kind = prunings_loaded >= CORNER_GROUPS;
+        Py_ssize_t count = move_views[kind].len / sizeof(uint32_t) / stride;
+        if (get_table(PySequence_Fast_GET_ITEM(prunings, prunings_loaded),
+                      &pruning_views[prunings_loaded], "B", count, "pruning") < 0) {
+            goto release;
+        }
+
+        search.moves[prunings_loaded] = move_views[kind].buf;
+        search.counts[prunings_loaded] = count;
+        search.pruning[prunings_loaded] = pruning_views[prunings_loaded].buf;
+
+        Py_ssize_t coordinate = PyLong_AsSsize_t(
+            PySequence_Fast_GET_ITEM(coordinates, prunings_loaded));
+        if (coordinate == -1 && PyErr_Occurred()) {
+            prunings_loaded++;
+            goto release;
+        }
+        if (coordinate < 0 || coordinate >= count) {
+            PyErr_SetString(PyExc_IndexError, "coordinate out of range");
+            prunings_loaded++;
+            goto release;
+        }
+        start[prunings_loaded] = (uint32_t)coordinate;
+    }
+
+    if (get_table(goals_object, &goals_view, "I", -1, "goal") < 0) {
+        goto release;
+    }
+    goals_loaded = 1;
+    search.goals = goals_view.buf;
+    search.goal_count = goals_view.len / sizeof(uint32_t) / 2;
+
+    int status;
+    Py_BEGIN_ALLOW_THREADS
+    status = search_last_layer(&search, start, 0, depth, -1);
+    Py_END_ALLOW_THREADS
+
+    if (status == SEARCH_ERROR) {
+        PyErr_SetString(PyExc_ValueError, "The move tables lead out of the tables");
+        goto release;
+    }
+    if (status == SEARCH_MEMORY) {
+        PyErr_NoMemory();
+        goto release;
+    }
+    if (status == SEARCH_EXHAUSTED) {
+        result = Py_BuildValue("(On)", Py_None, search.nodes);
+        goto release;
+    }
+
+    PyObject* paths = PyList_New(search.solution_count);
+    for (Py_ssize_t i = 0; paths != NULL && i < search.solution_count; i++) {
+        PyObject* path = PyTuple_New(depth);
+        for (int m = 0; path != NULL && m < depth; m++) {
+            PyObject* position = PyLong_FromLong(search.solutions[i * depth + m]);
+            if (position == NULL) {
+                Py_CLEAR(path);
+                break;
+            }
+            PyTuple_SET_ITEM(path, m, position);
+        }
+        if (path == NULL) {
+            Py_CLEAR(paths);
+            break;
+        }
+        PyList_SET_ITEM(paths, i, path);
+    }
+    if (paths != NULL) {
+        result = Py_BuildValue("(Nn)", paths, search.nodes);
+    }
+
+release:
+    PyMem_RawFree(search.solutions);
+    if (goals_loaded) {
+        PyBuffer_Release(&goals_view);
+    }
+    for (int i = 0; i < prunings_loaded; i++) {
+        PyBuffer_Release(&pruning_views[i]);
+    }
+    for (int i = 0; i < moves_loaded; i++) {
+        PyBuffer_Release(&move_views[i]);
+    }
+    Py_DECREF(prunings);
+    Py_DECREF(coordinates);
+
+    return result;
+}
+
+// Module method definitions
+static PyMethodDef SearchMethods[] = {
+    {"pair_distances", pair_distances, METH_VARARGS, "Build the distance table of a pair of coordinates"},
+    {"goal_distances", goal_distances, METH_VARARGS, "Build the distance table of a coordinate to its goal"},
+    {"two_phase", two_phase, METH_VARARGS, "Search a two-phase solution of 3x3x3 coordinates"},
+    {"last_layer", last_layer, METH_VARARGS, "Search the algorithms of a given length solving a last layer case"},
+    {NULL, NULL, 0, NULL}
+};
+
+// Module definition
+static struct PyModuleDef searchmodule = {
+    PyModuleDef_HEAD_INIT,
+    "search",
+    "Fast table building and searches of the solvers",
+    -1,
+    SearchMethods
+};
+
+// Module initialization function
+PyMODINIT_FUNC PyInit_search(void) {
+    return PyModule_Create(&searchmodule);
+}
@@ -0,0 +1,24 @@
+from collections.abc import Iterable
+from collections.abc import Sequence
+
+from _typeshed import ReadableBuffer
+
+def pair_distances(moves_a: ReadableBuffer, moves_b: ReadableBuffer,
+                   count_b: int, moves_count: int) -> bytearray:
+    ...
+def goal_distances(moves: ReadableBuffer, stride: int, moves_count: int,
+                   sources: Iterable[int]) -> bytearray:
+    ...
+def two_phase(tables: Sequence[ReadableBuffer], twist: int, flip: int,
+              slice_: int, corners: bytes, edges: bytes,
+              corner_permutations: bytes, edge_permutations: bytes,
+              phase2_moves: bytes,
+              max_length: int) -> tuple[list[int], list[int]] | None:
+    ...
+def last_layer(corner_moves: ReadableBuffer, edge_moves: ReadableBuffer,
+               prunings: Sequence[ReadableBuffer], stride: int,
+               frame_moves: bytes, successors: bytes,
+               goals: ReadableBuffer, coordinates: Sequence[int],
+               depth: int, max_nodes: int,
+               ) -> tuple[list[tuple[int, ...]] | None, int]:
+    ...
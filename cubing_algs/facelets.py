@@ -5,6 +5,8 @@ This module provides high-performance conversion between Kociemba facelets
 representation and cubies (corner/edge permutation/orientation) representation.
 
 Key optimizations:
+- Conversions done by the convert_3x3x3 C extension,
+  with a pure Python fallback
 - Pre-computed lookup tables for fast piece identification
 - Dictionary lookups instead of string.find() operations
 - Optional caching for repeated conversions
@@ -21,6 +23,13 @@ from cubing_algs.constants import FACES
 from cubing_algs.constants import OFFSET_ORIENTATION_MAP
 from cubing_algs.extensions import rotate_3x3x3
 
+try:
+    from cubing_algs.extensions import convert_3x3x3
+except ImportError:  # pragma: no cover
+    convert_3x3x3 = None  # type: ignore[assignment]
+
+STATE_SIZE = 54
+
 
 def _build_corner_lookup_table() -> dict[tuple[int, int], int]:
     """
@@ -223,12 +232,45 @@ def cubies_to_facelets(cp: list[int], co: list[int],  # noqa: PLR0913, PLR0917
     if cached_result is not None:
         return cached_result
 
-    facelets = [''] * 54
-
     if not scheme:
         scheme_parts = [FACES[so[i]] * 9 for i in range(6)]
         scheme = ''.join(scheme_parts)
 
+    if (
+            convert_3x3x3 is not None
+            and len(scheme) == STATE_SIZE
+            and scheme.isascii()
+    ):
+        result = convert_3x3x3.cubies_to_facelets(cp, co, ep, eo, scheme)
+    else:
+        result = python_cubies_to_facelets(cp, co, ep, eo, scheme)
+
+    _cache.set_facelets(cache_key, result)
+
+    return result
+
+
+def python_cubies_to_facelets(cp: list[int], co: list[int],
+                              ep: list[int], eo: list[int],
+                              scheme: str) -> str:
+    """
+    Place the colors of the cubies on the facelets, in pure Python.
+
+    Fallback of the convert_3x3x3 extension.
+
+    Args:
+        cp: Corner Permutation
+        co: Corner Orientation
+        ep: Edge Permutation
+        eo: Edge Orientation
+        scheme: 54-character string of the colors of the solved cube.
+
+    Returns:
+        Cube state in the Kociemba facelets representation string
+
+    """
+    facelets = [''] * 54
+
     for i in range(6):
         facelets[9 * i + 4] = scheme[9 * i + 4]
 
@@ -244,14 +286,10 @@ def cubies_to_facelets(cp: list[int], co: list[int],  # noqa: PLR0913, PLR0917
             original_facelet_idx = EDGE_FACELET_MAP[ep[i]][p]
             facelets[real_facelet_idx] = scheme[original_facelet_idx]
 
-    result = ''.join(facelets)
+    return ''.join(facelets)
 
-    _cache.set_facelets(cache_key, result)
 
-    return result
-
-
-def facelets_to_cubies(facelets: str) -> tuple[  # noqa: C901, PLR0912, PLR0914
+def facelets_to_cubies(facelets: str) -> tuple[
         list[int], list[int], list[int], list[int], list[int],
 ]:
     """
@@ -285,6 +323,36 @@ def facelets_to_cubies(facelets: str) -> tuple[  # noqa: C901, PLR0912, PLR0914
     if cached_result is not None:
         return cached_result
 
+    if (
+            convert_3x3x3 is not None
+            and len(facelets) == STATE_SIZE
+            and facelets.isascii()
+    ):
+        result = convert_3x3x3.facelets_to_cubies(facelets)
+    else:
+        result = python_facelets_to_cubies(facelets)
+
+    _cache.set_cubies(facelets, result)
+
+    return result
+
+
+def python_facelets_to_cubies(facelets: str) -> tuple[  # noqa: C901, PLR0912, PLR0914
+        list[int], list[int], list[int], list[int], list[int],
+]:
+    """
+    Identify the cubies of a facelets state, in pure Python.
+
+    Fallback of the convert_3x3x3 extension.
+
+    Args:
+        facelets: 54-character string representing the cube state
+                  in Kociemba facelets format (URFDLB)
+
+    Returns:
+        tuple: (cp, co, ep, eo, so) as facelets_to_cubies.
+
+    """
     so = [_FACE_TO_INDEX[facelets[9 * i + 4]] for i in range(6)]
 
     # Invert spatial orientation efficiently
@@ -349,11 +417,7 @@ def facelets_to_cubies(facelets: str) -> tuple[  # noqa: C901, PLR0912, PLR0914
                     eo[i] = 1
                     break
 
-    result = (cp, co, ep, eo, so)
-
-    _cache.set_cubies(facelets, result)
-
-    return result
+    return cp, co, ep, eo, so
 
 
 def clear_cache() -> None:
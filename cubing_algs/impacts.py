@@ -6,11 +6,16 @@ This module provides functions to analyze the spatial impact of algorithms
 on cube facelets, including which facelets are moved, how they move,
 and statistical analysis of the algorithm's effect on the cube.
 """
+from array import array
 from collections.abc import Callable
+from collections.abc import Sequence
+from functools import cached_property
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import NamedTuple
 from typing import TypedDict
 
+from cubing_algs.compiled import compute_permutation
 from cubing_algs.constants import CORNER_FACELET_MAP
 from cubing_algs.constants import EDGE_FACELET_MAP
 from cubing_algs.constants import FACE_EDGES_INDEX
@@ -19,14 +24,17 @@ from cubing_algs.constants import OPPOSITE_FACES
 from cubing_algs.constants import QTM_OPPOSITE_EDGE_OFFSETS
 from cubing_algs.constants import QTM_OPPOSITE_FACE_DOUBLE_PAIRS
 from cubing_algs.constants import QTM_SAME_FACE_OPPOSITE_PAIRS
+from cubing_algs.exceptions import InvalidCubeStateError
 from cubing_algs.face_transforms import transform_adjacent_position
 from cubing_algs.face_transforms import transform_opposite_position
-from cubing_algs.facelets import cubies_to_facelets
+from cubing_algs.initial_state import get_initial_state
 
 if TYPE_CHECKING:
     from cubing_algs.algorithm import Algorithm  # pragma: no cover
     from cubing_algs.vcube import VCube  # pragma: no cover
 
+DISTANCE_TYPECODE = 'B'
+
 
 class CycleAnalysis(TypedDict):
     """Analysis of permutation cycle structure."""
@@ -161,6 +169,24 @@ def parse_facelet_position(position: int, cube: 'VCube') -> FaceletPosition:
     )
 
 
+def count_facelet_borders(position: int, cube: 'VCube') -> int:
+    """
+    Count the coordinates of a facelet on the border of its face.
+
+    Args:
+        position: The facelet position index.
+        cube: The virtual cube for size context.
+
+    Returns:
+        2 for corner facelets, 1 for edge facelets and 0 for center facelets.
+
+    """
+    last = cube.size - 1
+    row, col = divmod(position % cube.face_size, cube.size)
+
+    return (row in {0, last}) + (col in {0, last})
+
+
 def positions_on_same_piece(pos1: int, pos2: int) -> bool:
     """
     Check if two positions are on the same physical piece (edge or corner).
@@ -563,6 +589,44 @@ def compute_qtm_distance(original_pos: int, final_pos: int,
     )
 
 
+@lru_cache(maxsize=32)
+def compute_distance_table(
+    distance_fn: Callable[[int, int, 'VCube'], int],
+    size: int = 3,
+) -> 'array[int]':
+    """
+    Compute the distances between all the pairs of facelet positions.
+
+    The table is computed once per distance function and cube size.
+    Facelets of different kinds, corners, edges or centers,
+    are never exchanged by moves, their distances are left to 0.
+
+    Args:
+        distance_fn: Function to compute distance between two positions.
+        size: Size of the cube.
+
+    Returns:
+        Flat array of the distances, the distance from position i
+        to position j being at index i * facelets + j.
+
+    """
+    from cubing_algs.vcube import VCube
+
+    cube = VCube(size=size)
+    positions = range(cube.face_number * cube.face_size)
+    kinds = [count_facelet_borders(position, cube) for position in positions]
+
+    return array(
+        DISTANCE_TYPECODE,
+        [
+            distance_fn(original_pos, final_pos, cube)
+            if kinds[original_pos] == kinds[final_pos] else 0
+            for original_pos in positions
+            for final_pos in positions
+        ],
+    )
+
+
 def compute_distance_metrics(
     permutations: dict[int, int],
     cube: 'VCube',
@@ -580,8 +644,11 @@ def compute_distance_metrics(
         DistanceMetrics containing distances, mean, max, and sum.
 
     """
+    table = compute_distance_table(distance_fn, cube.size)
+    facelets = cube.face_number * cube.face_size
+
     distances = {
-        original_pos: distance_fn(original_pos, final_pos, cube)
+        original_pos: table[original_pos * facelets + final_pos]
         for original_pos, final_pos in permutations.items()
     }
 
@@ -714,7 +781,8 @@ def analyze_layers(
     """
     Analyze impact by cube layers.
 
-    Separates facelets into outer layer (edges/corners) and center pieces.
+    Separates facelets into outer layer (edges/corners) and center pieces,
+    the centers being the facelets inside the border of their face.
 
     Args:
         permutations: Dictionary mapping original to final positions.
@@ -724,42 +792,19 @@ def analyze_layers(
         Dictionary with layer counts (centers_moved, outer_layer_moved, etc).
 
     """
-    # Center of each face (position 4 in 3x3 grid)
-    center_indices = {i * cube.face_size + 4 for i in range(6)}
-    edge_indices = set()
-    corner_indices = set()
-
-    for face_idx in range(6):
-        face_start = face_idx * cube.face_size
-        # Corners: positions 0, 2, 6, 8 in each face
-        corner_indices.update({
-            face_start + 0, face_start + 2,
-            face_start + 6, face_start + 8,
-        })
-        # Edges: positions 1, 3, 5, 7 in each face
-        edge_indices.update({
-            face_start + 1, face_start + 3,
-            face_start + 5, face_start + 7,
-        })
-
-    centers_moved = sum(
-        1 for pos in permutations
-        if pos in center_indices
-    )
-    edges_moved = sum(
-        1 for pos in permutations
-        if pos in edge_indices
-    )
-    corners_moved = sum(
-        1 for pos in permutations
-        if pos in corner_indices
-    )
+    counts = {'centers_moved': 0, 'edges_moved': 0, 'corners_moved': 0}
 
-    return {
-        'centers_moved': centers_moved,
-        'edges_moved': edges_moved,
-        'corners_moved': corners_moved,
-    }
+    for pos in permutations:
+        borders = count_facelet_borders(pos, cube)
+
+        if borders == 2:
+            counts['corners_moved'] += 1
+        elif borders == 1:
+            counts['edges_moved'] += 1
+        else:
+            counts['centers_moved'] += 1
+
+    return counts
 
 
 def compute_parity(permutation: list[int]) -> int:
@@ -1046,12 +1091,328 @@ def compute_cubie_complexity(
     return complexity, approach
 
 
-def compute_impacts(algorithm: 'Algorithm') -> ImpactData:  # noqa: PLR0914
+class LazyImpactData:  # noqa: PLR0904
+    """
+    Impact metrics of an algorithm, each computed on first access.
+
+    Exposes the same fields as ImpactData, so callers needing only
+    a few of them, like the transformation mask or the moved cubies,
+    do not pay for the distance maps, cycle analyses and patterns.
+
+    The facelet fields derive from the facelet permutation
+    and are available for any cube size,
+    the distance and cubie fields are specific to the 3x3x3.
+    """
+
+    def __init__(self, cube: 'VCube', permutation: Sequence[int]) -> None:
+        """
+        Initialize the lazy impacts of a cube oriented UF.
+
+        Args:
+            cube: The cube after the algorithm, oriented UF.
+            permutation: The facelet permutation leading to the cube,
+                facelet i comes from facelet permutation[i].
+
+        """
+        self.cube = cube
+        self.permutation = list(permutation)
+
+    def check_3x3x3(self, field: str) -> None:
+        """
+        Check that a field specific to the 3x3x3 can be computed.
+
+        Args:
+            field: The name of the field.
+
+        Raises:
+            InvalidCubeStateError: If the cube is not a 3x3x3.
+
+        """
+        if self.cube.size != 3:
+            msg = f'{ field } is only available for 3x3x3 cubes'
+            raise InvalidCubeStateError(msg)
+
+    def as_impact_data(self) -> ImpactData:
+        """
+        Compute all the fields.
+
+        The cube must be a 3x3x3, some fields being specific to it,
+        otherwise an InvalidCubeStateError is raised.
+
+        Returns:
+            The impact metrics as an ImpactData.
+
+        """
+        return ImpactData(
+            *(getattr(self, field) for field in ImpactData._fields),
+        )
+
+    @cached_property
+    def facelets_state(self) -> str:
+        """State of the facelets after the algorithm."""
+        return self.cube.state
+
+    @cached_property
+    def facelets_transformation_mask(self) -> str:
+        """Binary mask of the moved facelets."""
+        return ''.join(
+            '0' if origin == position else '1'
+            for position, origin in enumerate(self.permutation)
+        )
+
+    @cached_property
+    def facelets_fixed_count(self) -> int:
+        """Number of unmoved facelets."""
+        return self.facelets_transformation_mask.count('0')
+
+    @cached_property
+    def facelets_mobilized_count(self) -> int:
+        """Number of moved facelets."""
+        return self.facelets_transformation_mask.count('1')
+
+    @cached_property
+    def facelets_scrambled_percent(self) -> float:
+        """Ratio of moved facelets, fixed centers excluded."""
+        # Center facelets of odd cubes should not move
+        fixed_centers = self.cube.face_number if self.cube.size % 2 else 0
+
+        return self.facelets_mobilized_count / (
+            len(self.facelets_transformation_mask) - fixed_centers
+        )
+
+    @cached_property
+    def facelets_permutations(self) -> dict[int, int]:
+        """Final positions of the moved facelets."""
+        final_positions = [0] * len(self.permutation)
+        for final_pos, original_pos in enumerate(self.permutation):
+            final_positions[original_pos] = final_pos
+
+        return {
+            original_pos: final_pos
+            for original_pos, final_pos in enumerate(final_positions)
+            if final_pos != original_pos
+        }
+
+    @cached_property
+    def facelets_manhattan_distance(self) -> DistanceMetrics:
+        """Manhattan distances traveled by the facelets."""
+        self.check_3x3x3('facelets_manhattan_distance')
+
+        return compute_distance_metrics(
+            self.facelets_permutations, self.cube, compute_manhattan_distance,
+        )
+
+    @cached_property
+    def facelets_qtm_distance(self) -> DistanceMetrics:
+        """Quarter turn distances traveled by the facelets."""
+        self.check_3x3x3('facelets_qtm_distance')
+
+        return compute_distance_metrics(
+            self.facelets_permutations, self.cube, compute_qtm_distance,
+        )
+
+    @cached_property
+    def facelets_face_mobility(self) -> dict[str, int]:
+        """Number of moved facelets by face."""
+        return compute_face_impact(self.facelets_transformation_mask, self.cube)
+
+    @cached_property
+    def facelets_face_to_face_matrix(self) -> dict[str, dict[str, int]]:
+        """Number of facelets moved from each face to each face."""
+        return compute_face_to_face_matrix(
+            self.facelets_permutations, self.cube,
+        )
+
+    @cached_property
+    def facelets_symmetry(self) -> dict[str, bool]:
+        """Symmetries of the transformation mask."""
+        return detect_symmetry(self.facelets_transformation_mask, self.cube)
+
+    @cached_property
+    def facelets_layer_analysis(self) -> dict[str, int]:
+        """Number of moved facelets by layer."""
+        return analyze_layers(self.facelets_permutations, self.cube)
+
+    @cached_property
+    def cubies(self) -> tuple[list[int], list[int], list[int], list[int]]:
+        """Corner and edge permutations and orientations."""
+        self.check_3x3x3('cubies')
+
+        cp, co, ep, eo, _so = self.cube.to_cubies
+
+        return cp, co, ep, eo
+
+    @cached_property
+    def cubies_corner_permutation(self) -> list[int]:
+        """Corner permutation."""
+        return self.cubies[0]
+
+    @cached_property
+    def cubies_corner_orientation(self) -> list[int]:
+        """Corner orientation."""
+        return self.cubies[1]
+
+    @cached_property
+    def cubies_edge_permutation(self) -> list[int]:
+        """Edge permutation."""
+        return self.cubies[2]
+
+    @cached_property
+    def cubies_edge_orientation(self) -> list[int]:
+        """Edge orientation."""
+        return self.cubies[3]
+
+    @cached_property
+    def cubies_corners_moved(self) -> int:
+        """Number of corners out of position."""
+        return sum(
+            1 for i, pos in enumerate(self.cubies_corner_permutation)
+            if pos != i
+        )
+
+    @cached_property
+    def cubies_corners_twisted(self) -> int:
+        """Number of misoriented corners."""
+        return sum(
+            1 for orientation in self.cubies_corner_orientation
+            if orientation != 0
+        )
+
+    @cached_property
+    def cubies_edges_moved(self) -> int:
+        """Number of edges out of position."""
+        return sum(
+            1 for i, pos in enumerate(self.cubies_edge_permutation)
+            if pos != i
+        )
+
+    @cached_property
+    def cubies_edges_flipped(self) -> int:
+        """Number of flipped edges."""
+        return sum(
+            1 for orientation in self.cubies_edge_orientation
+            if orientation != 0
+        )
+
+    @cached_property
+    def cubies_corner_cycles(self) -> list[list[int]]:
+        """Permutation cycles of the corners."""
+        return find_permutation_cycles(self.cubies_corner_permutation)
+
+    @cached_property
+    def cubies_edge_cycles(self) -> list[list[int]]:
+        """Permutation cycles of the edges."""
+        return find_permutation_cycles(self.cubies_edge_permutation)
+
+    @cached_property
+    def complexity(self) -> tuple[int, str]:
+        """Solving complexity score and suggested approach."""
+        return compute_cubie_complexity(
+            self.cubies_corners_moved,
+            self.cubies_corners_twisted,
+            self.cubies_edges_moved,
+            self.cubies_edges_flipped,
+        )
+
+    @cached_property
+    def cubies_complexity_score(self) -> int:
+        """Overall solving complexity estimate."""
+        return self.complexity[0]
+
+    @cached_property
+    def cubies_suggested_approach(self) -> str:
+        """Recommended solving strategy."""
+        return self.complexity[1]
+
+    @cached_property
+    def cubies_corner_parity(self) -> int:
+        """Parity of the corner permutation."""
+        return compute_parity(self.cubies_corner_permutation)
+
+    @cached_property
+    def cubies_edge_parity(self) -> int:
+        """Parity of the edge permutation."""
+        return compute_parity(self.cubies_edge_permutation)
+
+    @cached_property
+    def cubies_parity_valid(self) -> bool:
+        """Whether corner and edge parities match."""
+        return self.cubies_corner_parity == self.cubies_edge_parity
+
+    @cached_property
+    def cubies_corner_cycle_analysis(self) -> CycleAnalysis:
+        """Analysis of the corner cycles."""
+        return analyze_cycles(self.cubies_corner_cycles)
+
+    @cached_property
+    def cubies_edge_cycle_analysis(self) -> CycleAnalysis:
+        """Analysis of the edge cycles."""
+        return analyze_cycles(self.cubies_edge_cycles)
+
+    @cached_property
+    def cubies_patterns(self) -> list[str]:
+        """Recognized patterns of the cubies."""
+        return classify_pattern(*self.cubies)
+
+
+def compute_lazy_impacts(algorithm: 'Algorithm',
+                         size: int = 3) -> LazyImpactData:
+    """
+    Compute the impact metrics of an algorithm on demand.
+
+    Only the facelet permutation of the algorithm,
+    followed by the rotations orienting the cube UF, is computed,
+    each metric is computed when first accessed.
+    Even cubes whose virtual centers are moved are left unoriented.
+
+    The distances and the cubie fields are specific to the 3x3x3,
+    on other sizes accessing them raises an InvalidCubeStateError,
+    and so does converting the impacts into an ImpactData.
+
+    Args:
+        algorithm: The algorithm to analyze.
+        size: Size of the cube.
+
+    Returns:
+        LazyImpactData: The same fields as compute_impacts.
+
+    """
+    from cubing_algs.transform.timing import untime_moves
+    from cubing_algs.vcube import VCube
+
+    initial_state = get_initial_state(size)
+
+    permutation = compute_permutation(str(untime_moves(algorithm)), size)
+    cube = VCube(
+        ''.join([initial_state[origin] for origin in permutation]),
+        size=size,
+        check=False,
+    )
+
+    try:
+        orientation_moves = cube.compute_orientation_moves('UF')
+    except ValueError:
+        # The virtual centers of even cubes may not tell the orientation
+        orientation_moves = ''
+
+    if orientation_moves:
+        orientation = compute_permutation(orientation_moves, size)
+        permutation = [permutation[origin] for origin in orientation]
+        cube = VCube(
+            ''.join([initial_state[origin] for origin in permutation]),
+            size=size,
+            check=False,
+        )
+
+    return LazyImpactData(cube, permutation)
+
+
+def compute_impacts(algorithm: 'Algorithm') -> ImpactData:
     """
     Compute comprehensive impact metrics for an algorithm.
 
     Analyzes both facelet-level (visual/spatial) and cubie-level (piece)
-    impacts of the algorithm on the cube state.
+    impacts of the algorithm on the cube state of a 3x3x3.
 
     Returns:
         ImpactData: Namedtuple containing comprehensive impact metrics:
@@ -1089,120 +1450,4 @@ def compute_impacts(algorithm: 'Algorithm') -> ImpactData:  # noqa: PLR0914
             - cubies_suggested_approach: Recommended solving strategy
 
     """
-    from cubing_algs.transform.timing import untime_moves
-    from cubing_algs.vcube import VCube
-
-    cube = VCube()
-    cube.rotate(untime_moves(algorithm))
-    cube = cube.oriented_copy('UF')
-
-    # Create unique state with each facelet having a unique character
-    state_unique = ''.join(
-        [
-            chr(ord('A') + i)
-            for i in range(cube.face_size * cube.face_number)
-        ],
-    )
-    state_unique_moved = cubies_to_facelets(*cube.to_cubies, state_unique)
-
-    mask = ''.join(
-        '0' if f1 == f2 else '1'
-        for f1, f2 in zip(state_unique, state_unique_moved, strict=True)
-    )
-
-    permutations = {}
-    for original_pos in range(len(state_unique)):
-        final_pos = state_unique_moved.find(
-            state_unique[original_pos],
-        )
-
-        if final_pos != original_pos:
-            permutations[original_pos] = final_pos
-
-    # Compute distance metrics using helper function
-    manhattan_distance = compute_distance_metrics(
-        permutations, cube, compute_manhattan_distance,
-    )
-    qtm_distance = compute_distance_metrics(
-        permutations, cube, compute_qtm_distance,
-    )
-
-    fixed_count = mask.count('0')
-    mobilized_count = mask.count('1')
-    # Center facelets should not move
-    scrambled_percent = mobilized_count / (len(state_unique) - cube.face_number)
-
-    face_mobility = compute_face_impact(mask, cube)
-
-    face_to_face_matrix = compute_face_to_face_matrix(permutations, cube)
-    symmetry = detect_symmetry(mask, cube)
-    layer_analysis = analyze_layers(permutations, cube)
-
-    # Cubie analysis
-    cp, co, ep, eo, _so = cube.to_cubies
-
-    # Count corners moved and twisted
-    corners_moved = sum(1 for i, pos in enumerate(cp) if pos != i)
-    corners_twisted = sum(1 for orientation in co if orientation != 0)
-
-    # Count edges moved and flipped
-    edges_moved = sum(1 for i, pos in enumerate(ep) if pos != i)
-    edges_flipped = sum(1 for orientation in eo if orientation != 0)
-
-    # Find permutation cycles
-    corner_cycles = find_permutation_cycles(cp)
-    edge_cycles = find_permutation_cycles(ep)
-
-    # Compute complexity and approach
-    complexity_score, suggested_approach = compute_cubie_complexity(
-        corners_moved,
-        corners_twisted,
-        edges_moved,
-        edges_flipped,
-    )
-
-    # New cubie analyses
-    corner_parity = compute_parity(cp)
-    edge_parity = compute_parity(ep)
-    parity_valid = corner_parity == edge_parity
-    corner_cycle_analysis = analyze_cycles(corner_cycles)
-    edge_cycle_analysis = analyze_cycles(edge_cycles)
-    patterns = classify_pattern(cp, co, ep, eo)
-
-    return ImpactData(
-        cube=cube,
-
-        # Facelet analysis
-        facelets_state=cube.state,
-        facelets_transformation_mask=mask,
-        facelets_fixed_count=fixed_count,
-        facelets_mobilized_count=mobilized_count,
-        facelets_scrambled_percent=scrambled_percent,
-        facelets_permutations=permutations,
-        facelets_manhattan_distance=manhattan_distance,
-        facelets_qtm_distance=qtm_distance,
-        facelets_face_mobility=face_mobility,
-        facelets_face_to_face_matrix=face_to_face_matrix,
-        facelets_symmetry=symmetry,
-        facelets_layer_analysis=layer_analysis,
-
-        # Cubie analysis
-        cubies_corner_permutation=cp,
-        cubies_corner_orientation=co,
-        cubies_edge_permutation=ep,
-        cubies_edge_orientation=eo,
-        cubies_corners_moved=corners_moved,
-        cubies_corners_twisted=corners_twisted,
-        cubies_edges_moved=edges_moved,
-        cubies_edges_flipped=edges_flipped,
-        cubies_corner_cycles=corner_cycles,
-        cubies_edge_cycles=edge_cycles,
-        cubies_complexity_score=complexity_score,
-        cubies_suggested_approach=suggested_approach,
-        cubies_corner_parity=corner_parity,
-        cubies_edge_parity=edge_parity,
-        cubies_parity_valid=parity_valid,
-        cubies_corner_cycle_analysis=corner_cycle_analysis,
-        cubies_edge_cycle_analysis=edge_cycle_analysis,
-        cubies_patterns=patterns,
-    )
+    return compute_lazy_impacts(algorithm).as_impact_data()
@@ -70,6 +70,7 @@ References
 
 """
 import operator
+from collections import Counter
 from typing import TYPE_CHECKING
 from typing import NamedTuple
 
@@ -77,6 +78,7 @@ from cubing_algs.move import Move
 
 if TYPE_CHECKING:
     from cubing_algs.algorithm import Algorithm  # pragma: no cover
+    from cubing_algs.packed import PackedAlgorithm  # pragma: no cover
 
 
 class MetricsData(NamedTuple):
@@ -398,6 +400,71 @@ def regroup_moves(
     return pauses, rotations, outer_moves, inner_moves
 
 
+def compute_packed_metrics(moves: 'PackedAlgorithm') -> MetricsData:
+    """
+    Calculate the metrics of a packed algorithm.
+
+    Each distinct move id is scored once and weighted by its number
+    of occurrences, giving the same results as compute_metrics.
+
+    Args:
+        moves: The packed algorithm to analyze.
+
+    Returns:
+        MetricsData: Namedtuple containing all calculated metrics.
+
+    """
+    pauses = 0
+    fields = {'rotation': 0, 'outer': 0, 'inner': 0}
+    scores = dict.fromkeys(MOVE_COUNTS, 0)
+    count: dict[str, int] = {}
+
+    for identifier, occurrences in Counter(moves.ids).items():
+        move = Move.from_id(identifier)
+
+        if move.is_pause:
+            pauses += occurrences
+            continue
+
+        if move.is_outer_move:
+            field = 'outer'
+        elif move.is_inner_move:
+            field = 'inner'
+        else:
+            field = 'rotation'
+
+        fields[field] += occurrences
+        for mode, datas in MOVE_COUNTS.items():
+            scores[mode] += occurrences * (
+                datas[field][0] + (amount(move) * datas[field][1])
+            )
+
+        if not move.is_rotation_move:
+            count.setdefault(move.raw_base_move, 0)
+            count[move.raw_base_move] += occurrences
+
+    return MetricsData(
+        pauses=pauses,
+        rotations=fields['rotation'],
+        outer_moves=fields['outer'],
+        inner_moves=fields['inner'],
+        htm=scores['htm'],
+        qtm=scores['qtm'],
+        stm=scores['stm'],
+        etm=scores['etm'],
+        rtm=scores['rtm'],
+        qstm=scores['qstm'],
+        generators=[
+            k
+            for k, v in sorted(
+                    count.items(),
+                    key=operator.itemgetter(1),
+                    reverse=True,
+            )
+        ],
+    )
+
+
 def compute_metrics(moves: 'Algorithm') -> MetricsData:
     """
     Calculate a comprehensive set of metrics for an algorithm.
@@ -468,6 +535,11 @@ def compute_metrics(moves: 'Algorithm') -> MetricsData:
         of layers as a single move.
 
     """
+    from cubing_algs.packed import PackedAlgorithm  # noqa: PLC0415
+
+    if isinstance(moves, PackedAlgorithm):
+        return compute_packed_metrics(moves)
+
     pauses, rotations, outer_moves, inner_moves = regroup_moves(moves)
 
     return MetricsData(
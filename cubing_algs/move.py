@@ -5,21 +5,55 @@ This module defines the Move class, which represents a single move in a
 Rubik's cube algorithm, along with properties to identify move types and
 transformations between different notations.
 """
+from abc import ABCMeta
 from collections import UserString
 from functools import cached_property
+from threading import Lock
 
 from cubing_algs.constants import ALL_BASIC_MOVES
 from cubing_algs.constants import DOUBLE_CHAR
 from cubing_algs.constants import INNER_MOVES
 from cubing_algs.constants import INVERT_CHAR
 from cubing_algs.constants import LAYER_SPLIT
+from cubing_algs.constants import OUTER_BASIC_MOVES
 from cubing_algs.constants import OUTER_MOVES
 from cubing_algs.constants import PAUSE_CHAR
 from cubing_algs.constants import ROTATIONS
 from cubing_algs.constants import WIDE_CHAR
+from cubing_algs.exceptions import InvalidMoveError
 
 
-class Move(UserString):  # noqa: PLR0904
+class MoveType(ABCMeta):
+    """
+    Metaclass of the moves, returning the interned instance
+    of the registered moves.
+
+    Moves created from a string skip UserString initialization,
+    creating a move is a single dictionary lookup for registered moves.
+    """
+
+    def __call__(cls, seq: object = '') -> 'Move':
+        """
+        Create a move, reusing the interned instance of registered moves.
+
+        Returns:
+            The interned move, or a new instance for unregistered moves.
+
+        """
+        if type(seq) is str and cls is Move:
+            move = MOVE_TABLE.interned.get(seq)
+            if move is None:
+                move = object.__new__(Move)
+                move.data = seq
+            return move
+
+        if type(seq) is Move and cls is Move:
+            return Move(seq.data)
+
+        return super().__call__(seq)
+
+
+class Move(UserString, metaclass=MoveType):  # noqa: PLR0904
     """
     Represents a single move in a Rubik's cube algorithm.
 
@@ -29,8 +63,48 @@ class Move(UserString):  # noqa: PLR0904
     a base move (letter) and optional modifiers (such as ', 2, w).
 
     Examples of valid moves: U, R', F2, Rw, M, x, 3-4Rw, 2F
+
+    Valid untimed moves registered in the move table are interned,
+    creating the same move twice returns the same instance.
     """
 
+    def __reduce__(self) -> tuple[type['Move'], tuple[str]]:
+        """
+        Recreate the move from its string, used by pickle and copy.
+
+        Returns:
+            The class and the move string.
+
+        """
+        return (Move, (self.data,))
+
+    @staticmethod
+    def from_id(identifier: int) -> 'Move':
+        """
+        Get the interned move of an id.
+
+        Args:
+            identifier: The id of the move.
+
+        Returns:
+            The untimed move registered with this id.
+
+        """
+        return MOVE_TABLE.moves[identifier]
+
+    @cached_property
+    def id(self) -> int:
+        """
+        Small integer identifying the move, without its time information.
+
+        Ids are assigned on first use and are only stable
+        within the current process.
+        Only valid moves have an id, InvalidMoveError is raised otherwise.
+        """
+        if self.is_timed:
+            return MOVE_TABLE.register(self.untimed)
+        return MOVE_TABLE.register(self)
+
     # Parsing
 
     @cached_property
@@ -443,3 +517,236 @@ class Move(UserString):  # noqa: PLR0904
                 f'{ self.time }',
             )
         return self
+
+
+UNKNOWN_ID = -1
+
+MAX_MOVE_IDS = 1 << 16
+
+
+def base_notation_moves() -> list[str]:
+    """
+    List the moves of the base notation, without layer information.
+
+    Returns:
+        The face, wide, slice and rotation moves with every modifier,
+        and the pause.
+
+    """
+    bases = ALL_BASIC_MOVES + tuple(
+        f'{ move }{ WIDE_CHAR }'
+        for move in OUTER_BASIC_MOVES
+    )
+
+    return [
+        f'{ base }{ modifier }'
+        for base in bases
+        for modifier in ('', INVERT_CHAR, DOUBLE_CHAR)
+    ] + [PAUSE_CHAR]
+
+
+class MoveTable:
+    """
+    Table of interned moves, indexed by small integer ids.
+
+    The moves of the base notation are registered upfront,
+    other moves are registered the first time their id is requested,
+    once they are validated.
+    Each registered move is interned,
+    and its most used properties are stored in arrays indexed by id.
+
+    Ids fit in two bytes, registering more than MAX_MOVE_IDS moves
+    raises InvalidMoveError.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a table holding the moves of the base notation."""
+        self.lock = Lock()
+        self.interned: dict[str, Move] = {}
+        self.moves: list[Move] = []
+        self.base_moves: list[str] = []
+        self.doubles: list[bool] = []
+        self.inverted_ids: list[int] = []
+        self.doubled_ids: list[int] = []
+        self.clockwise_turns: list[tuple[int, int] | None] = []
+
+        for data in base_notation_moves():
+            self.register(data)
+
+    def __len__(self) -> int:
+        """
+        Return the number of registered moves.
+
+        Returns:
+            The number of registered moves.
+
+        """
+        return len(self.moves)
+
+    def register(self, move: 'Move | str') -> int:
+        """
+        Register a valid untimed move.
+
+        Args:
+            move: The move or move string, without time information.
+                  An unregistered Move instance becomes the interned one.
+
+        Returns:
+            The id of the move.
+
+        Raises:
+            InvalidMoveError: If the move is not valid,
+                              or if the table is full.
+
+        """
+        data = move if isinstance(move, str) else move.data
+
+        interned = self.interned.get(data)
+        if interned is not None:
+            return interned.id
+
+        if isinstance(move, str):
+            move = object.__new__(Move)
+            move.data = data
+
+        if move.is_timed or not move.is_valid:
+            msg = f'{ data } is not a valid untimed move'
+            raise InvalidMoveError(msg)
+
+        with self.lock:
+            interned = self.interned.get(data)
+            if interned is not None:
+                return interned.id
+
+            identifier = len(self.moves)
+            if identifier >= MAX_MOVE_IDS:
+                msg = (
+                    f'Cannot register { data }, '
+                    f'the move table is limited to { MAX_MOVE_IDS } moves'
+                )
+                raise InvalidMoveError(msg)
+
+            move.__dict__['id'] = identifier
+            self.moves.append(move)
+            self.base_moves.append(move.base_move)
+            self.doubles.append(move.is_double)
+            self.inverted_ids.append(UNKNOWN_ID)
+            self.doubled_ids.append(UNKNOWN_ID)
+            self.clockwise_turns.append(None)
+            self.interned[data] = move
+
+        return identifier
+
+    def base_move(self, identifier: int) -> str:
+        """
+        Get the base move of a move.
+
+        Args:
+            identifier: The id of the move.
+
+        Returns:
+            The base letter of the move.
+
+        """
+        return self.base_moves[identifier]
+
+    def is_double(self, identifier: int) -> bool:
+        """
+        Check if a move is a double move.
+
+        Args:
+            identifier: The id of the move.
+
+        Returns:
+            True if the move has a double modifier.
+
+        """
+        return self.doubles[identifier]
+
+    def inverted(self, identifier: int) -> int:
+        """
+        Get the inverted version of a move.
+
+        Args:
+            identifier: The id of the move.
+
+        Returns:
+            The id of the inverted move.
+
+        """
+        inverted = self.inverted_ids[identifier]
+
+        if inverted == UNKNOWN_ID:
+            inverted = self.register(self.moves[identifier].inverted)
+            self.inverted_ids[identifier] = inverted
+
+        return inverted
+
+    def doubled(self, identifier: int) -> int:
+        """
+        Get the doubled version of a move.
+
+        Args:
+            identifier: The id of the move.
+
+        Returns:
+            The id of the doubled move.
+
+        """
+        doubled = self.doubled_ids[identifier]
+
+        if doubled == UNKNOWN_ID:
+            doubled = self.register(self.moves[identifier].doubled)
+            self.doubled_ids[identifier] = doubled
+
+        return doubled
+
+    def quarter_turns(self, identifier: int) -> tuple[int, int]:
+        """
+        Decompose a move into clockwise quarter turns.
+
+        Args:
+            identifier: The id of the move.
+
+        Returns:
+            The id of the clockwise quarter turn on the same layers,
+            and the number of quarter turns, from 1 to 3.
+            Pauses are returned unchanged with 0 quarter turns.
+
+        """
+        turns = self.clockwise_turns[identifier]
+
+        if turns is None:
+            move = self.moves[identifier]
+            if move.is_pause:
+                turns = (identifier, 0)
+            elif self.is_double(identifier):
+                turns = (self.doubled(identifier), 2)
+            elif move.is_counter_clockwise:
+                turns = (self.inverted(identifier), 3)
+            else:
+                turns = (identifier, 1)
+            self.clockwise_turns[identifier] = turns
+
+        return turns
+
+    def from_quarter_turns(self, clockwise: int, turns: int) -> int:
+        """
+        Compose a move from clockwise quarter turns.
+
+        Args:
+            clockwise: The id of the clockwise quarter turn.
+            turns: The number of quarter turns, from 1 to 3.
+
+        Returns:
+            The id of the move.
+
+        """
+        if turns == 2:
+            return self.doubled(clockwise)
+        if turns == 3:
+            return self.inverted(clockwise)
+        return clockwise
+
+
+MOVE_TABLE = MoveTable()
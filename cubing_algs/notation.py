@@ -0,0 +1,365 @@
+"""
+Single pass parser of the move notation.
+
+The notation is read once, from left to right, by a tokenizer feeding
+a parser with an explicit stack of the opened groups,
+which builds a small tree of the groups:
+
+- Commutators [A, B] and conjugates [A: B]
+- Parenthesis multipliers and inversions (R U)3, (R U)' and (R U)3'
+- Comments starting with // up to the end of the line
+
+The tree is then flattened into moves, inverting groups by walking them
+backwards, so the work is linear in the size of the input and of the
+resulting moves, whatever the nesting depth.
+Neither step recurses, deep nesting never hits the recursion limit.
+
+Inputs outside of this grammar, like stray characters or parentheses
+without modifiers inside modified ones, are not handled here and
+are left to the string expansion pipeline of the parsing module,
+which defines their behavior.
+"""
+import re
+from itertools import chain
+from itertools import repeat
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from cubing_algs.constants import MOVE_SPLIT
+from cubing_algs.move import Move
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator  # pragma: no cover
+
+SYMBOL_PATTERN = re.compile(r'[\[\]():,]|//')
+
+MODIFIER_PATTERN = re.compile(r"(\d*)('?)")
+
+CASE_FIXES = str.maketrans('mseXYZ', 'MSExyz')
+
+UNNORMALIZED_QUOTES = frozenset('`’')  # noqa: RUF001
+
+GLUED_CHARS = frozenset('0123456789-')
+
+OPENING_PREFIXES = frozenset('([:,]')
+
+
+class UnsupportedNotationError(Exception):
+    """Raised when the notation is outside the single pass grammar."""
+
+
+class NotationGroup(NamedTuple):
+    """Moves between parenthesis, with their multiplier and inversion."""
+
+    nodes: list['NotationNode']
+    multiplier: int
+    inverted: bool
+
+
+class NotationBracket(NamedTuple):
+    """Commutator [A, B] or conjugate [A: B] of two sequences."""
+
+    setup: list['NotationNode']
+    action: list['NotationNode']
+    commutator: bool
+
+
+type NotationNode = Move | NotationGroup | NotationBracket
+
+
+class NotationFrame:
+    """Group opened by a parenthesis or a bracket, while it is parsed."""
+
+    def __init__(self, opening: str) -> None:
+        """Initialize an empty group opened by a symbol."""
+        self.opening = opening
+        self.nodes: list[NotationNode] = []
+        self.plain = False
+        self.setup: list[NotationNode] | None = None
+        self.commutator = False
+
+
+class NotationParser:
+    """
+    Parser of a move notation, with an explicit stack of opened groups.
+
+    In secure mode the moves are not normalized,
+    otherwise slice moves and rotations are case fixed and
+    the redundant prime of 2' modifiers is dropped.
+    """
+
+    def __init__(self, text: str, *, secure: bool) -> None:
+        """Initialize the parser on a notation."""
+        self.text = text
+        self.secure = secure
+        self.position = 0
+
+    def parse(self) -> list['NotationNode']:
+        """
+        Parse the whole notation.
+
+        Each opened group pushes a frame collecting its nodes,
+        the frame is popped into a node of its parent when closed.
+        Frames also track whether their nodes contain
+        parenthesis without modifiers.
+
+        Returns:
+            The tree of the notation.
+
+        Raises:
+            UnsupportedNotationError: If the notation is outside the grammar.
+
+        """
+        text = self.text
+        root = NotationFrame('')
+        stack = [root]
+        frame = root
+
+        while True:
+            match = SYMBOL_PATTERN.search(text, self.position)
+            end = match.start() if match else len(text)
+            if end > self.position:
+                frame.nodes.extend(self.parse_moves(text[self.position:end]))
+                self.position = end
+
+            if match is None:
+                if frame is not root:
+                    raise UnsupportedNotationError(self.position)
+                return root.nodes
+
+            symbol = match.group()
+            if symbol == '//':
+                newline = text.find('\n', end)
+                self.position = newline if newline >= 0 else len(text)
+                continue
+
+            if symbol in '[(':
+                if symbol == '(':
+                    self.check_group_opening()
+                frame = NotationFrame(symbol)
+                stack.append(frame)
+                self.position += 1
+            elif frame.opening == '(' and symbol == ')':
+                stack.pop()
+                self.close_group(frame, stack[-1])
+                frame = stack[-1]
+            elif frame.opening == '[':
+                self.continue_bracket(symbol, stack)
+                frame = stack[-1]
+            else:
+                raise UnsupportedNotationError(self.position)
+
+    def parse_moves(self, segment: str) -> list[Move]:
+        """
+        Parse the valid moves of a segment without symbols.
+
+        Args:
+            segment: The text between two symbols.
+
+        Returns:
+            The moves.
+
+        Raises:
+            UnsupportedNotationError: If the segment contains
+                other characters than blanks, or an invalid move.
+
+        """
+        tokens = MOVE_SPLIT.split(segment)
+
+        separators = ''.join(tokens[::2])
+        if separators and not separators.isspace():
+            for index in range(0, len(tokens), 2):
+                separator = tokens[index]
+                # The redundant prime of 2' is dropped when normalizing
+                if (
+                        not self.secure
+                        and separator.startswith("'")
+                        and index
+                        and tokens[index - 1].endswith('2')
+                ):
+                    separator = separator[1:]
+                if separator and not separator.isspace():
+                    raise UnsupportedNotationError(separator)
+
+        moves = [Move(token) for token in tokens[1::2]]
+        for move in moves:
+            if not move.is_valid:
+                raise UnsupportedNotationError(move)
+
+        return moves
+
+    def check_group_opening(self) -> None:
+        """
+        Check that an opening parenthesis is not glued to a move.
+
+        Raises:
+            UnsupportedNotationError: If the parenthesis may be glued
+                to the move before it.
+
+        """
+        if (
+                self.position
+                and not self.text[self.position - 1].isspace()
+                and self.text[self.position - 1] not in OPENING_PREFIXES
+        ):
+            raise UnsupportedNotationError(self.position)
+
+    def continue_bracket(self, symbol: str,
+                         stack: list[NotationFrame]) -> None:
+        """
+        Separate or close the bracket on top of the stack.
+
+        Args:
+            symbol: The separator or closing symbol met in the bracket.
+            stack: The opened groups, the bracket is popped
+                   into a node of its parent when closed.
+
+        Raises:
+            UnsupportedNotationError: If the symbol is unexpected
+                in this part of the bracket.
+
+        """
+        frame = stack[-1]
+
+        if frame.setup is None and symbol in ':,':
+            frame.setup, frame.nodes = frame.nodes, []
+            frame.commutator = symbol == ','
+        elif frame.setup is not None and symbol == ']':
+            stack.pop()
+            parent = stack[-1]
+            parent.nodes.append(
+                NotationBracket(
+                    frame.setup, frame.nodes,
+                    commutator=frame.commutator,
+                ),
+            )
+            parent.plain = parent.plain or frame.plain
+        else:
+            raise UnsupportedNotationError(self.position)
+
+        self.position += 1
+
+    def close_group(self, frame: NotationFrame,
+                    parent: NotationFrame) -> None:
+        """
+        Close parenthesis and parse their modifiers, into the parent group.
+
+        Parenthesis without modifiers are only a visual grouping,
+        their nodes are added to the parent as is.
+
+        Args:
+            frame: The group closed by the parenthesis.
+            parent: The group receiving its nodes.
+
+        Raises:
+            UnsupportedNotationError: If the group is malformed,
+                or may be glued to the moves around it.
+
+        """
+        modifier = MODIFIER_PATTERN.match(self.text, self.position + 1)
+        if modifier is None:  # pragma: no cover
+            raise UnsupportedNotationError(self.position)
+
+        self.position = modifier.end()
+        multiplier, inversion = modifier.groups()
+
+        if not multiplier and not inversion:
+            if self.secure:
+                raise UnsupportedNotationError(self.position)
+            parent.nodes.extend(frame.nodes)
+            parent.plain = True
+            return
+
+        if (
+                frame.plain
+                or self.text[self.position:self.position + 1] in GLUED_CHARS
+        ):
+            raise UnsupportedNotationError(self.position)
+
+        parent.nodes.append(
+            NotationGroup(
+                frame.nodes,
+                int(multiplier) if multiplier else 1,
+                inverted=bool(inversion),
+            ),
+        )
+
+
+def flatten_nodes(nodes: list[NotationNode], *, inverted: bool,
+                  moves: list[Move]) -> None:
+    """
+    Append the moves of nodes, walking them backwards if inverted.
+
+    The nodes being walked are kept on a stack of iterators,
+    with whether they are inverted.
+
+    Args:
+        nodes: The nodes to flatten.
+        inverted: Whether to invert the sequence of nodes.
+        moves: The list receiving the moves.
+
+    """
+    stack: list[tuple[Iterator[NotationNode], bool]] = [
+        (reversed(nodes) if inverted else iter(nodes), inverted),
+    ]
+
+    while stack:
+        iterator, inverted = stack[-1]
+
+        for node in iterator:
+            if isinstance(node, Move):
+                moves.append(node.inverted if inverted else node)
+                continue
+
+            if isinstance(node, NotationGroup):
+                inversion = inverted != node.inverted
+                part = node.nodes[::-1] if inversion else node.nodes
+                stack.append(
+                    (chain.from_iterable(repeat(part, node.multiplier)),
+                     inversion),
+                )
+                break
+
+            parts = [(node.setup, False), (node.action, False),
+                     (node.setup, True)]
+            if node.commutator:
+                parts.append((node.action, True))
+
+            # Pushed backwards, the first part to walk ends on top
+            for part, part_inversion in parts if inverted else parts[::-1]:
+                inversion = inverted != part_inversion
+                stack.append(
+                    (reversed(part) if inversion else iter(part), inversion),
+                )
+            break
+        else:
+            stack.pop()
+
+
+def parse_notation(text: str, *, secure: bool) -> list[Move] | None:
+    """
+    Parse a move notation in a single pass.
+
+    Args:
+        text: The notation to parse.
+        secure: If True, the moves are not normalized.
+
+    Returns:
+        The moves, or None if the notation is outside the grammar
+        handled in a single pass.
+
+    """
+    if not secure:
+        if not UNNORMALIZED_QUOTES.isdisjoint(text):
+            return None
+        text = text.translate(CASE_FIXES)
+
+    try:
+        nodes = NotationParser(text, secure=secure).parse()
+    except UnsupportedNotationError:
+        return None
+
+    moves: list[Move] = []
+    flatten_nodes(nodes, inverted=False, moves=moves)
+
+    return moves
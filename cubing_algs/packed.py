@@ -0,0 +1,244 @@
+"""
+Compact Algorithm representation backed by an array of move ids.
+
+Each move is stored as the id of its interned instance in the move table,
+two bytes per move instead of a reference to a Move object.
+Moves are materialized only when the algorithm is indexed or iterated,
+transforms and metrics with a fast path work on the ids directly.
+"""
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from typing import overload
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.constants import PAUSE_CHAR
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.move import MOVE_TABLE
+from cubing_algs.move import Move
+
+if TYPE_CHECKING:
+    from typing import SupportsIndex  # pragma: no cover
+
+PACKED_TYPECODE = 'H'
+
+PAUSE_ID = MOVE_TABLE.register(PAUSE_CHAR)
+
+
+def pack_move(item: Move | str) -> int:
+    """
+    Get the id of a validated untimed move.
+
+    Args:
+        item: A Move object or string representing a single move.
+
+    Returns:
+        The id of the move in the move table.
+
+    Raises:
+        InvalidMoveError: If the move is not valid or is timed.
+
+    """
+    move = Algorithm.parse_move(item)
+
+    if move.is_timed:
+        msg = f'{ item } is a timed move, which cannot be packed'
+        raise InvalidMoveError(msg)
+
+    return move.id
+
+
+class PackedAlgorithm(Algorithm):
+    """
+    Algorithm storing its moves as an array of interned move ids.
+
+    The ids are the source of truth until the list of moves is requested
+    through the data attribute, for example by an inherited list method,
+    then the list is used until the ids are requested again.
+
+    Only untimed moves can be packed.
+    Pickling stores the move strings, not the ids.
+    """
+
+    def __init__(self, initlist: Iterable[Move] | None = None) -> None:
+        """Initialize a packed algorithm from an optional sequence of moves."""
+        self._moves: list[Move] | None = None
+        self._ids: array[int] | None = array(PACKED_TYPECODE)
+
+        if isinstance(initlist, PackedAlgorithm):
+            self._ids = array(PACKED_TYPECODE, initlist.ids)
+        elif initlist is not None:
+            self._ids = array(
+                PACKED_TYPECODE,
+                [pack_move(move) for move in initlist],
+            )
+
+    @staticmethod
+    def from_ids(ids: Iterable[int]) -> 'PackedAlgorithm':
+        """
+        Create a packed algorithm from move ids.
+
+        Args:
+            ids: Ids of moves registered in the move table.
+
+        Returns:
+            A packed algorithm holding the ids.
+
+        """
+        algorithm = PackedAlgorithm()
+        algorithm.ids = array(PACKED_TYPECODE, ids)
+
+        return algorithm
+
+    @property
+    def ids(self) -> 'array[int]':
+        """Array of the move ids, packing the list of moves if needed."""
+        if self._ids is None:
+            self._ids = array(
+                PACKED_TYPECODE,
+                [pack_move(move) for move in self._moves or []],
+            )
+            self._moves = None
+
+        return self._ids
+
+    @ids.setter
+    def ids(self, ids: 'array[int]') -> None:
+        """Replace the moves by an array of move ids."""
+        self.invalidate_analysis()
+        self._ids = ids
+        self._moves = None
+
+    @property
+    def data(self) -> list[Move]:
+        """List of the moves, materialized from the ids if needed."""
+        if self._moves is None:
+            self._moves = [
+                MOVE_TABLE.moves[identifier]
+                for identifier in self._ids or []
+            ]
+            self._ids = None
+
+        return self._moves
+
+    @data.setter
+    def data(self, moves: list[Move]) -> None:
+        """Replace the moves by a list of moves."""
+        self.invalidate_analysis()
+        self._moves = moves
+        self._ids = None
+
+    def copy(self) -> 'PackedAlgorithm':
+        """
+        Copy the packed algorithm.
+
+        Returns:
+            A new packed algorithm with the same moves.
+
+        """
+        return PackedAlgorithm(self)
+
+    def append(self, item: Move | str) -> None:
+        """Add a move to the end of the algorithm."""
+        self.invalidate_analysis()
+        self.ids.append(pack_move(item))
+
+    def insert(self, i: int, item: Move | str) -> None:
+        """Insert a move at a specific position in the algorithm."""
+        self.invalidate_analysis()
+        self.ids.insert(i, pack_move(item))
+
+    def extend(self, other: Iterable[Move | str] | Move | str) -> None:
+        """Extend the algorithm with moves from another sequence."""
+        self.invalidate_analysis()
+        if isinstance(other, PackedAlgorithm):
+            self.ids.extend(other.ids)
+        elif isinstance(other, Algorithm):
+            self.ids.extend([pack_move(move) for move in other])
+        else:
+            self.ids.extend(
+                [pack_move(move) for move in self.parse_moves(other)],
+            )
+
+    def __len__(self) -> int:
+        """
+        Return the number of moves.
+
+        Returns:
+            The number of moves in the algorithm.
+
+        """
+        if self._moves is not None:
+            return len(self._moves)
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Move]:
+        """
+        Iterate over the moves, materialized one at a time.
+
+        Returns:
+            An iterator over the moves.
+
+        """
+        if self._moves is not None:
+            return iter(self._moves)
+        return map(MOVE_TABLE.moves.__getitem__, self.ids)
+
+    @overload
+    def __getitem__(self, i: 'SupportsIndex') -> Move: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> 'PackedAlgorithm': ...
+
+    def __getitem__(
+            self, i: 'SupportsIndex | slice',
+    ) -> 'Move | PackedAlgorithm':
+        """
+        Get a move, or a packed algorithm for a slice.
+
+        Args:
+            i: Index or slice of the moves.
+
+        Returns:
+            The move at the index, or the moves of the slice.
+
+        """
+        if self._moves is not None:
+            if isinstance(i, slice):
+                return PackedAlgorithm(self._moves[i])
+            return self._moves[i]
+
+        if isinstance(i, slice):
+            return PackedAlgorithm.from_ids(self.ids[i])
+        return MOVE_TABLE.moves[self.ids[i]]
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare with another algorithm or list of moves.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            True if the moves are the same.
+
+        """
+        if isinstance(other, PackedAlgorithm):
+            return self.ids == other.ids
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[type['PackedAlgorithm'], tuple[list[str]]]:
+        """
+        Serialize the move strings, used by pickle and copy.
+
+        The ids are only stable within the current process,
+        the moves are registered again when loaded.
+
+        Returns:
+            The class and the move strings.
+
+        """
+        return (PackedAlgorithm, ([move.data for move in self],))
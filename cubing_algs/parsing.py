@@ -7,13 +7,17 @@ Algorithm objects.
 """
 import logging
 import re
+from collections import OrderedDict
 from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Literal
 
 from cubing_algs.algorithm import Algorithm
 from cubing_algs.commutator_conjugate import expand_commutators_and_conjugates
 from cubing_algs.constants import MOVE_SPLIT
 from cubing_algs.exceptions import InvalidMoveError
 from cubing_algs.move import Move
+from cubing_algs.notation import parse_notation
 from cubing_algs.parenthesis import (
     expand_parenthesis_multipliers_and_inversions,
 )
@@ -30,6 +34,8 @@ CLEAN_PATTERNS = [
 
 CASE_FIXES = str.maketrans('mseXYZ', 'MSExyz')
 
+type ErrorMode = Literal['skip', 'raise', 'collect']
+
 
 def clean_multiline_and_comments(text: str) -> str:
     """
@@ -144,6 +150,150 @@ def check_moves(moves: list[Move]) -> bool:
     return True
 
 
+class ParseCache:
+    """
+    Bounded cache of parsed algorithms with LRU eviction.
+
+    Algorithms are keyed by their raw notation and the secure flag.
+    The cached algorithms are never handed out, callers get copies,
+    so mutating a parsed algorithm cannot alter later results.
+
+    The cache is disabled by default,
+    and a max_size below 1 caches nothing.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        """Initialize a disabled parse cache with configurable size."""
+        self.max_size = max_size
+        self.algorithms: OrderedDict[tuple[str, bool], Algorithm] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self._enabled = False
+
+    def get_algorithm(self, raw_moves: str,
+                      *, secure: bool) -> Algorithm | None:
+        """
+        Get a copy of a parsed algorithm from the cache.
+
+        Args:
+            raw_moves: The raw notation to look up.
+            secure: The secure flag used when parsing.
+
+        Returns:
+            A copy of the cached algorithm if found, None otherwise.
+
+        """
+        if not self._enabled:
+            return None
+
+        algorithm = self.algorithms.get((raw_moves, secure))
+        if algorithm is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.algorithms.move_to_end((raw_moves, secure))
+
+        return algorithm.copy()
+
+    def set_algorithm(self, raw_moves: str, algorithm: Algorithm,
+                      *, secure: bool) -> None:
+        """Cache a copy of a parsed algorithm."""
+        if not self._enabled or self.max_size < 1:
+            return
+
+        while len(self.algorithms) >= self.max_size:
+            # Evict the least recently used algorithms
+            self.algorithms.popitem(last=False)
+
+        self.algorithms[raw_moves, secure] = algorithm.copy()
+
+    def clear(self) -> None:
+        """Clear all cached algorithms and statistics."""
+        self.algorithms.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def enable(self) -> None:
+        """Enable caching."""
+        self._enabled = True
+
+    def disable(self) -> None:
+        """Disable caching."""
+        self._enabled = False
+
+
+# Global cache instance
+_parse_cache = ParseCache()
+
+
+def clear_parse_cache() -> None:
+    """Clear the parsed algorithms cache."""
+    _parse_cache.clear()
+
+
+def disable_parse_cache() -> None:
+    """Disable caching of parsed algorithms."""
+    _parse_cache.disable()
+
+
+def enable_parse_cache() -> None:
+    """Enable caching of parsed algorithms."""
+    _parse_cache.enable()
+
+
+def get_parse_cache_info() -> dict[str, int]:
+    """
+    Get information about the current parse cache state.
+
+    Returns:
+        Dictionary with cache statistics including size, hits and misses.
+
+    """
+    return {
+        'cached': len(_parse_cache.algorithms),
+        'hits': _parse_cache.hits,
+        'misses': _parse_cache.misses,
+        'max_size': _parse_cache.max_size,
+        'enabled': _parse_cache._enabled,  # noqa: SLF001
+    }
+
+
+def expand_notation(raw_moves: str, *, secure: bool) -> list[Move]:
+    """
+    Expand a move notation by successive rewrites of the string.
+
+    Comments are removed, then commutators and conjugates are expanded,
+    then parenthesis multipliers and inversions, before splitting
+    the string into moves.
+    This pipeline defines the behavior of the notations outside of
+    the grammar handled in a single pass by parse_notation.
+
+    Args:
+        raw_moves: The notation to expand.
+        secure: If True, skip the cleaning of the moves.
+
+    Returns:
+        The moves, not validated.
+
+    """
+    raw_moves = clean_multiline_and_comments(raw_moves)
+
+    # First expand commutators/conjugates so modifiers work on simple moves
+    expanded_moves = expand_commutators_and_conjugates(raw_moves)
+    # Then expand multipliers and inversions
+    expanded_moves = expand_parenthesis_multipliers_and_inversions(
+        expanded_moves,
+    )
+
+    if not secure:
+        return split_moves(clean_moves(expanded_moves))
+
+    return split_moves(expanded_moves)
+
+
 def parse_moves(raw_moves: Iterable[Move | str] | Move | str,
                 *, secure: bool = True) -> Algorithm:
     """
@@ -160,6 +310,13 @@ def parse_moves(raw_moves: Iterable[Move | str] | Move | str,
     - Supports parenthesis multipliers (R U)3
     - Supports commutators [A, B] and conjugates [A: B]
 
+    Once enabled with enable_parse_cache, parsed algorithms are cached
+    and copies are returned for the notations already parsed.
+
+    The notation is parsed in a single pass by parse_notation,
+    falling back on the string expansions of expand_notation
+    for the notations outside of its grammar.
+
     Args:
         raw_moves: The moves to parse, as a string, iterable, or Algorithm.
         secure: If True, skip cleaning and validation steps.
@@ -199,25 +356,22 @@ def parse_moves(raw_moves: Iterable[Move | str] | Move | str,
     else:
         raw_moves_str = str(raw_moves)
 
-    raw_moves_str = clean_multiline_and_comments(raw_moves_str)
+    cached = _parse_cache.get_algorithm(raw_moves_str, secure=secure)
+    if cached is not None:
+        return cached
 
-    # First expand commutators/conjugates so modifiers work on simple moves
-    expanded_moves = expand_commutators_and_conjugates(raw_moves_str)
-    # Then expand multipliers and inversions
-    expanded_moves = expand_parenthesis_multipliers_and_inversions(
-        expanded_moves,
-    )
+    moves = parse_notation(raw_moves_str, secure=secure)
+    if moves is None:
+        moves = expand_notation(raw_moves_str, secure=secure)
 
-    if not secure:
-        moves = split_moves(clean_moves(expanded_moves))
-    else:
-        moves = split_moves(expanded_moves)
+        if not secure and not check_moves(moves):
+            error = f'{ raw_moves } contains invalid move'
+            raise InvalidMoveError(error)
 
-    if not secure and not check_moves(moves):
-        error = f'{ raw_moves } contains invalid move'
-        raise InvalidMoveError(error)
+    algorithm = Algorithm(moves)
+    _parse_cache.set_algorithm(raw_moves_str, algorithm, secure=secure)
 
-    return Algorithm(moves)
+    return algorithm
 
 
 def parse_moves_cfop(
@@ -245,3 +399,47 @@ def parse_moves_cfop(
         trim_moves('U'),
         to_fixpoint=True,
     )
+
+
+def iter_parse_moves(
+        lines: Iterable[str], *,
+        secure: bool = False, on_error: ErrorMode = 'skip',
+) -> Iterator[tuple[int, Algorithm | InvalidMoveError]]:
+    """
+    Parse algorithms one per line, lazily.
+
+    Lines are read and parsed one at a time, only the current line
+    and its algorithm are held, and blank lines are ignored.
+    The moves of the base notation are interned, so the algorithms
+    of all the lines share the same Move instances.
+
+    Args:
+        lines: The lines to parse, like an open text file.
+        secure: If True, skip cleaning and validation steps.
+        on_error: What to do with the lines containing invalid moves,
+            'skip' them, 'raise' the error, or 'collect' the error
+            in place of the algorithm.
+
+    Yields:
+        The line number, starting at 1, paired with the algorithm
+        of the line, or with its error when collecting errors.
+
+    Raises:
+        InvalidMoveError: If a line contains invalid moves
+            and errors are raised.
+
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line or line.isspace():
+            continue
+
+        try:
+            algorithm = parse_moves(line.rstrip('\r\n'), secure=secure)
+        except InvalidMoveError as error:
+            if on_error == 'raise':
+                raise
+            if on_error == 'collect':
+                yield line_number, error
+            continue
+
+        yield line_number, algorithm
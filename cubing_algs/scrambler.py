@@ -9,7 +9,18 @@ from cubing_algs.constants import FACE_ORDER
 from cubing_algs.constants import ITERATIONS_BY_CUBE_SIZE
 from cubing_algs.constants import OPPOSITE_FACES
 from cubing_algs.constants import OUTER_BASIC_MOVES
+from cubing_algs.integrity import count_inversions
+from cubing_algs.move import Move
+from cubing_algs.packed import PackedAlgorithm
+from cubing_algs.packed import pack_move
 from cubing_algs.parsing import parse_moves
+from cubing_algs.solvers.pocket import STATE_COUNT
+from cubing_algs.solvers.pocket import TWIST_COUNT
+from cubing_algs.solvers.pocket import solve_coordinates
+from cubing_algs.solvers.two_phase import DEFAULT_MAX_LENGTH
+from cubing_algs.solvers.two_phase import solve
+from cubing_algs.transform.mirror import mirror_moves
+from cubing_algs.vcube import VCube
 
 FACE_REGEXP = re.compile(rf"({ '|'.join(FACE_ORDER) })")
 
@@ -209,6 +220,103 @@ def scramble(cube_size: int, iterations: int = 0, *,
     return random_moves(cube_size, move_set, iterations, rng)
 
 
+def build_successors(move_set: list[str]) -> list[list[int]]:
+    """
+    Build the moves allowed after each move of a move set.
+
+    The face of each move is searched once, so the moves following
+    a move are drawn without checking them with is_valid_next_move.
+
+    Args:
+        move_set: List of available moves.
+
+    Returns:
+        The indexes in the move set of the moves allowed
+        after each move, indexed by the index of the move.
+
+    """
+    faces = []
+    for move in move_set:
+        face_search = FACE_REGEXP.search(move)
+        faces.append(face_search[0] if face_search else '')
+
+    successors_by_face = {
+        previous: [
+            index for index, face in enumerate(faces)
+            if previous and face
+            and face != previous and OPPOSITE_FACES[face] != previous
+        ]
+        for previous in set(faces)
+    }
+
+    return [successors_by_face[face] for face in faces]
+
+
+def scrambles(cube_size: int, count: int,  # noqa: PLR0913
+              iterations: int = 0, *,
+              inner_layers: bool = False,
+              right_handed: bool = True,
+              packed: bool = False,
+              rng: Random | None = None) -> list[Algorithm]:
+    """
+    Generate many random scrambles for a cube of the specified size.
+
+    The scrambles are drawn like the ones of scramble, each move
+    being equally likely among the moves allowed after the previous
+    one, but the allowed moves are computed once for all the scrambles,
+    and the algorithms are built from the moves without parsing them.
+
+    Args:
+        cube_size: Size of the cube (e.g., 3 for 3x3x3).
+        count: Number of scrambles to generate.
+        iterations: Number of moves in each scramble (0 for automatic).
+        inner_layers: Whether to include inner layer moves.
+        right_handed: Whether to optimize for right-handed solving.
+        packed: Whether to build PackedAlgorithm storing move ids.
+        rng: Optional random number generator.
+
+    Returns:
+        List of algorithms containing the scramble sequences.
+
+    """
+    if rng is None:
+        rng = DEFAULT_RNG
+
+    move_set = build_cube_move_set(
+        cube_size,
+        inner_layers=inner_layers,
+        right_handed=right_handed,
+    )
+    successors = build_successors(move_set)
+    moves = [Move(move) for move in move_set]
+    ids = [pack_move(move) for move in moves]
+    iterations_range = ITERATIONS_BY_CUBE_SIZE[min(cube_size, 7)]
+
+    choice = rng.choice
+    move_count = len(move_set)
+
+    algorithms: list[Algorithm] = []
+    for _ in range(count):
+        length = iterations or rng.randint(*iterations_range)
+
+        index = rng.randrange(move_count)
+        indexes = [index]
+        for _ in range(length - 1):
+            index = choice(successors[index])
+            indexes.append(index)
+
+        if packed:
+            algorithms.append(
+                PackedAlgorithm.from_ids([ids[index] for index in indexes]),
+            )
+        else:
+            algorithms.append(
+                Algorithm([moves[index] for index in indexes]),
+            )
+
+    return algorithms
+
+
 def scramble_easy_cross(rng: Random | None = None) -> Algorithm:
     """
     Generate an easy cross scramble using only basic face moves.
@@ -224,3 +332,84 @@ def scramble_easy_cross(rng: Random | None = None) -> Algorithm:
 
     """
     return random_moves(3, MOVES_EASY_CROSS, 10, rng)
+
+
+def random_cube(rng: Random | None = None) -> VCube:
+    """
+    Generate a 3x3x3 cube in a uniformly random legal state.
+
+    The corners and edges are shuffled independently, fixing the parity
+    of the edges to the one of the corners, and all but the last corner
+    and edge are randomly oriented, fixing the last orientations
+    so the cube passes the integrity checks.
+
+    Args:
+        rng: Optional random number generator.
+
+    Returns:
+        A virtual cube in a random state, solvable and equally likely.
+
+    """
+    if rng is None:
+        rng = DEFAULT_RNG
+
+    cp = list(range(8))
+    rng.shuffle(cp)
+    ep = list(range(12))
+    rng.shuffle(ep)
+    if count_inversions(cp) % 2 != count_inversions(ep) % 2:
+        ep[0], ep[1] = ep[1], ep[0]
+
+    co = [rng.randrange(3) for _ in range(7)]
+    co.append(-sum(co) % 3)
+    eo = [rng.randrange(2) for _ in range(11)]
+    eo.append(-sum(eo) % 2)
+
+    return VCube.from_cubies(cp, co, ep, eo, list(range(6)))
+
+
+def scramble_random_state(rng: Random | None = None,
+                          max_length: int = DEFAULT_MAX_LENGTH) -> Algorithm:
+    """
+    Generate a random state scramble for the 3x3x3 cube.
+
+    Unlike random moves, every legal state is equally likely to be
+    scrambled, the scramble being the inverse of the solution of
+    a random state found by the two-phase solver.
+
+    Args:
+        rng: Optional random number generator.
+        max_length: The maximal number of moves of the scramble.
+
+    Returns:
+        Algorithm of face moves bringing the solved cube to a random state.
+
+    """
+    return mirror_moves(solve(random_cube(rng), max_length))
+
+
+def scramble_random_state_2x2(rng: Random | None = None,
+                              metric: str = 'htm') -> Algorithm:
+    """
+    Generate a random state scramble for the 2x2x2 cube.
+
+    Every state is equally likely to be scrambled, the scramble being
+    the inverse of the optimal solution of a random state.
+
+    Args:
+        rng: Optional random number generator.
+        metric: The metric in which the scramble is optimal, htm or qtm.
+
+    Returns:
+        Algorithm of U, R and F moves bringing the solved cube
+        to a random state.
+
+    """
+    if rng is None:
+        rng = DEFAULT_RNG
+
+    permutation, twist = divmod(rng.randrange(STATE_COUNT), TWIST_COUNT)
+
+    return mirror_moves(
+        parse_moves(solve_coordinates(permutation, twist, metric)),
+    )
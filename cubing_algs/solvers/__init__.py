@@ -0,0 +1 @@
+"""Solvers finding algorithms that bring a cube back to its solved state."""
@@ -0,0 +1,850 @@
+"""
+Optimal search of the algorithms of the last layer cases.
+
+The algorithms of an OLL or PLL case are searched by iterative
+deepening over the moves of a generator set, such as <R, U, F, L, D, B>
+for the face turn metric, or <R, U, M> for short slice algorithms.
+
+The cubies are followed relative to the centers, with the orientation
+in which the cube is held, so a slice move acts as a pair of moves of
+the opposite faces, and wide moves and rotations are free, as they are
+in the metrics of the algorithms.
+
+The cubies are split in five groups of four pieces, the corners of
+the U and D layers and the edges of the U, D and E layers. Each group
+has a coordinate numbering the positions and orientations of its
+pieces, a single move table serving all the groups of the same kind,
+and a pruning table bounding the depth of the search by the distance
+of the group to its goal.
+
+The tables are computed once and written to the cache directory
+of the solvers. The searches run in the search extension, at about
+3 million nodes per second: the cases up to 10 moves are searched
+in a few seconds in the face turn metric, and in up to a minute
+in the slice turn metric. The longest cases, up to 14 moves, would
+take hours, so a search gives up after a budget of nodes.
+"""
+from array import array
+from functools import lru_cache
+from itertools import permutations
+from itertools import product
+from math import perm
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import NamedTuple
+from typing import TypedDict
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.constants import FACE_ORDER
+from cubing_algs.cubies import CubieCube
+from cubing_algs.cycles import MAX_CYCLES
+from cubing_algs.extensions import search
+from cubing_algs.move import Move
+from cubing_algs.parsing import parse_moves
+from cubing_algs.solvers.tables import load_table
+from cubing_algs.solvers.two_phase import POWERS
+from cubing_algs.transform.mirror import mirror_moves
+from cubing_algs.vcube import VCube
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable  # pragma: no cover
+    from collections.abc import Sequence  # pragma: no cover
+
+    from cubing_algs.cases.case import Case  # pragma: no cover
+
+MOVE_TYPECODE: Final = 'I'
+
+PRUNING_TYPECODE: Final = 'B'
+
+MOVES = tuple(
+    f'{ layer }{ power }'
+    for layer in (*FACE_ORDER, 'M', 'E', 'S')
+    for power in POWERS
+)
+
+FACE_MOVES_COUNT = 18
+
+GENERATORS = {
+    'RUFLDB': MOVES[:FACE_MOVES_COUNT],
+    'RUFLDBMES': MOVES,
+    'RUM': ('R', 'R2', "R'", 'U', 'U2', "U'", 'M', 'M2', "M'"),
+}
+
+# Axis and rank along the axis of the layers
+LAYERS = {
+    'U': (0, 0), 'E': (0, 1), 'D': (0, 2),
+    'R': (1, 0), 'M': (1, 1), 'L': (1, 2),
+    'F': (2, 0), 'S': (2, 1), 'B': (2, 2),
+}
+
+AUFS = ('', 'U', 'U2', "U'")
+
+GROUP_SIZE: Final = 4
+
+CORNER_COUNT = 8
+EDGE_COUNT = 12
+
+# Orientations of the pieces of a group, by number of orientations
+ORIENTATION_COUNTS = {3: 3 ** GROUP_SIZE, 2: 2 ** GROUP_SIZE}
+
+CORNER_COORDINATE_COUNT = perm(CORNER_COUNT, GROUP_SIZE) * 3 ** GROUP_SIZE
+EDGE_COORDINATE_COUNT = perm(EDGE_COUNT, GROUP_SIZE) * 2 ** GROUP_SIZE
+
+# Pieces of the groups, by cubie index
+U_CORNERS = (0, 1, 2, 3)
+D_CORNERS = (4, 5, 6, 7)
+U_EDGES = (0, 1, 2, 3)
+D_EDGES = (4, 5, 6, 7)
+E_EDGES = (8, 9, 10, 11)
+
+STEPS = ('OLL', 'PLL')
+
+DEFAULT_MAX_LENGTH = 12
+
+# Nodes searched before giving up, about a minute for the extension
+DEFAULT_MAX_NODES = 200_000_000
+
+
+class LastLayerSolution(NamedTuple):
+    """An algorithm solving a case after an adjustment of the U face."""
+
+    auf: str
+    algorithm: Algorithm
+
+
+class OptimalData(TypedDict):
+    """Optimal values of a case, as stored in its data."""
+
+    optimal_cycles: int
+    optimal_htm: int
+    optimal_stm: int
+
+
+class LastLayerTables(NamedTuple):
+    """Move and pruning tables of the last layer search."""
+
+    corner_moves: memoryview
+    edge_moves: memoryview
+    u_corners_pruning: memoryview
+    d_corners_pruning: memoryview
+    u_edges_pruning: memoryview
+    d_edges_pruning: memoryview
+    e_edges_pruning: memoryview
+
+
+def orientation_coordinate(orientations: 'Sequence[int]', base: int) -> int:
+    """
+    Compute the orientation part of the coordinate of a group.
+
+    Args:
+        orientations: The orientations of the pieces of the group.
+        base: The number of orientations of a piece.
+
+    Returns:
+        The orientations in base.
+
+    """
+    coordinate = 0
+    for orientation in orientations:
+        coordinate = coordinate * base + orientation
+
+    return coordinate
+
+
+@lru_cache(maxsize=2)
+def get_positions(count: int) -> dict[tuple[int, ...], int]:
+    """
+    Index the positions of the pieces of a group.
+
+    Args:
+        count: The number of positions of the pieces.
+
+    Returns:
+        The index of each ordered choice of positions.
+
+    """
+    return {
+        positions: index
+        for index, positions in enumerate(
+            permutations(range(count), GROUP_SIZE),
+        )
+    }
+
+
+def group_coordinate(positions: 'Sequence[int]',
+                     orientations: 'Sequence[int]', base: int) -> int:
+    """
+    Compute the coordinate of a group of pieces.
+
+    Args:
+        positions: The positions of the pieces of the group.
+        orientations: The orientations of the pieces of the group.
+        base: The number of orientations of a piece.
+
+    Returns:
+        The index of the positions times base^4,
+        plus the orientations in base.
+
+    """
+    return (
+        get_positions(CORNER_COUNT if base == 3 else EDGE_COUNT)[
+            tuple(positions)
+        ] * ORIENTATION_COUNTS[base]
+        + orientation_coordinate(orientations, base)
+    )
+
+
+def cubies_coordinates(cubies: tuple[list[int], ...] | tuple[
+        tuple[int, ...], ...,
+]) -> tuple[int, int, int, int, int]:
+    """
+    Compute the coordinates of the five groups of a cubie state.
+
+    Args:
+        cubies: The corner and edge permutations and orientations.
+
+    Returns:
+        The coordinates of the U and D corners,
+        and of the U, D and E edges.
+
+    """
+    cp, co, ep, eo = cubies[:4]
+
+    def coordinate(pieces: tuple[int, ...], permutation: 'Sequence[int]',
+                   orientation: 'Sequence[int]', base: int) -> int:
+        positions = [permutation.index(piece) for piece in pieces]
+        return group_coordinate(
+            positions, [orientation[position] for position in positions],
+            base,
+        )
+
+    return (
+        coordinate(U_CORNERS, cp, co, 3),
+        coordinate(D_CORNERS, cp, co, 3),
+        coordinate(U_EDGES, ep, eo, 2),
+        coordinate(D_EDGES, ep, eo, 2),
+        coordinate(E_EDGES, ep, eo, 2),
+    )
+
+
+def move_cubies(move: str) -> tuple[list[int], ...]:
+    """
+    Compute the cubies moved by a move, relative to the centers.
+
+    Args:
+        move: A face or slice move.
+
+    Returns:
+        The corner and edge permutations and orientations.
+
+    """
+    cube = VCube()
+    cube.rotate(move)
+
+    return cube.to_cubies[:4]
+
+
+def build_group_moves(count: int, base: int) -> 'array[int]':
+    """
+    Build the move table of the coordinate of a group of pieces.
+
+    The pieces are not named by the coordinate, so the table
+    is shared by all the groups of the same kind.
+
+    Args:
+        count: The number of positions of the pieces.
+        base: The number of orientations of a piece.
+
+    Returns:
+        The coordinates after each move of MOVES,
+        indexed by coordinate * 27 + move.
+
+    """
+    orientation_count = ORIENTATION_COUNTS[base]
+    indexes = get_positions(count)
+
+    # Destinations of the positions and twists added there by the moves
+    destinations = []
+    for move in MOVES:
+        cp, co, ep, eo = move_cubies(move)
+        permutation, orientation = (cp, co) if base == 3 else (ep, eo)
+        destinations.append(
+            [
+                (target, orientation[target])
+                for target in sorted(
+                    range(count), key=permutation.__getitem__,
+                )
+            ],
+        )
+
+    # Sums of the orientations of the pieces, digit by digit
+    sums = [
+        orientation_coordinate(
+            [
+                (digit + twist) % base
+                for digit, twist in zip(digits, twists, strict=True)
+            ],
+            base,
+        )
+        for digits in product(range(base), repeat=GROUP_SIZE)
+        for twists in product(range(base), repeat=GROUP_SIZE)
+    ]
+
+    table = array(MOVE_TYPECODE)
+    for positions in indexes:
+        moved = [
+            (
+                indexes[
+                    tuple(targets[position][0] for position in positions)
+                ] * orientation_count,
+                orientation_coordinate(
+                    [targets[position][1] for position in positions], base,
+                ),
+            )
+            for targets in destinations
+        ]
+        for code in range(orientation_count):
+            row = code * orientation_count
+            table.extend(
+                [start + sums[row + twist] for start, twist in moved],
+            )
+
+    return table
+
+
+@lru_cache(maxsize=1)
+def get_frame_moves() -> tuple[tuple[tuple[int, int], ...], ...]:
+    """
+    Compute the effect of the moves in each orientation of the cube.
+
+    A move made with the cube held in an orientation is the move
+    conjugated by the rotation of the orientation, followed
+    by a rotation when it is a slice move.
+
+    Returns:
+        The relative move in MOVES and the next orientation
+        after each move of MOVES, indexed by orientation and move,
+        the first orientation being the starting one.
+
+    """
+    relative_moves = {
+        tuple(tuple(values) for values in move_cubies(move)): index
+        for index, move in enumerate(MOVES)
+    }
+
+    # The cube turned around the U face, then the U center moved
+    rotations = [
+        f'{ turn } { move }'.strip()
+        for move in ('', 'x', 'x2', "x'", 'z', "z'")
+        for turn in ('', 'y', 'y2', "y'")
+    ]
+    orientations = {}
+    for index, rotation in enumerate(rotations):
+        cube = VCube()
+        cube.rotate(rotation)
+        orientations[cube.state[4::9]] = index
+
+    # Rotations bringing back the centers of each orientation
+    inverses = [
+        str(parse_moves(rotation).transform(mirror_moves))
+        for rotation in rotations
+    ]
+    returns = dict(zip(orientations, inverses, strict=True))
+
+    frame_moves = []
+    for rotation, inverse in zip(rotations, inverses, strict=True):
+        moves = []
+        for move in MOVES:
+            cube = VCube()
+            cube.rotate(f'{ rotation } { move } { inverse }')
+            cube.rotate(returns[cube.state[4::9]])
+
+            moved = VCube()
+            moved.rotate(f'{ rotation } { move }')
+            moves.append(
+                (
+                    relative_moves[
+                        tuple(tuple(values) for values in cube.to_cubies[:4])
+                    ],
+                    orientations[moved.state[4::9]],
+                ),
+            )
+        frame_moves.append(tuple(moves))
+
+    return tuple(frame_moves)
+
+
+def get_goals(step: str) -> tuple[
+        frozenset[tuple[int, int]], frozenset[int], frozenset[int],
+]:
+    """
+    Compute the coordinates of the U layer once a step is solved.
+
+    The OLL is solved when the U layer is oriented, whatever
+    its permutation, and the PLL when the cube is solved
+    up to an adjustment of the U face.
+
+    Args:
+        step: The step of the case, OLL or PLL.
+
+    Returns:
+        The pairs of U corners and U edges coordinates of the goal,
+        and the U corners and U edges coordinates of the goal.
+
+    """
+    if step == 'PLL':
+        pairs = frozenset(
+            (coordinates[0], coordinates[2])
+            for coordinates in (
+                cubies_coordinates(move_cubies(auf)) for auf in AUFS
+            )
+        )
+    else:
+        pairs = frozenset(
+            product(
+                (
+                    group_coordinate(positions, (0, 0, 0, 0), 3)
+                    for positions in permutations(U_CORNERS)
+                ),
+                (
+                    group_coordinate(positions, (0, 0, 0, 0), 2)
+                    for positions in permutations(U_EDGES)
+                ),
+            ),
+        )
+
+    return (
+        pairs,
+        frozenset(corners for corners, _edges in pairs),
+        frozenset(edges for _corners, edges in pairs),
+    )
+
+
+def build_pruning_table(moves: memoryview, moves_count: int,
+                        sources: 'Iterable[int]') -> bytearray:
+    """
+    Build the distance table of a group to its goal.
+
+    Args:
+        moves: The move table of the coordinate of the group.
+        moves_count: The number of moves of MOVES searched,
+            the face moves or all of them.
+        sources: The coordinates of the goal.
+
+    Returns:
+        The number of moves needed to reach the goal,
+        indexed by coordinate.
+
+    """
+    return search.goal_distances(moves, len(MOVES), moves_count, sources)
+
+
+@lru_cache(maxsize=4)
+def get_tables(step: str, moves_count: int) -> LastLayerTables:
+    """
+    Load the tables of the search of a step.
+
+    Args:
+        step: The step of the cases, OLL or PLL.
+        moves_count: The number of moves of MOVES searched,
+            18 for the face moves, 27 with the slice moves.
+
+    Returns:
+        The move and pruning tables.
+
+    """
+    stride = len(MOVES)
+    corner_moves = load_table(
+        'last-layer-corner-moves', MOVE_TYPECODE,
+        CORNER_COORDINATE_COUNT * stride,
+        lambda: build_group_moves(CORNER_COUNT, 3),
+    )
+    edge_moves = load_table(
+        'last-layer-edge-moves', MOVE_TYPECODE,
+        EDGE_COORDINATE_COUNT * stride,
+        lambda: build_group_moves(EDGE_COUNT, 2),
+    )
+
+    metric = 'htm' if moves_count == FACE_MOVES_COUNT else 'stm'
+    _pairs, u_corners, u_edges = get_goals(step)
+    _uc, d_corners, _ue, d_edges, e_edges = cubies_coordinates(
+        move_cubies(''),
+    )
+
+    def pruning(name: str, moves: memoryview,
+                sources: 'Iterable[int]') -> memoryview:
+        return load_table(
+            f'last-layer-{ metric }-{ name }-pruning', PRUNING_TYPECODE,
+            len(moves) // stride,
+            lambda: build_pruning_table(moves, moves_count, sources),
+        )
+
+    return LastLayerTables(
+        corner_moves,
+        edge_moves,
+        pruning(f'{ step.lower() }-corners', corner_moves, u_corners),
+        pruning('d-corners', corner_moves, [d_corners]),
+        pruning(f'{ step.lower() }-edges', edge_moves, u_edges),
+        pruning('d-edges', edge_moves, [d_edges]),
+        pruning('e-edges', edge_moves, [e_edges]),
+    )
+
+
+def build_successors(moves: tuple[str, ...]) -> tuple[tuple[int, ...], ...]:
+    """
+    Build the moves allowed after each move of a generator set.
+
+    Moves of the same layer are merged, and moves of the same axis
+    commute, so only their order along the axis is searched.
+    The search does not start by a U move, already tried
+    as an adjustment of the U face.
+
+    Args:
+        moves: The moves of the generator set.
+
+    Returns:
+        The positions of the allowed moves in the generator set,
+        indexed by the position of the previous move, -1 when
+        there is none.
+
+    """
+    layers = [LAYERS[move[0]] for move in moves]
+
+    return tuple(
+        tuple(
+            position
+            for position, (axis, rank) in enumerate(layers)
+            if (
+                (axis, rank) != LAYERS['U'] if last == -1
+                else axis != layers[last][0] or rank > layers[last][1]
+            )
+        )
+        for last in (*range(len(moves)), -1)
+    )
+
+
+class LastLayerSearch:
+    """
+    Search of the optimal algorithms of a last layer case.
+
+    The depth of the search is increased from the distance bound
+    of the pruning tables, and all the algorithms of each length
+    are collected, up to the optimal length plus a slack.
+    The algorithms of each length are searched by the search
+    extension, which releases the GIL while walking the tables.
+
+    The searched nodes are counted over all the lengths, and the search
+    gives up once a budget is spent, rather than running for hours
+    on the longest cases.
+    """
+
+    def __init__(self, cube: VCube, step: str,  # noqa: PLR0913 PLR0917
+                 generators: str, slack: int, max_length: int,
+                 max_nodes: int | None) -> None:
+        """Initialize the search of the state of a cube."""
+        self.cube = cube
+        self.moves = GENERATORS[generators]
+        self.slack = slack
+        self.max_length = max_length
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+        indexes = [MOVES.index(move) for move in self.moves]
+        self.tables = get_tables(
+            step,
+            len(MOVES) if max(indexes) >= FACE_MOVES_COUNT
+            else FACE_MOVES_COUNT,
+        )
+
+        # Flat tables of the extension, the moves and next orientations
+        # by orientation, and the allowed moves after each move
+        self.frame_moves = bytes(
+            [
+                value
+                for moves in get_frame_moves()
+                for index in indexes
+                for value in moves[index]
+            ],
+        )
+        self.successors = bytes(
+            [
+                position in allowed
+                for allowed in build_successors(self.moves)
+                for position in range(len(self.moves))
+            ],
+        )
+        goal, _u_corners, _u_edges = get_goals(step)
+        self.goals = array(
+            MOVE_TYPECODE, [coordinate for pair in goal for coordinate in pair],
+        )
+
+        self.auf = ''
+        self.solutions: list[LastLayerSolution] = []
+
+    def distance(self, coordinates: tuple[int, ...]) -> int:
+        """
+        Bound the number of moves solving coordinates.
+
+        Args:
+            coordinates: The coordinates of the five groups.
+
+        Returns:
+            The largest distance of the groups to their goal.
+
+        """
+        return max(
+            table[coordinate]
+            for table, coordinate in zip(
+                self.tables[2:], coordinates, strict=True,
+            )
+        )
+
+    def run(self) -> list[LastLayerSolution]:
+        """
+        Search the algorithms.
+
+        Returns:
+            The algorithms of the optimal length up to
+            the slack more, ordered by length, or an empty list
+            if there is none of the maximal length.
+
+        """
+        starts = []
+        for auf in AUFS:
+            cube = self.cube.copy()
+            cube.rotate(auf, history=False)
+            starts.append((auf, cubies_coordinates(cube.to_cubies)))
+
+        optimal = None
+        for depth in range(
+                min(self.distance(coordinates) for _auf, coordinates in starts),
+                self.max_length + 1,
+        ):
+            if optimal is not None and depth > optimal + self.slack:
+                break
+
+            for auf, coordinates in starts:
+                self.auf = auf
+                for path in self.search(coordinates, depth):
+                    self.record(path)
+
+            if optimal is None and self.solutions:
+                optimal = depth
+
+        return self.solutions
+
+    def search(self, coordinates: tuple[int, ...],
+               depth: int) -> list[tuple[int, ...]]:
+        """
+        Search the algorithms of a given length.
+
+        The search stops at the states reaching the goal,
+        the longer algorithms going through them being redundant.
+
+        Args:
+            coordinates: The coordinates of the five groups.
+            depth: The number of moves of the algorithms.
+
+        Returns:
+            The positions in the generator set of the moves
+            of each algorithm.
+
+        Raises:
+            ValueError: If the search needs more than
+                the maximal number of nodes.
+
+        """
+        tables = self.tables
+
+        paths, nodes = search.last_layer(
+            tables.corner_moves, tables.edge_moves, tables[2:], len(MOVES),
+            self.frame_moves, self.successors, self.goals, coordinates, depth,
+            -1 if self.max_nodes is None else self.max_nodes - self.nodes,
+        )
+        self.nodes += nodes
+
+        if paths is None:
+            msg = (
+                f'No algorithm found in { self.max_nodes } searched nodes, '
+                f'stopped at { depth } moves'
+            )
+            raise ValueError(msg)
+
+        return paths
+
+    def record(self, path: tuple[int, ...]) -> None:
+        """
+        Record a path as an algorithm, unless ending by a U move.
+
+        Args:
+            path: The positions in the generator set of the moves.
+
+        """
+        if not path and self.auf:
+            # A solved case is not solved again after an adjustment
+            return
+
+        for position in reversed(path):
+            axis, rank = LAYERS[self.moves[position][0]]
+            if axis:
+                break
+            if not rank:
+                # Already found shorter, with the adjustment of the U face
+                return
+
+        self.solutions.append(
+            LastLayerSolution(
+                self.auf,
+                Algorithm([Move(self.moves[position]) for position in path]),
+            ),
+        )
+
+
+def case_cube(case: 'Case') -> VCube:
+    """
+    Set up the state of a last layer case.
+
+    Args:
+        case: An OLL or PLL case of the CFOP method.
+
+    Returns:
+        The cube solved by the main algorithm of the case.
+
+    Raises:
+        ValueError: If the case is not an OLL or PLL case of CFOP.
+
+    """
+    if case.method != 'CFOP' or case.step not in STEPS:
+        msg = (
+            f'Unsupported case { case.name }, '
+            'only the OLL and PLL cases of CFOP are searched'
+        )
+        raise ValueError(msg)
+
+    cube = VCube()
+    cube.rotate(case.main_algorithm.transform(mirror_moves), history=False)
+
+    return cube
+
+
+def search_case(case: 'Case', generators: str = 'RUFLDB',
+                slack: int = 0,
+                max_length: int = DEFAULT_MAX_LENGTH,
+                max_nodes: int | None = DEFAULT_MAX_NODES,
+                ) -> list[LastLayerSolution]:
+    """
+    Search the optimal algorithms of a last layer case.
+
+    Each algorithm solves the case after an adjustment of the U face,
+    and up to a final one, with moves of a generator set: RUFLDB for
+    the face turn metric, RUFLDBMES for the slice turn metric,
+    or RUM for the algorithms with R, U and M moves only.
+
+    Args:
+        case: An OLL or PLL case of the CFOP method.
+        generators: The name of the generator set.
+        slack: The number of moves above the optimal length
+            of the algorithms also returned.
+        max_length: The maximal number of moves of the algorithms.
+        max_nodes: The maximal number of nodes searched,
+            None to search without limit.
+
+    Returns:
+        The algorithms ordered by length, or an empty list
+        if there is none of the maximal length.
+
+    Raises:
+        ValueError: If the generator set is unknown,
+            or the search needs more than the maximal number of nodes.
+
+    """
+    if generators not in GENERATORS:
+        msg = (
+            f'Unsupported generators { generators }, '
+            f'use one of { ", ".join(GENERATORS) }'
+        )
+        raise ValueError(msg)
+
+    return LastLayerSearch(
+        case_cube(case), case.step, generators, slack, max_length, max_nodes,
+    ).run()
+
+
+def auf_cycles(algorithm: Algorithm) -> int:
+    """
+    Count the applications of an algorithm solving the cube.
+
+    Unlike the cycles of the algorithm, the cube is solved
+    up to an adjustment of the U face. The moves are tracked
+    on the cubies, so each check compares the cubies.
+
+    Args:
+        algorithm: The algorithm to repeat.
+
+    Returns:
+        The number of applications, capped at 100.
+
+    """
+    moves = str(algorithm)
+
+    cube = CubieCube()
+    for cycles in range(1, MAX_CYCLES):
+        cube.rotate(moves)
+        for auf in AUFS:
+            adjusted = cube.copy()
+            adjusted.rotate(auf)
+            if adjusted.is_solved:
+                return cycles
+
+    return MAX_CYCLES
+
+
+def optimal_case_data(case: 'Case',
+                      max_length: int = DEFAULT_MAX_LENGTH,
+                      max_nodes: int | None = DEFAULT_MAX_NODES,
+                      ) -> OptimalData:
+    """
+    Compute the optimal values of a last layer case.
+
+    The optimal cycles are the fewest repetitions beyond the first
+    needed to solve the cube again, among the optimal algorithms
+    and the known algorithms of the case.
+
+    Args:
+        case: An OLL or PLL case of the CFOP method.
+        max_length: The maximal number of moves of the algorithms.
+        max_nodes: The maximal number of nodes searched in each metric,
+            None to search without limit.
+
+    Returns:
+        The optimal cycles, and the optimal lengths
+        in the face turn and slice turn metrics.
+
+    Raises:
+        ValueError: If the case has no algorithm of the maximal length,
+            or the search needs more than the maximal number of nodes.
+
+    """
+    htm = search_case(
+        case, 'RUFLDB', max_length=max_length, max_nodes=max_nodes,
+    )
+    stm = search_case(
+        case, 'RUFLDBMES', max_length=max_length, max_nodes=max_nodes,
+    )
+
+    if not htm or not stm:
+        msg = f'No algorithm found in { max_length } moves'
+        raise ValueError(msg)
+
+    return {
+        'optimal_cycles': min(
+            auf_cycles(algorithm)
+            for algorithm in (
+                *(solution.algorithm for solution in htm + stm),
+                *case.algorithms,
+                *case.two_phase_algorithms,
+            )
+        ) - 1,
+        'optimal_htm': len(htm[0].algorithm),
+        'optimal_stm': len(stm[0].algorithm),
+    }
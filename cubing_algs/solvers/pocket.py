@@ -0,0 +1,306 @@
+"""
+Optimal solver of the 2x2x2 cube.
+
+Keeping the DBL corner in place, the 2x2x2 is solved with U, R and F
+moves only, which leaves 7! permutations times 3^6 orientations of
+the other corners, 3,674,160 states.
+
+The distance to the solved state of each of them is stored in a table,
+one for each metric, so an optimal solution is read by following
+moves decreasing the distance, without any search.
+"""
+from array import array
+from functools import lru_cache
+from math import factorial
+from typing import TYPE_CHECKING
+from typing import Final
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.cubies import compute_moves_cubies
+from cubing_algs.facelets import facelets_to_cubies
+from cubing_algs.initial_state import get_initial_state
+from cubing_algs.move import Move
+from cubing_algs.solvers.tables import build_distance_table
+from cubing_algs.solvers.tables import load_table
+from cubing_algs.solvers.two_phase import build_permutation_moves
+from cubing_algs.solvers.two_phase import orientations
+from cubing_algs.solvers.two_phase import permutation_coordinate
+
+if TYPE_CHECKING:
+    from cubing_algs.vcube import VCube  # pragma: no cover
+
+MOVE_TYPECODE: Final = 'H'
+
+DISTANCE_TYPECODE: Final = 'B'
+
+FIXED_CORNER = 6
+
+# Positions of the corners moved by U, R and F
+POSITIONS = (0, 1, 2, 3, 4, 5, 7)
+
+PERMUTATION_COUNT = factorial(7)
+TWIST_COUNT = 3 ** 6
+STATE_COUNT = PERMUTATION_COUNT * TWIST_COUNT
+
+METRIC_MOVES = {
+    'htm': ('U', 'U2', "U'", 'R', 'R2', "R'", 'F', 'F2', "F'"),
+    'qtm': ('U', "U'", 'R', "R'", 'F', "F'"),
+}
+
+# Facelets of the 2x2x2 at the corners of the 3x3x3 facelets
+FACELETS_3X3X3 = {
+    index: 4 * face + 2 * (row // 2) + column // 2
+    for index in range(54)
+    for face, rest in [divmod(index, 9)]
+    for row, column in [divmod(rest, 3)]
+    if row != 1 and column != 1
+}
+
+
+def move_corners(move: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Compute the permutation and orientation of the corners by a move.
+
+    Args:
+        move: A U, R or F move.
+
+    Returns:
+        The origins and twists of the moved corners,
+        indexed by their position in POSITIONS.
+
+    """
+    cp, co, _ep, _eo, _so = compute_moves_cubies(move)
+
+    return (
+        tuple(POSITIONS.index(cp[position]) for position in POSITIONS),
+        tuple(co[position] for position in POSITIONS),
+    )
+
+
+def twist_coordinate(co: list[int]) -> int:
+    """
+    Compute the orientation coordinate of the corners.
+
+    Args:
+        co: The orientations of the corners, indexed by their
+            position in POSITIONS.
+
+    Returns:
+        The orientations of the first 6 corners in base 3.
+
+    """
+    coordinate = 0
+    for twist in co[:6]:
+        coordinate = coordinate * 3 + twist
+
+    return coordinate
+
+
+def build_twist_moves(moves: tuple[str, ...]) -> 'array[int]':
+    """
+    Build the move table of the orientation coordinate.
+
+    Args:
+        moves: The moves of the metric.
+
+    Returns:
+        The coordinates after each move, indexed by
+        coordinate * moves count + move.
+
+    """
+    moves_corners = [move_corners(move) for move in moves]
+
+    table = array(MOVE_TYPECODE)
+    for coordinate in range(TWIST_COUNT):
+        co = orientations(coordinate, 3, len(POSITIONS))
+        for permutation, orientation in moves_corners:
+            table.append(
+                twist_coordinate(
+                    [
+                        (co[origin] + twist) % 3
+                        for origin, twist in zip(
+                            permutation, orientation, strict=True,
+                        )
+                    ],
+                ),
+            )
+
+    return table
+
+
+def check_metric(metric: str) -> None:
+    """
+    Check that the solutions can be optimal in a metric.
+
+    Args:
+        metric: The metric of the solutions.
+
+    Raises:
+        ValueError: If the metric is not htm or qtm.
+
+    """
+    if metric not in METRIC_MOVES:
+        msg = f'Unsupported metric { metric }, use one of htm or qtm'
+        raise ValueError(msg)
+
+
+@lru_cache(maxsize=2)
+def get_move_tables(metric: str) -> tuple['array[int]', 'array[int]']:
+    """
+    Build the move tables of the moves of a metric.
+
+    Args:
+        metric: The metric of the solutions, htm or qtm.
+
+    Returns:
+        The move tables of the permutation and
+        of the orientation coordinates.
+
+    """
+    moves = METRIC_MOVES[metric]
+
+    return (
+        build_permutation_moves(
+            [move_corners(move)[0] for move in moves], 0, len(POSITIONS),
+        ),
+        build_twist_moves(moves),
+    )
+
+
+@lru_cache(maxsize=2)
+def get_distance_table(metric: str) -> memoryview:
+    """
+    Load the distances to the solved state of all the states.
+
+    Args:
+        metric: The metric of the distances, htm or qtm.
+
+    Returns:
+        The distances, indexed by permutation * 729 + twist.
+
+    """
+    permutation_moves, twist_moves = get_move_tables(metric)
+
+    return load_table(
+        f'pocket-{ metric }-distances', DISTANCE_TYPECODE, STATE_COUNT,
+        lambda: build_distance_table(
+            permutation_moves, twist_moves,
+            TWIST_COUNT, len(METRIC_MOVES[metric]),
+        ),
+    )
+
+
+def cube_coordinates(cube: 'VCube') -> tuple[int, int]:
+    """
+    Compute the coordinates of a 2x2x2 cube, relative to its DBL corner.
+
+    The colors of the DBL corner are taken as the colors of the D, B
+    and L faces, and their opposite colors as the ones of the U, F
+    and R faces, so the cube can be in any orientation.
+
+    Args:
+        cube: The 2x2x2 virtual cube.
+
+    Returns:
+        The permutation and orientation coordinates.
+
+    Raises:
+        ValueError: If the cube is not a 2x2x2, or its corners
+            are not in a solvable state.
+
+    """
+    if cube.size != 2:
+        msg = 'The pocket solver only supports 2x2x2 cubes'
+        raise ValueError(msg)
+
+    state = cube.state
+    opposites = dict(zip('URFDLB', 'DLBURF', strict=True))
+
+    # Corners of a 3x3x3, its centers colored as the DBL corner
+    facelets = list(get_initial_state(3))
+    for index, facelet in FACELETS_3X3X3.items():
+        facelets[index] = state[facelet]
+
+    d_color, b_color, l_color = (
+        state[FACELETS_3X3X3[index]] for index in (33, 53, 42)
+    )
+    for face, color in zip(
+            'URFDLB',
+            (
+                opposites[d_color], opposites[l_color], opposites[b_color],
+                d_color, l_color, b_color,
+            ),
+            strict=True,
+    ):
+        facelets['URFDLB'.index(face) * 9 + 4] = color
+
+    cp, co, _ep, _eo, _so = facelets_to_cubies(''.join(facelets))
+
+    if sorted(cp) != list(range(8)) or sum(co) % 3:
+        msg = 'The corners of the 2x2x2 cube are not solvable'
+        raise ValueError(msg)
+
+    return (
+        permutation_coordinate(
+            [POSITIONS.index(cp[position]) for position in POSITIONS],
+        ),
+        twist_coordinate([co[position] for position in POSITIONS]),
+    )
+
+
+def solve_coordinates(permutation: int, twist: int,
+                      metric: str = 'htm') -> list[str]:
+    """
+    Solve the state of given coordinates optimally.
+
+    Args:
+        permutation: The permutation coordinate.
+        twist: The orientation coordinate.
+        metric: The metric of the solution, htm or qtm.
+
+    Returns:
+        The moves of an optimal solution.
+
+    """
+    check_metric(metric)
+
+    distances = get_distance_table(metric)
+    permutation_moves, twist_moves = get_move_tables(metric)
+    moves = METRIC_MOVES[metric]
+    count = len(moves)
+
+    solution = []
+    distance = distances[permutation * TWIST_COUNT + twist]
+    while distance:
+        for move in range(count):
+            moved_permutation = permutation_moves[permutation * count + move]
+            moved_twist = twist_moves[twist * count + move]
+            if distances[
+                    moved_permutation * TWIST_COUNT + moved_twist
+            ] < distance:
+                break
+
+        solution.append(moves[move])
+        permutation, twist = moved_permutation, moved_twist
+        distance -= 1
+
+    return solution
+
+
+def solve(cube: 'VCube', metric: str = 'htm') -> Algorithm:
+    """
+    Solve a 2x2x2 virtual cube optimally.
+
+    Args:
+        cube: The 2x2x2 virtual cube, whatever its orientation.
+        metric: The metric of the solution, htm or qtm.
+
+    Returns:
+        The U, R and F moves of an optimal solution.
+
+    """
+    return Algorithm(
+        [Move(move) for move in solve_coordinates(
+            *cube_coordinates(cube), metric=metric,
+        )],
+    )
@@ -0,0 +1,174 @@
+"""
+Persistent tables of the solvers.
+
+Move and pruning tables are expensive to compute, so they are computed
+once and written to a cache directory, then memory mapped read-only
+by the processes needing them.
+
+The tables are accessed through memoryviews of the mappings, without
+copying them in memory, and the pages of a table are shared by all
+the processes mapping it, like the worker processes of a pool.
+
+The cache directory is versioned, the version being increased when
+the content or the layout of a table changes, so stale tables
+are never mapped.
+"""
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from collections.abc import Buffer
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from cubing_algs.extensions import search
+
+type Typecode = Literal['B', 'H', 'I']
+
+TABLES_VERSION = 1
+
+CACHE_ENVIRONMENT = 'CUBING_ALGS_CACHE'
+
+TABLE_MODE = 0o644
+
+EMPTY = 255
+
+
+def get_cache_directory() -> Path:
+    """
+    Get the directory of the tables of the current version.
+
+    The cache directory can be set with the CUBING_ALGS_CACHE
+    environment variable, defaulting to a cubing-algs directory
+    in the user cache directory.
+
+    Returns:
+        The directory where the tables are written.
+
+    """
+    cache = os.environ.get(CACHE_ENVIRONMENT)
+    if cache:
+        directory = Path(cache)
+    else:
+        directory = Path(
+            os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache',
+        ) / 'cubing-algs'
+
+    # The items of the tables are stored in the native byte order
+    return directory / f'tables-v{ TABLES_VERSION }-{ sys.byteorder }'
+
+
+def map_table(path: Path, typecode: Typecode, size: int) -> memoryview | None:
+    """
+    Map a table file in memory.
+
+    Args:
+        path: The file of the table.
+        typecode: The array typecode of the items.
+        size: The number of items of the table.
+
+    Returns:
+        A read-only view of the items, or None if the file
+        does not exist or has not the size of the table.
+
+    """
+    try:
+        with path.open('rb') as table_file:
+            mapping = mmap.mmap(
+                table_file.fileno(), 0, access=mmap.ACCESS_READ,
+            )
+    except (OSError, ValueError):
+        return None
+
+    if len(mapping) != size * array(typecode).itemsize:
+        mapping.close()
+        return None
+
+    return memoryview(mapping).cast(typecode)
+
+
+def write_table(path: Path, table: 'array[int] | bytearray') -> None:
+    """
+    Write a table file atomically.
+
+    The table is written to a temporary file renamed at the end,
+    so processes writing the same table concurrently never map
+    a partially written file.
+
+    Args:
+        path: The file of the table.
+        table: The items of the table.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f'{ path.name }.', delete=False,
+    ) as temporary:
+        temporary_path = Path(temporary.name)
+        try:
+            temporary.write(table)
+            temporary.close()
+            # Readable by other users sharing the cache directory
+            temporary_path.chmod(TABLE_MODE)
+            temporary_path.replace(path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+
+def load_table(name: str, typecode: Typecode, size: int,
+               build: Callable[[], 'array[int] | bytearray']) -> memoryview:
+    """
+    Load a table from the cache directory, building it if needed.
+
+    When the cache directory is not writable, the built table
+    is kept in memory instead.
+
+    Args:
+        name: The name of the table file.
+        typecode: The array typecode of the items.
+        size: The number of items of the table.
+        build: The function computing the items of the table.
+
+    Returns:
+        A read-only view of the items of the table.
+
+    """
+    path = get_cache_directory() / f'{ name }.bin'
+
+    view = map_table(path, typecode, size)
+    if view is not None:
+        return view
+
+    table = build()
+    try:
+        write_table(path, table)
+    except OSError:
+        return memoryview(table).toreadonly()
+
+    return map_table(path, typecode, size) or memoryview(table).toreadonly()
+
+
+def build_distance_table(moves_a: Buffer, moves_b: Buffer,
+                         count_b: int, moves_count: int) -> bytearray:
+    """
+    Build the distance table of a pair of coordinates.
+
+    A breadth first search from the solved pair of coordinates,
+    both 0, stores the number of moves needed to solve each pair,
+    as a pruning table of a search or the table of a whole puzzle.
+    The search runs in the search extension, without the GIL.
+
+    Args:
+        moves_a: The move table of the first coordinate.
+        moves_b: The move table of the second coordinate.
+        count_b: The number of values of the second coordinate.
+        moves_count: The number of moves of the move tables.
+
+    Returns:
+        The distances of the pairs, indexed by a * count_b + b.
+
+    """
+    return search.pair_distances(moves_a, moves_b, count_b, moves_count)
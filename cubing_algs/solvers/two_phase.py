@@ -0,0 +1,610 @@
+"""
+Two-phase solver of the 3x3x3 cube.
+
+The search of Kociemba's algorithm is split in two phases:
+
+- Phase 1 brings the cube into the subgroup generated by
+  <U, D, R2, L2, F2, B2>, where all the corners and edges are oriented
+  and the four edges of the E slice are in the slice.
+- Phase 2 solves the cube without leaving this subgroup.
+
+Each phase works on coordinates, small integers numbering
+the parts of the cubies it cares about, so moves are applied by
+looking up move tables, and the depth of each iterative deepening
+search is bounded by the distances stored in pruning tables.
+
+The tables are computed once, the first time a cube is solved,
+and written to the cache directory of the solvers, then mapped
+in memory by the next processes.
+
+The pruning tables and the searches of both phases are computed
+by the search extension, so the tables are built in about a second,
+and a random state is solved in 22 moves in a few milliseconds.
+"""
+from array import array
+from functools import lru_cache
+from itertools import combinations
+from itertools import permutations
+from math import comb
+from math import factorial
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import NamedTuple
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.constants import FACE_ORDER
+from cubing_algs.cubies import compute_moves_cubies
+from cubing_algs.extensions import search
+from cubing_algs.integrity import VCubeIntegrityChecker
+from cubing_algs.move import Move
+from cubing_algs.solvers.tables import build_distance_table
+from cubing_algs.solvers.tables import load_table
+
+if TYPE_CHECKING:
+    from cubing_algs.cubies import Cubies  # pragma: no cover
+    from cubing_algs.vcube import VCube  # pragma: no cover
+
+MOVE_TYPECODE: Final = 'H'
+
+PRUNING_TYPECODE: Final = 'B'
+
+POWERS = ('', '2', "'")
+
+MOVES = tuple(f'{ face }{ power }' for face in FACE_ORDER for power in POWERS)
+
+PHASE2_MOVES = (
+    'U', 'U2', "U'", 'R2', 'F2', 'D', 'D2', "D'", 'L2', 'B2',
+)
+
+PHASE2_MOVE_INDEXES = tuple(MOVES.index(move) for move in PHASE2_MOVES)
+
+
+TWIST_COUNT = 3 ** 7
+FLIP_COUNT = 2 ** 11
+SLICE_COUNT = comb(12, 4)
+CORNER_PERMUTATION_COUNT = factorial(8)
+EDGE_PERMUTATION_COUNT = factorial(8)
+SLICE_PERMUTATION_COUNT = factorial(4)
+
+SLICE_EDGES = 8
+
+# Positions of the slice edges, numbered so the solved cube is 0
+SLICE_POSITIONS: dict[tuple[int, ...], int] = {
+    positions: index
+    for index, positions in enumerate(combinations(range(11, -1, -1), 4))
+}
+
+DEFAULT_MAX_LENGTH = 22
+
+
+class TwoPhaseTables(NamedTuple):
+    """Move and pruning tables of the two-phase search."""
+
+    twist_moves: memoryview
+    flip_moves: memoryview
+    slice_moves: memoryview
+    corner_moves: memoryview
+    edge_moves: memoryview
+    slice_permutation_moves: memoryview
+    twist_slice_pruning: memoryview
+    flip_slice_pruning: memoryview
+    corner_slice_pruning: memoryview
+    edge_slice_pruning: memoryview
+
+
+def permutation_coordinate(permutation: list[int]) -> int:
+    """
+    Compute the rank of a permutation in lexicographic order.
+
+    Args:
+        permutation: The permutation of 0 to n - 1.
+
+    Returns:
+        The index of the permutation in itertools.permutations.
+
+    """
+    coordinate = 0
+    size = len(permutation)
+
+    for i in range(size):
+        smaller = sum(
+            1 for value in permutation[i + 1:]
+            if value < permutation[i]
+        )
+        coordinate += smaller * factorial(size - 1 - i)
+
+    return coordinate
+
+
+def twist_coordinate(co: list[int]) -> int:
+    """
+    Compute the orientation coordinate of the corners.
+
+    Args:
+        co: The corner orientations.
+
+    Returns:
+        The orientations of the first 7 corners in base 3.
+
+    """
+    coordinate = 0
+    for twist in co[:7]:
+        coordinate = coordinate * 3 + twist
+
+    return coordinate
+
+
+def flip_coordinate(eo: list[int]) -> int:
+    """
+    Compute the orientation coordinate of the edges.
+
+    Args:
+        eo: The edge orientations.
+
+    Returns:
+        The orientations of the first 11 edges in base 2.
+
+    """
+    coordinate = 0
+    for flip in eo[:11]:
+        coordinate = coordinate * 2 + flip
+
+    return coordinate
+
+
+def slice_coordinate(ep: list[int]) -> int:
+    """
+    Compute the coordinate of the positions of the slice edges.
+
+    Args:
+        ep: The edge permutation.
+
+    Returns:
+        The index of the positions holding the FR, FL, BL and BR edges.
+
+    """
+    return SLICE_POSITIONS[
+        tuple(i for i in range(11, -1, -1) if ep[i] >= SLICE_EDGES)
+    ]
+
+
+def orientations(coordinate: int, base: int, count: int) -> list[int]:
+    """
+    Decode an orientation coordinate.
+
+    The orientation of the last piece is deduced from the others,
+    their sum being a multiple of the base.
+
+    Args:
+        coordinate: The orientation coordinate.
+        base: 3 for the corners, 2 for the edges.
+        count: The number of pieces.
+
+    Returns:
+        The orientations of the pieces.
+
+    """
+    values = [0] * count
+    for i in range(count - 2, -1, -1):
+        coordinate, values[i] = divmod(coordinate, base)
+    values[-1] = -sum(values) % base
+
+    return values
+
+
+def build_orientation_moves(base: int, count: int,
+                            coordinate_count: int) -> 'array[int]':
+    """
+    Build the move table of an orientation coordinate.
+
+    Args:
+        base: 3 for the corners, 2 for the edges.
+        count: The number of pieces.
+        coordinate_count: The number of coordinates.
+
+    Returns:
+        The coordinates after each move, indexed by
+        coordinate * 18 + move.
+
+    """
+    # The permutation and orientation of the moves, for this kind of pieces
+    offset = 0 if base == 3 else 2
+    moves = [compute_moves_cubies(move) for move in MOVES]
+    moves_pieces = [
+        (cubies[offset], cubies[offset + 1]) for cubies in moves
+    ]
+
+    table = array(MOVE_TYPECODE)
+    for coordinate in range(coordinate_count):
+        values = orientations(coordinate, base, count)
+        for permutation, orientation in moves_pieces:
+            moved = 0
+            for origin, twist in zip(
+                    permutation[:count - 1], orientation, strict=False,
+            ):
+                moved = moved * base + (values[origin] + twist) % base
+            table.append(moved)
+
+    return table
+
+
+def build_slice_moves() -> 'array[int]':
+    """
+    Build the move table of the slice coordinate.
+
+    Returns:
+        The coordinates after each move, indexed by
+        coordinate * 18 + move.
+
+    """
+    moves = [compute_moves_cubies(move)[2] for move in MOVES]
+
+    table = array(MOVE_TYPECODE)
+    for positions in SLICE_POSITIONS:
+        occupied = [position in positions for position in range(12)]
+        for permutation in moves:
+            table.append(
+                SLICE_POSITIONS[
+                    tuple(
+                        i for i in range(11, -1, -1)
+                        if occupied[permutation[i]]
+                    )
+                ],
+            )
+
+    return table
+
+
+def build_permutation_moves(moves: list[tuple[int, ...]],
+                            start: int, size: int) -> 'array[int]':
+    """
+    Build the move table of a permutation coordinate of phase 2.
+
+    Args:
+        moves: The permutations of the pieces by the phase 2 moves.
+        start: The first position of the permuted pieces.
+        size: The number of permuted pieces.
+
+    Returns:
+        The coordinates after each phase 2 move, indexed by
+        coordinate * 10 + move.
+
+    """
+    indexes = {
+        permutation: index
+        for index, permutation in enumerate(permutations(range(size)))
+    }
+    moves_positions = [
+        [origin - start for origin in permutation[start:start + size]]
+        for permutation in moves
+    ]
+
+    table = array(MOVE_TYPECODE)
+    for permutation in indexes:
+        for positions in moves_positions:
+            table.append(
+                indexes[tuple([permutation[origin] for origin in positions])],
+            )
+
+    return table
+
+
+def load_move_tables() -> tuple[memoryview, ...]:
+    """
+    Load the move tables of the two-phase search.
+
+    Returns:
+        The twist, flip and slice move tables of phase 1,
+        and the corner, edge and slice permutation move tables
+        of phase 2.
+
+    """
+    phase1_count = len(MOVES)
+    phase2_count = len(PHASE2_MOVES)
+
+    def build_phase2_moves(kind: int, start: int,
+                           size: int) -> 'array[int]':
+        return build_permutation_moves(
+            [compute_moves_cubies(move)[kind] for move in PHASE2_MOVES],
+            start, size,
+        )
+
+    return (
+        load_table(
+            'two-phase-twist-moves', MOVE_TYPECODE,
+            TWIST_COUNT * phase1_count,
+            lambda: build_orientation_moves(3, 8, TWIST_COUNT),
+        ),
+        load_table(
+            'two-phase-flip-moves', MOVE_TYPECODE,
+            FLIP_COUNT * phase1_count,
+            lambda: build_orientation_moves(2, 12, FLIP_COUNT),
+        ),
+        load_table(
+            'two-phase-slice-moves', MOVE_TYPECODE,
+            SLICE_COUNT * phase1_count,
+            build_slice_moves,
+        ),
+        load_table(
+            'two-phase-corner-moves', MOVE_TYPECODE,
+            CORNER_PERMUTATION_COUNT * phase2_count,
+            lambda: build_phase2_moves(0, 0, 8),
+        ),
+        load_table(
+            'two-phase-edge-moves', MOVE_TYPECODE,
+            EDGE_PERMUTATION_COUNT * phase2_count,
+            lambda: build_phase2_moves(2, 0, 8),
+        ),
+        load_table(
+            'two-phase-slice-permutation-moves', MOVE_TYPECODE,
+            SLICE_PERMUTATION_COUNT * phase2_count,
+            lambda: build_phase2_moves(2, SLICE_EDGES, 4),
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_tables() -> TwoPhaseTables:
+    """
+    Load the move and pruning tables of the two-phase search.
+
+    The tables are built and written to the cache directory
+    the first time, then mapped from there.
+
+    Returns:
+        The tables, loaded on the first call only.
+
+    """
+    (
+        twist_moves, flip_moves, slice_moves,
+        corner_moves, edge_moves, slice_permutation_moves,
+    ) = load_move_tables()
+
+    phase1_count = len(MOVES)
+    phase2_count = len(PHASE2_MOVES)
+
+    return TwoPhaseTables(
+        twist_moves,
+        flip_moves,
+        slice_moves,
+        corner_moves,
+        edge_moves,
+        slice_permutation_moves,
+        load_table(
+            'two-phase-twist-slice-pruning', PRUNING_TYPECODE,
+            TWIST_COUNT * SLICE_COUNT,
+            lambda: build_distance_table(
+                twist_moves, slice_moves, SLICE_COUNT, phase1_count,
+            ),
+        ),
+        load_table(
+            'two-phase-flip-slice-pruning', PRUNING_TYPECODE,
+            FLIP_COUNT * SLICE_COUNT,
+            lambda: build_distance_table(
+                flip_moves, slice_moves, SLICE_COUNT, phase1_count,
+            ),
+        ),
+        load_table(
+            'two-phase-corner-slice-pruning', PRUNING_TYPECODE,
+            CORNER_PERMUTATION_COUNT * SLICE_PERMUTATION_COUNT,
+            lambda: build_distance_table(
+                corner_moves, slice_permutation_moves,
+                SLICE_PERMUTATION_COUNT, phase2_count,
+            ),
+        ),
+        load_table(
+            'two-phase-edge-slice-pruning', PRUNING_TYPECODE,
+            EDGE_PERMUTATION_COUNT * SLICE_PERMUTATION_COUNT,
+            lambda: build_distance_table(
+                edge_moves, slice_permutation_moves,
+                SLICE_PERMUTATION_COUNT, phase2_count,
+            ),
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_move_permutations() -> tuple[bytes, bytes]:
+    """
+    Compute the permutations of the corners and edges by the moves.
+
+    Returns:
+        The corner permutations and the edge permutations
+        of the moves of MOVES, one after the other.
+
+    """
+    moves = [compute_moves_cubies(move) for move in MOVES]
+
+    return (
+        bytes([origin for cubies in moves for origin in cubies[0]]),
+        bytes([origin for cubies in moves for origin in cubies[2]]),
+    )
+
+
+def apply_moves(cubies: 'Cubies', moves: list[int]) -> tuple[
+        list[int], list[int], list[int], list[int],
+]:
+    """
+    Apply moves of the two-phase move set to cubies.
+
+    Args:
+        cubies: The corner and edge permutations and orientations.
+        moves: The indexes of the moves.
+
+    Returns:
+        The cubies after the moves.
+
+    """
+    cp, co, ep, eo = (list(values) for values in cubies[:4])
+
+    for move in moves:
+        mcp, mco, mep, meo, _mso = compute_moves_cubies(MOVES[move])
+        co = [(co[origin] + twist) % 3 for origin, twist in zip(
+            mcp, mco, strict=True,
+        )]
+        cp = [cp[origin] for origin in mcp]
+        eo = [eo[origin] ^ flip for origin, flip in zip(
+            mep, meo, strict=True,
+        )]
+        ep = [ep[origin] for origin in mep]
+
+    return cp, co, ep, eo
+
+
+class TwoPhaseSearch:
+    """
+    Search of a solution of a cubie state in two phases.
+
+    The solution of phase 1 is lengthened by iterative deepening,
+    and each of them is completed by the shortest solution of phase 2
+    fitting in the maximal length, so the first solution found is
+    not optimal, but is found quickly.
+
+    Both phases are searched by the search extension,
+    which releases the GIL while walking the tables.
+    """
+
+    def __init__(self, cubies: 'Cubies', max_length: int) -> None:
+        """Initialize the search of a cubie state."""
+        self.cubies = cubies
+        self.max_length = max_length
+        self.tables = get_tables()
+        self.phase1: list[int] = []
+        self.phase2: list[int] = []
+
+    def run(self) -> list[int] | None:
+        """
+        Search a solution.
+
+        Returns:
+            The indexes of the moves of the solution,
+            or None if there is no solution of the maximal length.
+
+        """
+        cp, co, ep, eo = self.cubies[:4]
+        corner_permutations, edge_permutations = get_move_permutations()
+
+        phases = search.two_phase(
+            self.tables,
+            twist_coordinate(list(co)),
+            flip_coordinate(list(eo)),
+            slice_coordinate(list(ep)),
+            bytes(cp), bytes(ep),
+            corner_permutations, edge_permutations,
+            bytes(PHASE2_MOVE_INDEXES),
+            self.max_length,
+        )
+        if phases is None:
+            return None
+
+        self.phase1, self.phase2 = phases
+
+        return self.solution
+
+    @property
+    def solution(self) -> list[int]:
+        """
+        Join the moves of both phases.
+
+        Phase 1 ends by a quarter turn of the R, F, L or B faces,
+        which is merged with a half turn of the same face
+        starting phase 2.
+
+        Returns:
+            The indexes of the moves of the solution.
+
+        """
+        if (
+                self.phase1 and self.phase2
+                and self.phase1[-1] // 3 == self.phase2[0] // 3
+        ):
+            face, power = divmod(self.phase1[-1], 3)
+            merged = face * 3 + (power + 2) % 4
+            return [*self.phase1[:-1], merged, *self.phase2[1:]]
+
+        return self.phase1 + self.phase2
+
+
+def check_cubies(cubies: 'Cubies') -> None:
+    """
+    Check that a cubie state can be solved.
+
+    The coordinates of the search ignore the orientation
+    of the last corner and the last edge, and a state with
+    a parity error would be searched without end.
+    An InvalidCubeStateError is raised by the integrity checks
+    if the pieces are not permuted, twisted, flipped,
+    or swapped as a solvable cube.
+
+    Args:
+        cubies: The corner and edge permutations and orientations.
+
+    """
+    cp, co, ep, eo = (list(values) for values in cubies[:4])
+
+    VCubeIntegrityChecker.check_corner_permutations(cp)
+    VCubeIntegrityChecker.check_corner_orientations(co)
+    VCubeIntegrityChecker.check_corner_sum(co)
+    VCubeIntegrityChecker.check_edge_permutations(ep)
+    VCubeIntegrityChecker.check_edge_orientations(eo)
+    VCubeIntegrityChecker.check_edge_sum(eo)
+    VCubeIntegrityChecker.check_permutation_parity(cp, ep)
+
+
+def solve_cubies(cubies: 'Cubies',
+                 max_length: int = DEFAULT_MAX_LENGTH) -> list[int] | None:
+    """
+    Solve a cubie state with the two-phase search.
+
+    Args:
+        cubies: The corner and edge permutations and orientations
+            of a solvable state.
+        max_length: The maximal number of moves of the solution.
+
+    The state is checked first, an InvalidCubeStateError
+    is raised if it cannot be solved.
+
+    Returns:
+        The indexes of the moves of the solution in MOVES,
+        or None if there is no solution of the maximal length.
+
+    """
+    check_cubies(cubies)
+
+    return TwoPhaseSearch(cubies, max_length).run()
+
+
+def solve(cube: 'VCube', max_length: int = DEFAULT_MAX_LENGTH) -> Algorithm:
+    """
+    Solve a 3x3x3 virtual cube with the two-phase search.
+
+    The solution is not optimal, but is usually found quickly
+    for a maximal length above 20 moves.
+
+    Args:
+        cube: The 3x3x3 virtual cube, whatever its orientation.
+        max_length: The maximal number of moves of the solution.
+
+    Returns:
+        The face moves solving the cube, relative to its centers.
+
+    Raises:
+        ValueError: If the cube is not a 3x3x3,
+            or has no solution of the maximal length.
+
+    """
+    if cube.size != 3:
+        msg = 'The two-phase solver only supports 3x3x3 cubes'
+        raise ValueError(msg)
+
+    cp, co, ep, eo, so = cube.to_cubies
+    solution = solve_cubies(
+        (tuple(cp), tuple(co), tuple(ep), tuple(eo), tuple(so)),
+        max_length,
+    )
+
+    if solution is None:
+        msg = f'No solution found in { max_length } moves'
+        raise ValueError(msg)
+
+    return Algorithm([Move(MOVES[move]) for move in solution])
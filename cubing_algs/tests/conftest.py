@@ -0,0 +1,31 @@
+"""
+Configuration of the tests of cubing_algs.
+
+The tables of the solvers are written to a temporary cache directory,
+removed when the tests end, unless CUBING_ALGS_CACHE is already set
+to keep them between runs.
+"""
+import os
+import tempfile
+
+import pytest
+
+TABLES_CACHE = pytest.StashKey[tempfile.TemporaryDirectory[str]]()
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    """Use a temporary cache directory for the tables of the solvers."""
+    if os.environ.get('CUBING_ALGS_CACHE'):
+        return
+
+    cache = tempfile.TemporaryDirectory(prefix='cubing-algs-tests-')
+    session.stash[TABLES_CACHE] = cache
+    os.environ['CUBING_ALGS_CACHE'] = cache.name
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Remove the temporary cache directory of the tables."""
+    cache = session.stash.get(TABLES_CACHE, None)
+    if cache is not None:
+        del os.environ['CUBING_ALGS_CACHE']
+        cache.cleanup()
@@ -2,6 +2,7 @@
 import unittest
 from contextlib import redirect_stdout
 from io import StringIO
+from typing import TYPE_CHECKING
 
 from cubing_algs.algorithm import Algorithm
 from cubing_algs.ergonomics import ErgonomicsData
@@ -10,8 +11,20 @@ from cubing_algs.move import Move
 from cubing_algs.parsing import parse_moves
 from cubing_algs.transform.optimize import optimize_do_undo_moves
 from cubing_algs.transform.optimize import optimize_double_moves
+from cubing_algs.transform.optimize import optimize_repeat_three_moves
+from cubing_algs.transform.optimize import optimize_triple_moves
+from cubing_algs.transform.optimize import simplify_moves
+from cubing_algs.transform.pause import unpause_moves
+from cubing_algs.transform.rotation import compress_rotations
+from cubing_algs.transform.rotation import remove_rotations
+from cubing_algs.transform.size import compress_moves
+from cubing_algs.transform.timing import untime_moves
+from cubing_algs.transform.trim import trim_moves
 from cubing_algs.vcube import VCube
 
+if TYPE_CHECKING:
+    from collections.abc import Callable  # pragma: no cover
+
 
 class AlgorithmTestCase(unittest.TestCase):  # noqa: PLR0904
     """Tests for the Algorithm class core functionality."""
@@ -664,6 +677,88 @@ class AlgorithmTestCase(unittest.TestCase):  # noqa: PLR0904
         self.assertFalse(algo.has_internal_rotations)
 
 
+class AlgorithmTransformUnchangedTestCase(unittest.TestCase):
+    """Tests for the detection of unchanged transformations."""
+
+    def test_transform_returns_new_algorithm(self) -> None:
+        """Test that an unchanged algorithm is still copied."""
+        algo = parse_moves("R U R' U'")
+        result = algo.transform(optimize_do_undo_moves, to_fixpoint=True)
+
+        self.assertIsNot(result, algo)
+        self.assertEqual(result, algo)
+
+    def test_transform_in_place_process(self) -> None:
+        """Test that a process modifying its input keeps the algorithm."""
+        def double(old_moves: Algorithm) -> Algorithm:
+            old_moves.extend(old_moves.copy())
+            return old_moves
+
+        algo = parse_moves("R U'")
+        self.assertEqual(algo.metrics.htm, 2)
+
+        result = algo.transform(double)
+
+        self.assertEqual(result, parse_moves("R U' R U'"))
+        self.assertEqual(algo, parse_moves("R U'"))
+        self.assertEqual(algo.metrics.htm, 2)
+
+    def test_unchanged_process_not_called_again(self) -> None:
+        """Test that a process is skipped on an algorithm it kept."""
+        calls: list[Algorithm] = []
+
+        def keep(old_moves: Algorithm) -> Algorithm:
+            calls.append(old_moves)
+            return old_moves
+
+        result = parse_moves('R R R R U').transform(
+            optimize_double_moves,
+            keep,
+            optimize_do_undo_moves,
+            to_fixpoint=True,
+        )
+
+        self.assertEqual(result, parse_moves('U'))
+        self.assertEqual(calls, [parse_moves('R2 R2 U'), parse_moves('U')])
+
+    def test_copying_process_to_fixpoint(self) -> None:
+        """Test that processes returning copies still reach a fixpoint."""
+        calls: list[Algorithm] = []
+
+        def copy(old_moves: Algorithm) -> Algorithm:
+            calls.append(old_moves)
+            return old_moves.copy()
+
+        result = parse_moves("R R'").transform(
+            copy, optimize_do_undo_moves, to_fixpoint=True,
+        )
+
+        self.assertEqual(result, parse_moves(''))
+        self.assertEqual(len(calls), 2)
+
+    def test_transforms_return_unchanged_input(self) -> None:
+        """Test that transforms return their input when unchanged."""
+        for algo in (
+                parse_moves("R U R' U' F2 D"),
+                parse_moves("R U R' U' F2 D").packed,
+        ):
+            for process in (
+                    optimize_do_undo_moves,
+                    optimize_double_moves,
+                    optimize_repeat_three_moves,
+                    optimize_triple_moves,
+                    simplify_moves,
+                    compress_moves,
+                    compress_rotations,
+                    remove_rotations,
+                    unpause_moves,
+                    untime_moves,
+                    trim_moves('y'),
+            ):
+                with self.subTest(process=process, algo=type(algo)):
+                    self.assertIs(process(algo), algo)
+
+
 class AlgorithmCyclesPropertyTestCase(unittest.TestCase):
     """Test cases for the Algorithm.cycles property."""
 
@@ -812,3 +907,93 @@ class AlgorithmErgonomicsTestCase(unittest.TestCase):
         ergo = algo.ergonomics
 
         self.assertIsInstance(ergo, ErgonomicsData)
+
+
+class AlgorithmAnalysisCacheTestCase(unittest.TestCase):
+    """Tests for the cache of the analysis properties."""
+
+    properties = (
+        'cycles', 'metrics', '_impacts', 'ergonomics', 'structure',
+        'min_cube_size',
+    )
+
+    def test_cached(self) -> None:
+        """Test that analysis properties are computed once."""
+        algo = Algorithm.parse_moves("R U R' U'")
+
+        for name in self.properties:
+            with self.subTest(name=name):
+                self.assertIs(getattr(algo, name), getattr(algo, name))
+
+    def test_invalidated_by_mutations(self) -> None:
+        """Test that each modification clears the cached analysis."""
+        mutations: tuple[Callable[[Algorithm], object], ...] = (
+            lambda algo: algo.append('F'),
+            lambda algo: algo.insert(0, 'F'),
+            lambda algo: algo.extend('F'),
+            lambda algo: algo.__iadd__('F'),
+            lambda algo: algo.__imul__(2),
+            lambda algo: algo.__setitem__(0, Move('F')),
+            lambda algo: algo.__delitem__(0),
+            lambda algo: algo.pop(),
+            lambda algo: algo.remove(Move('U')),
+            lambda algo: algo.clear(),
+            lambda algo: algo.reverse(),
+            lambda algo: algo.sort(),
+        )
+
+        for index, mutation in enumerate(mutations):
+            for packed in (False, True):
+                with self.subTest(mutation=index, packed=packed):
+                    algo = Algorithm.parse_moves("R U R' U2 F")
+                    if packed:
+                        algo = algo.packed
+                    for name in self.properties:
+                        getattr(algo, name)
+
+                    mutation(algo)
+
+                    for name in self.properties:
+                        self.assertNotIn(name, algo.__dict__)
+
+                    expected = Algorithm(list(algo))
+                    self.assertEqual(algo.metrics, expected.metrics)
+                    self.assertEqual(algo.cycles, expected.cycles)
+                    self.assertEqual(
+                        algo.impacts.facelets_state,
+                        expected.impacts.facelets_state,
+                    )
+
+    def test_copies_not_cached(self) -> None:
+        """Test that a modified copy does not alter the original."""
+        algo = Algorithm.parse_moves("R U R' U'")
+        metrics = algo.metrics
+        copy = algo.copy()
+        copy.append('F')
+
+        self.assertIs(algo.metrics, metrics)
+        self.assertEqual(copy.metrics.htm, 5)
+
+    def test_impacts_copies_cube(self) -> None:
+        """Test that moving the impacts cube leaves the cache unchanged."""
+        algo = Algorithm.parse_moves("R U R' U'")
+        state = algo.impacts.cube.state
+
+        algo.impacts.cube.rotate('F')
+
+        self.assertEqual(algo.impacts.cube.state, state)
+        self.assertIs(
+            algo.impacts.facelets_transformation_mask,
+            algo.impacts.facelets_transformation_mask,
+        )
+
+    def test_show_copies_cube(self) -> None:
+        """Test that the shown cube is not the cached one."""
+        algo = Algorithm.parse_moves("R U R' U'")
+
+        with redirect_stdout(StringIO()):
+            cube = algo.show()
+        cube.rotate('F')
+
+        self.assertIsNot(cube, algo.impacts.cube)
+        self.assertEqual(algo.impacts.cube.state, algo.show().state)
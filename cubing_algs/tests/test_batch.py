@@ -0,0 +1,238 @@
+"""Tests for batch simulation of algorithms."""
+
+import pickle  # noqa: S403
+import threading
+import unittest
+from collections.abc import Callable
+from collections.abc import Iterator
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.batch import AnalysisRecord
+from cubing_algs.batch import analyze
+from cubing_algs.batch import compact_value
+from cubing_algs.batch import get_rotate_moves
+from cubing_algs.batch import simulate_many
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.vcube import VCube
+
+SCRAMBLES = [
+    "R U R' U'",
+    "F2 D' L B2 U R' F",
+    "x R2 D2 L' U2 B y'",
+    "U2 F' L2 D B'",
+    "z D L2 F' R U",
+]
+
+
+class SimulateManyTestCase(unittest.TestCase):
+    """Tests for the simulate_many function."""
+
+    def test_one_algorithm_per_state(self) -> None:
+        """Test applying a different algorithm on each state."""
+        states = [VCube().state] * len(SCRAMBLES)
+        expected = []
+        for scramble in SCRAMBLES:
+            cube = VCube()
+            cube.rotate(scramble)
+            expected.append(cube.state)
+
+        for workers in (1, 2, 3, 8):
+            with self.subTest(workers=workers):
+                self.assertEqual(
+                    simulate_many(states, SCRAMBLES, workers=workers),
+                    expected,
+                )
+
+    def test_single_algorithm(self) -> None:
+        """Test applying the same algorithm on every state."""
+        states = []
+        for scramble in SCRAMBLES:
+            cube = VCube()
+            cube.rotate(scramble)
+            states.append(cube.state)
+
+        algorithm = Algorithm.parse_moves("R U R' U'")
+        expected = []
+        for state in states:
+            cube = VCube(state, check=False)
+            cube.rotate(algorithm)
+            expected.append(cube.state)
+
+        self.assertEqual(simulate_many(states, algorithm), expected)
+        self.assertEqual(simulate_many(states, "R U R' U'"), expected)
+
+    def test_algorithm_objects(self) -> None:
+        """Test applying Algorithm objects."""
+        algorithms = [Algorithm.parse_moves(s) for s in SCRAMBLES]
+
+        self.assertEqual(
+            simulate_many([VCube().state] * len(SCRAMBLES), algorithms),
+            simulate_many([VCube().state] * len(SCRAMBLES), SCRAMBLES),
+        )
+
+    def test_other_sizes(self) -> None:
+        """Test simulating cubes of other sizes."""
+        for size in (2, 4, 5):
+            with self.subTest(size=size):
+                cube = VCube(size=size)
+                cube.rotate("R U' F2 x")
+
+                self.assertEqual(
+                    simulate_many(
+                        [VCube(size=size).state] * 3, "R U' F2 x",
+                        size=size, workers=2,
+                    ),
+                    [cube.state] * 3,
+                )
+
+    def test_empty(self) -> None:
+        """Test simulating no states."""
+        self.assertEqual(simulate_many([], []), [])
+        self.assertEqual(simulate_many([], 'R'), [])
+
+    def test_mismatched_lengths(self) -> None:
+        """Test that algorithms must match the states."""
+        with self.assertRaises(ValueError):
+            simulate_many([VCube().state] * 2, ['R'])
+
+    def test_invalid_move(self) -> None:
+        """Test that invalid moves raise an InvalidMoveError."""
+        with self.assertRaises(InvalidMoveError):
+            simulate_many([VCube().state] * 2, ['R', 'T'])
+        with self.assertRaises(InvalidMoveError):
+            simulate_many([VCube(size=2).state], 'M', size=2)
+
+
+class RotateExtensionThreadsTestCase(unittest.TestCase):
+    """Tests for running the rotation extensions in threads."""
+
+    @staticmethod
+    def rotate_many(rotate_moves: Callable[[str, str], str],
+                    state: str, moves: str, results: list[str]) -> None:
+        """Apply the same moves repeatedly, collecting the results."""
+        results.extend(rotate_moves(state, moves) for _ in range(20))
+
+    def test_concurrent_rotations(self) -> None:
+        """Test that concurrent rotations give consistent results."""
+        for size in (2, 3, 6):
+            with self.subTest(size=size):
+                rotate_moves = get_rotate_moves(size)
+                moves = ' '.join(["R U R' U' F2 D B'"] * 50)
+                solved = VCube(size=size).state
+                results: list[str] = []
+
+                threads = [
+                    threading.Thread(
+                        target=self.rotate_many,
+                        args=(rotate_moves, solved, moves, results),
+                    )
+                    for _ in range(4)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(
+                    results,
+                    [rotate_moves(solved, moves)] * 80,
+                )
+
+
+class AnalyzeTestCase(unittest.TestCase):
+    """Tests for the analyze function."""
+
+    def test_analyze(self) -> None:
+        """Test that records match the analysis of each algorithm."""
+        algorithms: list[Algorithm | str] = [
+            *SCRAMBLES, Algorithm.parse_moves("F R U R' U' F'"),
+        ]
+        records = list(analyze(algorithms, processes=2, chunksize=2))
+
+        self.assertEqual(
+            [record.algorithm for record in records],
+            [str(algorithm) for algorithm in algorithms],
+        )
+        for record, algorithm in zip(records, algorithms, strict=True):
+            parsed = Algorithm.parse_moves(algorithm)
+            self.assertIsNone(record.error)
+            self.assertEqual(
+                record.results,
+                {
+                    'metrics': compact_value(parsed.metrics),
+                    'impacts': compact_value(parsed.impacts),
+                    'ergonomics': compact_value(parsed.ergonomics),
+                    'structure': compact_value(parsed.structure),
+                },
+            )
+
+    def test_analyze_fields(self) -> None:
+        """Test computing a selection of fields."""
+        (record,) = analyze(
+            ["R U R' U'"], ('cycles', 'min_cube_size'), processes=1,
+        )
+
+        self.assertEqual(
+            record,
+            AnalysisRecord("R U R' U'", {'cycles': 6, 'min_cube_size': 2}),
+        )
+
+    def test_analyze_invalid_algorithm(self) -> None:
+        """Test that invalid algorithms are reported in their record."""
+        records = list(analyze(['R', 'T', 'U'], ('cycles',), processes=1))
+
+        self.assertEqual([record.results for record in records],
+                         [{'cycles': 4}, {}, {'cycles': 4}])
+        self.assertIsNotNone(records[1].error)
+
+    def test_analyze_failing_field(self) -> None:
+        """Test that fields failing on an algorithm are reported."""
+        records = list(
+            analyze(["R U'", '3Rw U', 'F'], ('cycles', 'metrics'),
+                    processes=1),
+        )
+
+        self.assertEqual(
+            [sorted(record.results) for record in records],
+            [['cycles', 'metrics'], ['metrics'], ['cycles', 'metrics']],
+        )
+        self.assertIsNone(records[0].error)
+        self.assertTrue((records[1].error or '').startswith('cycles: '))
+        self.assertIsNone(records[2].error)
+
+    def test_analyze_streaming(self) -> None:
+        """Test that the algorithms are read as the records are yielded."""
+        read: list[str] = []
+
+        def algorithms() -> Iterator[str]:
+            for index in range(1000):
+                read.append(str(index))
+                yield 'R' if index % 2 else "R'"
+
+        records = analyze(algorithms(), ('cycles',), processes=1, chunksize=4)
+        first = next(records)
+
+        self.assertEqual(first.results, {'cycles': 4})
+        self.assertLessEqual(len(read), 2 * 4 + 1)
+
+        self.assertEqual(len(list(records)), 999)
+        self.assertEqual(len(read), 1000)
+
+    def test_analyze_unknown_field(self) -> None:
+        """Test that the fields are validated when called."""
+        with self.assertRaises(ValueError):
+            analyze(['R'], ('metrics', 'color'))
+
+    def test_compact_value(self) -> None:
+        """Test that results are converted into plain values."""
+        algorithm = Algorithm.parse_moves("F R U R' U' F'")
+        impacts = compact_value(algorithm.impacts)
+        structure = compact_value(algorithm.structure)
+
+        self.assertNotIn('cube', impacts)
+        self.assertIsInstance(impacts['facelets_manhattan_distance'], dict)
+        self.assertEqual(structure['structures'][0]['setup'], 'F')
+        self.assertEqual(
+            pickle.loads(pickle.dumps(structure)),  # noqa: S301
+            structure,
+        )
@@ -0,0 +1,224 @@
+"""Tests for compiled algorithms."""
+
+import unittest
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.compiled import CompiledAlgorithm
+from cubing_algs.compiled import compute_permutation
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.vcube import VCube
+
+
+class ComputePermutationTestCase(unittest.TestCase):
+    """Tests for composing moves into a facelet permutation."""
+
+    def test_empty(self) -> None:
+        """Test that no moves give the identity."""
+        for size in (2, 3, 4, 5):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    compute_permutation('', size),
+                    list(range(6 * size * size)),
+                )
+
+    def test_matches_rotation(self) -> None:
+        """Test that the permutation matches the rotation extensions."""
+        for size, moves in (
+                (2, "R U R' U' F2 D2 B2 F' y"),
+                (3, "R U R' U' M2 E S' r' x2"),
+                (4, "R U 2Rw2 3F' Lw x"),
+                (5, "R U 2-3Rw' M E2 z"),
+        ):
+            with self.subTest(size=size):
+                cube = VCube(size=size)
+                permutation = compute_permutation(moves, size)
+                state = cube.state
+
+                self.assertEqual(
+                    cube.rotate(moves),
+                    ''.join(state[i] for i in permutation),
+                )
+
+    def test_invalid_move(self) -> None:
+        """Test that invalid moves raise an InvalidMoveError."""
+        with self.assertRaises(InvalidMoveError):
+            compute_permutation('R T', 3)
+        with self.assertRaises(InvalidMoveError):
+            compute_permutation('R M', 2)
+        with self.assertRaises(InvalidMoveError):
+            compute_permutation('R M', 4)
+
+
+class CompiledAlgorithmTestCase(unittest.TestCase):
+    """Tests for the CompiledAlgorithm class."""
+
+    def test_compile(self) -> None:
+        """Test compiling an algorithm."""
+        compiled = Algorithm.parse_moves("R U R' U'").compile()
+
+        self.assertEqual(compiled.size, 3)
+        self.assertEqual(compiled.moves, "R U R' U'")
+        self.assertEqual(len(compiled.permutation), 54)
+
+    def test_compile_ignores_pauses_and_timings(self) -> None:
+        """Test that pauses and timings are removed."""
+        compiled = Algorithm.parse_moves('R@100 . U@200').compile()
+
+        self.assertEqual(compiled.moves, 'R U')
+        self.assertEqual(
+            compiled,
+            Algorithm.parse_moves('R U').compile(),
+        )
+
+    def test_apply(self) -> None:
+        """Test that applying equals replaying the moves."""
+        algorithm = Algorithm.parse_moves(
+            "R U R' U' R' F R2 U' R' U' R U R' F'",
+        )
+        compiled = algorithm.compile()
+        cube = VCube()
+        cube.rotate("F R U' B2")
+
+        self.assertEqual(
+            compiled.apply(cube.state),
+            cube.copy().rotate(algorithm),
+        )
+
+    def test_apply_invalid_state(self) -> None:
+        """Test that a state of the wrong length is rejected."""
+        compiled = Algorithm.parse_moves('R').compile()
+
+        with self.assertRaises(ValueError):
+            compiled.apply(VCube(size=2).state)
+
+    def test_order(self) -> None:
+        """Test the order of some algorithms."""
+        for moves, order in (
+                ('R', 4),
+                ('R2', 2),
+                ("R U R' U'", 6),
+                ("R U R' U' R' F R2 U' R' U' R U R' F'", 2),
+                ('R U', 105),
+                ("R U2 D' B D'", 1260),
+                ('x', 4),
+        ):
+            with self.subTest(moves=moves):
+                self.assertEqual(
+                    Algorithm.parse_moves(moves).compile().order,
+                    order,
+                )
+
+    def test_order_matches_simulation(self) -> None:
+        """Test that the order restores the cube."""
+        compiled = Algorithm.parse_moves("R U2 F' L").compile()
+        cube = VCube()
+
+        for _ in range(compiled.order - 1):
+            cube.rotate(compiled)
+            self.assertNotEqual(cube.state, VCube().state)
+
+        cube.rotate(compiled)
+        self.assertEqual(cube.state, VCube().state)
+
+    def test_identity(self) -> None:
+        """Test identity detection."""
+        self.assertTrue(Algorithm.parse_moves("R R'").compile().is_identity)
+        self.assertTrue(Algorithm().compile().is_identity)
+        self.assertFalse(Algorithm.parse_moves('R').compile().is_identity)
+        self.assertEqual(Algorithm().compile().order, 1)
+
+    def test_facelet_cycles(self) -> None:
+        """Test the cycles of a quarter turn."""
+        cycles = Algorithm.parse_moves('R').compile().facelet_cycles
+
+        self.assertEqual(len(cycles), 5)
+        self.assertTrue(all(len(cycle) == 4 for cycle in cycles))
+
+    def test_power(self) -> None:
+        """Test composing the permutation with itself."""
+        compiled = Algorithm.parse_moves("R U F'").compile()
+
+        self.assertEqual(
+            compiled.power(3),
+            Algorithm.parse_moves("R U F' R U F' R U F'").compile(),
+        )
+        self.assertEqual(
+            compiled.power(-1),
+            Algorithm.parse_moves("F U' R'").compile(),
+        )
+        self.assertTrue(compiled.power(compiled.order).is_identity)
+        self.assertTrue(compiled.power(0).is_identity)
+
+    def test_equality(self) -> None:
+        """Test that equality depends on the effect on the cube."""
+        self.assertEqual(
+            Algorithm.parse_moves('R2').compile(),
+            Algorithm.parse_moves("R' R'").compile(),
+        )
+        self.assertNotEqual(
+            Algorithm.parse_moves('R').compile(),
+            Algorithm.parse_moves('R').compile(size=4),
+        )
+        self.assertNotEqual(Algorithm.parse_moves('R').compile(), 'R')
+        self.assertEqual(
+            len({
+                Algorithm.parse_moves('U2').compile(),
+                Algorithm.parse_moves("U' U'").compile(),
+            }),
+            1,
+        )
+
+    def test_repr(self) -> None:
+        """Test the string representation."""
+        self.assertEqual(
+            repr(Algorithm.parse_moves("R U'").compile(size=4)),
+            "CompiledAlgorithm('R U'', size=4)",
+        )
+
+    def test_direct_construction(self) -> None:
+        """Test building a compiled algorithm from a permutation."""
+        compiled = CompiledAlgorithm(range(24), size=2)
+
+        self.assertTrue(compiled.is_identity)
+        self.assertEqual(compiled.apply(VCube(size=2).state),
+                         VCube(size=2).state)
+
+
+class VCubeRotateCompiledTestCase(unittest.TestCase):
+    """Tests for applying compiled algorithms to a VCube."""
+
+    def test_rotate(self) -> None:
+        """Test rotating with a compiled algorithm."""
+        for size in (2, 3, 4, 5):
+            with self.subTest(size=size):
+                algorithm = Algorithm.parse_moves("R U R' U' F2")
+                cube = VCube(size=size)
+                expected = VCube(size=size)
+                expected.rotate(algorithm)
+
+                cube.rotate(algorithm.compile(size=size))
+
+                self.assertEqual(cube.state, expected.state)
+                self.assertEqual(cube.history, expected.history)
+
+    def test_rotate_without_history(self) -> None:
+        """Test rotating without recording the history."""
+        cube = VCube()
+        cube.rotate(Algorithm.parse_moves('R U').compile(), history=False)
+
+        self.assertEqual(cube.history, [])
+
+    def test_rotate_empty(self) -> None:
+        """Test rotating with an empty compiled algorithm."""
+        cube = VCube()
+        cube.rotate(Algorithm().compile())
+
+        self.assertEqual(cube.state, VCube().state)
+        self.assertEqual(cube.history, [])
+
+    def test_rotate_size_mismatch(self) -> None:
+        """Test that a compiled algorithm is bound to its cube size."""
+        cube = VCube(size=4)
+
+        with self.assertRaises(InvalidMoveError):
+            cube.rotate(Algorithm.parse_moves('R').compile())
@@ -0,0 +1,172 @@
+"""Tests for the cubie level simulation of the 3x3x3 cube."""
+
+import unittest
+from random import Random
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.cubies import BASIC_MOVES
+from cubing_algs.cubies import MOVE_TABLES
+from cubing_algs.cubies import CubieCube
+from cubing_algs.cubies import compute_moves_cubies
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.extensions import multiply_3x3x3
+from cubing_algs.vcube import VCube
+
+MOVES_POOL = [
+    'R', "R'", 'R2', 'U', "U'", 'U2', 'F', 'F2', "D'", 'L', 'B2',
+    'M', "M'", 'M2', 'E2', 'S', "S'", 'x', 'y2', "z'",
+    'Rw', "r'", 'Uw2', 'f',
+]
+
+
+class ComputeMovesCubiesTestCase(unittest.TestCase):
+    """Tests for the cubie representation of moves."""
+
+    def test_face_move(self) -> None:
+        """Test the cubies of a face move."""
+        self.assertEqual(
+            compute_moves_cubies('F R'),
+            (
+                (0, 5, 2, 1, 7, 4, 6, 3),
+                (1, 2, 0, 2, 1, 1, 0, 2),
+                (1, 9, 2, 3, 11, 8, 6, 7, 4, 5, 10, 0),
+                (1, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0),
+                (0, 1, 2, 3, 4, 5),
+            ),
+        )
+
+    def test_rotation(self) -> None:
+        """Test that rotations move the centers."""
+        cp, _co, _ep, _eo, so = compute_moves_cubies('y')
+
+        self.assertEqual(so, (0, 5, 1, 3, 2, 4))
+        self.assertNotEqual(cp, tuple(range(8)))
+
+    def test_invalid_move(self) -> None:
+        """Test that invalid moves raise an InvalidMoveError."""
+        with self.assertRaises(InvalidMoveError):
+            compute_moves_cubies('R T')
+
+
+class CubieCubeTestCase(unittest.TestCase):
+    """Tests for the CubieCube class."""
+
+    def test_solved(self) -> None:
+        """Test the solved cube."""
+        cube = CubieCube()
+
+        self.assertTrue(cube.is_solved)
+        self.assertEqual(cube.state, VCube().state)
+        self.assertEqual(cube.to_cubies, VCube().to_cubies)
+
+    def test_rotate(self) -> None:
+        """Test applying moves."""
+        cube = CubieCube()
+        cube.rotate(Algorithm.parse_moves('F R'))
+
+        self.assertEqual(cube.cp, [0, 5, 2, 1, 7, 4, 6, 3])
+        self.assertEqual(cube.co, [1, 2, 0, 2, 1, 1, 0, 2])
+        self.assertEqual(
+            cube.state,
+            'UUFUUFLLFUUURRRRRRFFRFFDFFDRRBDDBDDBLLDLLDLLDLBBUBBUBB',
+        )
+        self.assertFalse(cube.is_solved)
+
+        cube.rotate("R' F'")
+        self.assertTrue(cube.is_solved)
+
+    def test_rotate_spellings(self) -> None:
+        """Test the spellings of moves left out of the move tables."""
+        for move, spelling in (("R2'", 'R2'), ("x2'", 'x2'), ('Rw', 'r')):
+            with self.subTest(move=move):
+                cube = CubieCube()
+                cube.rotate(f'U { move } F')
+                expected = CubieCube()
+                expected.rotate(f'U { spelling } F')
+
+                self.assertEqual(cube, expected)
+
+    def test_multiply(self) -> None:
+        """Test multiplying by the cubies of moves."""
+        cube = CubieCube()
+        cube.multiply(compute_moves_cubies("F R U'"))
+        expected = CubieCube()
+        expected.rotate("F R U'")
+
+        self.assertEqual(cube, expected)
+
+    def test_multiply_moves_errors(self) -> None:
+        """Test that the multiply extension checks its arguments."""
+        cube = CubieCube()
+
+        for cubies, tables, moves in (
+                (cube.cubies[1:], MOVE_TABLES, b'\0'),
+                (cube.cubies, MOVE_TABLES[1:], b'\0'),
+                (cube.cubies, MOVE_TABLES, bytes([len(BASIC_MOVES)])),
+                (cube.cubies, bytes([8]) * len(cube.cubies), b'\0'),
+        ):
+            with self.subTest(moves=moves), self.assertRaises(ValueError):
+                multiply_3x3x3.multiply_moves(cubies, tables, moves)
+
+    def test_rotate_invalid(self) -> None:
+        """Test that the cube is untouched by invalid moves."""
+        cube = CubieCube()
+
+        with self.assertRaises(InvalidMoveError):
+            cube.rotate('R U T')
+
+        self.assertEqual(cube, CubieCube())
+
+    def test_rotations_solved(self) -> None:
+        """Test that a rotated cube is solved."""
+        cube = CubieCube()
+        cube.rotate("x y' M")
+
+        self.assertFalse(cube.is_solved)
+
+        cube.rotate("M'")
+        self.assertTrue(cube.is_solved)
+
+    def test_vcube_parity(self) -> None:
+        """Test that the cubies match the facelets on random algorithms."""
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(300):
+            moves = ' '.join(rng.choices(MOVES_POOL, k=rng.randint(0, 25)))
+
+            vcube = VCube()
+            vcube.rotate(moves)
+            cube = CubieCube()
+            for move in moves.split():
+                cube.rotate(move)
+
+            self.assertEqual(cube.state, vcube.state, moves)
+            self.assertEqual(cube.to_cubies, vcube.to_cubies, moves)
+            self.assertEqual(cube.is_solved, vcube.is_solved, moves)
+            self.assertEqual(CubieCube.from_vcube(vcube), cube, moves)
+            self.assertEqual(cube.to_vcube().state, vcube.state, moves)
+
+    def test_from_vcube_size(self) -> None:
+        """Test that only 3x3x3 cubes are converted."""
+        with self.assertRaises(ValueError):
+            CubieCube.from_vcube(VCube(size=2))
+
+    def test_copy(self) -> None:
+        """Test that copies do not share their cubies."""
+        cube = CubieCube()
+        copy = cube.copy()
+        copy.rotate('R')
+
+        self.assertTrue(cube.is_solved)
+        self.assertNotEqual(cube, copy)
+        self.assertNotEqual(cube, 'R')
+
+    def test_repr(self) -> None:
+        """Test the representation of the cube."""
+        self.assertEqual(
+            repr(CubieCube()),
+            'CubieCube(cp=[0, 1, 2, 3, 4, 5, 6, 7], '
+            'co=[0, 0, 0, 0, 0, 0, 0, 0], '
+            'ep=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11], '
+            'eo=[0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], so=[0, 1, 2, 3, 4, 5])',
+        )
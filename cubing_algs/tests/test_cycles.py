@@ -149,3 +149,15 @@ class ComputeCyclesTestCase(unittest.TestCase):
         algorithm = Algorithm.parse_moves("R U R' U'")
         result = compute_cycles(algorithm)
         self.assertEqual(result, 6)
+
+    def test_safety_limit_reached(self) -> None:
+        """Test that high order algorithms are capped."""
+        algorithm = Algorithm.parse_moves("R U2 D' B D'")
+        result = compute_cycles(algorithm)
+        self.assertEqual(result, 100)  # Order is 1260
+
+    def test_pauses_and_timings(self) -> None:
+        """Test that pauses and timings are ignored."""
+        algorithm = Algorithm.parse_moves("R@100 . U@200 R'@300 U'@400")
+        result = compute_cycles(algorithm)
+        self.assertEqual(result, 6)
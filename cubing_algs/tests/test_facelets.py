@@ -1,5 +1,6 @@
 """Tests for facelet and cubie conversion functions."""
 import unittest
+from random import Random
 
 from cubing_algs.facelets import _CORNER_LOOKUP
 from cubing_algs.facelets import _EDGE_LOOKUP
@@ -10,12 +11,18 @@ from cubing_algs.facelets import disable_cache
 from cubing_algs.facelets import enable_cache
 from cubing_algs.facelets import facelets_to_cubies
 from cubing_algs.facelets import get_cache_info
+from cubing_algs.facelets import python_cubies_to_facelets
+from cubing_algs.facelets import python_facelets_to_cubies
 from cubing_algs.initial_state import get_initial_state
 from cubing_algs.masks import F2L_MASK
 from cubing_algs.vcube import VCube
 
 INITIAL_STATE = get_initial_state(3)
 
+MOVES_POOL = ['R', 'U', 'F', 'D', 'L', 'B', "R'", 'M', 'x', 'y', 'S2', 'E']
+
+ALTERATION_RATE = 0.5
+
 
 class CubiesToFaceletsTestCase(unittest.TestCase):
     """Tests for converting cubie representation to facelet representation."""
@@ -603,7 +610,7 @@ class TestFaceletsOptimizationCoverage(unittest.TestCase):
             _CORNER_LOOKUP.clear()
 
             # Now all corner lookups will fail and use fallback
-            result = facelets_to_cubies(INITIAL_STATE)
+            result = python_facelets_to_cubies(INITIAL_STATE)
 
             # Should still work with fallback logic
             self.assertEqual(len(result), 5)
@@ -625,7 +632,7 @@ class TestFaceletsOptimizationCoverage(unittest.TestCase):
             _EDGE_LOOKUP.clear()
 
             # Now all edge lookups will fail and use fallback
-            result = facelets_to_cubies(INITIAL_STATE)
+            result = python_facelets_to_cubies(INITIAL_STATE)
 
             # Should still work with fallback logic
             self.assertEqual(len(result), 5)
@@ -651,7 +658,7 @@ class TestFaceletsOptimizationCoverage(unittest.TestCase):
             _EDGE_LOOKUP.clear()
 
             # This should use fallback and hit the flipped edge case
-            result = facelets_to_cubies(cube.state)
+            result = python_facelets_to_cubies(cube.state)
 
             # Should still work with fallback logic
             self.assertEqual(len(result), 5)
@@ -778,3 +785,97 @@ class TestFaceletsOptimizationCoverage(unittest.TestCase):
         # The result should have valid corner orientations (0, 1, or 2)
         for co in result[1]:  # Corner orientations
             self.assertIn(co, [0, 1, 2])
+
+
+class ConvertExtensionTestCase(unittest.TestCase):
+    """Test the C conversions against their Python fallbacks."""
+
+    def setUp(self) -> None:
+        """Disable the cache to reach the conversions."""
+        disable_cache()
+        self.addCleanup(enable_cache)
+
+    def test_facelets_to_cubies(self) -> None:
+        """Test identifying the cubies of valid and invalid states."""
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(500):
+            cube = VCube()
+            cube.rotate(' '.join(rng.choices(MOVES_POOL, k=20)))
+            facelets = list(cube.state)
+            if rng.random() < ALTERATION_RATE:
+                for _ in range(rng.randint(1, 4)):
+                    facelets[rng.randrange(54)] = rng.choice('URFDLB')
+            state = ''.join(facelets)
+
+            self.assertEqual(
+                facelets_to_cubies(state),
+                python_facelets_to_cubies(state),
+                state,
+            )
+
+    def test_cubies_to_facelets(self) -> None:
+        """Test placing valid and invalid cubies."""
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(500):
+            cp = [rng.randrange(-8, 8) for _ in range(8)]
+            co = [rng.randrange(-3, 5) for _ in range(8)]
+            ep = rng.sample(range(12), 12)
+            eo = [rng.randrange(-2, 3) for _ in range(12)]
+            scheme = ''.join(rng.choices('URFDLB01', k=54))
+
+            self.assertEqual(
+                cubies_to_facelets(cp, co, ep, eo, [0, 1, 2, 3, 4, 5], scheme),
+                python_cubies_to_facelets(cp, co, ep, eo, scheme),
+            )
+
+    def test_cubies_to_facelets_huge_integers(self) -> None:
+        """Test that huge integers are not narrowed into range."""
+        cp, co, ep, eo, _ = facelets_to_cubies(INITIAL_STATE)
+        wrapped = (1 << 32) + 1
+
+        for index in (wrapped, -wrapped, 1 << 64, -(1 << 80)):
+            with self.subTest(index=index):
+                with self.assertRaises(IndexError):
+                    cubies_to_facelets(
+                        [index, *cp[1:]], co, ep, eo,
+                        [0, 1, 2, 3, 4, 5], INITIAL_STATE,
+                    )
+                with self.assertRaises(IndexError):
+                    cubies_to_facelets(
+                        cp, co, [*ep[:11], index], eo,
+                        [0, 1, 2, 3, 4, 5], INITIAL_STATE,
+                    )
+
+        for orientation in (wrapped, (1 << 64) + 2, -(1 << 80) - 1):
+            with self.subTest(orientation=orientation):
+                twisted_co = [orientation, *co[1:]]
+                flipped_eo = [*eo[:11], orientation]
+
+                self.assertEqual(
+                    cubies_to_facelets(
+                        cp, twisted_co, ep, flipped_eo,
+                        [0, 1, 2, 3, 4, 5], INITIAL_STATE,
+                    ),
+                    python_cubies_to_facelets(
+                        cp, twisted_co, ep, flipped_eo, INITIAL_STATE,
+                    ),
+                )
+
+    def test_invalid_color(self) -> None:
+        """Test that unknown colors raise a KeyError."""
+        with self.assertRaises(KeyError):
+            facelets_to_cubies('X' + INITIAL_STATE[1:])
+        with self.assertRaises(KeyError):
+            python_facelets_to_cubies('X' + INITIAL_STATE[1:])
+
+    def test_non_ascii_scheme(self) -> None:
+        """Test that other schemes are placed by the fallback."""
+        scheme = '█' * 27 + '░' * 27
+        cubies = facelets_to_cubies(INITIAL_STATE)
+
+        self.assertEqual(
+            cubies_to_facelets(*cubies[:4], [0, 1, 2, 3, 4, 5], scheme),
+            scheme,
+        )
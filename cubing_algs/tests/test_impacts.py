@@ -3,19 +3,23 @@ import unittest
 
 from cubing_algs.algorithm import Algorithm
 from cubing_algs.constants import FACE_ORDER
+from cubing_algs.exceptions import InvalidCubeStateError
 from cubing_algs.impacts import DistanceMetrics
 from cubing_algs.impacts import ImpactData
 from cubing_algs.impacts import analyze_cycles
 from cubing_algs.impacts import analyze_layers
 from cubing_algs.impacts import classify_pattern
 from cubing_algs.impacts import compute_cubie_complexity
+from cubing_algs.impacts import compute_distance_table
 from cubing_algs.impacts import compute_face_impact
 from cubing_algs.impacts import compute_face_to_face_matrix
 from cubing_algs.impacts import compute_impacts
+from cubing_algs.impacts import compute_lazy_impacts
 from cubing_algs.impacts import compute_manhattan_distance
 from cubing_algs.impacts import compute_opposite_face_manhattan_distance
 from cubing_algs.impacts import compute_parity
 from cubing_algs.impacts import compute_qtm_distance
+from cubing_algs.impacts import count_facelet_borders
 from cubing_algs.impacts import detect_symmetry
 from cubing_algs.impacts import find_permutation_cycles
 from cubing_algs.impacts import parse_facelet_position
@@ -3579,3 +3583,149 @@ class TestPositionsOnAdjacentCorners(unittest.TestCase):
         # URF [8, 9, 20] and DBL [33, 53, 42] don't share an edge
         result = positions_on_adjacent_corners(8, 33, self.cube)
         self.assertFalse(result)
+
+
+class TestDistanceTable(unittest.TestCase):
+    """Test the precomputed distances between facelet positions."""
+
+    def test_count_facelet_borders(self) -> None:
+        """Test the kinds of the facelets."""
+        cube = VCube()
+
+        self.assertEqual(
+            [count_facelet_borders(position, cube) for position in range(9)],
+            [2, 1, 2, 1, 0, 1, 2, 1, 2],
+        )
+        self.assertEqual(count_facelet_borders(49, cube), 0)
+        self.assertEqual(count_facelet_borders(5, VCube(size=4)), 0)
+        self.assertEqual(count_facelet_borders(16, VCube(size=4)), 2)
+
+    def test_same_distances(self) -> None:
+        """Test that the tables match the distance functions."""
+        cube = VCube()
+
+        for distance_fn in (compute_manhattan_distance, compute_qtm_distance):
+            with self.subTest(distance_fn=distance_fn.__name__):
+                table = compute_distance_table(distance_fn)
+
+                self.assertEqual(len(table), 54 * 54)
+                for original_pos in range(54):
+                    for final_pos in range(54):
+                        if (
+                                count_facelet_borders(original_pos, cube)
+                                == count_facelet_borders(final_pos, cube)
+                        ):
+                            self.assertEqual(
+                                table[original_pos * 54 + final_pos],
+                                distance_fn(original_pos, final_pos, cube),
+                            )
+
+    def test_cached(self) -> None:
+        """Test that the tables are computed once."""
+        self.assertIs(
+            compute_distance_table(compute_qtm_distance, 3),
+            compute_distance_table(compute_qtm_distance, 3),
+        )
+        self.assertIsNot(
+            compute_distance_table(compute_qtm_distance),
+            compute_distance_table(compute_manhattan_distance),
+        )
+
+
+class TestLazyImpactData(unittest.TestCase):
+    """Test the impact metrics computed on first access."""
+
+    algorithms = (
+        '', "R U R' U'", "R U R' U' R' F R2 U' R' U' R U R' F'",
+        'M2 U M2 U2 M2 U M2', "x R' U R' D2 R U' R' D2 R2 x'",
+        'R@100 U@200',
+    )
+
+    def test_same_fields(self) -> None:
+        """Test that lazy impacts match the computed impacts."""
+        for moves in self.algorithms:
+            with self.subTest(moves=moves):
+                algorithm = Algorithm.parse_moves(moves)
+                impacts = compute_impacts(algorithm)
+                lazy = compute_lazy_impacts(algorithm)
+
+                for field in ImpactData._fields[1:]:
+                    self.assertEqual(
+                        getattr(lazy, field), getattr(impacts, field), field,
+                    )
+                self.assertEqual(lazy.cube.state, impacts.cube.state)
+
+    def test_lazy(self) -> None:
+        """Test that only the accessed fields are computed."""
+        lazy = compute_lazy_impacts(Algorithm.parse_moves("R U R' U'"))
+
+        self.assertEqual(lazy.cubies_corners_moved, 4)
+        self.assertEqual(
+            lazy.facelets_transformation_mask,
+            compute_impacts(Algorithm.parse_moves("R U R' U'"))
+            .facelets_transformation_mask,
+        )
+        self.assertIn('facelets_transformation_mask', lazy.__dict__)
+        self.assertNotIn('facelets_permutations', lazy.__dict__)
+        self.assertNotIn('facelets_qtm_distance', lazy.__dict__)
+        self.assertNotIn('cubies_patterns', lazy.__dict__)
+
+    def test_as_impact_data(self) -> None:
+        """Test converting lazy impacts into impact data."""
+        lazy = compute_lazy_impacts(Algorithm.parse_moves('F2'))
+        impacts = lazy.as_impact_data()
+
+        self.assertIsInstance(impacts, ImpactData)
+        self.assertIs(impacts.cube, lazy.cube)
+        self.assertEqual(impacts.facelets_mobilized_count, 20)
+
+    def test_permutation(self) -> None:
+        """Test that the facelet fields derive from the permutation."""
+        lazy = compute_lazy_impacts(Algorithm.parse_moves("R U R' U' x"))
+
+        self.assertEqual(
+            ''.join(VCube().state[origin] for origin in lazy.permutation),
+            lazy.cube.state,
+        )
+        for original_pos, final_pos in lazy.facelets_permutations.items():
+            self.assertEqual(lazy.permutation[final_pos], original_pos)
+
+    def test_big_cubes(self) -> None:
+        """Test the facelet fields on other cube sizes."""
+        for size, moves, moved, layers in (
+                (2, 'R', 12, (0, 0, 12)),
+                (4, 'Rw', 48, (12, 24, 12)),
+                (5, '2R', 20, (12, 8, 0)),
+        ):
+            with self.subTest(size=size):
+                lazy = compute_lazy_impacts(
+                    Algorithm.parse_moves(f'{ moves } y'), size,
+                )
+                cube = VCube(size=size)
+                cube.rotate(moves)
+
+                self.assertEqual(lazy.cube.state, cube.state)
+                self.assertEqual(lazy.facelets_mobilized_count, moved)
+                self.assertEqual(len(lazy.facelets_permutations), moved)
+                self.assertEqual(
+                    tuple(lazy.facelets_layer_analysis.values()), layers,
+                )
+
+    def test_big_cubes_specific_fields(self) -> None:
+        """Test that the 3x3x3 specific fields are not computed."""
+        lazy = compute_lazy_impacts(Algorithm.parse_moves('R'), 4)
+
+        self.assertEqual(lazy.facelets_scrambled_percent, 32 / 96)
+
+        for field in (
+                'facelets_manhattan_distance', 'facelets_qtm_distance',
+                'cubies_corners_moved', 'cubies_patterns',
+        ):
+            with (
+                    self.subTest(field=field),
+                    self.assertRaises(InvalidCubeStateError),
+            ):
+                getattr(lazy, field)
+
+        with self.assertRaises(InvalidCubeStateError):
+            lazy.as_impact_data()
@@ -1,7 +1,13 @@
 """Tests for the Move class."""
 
+import copy
+import pickle  # noqa: S403
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.move import MOVE_TABLE
 from cubing_algs.move import Move
 
 
@@ -386,3 +392,141 @@ class MoveTestCase(unittest.TestCase):  # noqa: PLR0904
 
         self.assertEqual(Move('.@100').time, '@100')
         self.assertEqual(Move('.@100').timed, 100)
+
+
+class MoveInterningTestCase(unittest.TestCase):
+    """Tests for move interning and integer ids."""
+
+    def test_untimed_moves_are_interned(self) -> None:
+        """Test that equal untimed moves share the same instance."""
+        self.assertIs(Move("R'"), Move("R'"))
+        self.assertIs(Move(Move('U2')), Move('U2'))
+        self.assertIsNot(Move('R@100'), Move('R@100'))
+        self.assertEqual(Move('R@100'), Move('R@100'))
+
+    def test_invalid_moves_are_not_interned(self) -> None:
+        """Test that invalid moves are never registered."""
+        size = len(MOVE_TABLE)
+
+        self.assertIsNot(Move('X12345'), Move('X12345'))
+        self.assertFalse(Move('X12345').is_valid)
+        with self.assertRaises(InvalidMoveError):
+            _ = Move('X12345').id
+        with self.assertRaises(InvalidMoveError):
+            _ = Move('X12345@100').id
+
+        self.assertEqual(len(MOVE_TABLE), size)
+        self.assertNotIn('X12345', MOVE_TABLE.interned)
+
+    def test_layered_moves_are_interned_on_id(self) -> None:
+        """Test that valid moves are interned once their id is requested."""
+        move = Move('7-9Bw2')
+
+        self.assertIsNot(Move('7-9Bw2'), move)
+        identifier = move.id
+        self.assertIs(Move('7-9Bw2'), move)
+        self.assertIs(Move.from_id(identifier), move)
+
+    def test_table_limit(self) -> None:
+        """Test that registering past the limit raises a clear error."""
+        with (
+                patch('cubing_algs.move.MAX_MOVE_IDS', len(MOVE_TABLE)),
+                self.assertRaisesRegex(InvalidMoveError, 'limited to'),
+        ):
+            _ = Move('8-9Lw2').id
+
+        self.assertEqual(Move('R').id, Move('R@100').id)
+
+    def test_concurrent_registering(self) -> None:
+        """Test that threads registering the same move get the same id."""
+        with ThreadPoolExecutor(8) as executor:
+            ids = set(executor.map(
+                lambda _: Move('11-12Dw2').id,
+                range(64),
+            ))
+
+        self.assertEqual(len(ids), 1)
+
+    def test_id(self) -> None:
+        """Test that ids identify untimed moves."""
+        self.assertEqual(Move('R').id, Move('R').id)
+        self.assertEqual(Move('R@100').id, Move('R').id)
+        self.assertNotEqual(Move('R').id, Move("R'").id)
+        self.assertNotEqual(Move('r').id, Move('Rw').id)
+
+    def test_from_id(self) -> None:
+        """Test getting a move back from its id."""
+        move = Move('3-4Rw2')
+
+        self.assertIs(Move.from_id(move.id), move)
+        self.assertIs(Move.from_id(Move("F'@250").id), Move("F'"))
+
+    def test_table(self) -> None:
+        """Test the properties stored in the move table."""
+        move = Move("2-4u'")
+
+        self.assertEqual(MOVE_TABLE.base_move(move.id), 'U')
+        self.assertFalse(MOVE_TABLE.is_double(move.id))
+        self.assertIs(
+            Move.from_id(MOVE_TABLE.inverted(move.id)),
+            Move('2-4u'),
+        )
+        self.assertIs(
+            Move.from_id(MOVE_TABLE.doubled(move.id)),
+            Move('2-4u2'),
+        )
+        self.assertEqual(MOVE_TABLE.inverted(Move('R2').id), Move('R2').id)
+        self.assertEqual(MOVE_TABLE.doubled(Move('.').id), Move('.').id)
+        self.assertGreaterEqual(len(MOVE_TABLE), 1)
+
+    def test_transformations_are_interned(self) -> None:
+        """Test that transformations return interned moves."""
+        self.assertIs(Move('R').inverted, Move("R'"))
+        self.assertIs(Move("R'").doubled, Move('R2'))
+        self.assertIs(Move('R2').doubled, Move('R'))
+        self.assertIs(Move('R@100').untimed, Move('R'))
+
+    def test_timed_transformations(self) -> None:
+        """Test that transformations keep the time information."""
+        move = Move("R'@100")
+
+        self.assertEqual(move.inverted, 'R@100')
+        self.assertEqual(move.doubled, 'R2@100')
+
+        double = Move('R2@100')
+        self.assertIs(double.inverted, double)
+
+    def test_pickle_and_copy(self) -> None:
+        """Test that pickling and copying keep interning."""
+        move = Move("Rw'")
+        timed = Move("Rw'@120")
+
+        self.assertIs(pickle.loads(pickle.dumps(move)), move)  # noqa: S301
+        self.assertIs(copy.copy(move), move)
+        self.assertIs(copy.deepcopy(move), move)
+        self.assertEqual(pickle.loads(pickle.dumps(timed)), timed)  # noqa: S301
+        self.assertEqual(copy.deepcopy(timed).inverted, 'Rw@120')
+
+    def test_quarter_turns(self) -> None:
+        """Test decomposing moves into clockwise quarter turns."""
+        for move, clockwise, turns in (
+                ('R', 'R', 1),
+                ('R2', 'R', 2),
+                ("2-3Rw'", '2-3Rw', 3),
+                ('x2', 'x', 2),
+                ('.', '.', 0),
+        ):
+            with self.subTest(move=move):
+                identifier = Move(move).id
+
+                self.assertEqual(
+                    MOVE_TABLE.quarter_turns(identifier),
+                    (Move(clockwise).id, turns),
+                )
+                if turns:
+                    self.assertEqual(
+                        MOVE_TABLE.from_quarter_turns(
+                            Move(clockwise).id, turns,
+                        ),
+                        identifier,
+                    )
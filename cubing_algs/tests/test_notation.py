@@ -0,0 +1,182 @@
+"""Tests for the single pass parser of the move notation."""
+
+import logging
+import unittest
+from random import Random
+
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.move import Move
+from cubing_algs.notation import parse_notation
+from cubing_algs.parsing import check_moves
+from cubing_algs.parsing import expand_notation
+
+MOVES_POOL = [
+    'R', "R'", 'R2', "R2'", 'U', "u'", 'm', 'M2', 'x', 'X',
+    '2R', '2-3Rw', 'R@100', '.', 'r2', "F'@20",
+]
+
+JUNK_POOL = [
+    '(', ')', '[', ']', ',', ':', "'", '2', '0', '-', '/',
+    '\n', '//c\n', '`', 'T',
+]
+
+GROUP_RATE = 0.2
+BRACKET_RATE = 0.35
+JUNK_RATE = 0.3
+
+
+def random_notation(rng: Random, depth: int = 0) -> str:
+    """
+    Build a random notation with nested groups.
+
+    Returns:
+        The notation.
+
+    """
+    parts = []
+    for _ in range(rng.randint(0, 4)):
+        draw = rng.random()
+        if depth < 4 and draw < GROUP_RATE:
+            parts.append(
+                f'({ random_notation(rng, depth + 1) })'
+                + rng.choice(['', '2', "'", "3'", '0']),
+            )
+        elif depth < 4 and draw < BRACKET_RATE:
+            parts.append(
+                f'[{ random_notation(rng, depth + 1) }'
+                f'{ rng.choice([",", ":", ", ", ": "]) }'
+                f'{ random_notation(rng, depth + 1) }]',
+            )
+        else:
+            parts.append(rng.choice(MOVES_POOL))
+        parts.append(rng.choice([' ', '', '  ', '\n', ' // c\n']))
+
+    return ''.join(parts)
+
+
+def expand(text: str, *, secure: bool) -> list[str] | str:
+    """
+    Expand a notation with the string rewrites.
+
+    Returns:
+        The moves as strings, or the name of the error raised.
+
+    """
+    try:
+        moves = expand_notation(text, secure=secure)
+    except InvalidMoveError as error:
+        return type(error).__name__
+
+    if not secure and not check_moves(moves):
+        return 'InvalidMoveError'
+
+    return [str(move) for move in moves]
+
+
+class ParseNotationTestCase(unittest.TestCase):
+    """Tests for the parse_notation function."""
+
+    def test_parse_notation(self) -> None:
+        """Test parsing the supported notations."""
+        cases = [
+            ('', []),
+            ("R U R' U'", ['R', 'U', "R'", "U'"]),
+            ("(R U)3'", ["U'", "R'", "U'", "R'", "U'", "R'"]),
+            ('(R U)0 F', ['F']),
+            ("[R U R', D]", ['R', 'U', "R'", 'D', 'R', "U'", "R'", "D'"]),
+            ('[F: [U, R]]', ['F', 'U', 'R', "U'", "R'", "F'"]),
+            ("([R, U])'", ['U', 'R', "U'", "R'"]),
+            ('R // first\nU//second', ['R', 'U']),
+        ]
+
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse_notation(text, secure=True), expected)
+
+    def test_parse_notation_normalized(self) -> None:
+        """Test that moves are normalized unless in secure mode."""
+        self.assertEqual(
+            parse_notation("(R2' m) X", secure=False),
+            ['R2', 'M', 'x'],
+        )
+        self.assertIsNone(parse_notation("R2'", secure=True))
+        self.assertIsNone(parse_notation('m', secure=True))
+        self.assertIsNone(parse_notation('R U’', secure=False))  # noqa: RUF001
+
+    def test_parse_notation_timed(self) -> None:
+        """Test that inverted timed moves keep their time."""
+        self.assertEqual(
+            parse_notation("(R@100 U'@200 .@300)'", secure=True),
+            ['.@300', 'U@200', "R'@100"],
+        )
+
+    def test_unsupported_notations(self) -> None:
+        """Test the notations left to the string expansions."""
+        for text in (
+                'R T', 'R, U', '[R U]', '[R, U: F]', '[R, U', '(R U',
+                "R(2R)'", "(R)'2R", '((R U) F)2', '(R U) F',
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_notation(text, secure=True))
+
+        self.assertEqual(
+            parse_notation('(R U) F', secure=False),
+            ['R', 'U', 'F'],
+        )
+
+    def test_deep_nesting(self) -> None:
+        """Test that deeply nested groups are parsed."""
+        depth = 200
+        text = '(' * depth + "R U'" + ")'" * depth
+        moves = parse_notation(text, secure=True)
+
+        self.assertEqual(moves, ['R', "U'"])
+
+        text = '[R: ' * depth + 'U' + ']' * depth
+        moves = parse_notation(text, secure=True)
+
+        self.assertIsNotNone(moves)
+        self.assertEqual(len(moves or []), 2 * depth + 1)
+        self.assertEqual((moves or [])[depth], Move('U'))
+
+    def test_nesting_beyond_recursion_limit(self) -> None:
+        """Test that nesting beyond the recursion limit is parsed."""
+        depth = 5000
+        text = '(' * depth + 'R' + ")'" * depth
+
+        self.assertEqual(parse_notation(text, secure=True), ['R'])
+
+        text = '[R: ' * depth + 'U' + ']' * depth
+        moves = parse_notation(text, secure=True)
+
+        self.assertEqual(len(moves or []), 2 * depth + 1)
+        self.assertEqual((moves or [])[depth], Move('U'))
+
+        text = "[R, U'] " + '[' * depth + 'R' + ']' * depth
+        self.assertIsNone(parse_notation(text, secure=True))
+
+    def test_parity_fuzz(self) -> None:
+        """Test parity with the string expansions on random notations."""
+        rng = Random(42)  # noqa: S311
+        logging.disable(logging.ERROR)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+        for _ in range(2000):
+            text = random_notation(rng)
+            if rng.random() < JUNK_RATE:
+                characters = list(text)
+                for _ in range(rng.randint(1, 3)):
+                    characters.insert(
+                        rng.randint(0, len(characters)),
+                        rng.choice(JUNK_POOL),
+                    )
+                text = ''.join(characters)
+
+            for secure in (True, False):
+                moves = parse_notation(text, secure=secure)
+                if moves is not None:
+                    self.assertEqual(
+                        [str(move) for move in moves],
+                        expand(text, secure=secure),
+                        text,
+                    )
@@ -0,0 +1,229 @@
+"""Tests for the packed algorithm representation."""
+
+import pickle  # noqa: S403
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from random import Random
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.metrics import compute_metrics
+from cubing_algs.move import Move
+from cubing_algs.packed import PackedAlgorithm
+from cubing_algs.transform.mirror import mirror_moves
+from cubing_algs.transform.optimize import optimize_do_undo_moves
+from cubing_algs.transform.optimize import optimize_double_moves
+from cubing_algs.transform.optimize import optimize_repeat_three_moves
+from cubing_algs.transform.optimize import optimize_triple_moves
+from cubing_algs.transform.pause import unpause_moves
+from cubing_algs.transform.timing import untime_moves
+
+MOVES_POOL = [
+    'R', "R'", 'R2', 'U', "U'", 'U2', 'F', 'F2', "D'",
+    'M', "M'", 'M2', 'E2', 'S', 'x', 'y2', "z'", '.',
+    'Rw', '2R', "r'", '3Uw2', '2-3Lw',
+]
+
+TRANSFORMS = (
+    optimize_repeat_three_moves,
+    optimize_do_undo_moves,
+    optimize_double_moves,
+    optimize_triple_moves,
+    mirror_moves,
+    unpause_moves,
+    untime_moves,
+)
+
+
+def shifted_round_trip(
+        packed: PackedAlgorithm,
+) -> tuple[PackedAlgorithm, str]:
+    """
+    Load a packed algorithm in a process registering other moves first.
+
+    Returns:
+        The packed algorithm and its moves as a string.
+
+    """
+    _ = Move('4-6Uw2').id
+    _ = Move("3-5Bw'").id
+
+    return packed, str(packed)
+
+
+class PackedAlgorithmTestCase(unittest.TestCase):
+    """Tests for the PackedAlgorithm class."""
+
+    def test_packed(self) -> None:
+        """Test packing an algorithm."""
+        algorithm = Algorithm.parse_moves("R U R' U'")
+        packed = algorithm.packed
+
+        self.assertIsInstance(packed, PackedAlgorithm)
+        self.assertEqual(packed.ids.typecode, 'H')
+        self.assertEqual(list(packed.ids), [move.id for move in algorithm])
+        self.assertEqual(str(packed), "R U R' U'")
+        self.assertEqual(len(packed), 4)
+        self.assertEqual(packed, algorithm)
+        self.assertEqual(Algorithm(packed), algorithm)
+
+    def test_packed_timed(self) -> None:
+        """Test that timed moves cannot be packed."""
+        with self.assertRaises(InvalidMoveError):
+            _ = Algorithm.parse_moves('R@100 U@200').packed
+
+        packed = Algorithm.parse_moves('R').packed
+        with self.assertRaises(InvalidMoveError):
+            packed.append('U@100')
+
+    def test_lazy_moves(self) -> None:
+        """Test that indexing and iterating keep the ids."""
+        packed = Algorithm.parse_moves("R U2 F'").packed
+
+        self.assertIs(packed[1], Move('U2'))
+        self.assertEqual(packed[-1], "F'")
+        self.assertEqual(list(packed), ['R', 'U2', "F'"])
+        self.assertIsNone(packed._moves)  # noqa: SLF001
+
+    def test_slice(self) -> None:
+        """Test that slices are packed algorithms."""
+        packed = Algorithm.parse_moves("R U2 F' D").packed
+        sliced = packed[1:3]
+
+        self.assertIsInstance(sliced, PackedAlgorithm)
+        self.assertEqual(str(sliced), "U2 F'")
+
+    def test_mutations(self) -> None:
+        """Test modifying a packed algorithm."""
+        packed = Algorithm.parse_moves('R U').packed
+        packed.append("F'")
+        packed.insert(0, Move('D2'))
+        packed.extend("L B'")
+        packed += Algorithm.parse_moves('x').packed
+
+        self.assertEqual(str(packed), "D2 R U F' L B' x")
+
+        with self.assertRaises(InvalidMoveError):
+            packed.append('T')
+
+    def test_list_methods(self) -> None:
+        """Test inherited list methods materializing the moves."""
+        packed = Algorithm.parse_moves("R U F'").packed
+        packed.reverse()
+        packed[0] = Move('D')
+        moved = packed.pop()
+
+        self.assertEqual(moved, 'R')
+        self.assertEqual(str(packed), 'D U')
+        self.assertIn(Move('U'), packed)
+
+        packed.append('B')
+        self.assertEqual(
+            list(packed.ids),
+            [Move(m).id for m in ('D', 'U', 'B')],
+        )
+        self.assertEqual(str(packed), 'D U B')
+
+    def test_copy(self) -> None:
+        """Test that copies do not share their ids."""
+        packed = Algorithm.parse_moves('R U').packed
+        copy = packed.copy()
+        copy.append('F')
+
+        self.assertEqual(str(packed), 'R U')
+        self.assertEqual(str(copy), 'R U F')
+        self.assertIsInstance(packed + 'D', PackedAlgorithm)
+
+    def test_pickle(self) -> None:
+        """Test that pickling stores the moves and not the ids."""
+        packed = Algorithm.parse_moves("5-6Rw2 R U' 2-3Lw").packed
+        loaded = pickle.loads(pickle.dumps(packed))  # noqa: S301
+
+        self.assertIsInstance(loaded, PackedAlgorithm)
+        self.assertEqual(loaded, packed)
+        self.assertNotIn(b'array', pickle.dumps(packed))
+
+    def test_pickle_across_processes(self) -> None:
+        """Test that packed algorithms round trip through another process."""
+        packed = Algorithm.parse_moves("7-8Fw R U' 5-6Rw2 2-3Lw").packed
+
+        with ProcessPoolExecutor(
+                max_workers=1, mp_context=get_context('spawn'),
+        ) as executor:
+            returned, moves = executor.submit(
+                shifted_round_trip, packed,
+            ).result()
+
+        self.assertEqual(moves, "7-8Fw R U' 5-6Rw2 2-3Lw")
+        self.assertIsInstance(returned, PackedAlgorithm)
+        self.assertEqual(returned, packed)
+
+    def test_from_ids(self) -> None:
+        """Test creating a packed algorithm from ids."""
+        packed = PackedAlgorithm.from_ids([Move('R').id, Move("U'").id])
+
+        self.assertEqual(str(packed), "R U'")
+
+
+class PackedFastPathsTestCase(unittest.TestCase):
+    """Tests for the transforms and metrics working on move ids."""
+
+    def test_transforms(self) -> None:
+        """Test that transforms keep the algorithms packed."""
+        packed = Algorithm.parse_moves("R R R U U' F F . F2 D2 D2").packed
+
+        for transform in TRANSFORMS:
+            with self.subTest(transform=transform.__name__):
+                result = transform(packed)
+
+                self.assertIsInstance(result, PackedAlgorithm)
+                self.assertEqual(
+                    str(result),
+                    str(transform(Algorithm(packed))),
+                )
+
+    def test_transforms_fuzz(self) -> None:
+        """Test that packed transforms match on random algorithms."""
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(300):
+            algorithm = Algorithm.parse_moves(
+                ' '.join(rng.choices(MOVES_POOL, k=rng.randint(0, 20))),
+            )
+            packed = algorithm.packed
+
+            for transform in TRANSFORMS:
+                self.assertEqual(
+                    str(transform(packed)), str(transform(algorithm)),
+                )
+
+            self.assertEqual(
+                packed.transform(*TRANSFORMS[:4], to_fixpoint=True),
+                algorithm.transform(*TRANSFORMS[:4], to_fixpoint=True),
+            )
+
+    def test_max_depth(self) -> None:
+        """Test that the depth of optimizations is respected."""
+        algorithm = Algorithm.parse_moves("R U U' F F' R'")
+
+        for depth in range(4):
+            with self.subTest(depth=depth):
+                self.assertEqual(
+                    optimize_do_undo_moves(algorithm.packed, depth),
+                    optimize_do_undo_moves(algorithm, depth),
+                )
+
+    def test_metrics(self) -> None:
+        """Test that packed metrics match on random algorithms."""
+        rng = Random(7)  # noqa: S311
+
+        for _ in range(300):
+            algorithm = Algorithm.parse_moves(
+                ' '.join(rng.choices(MOVES_POOL, k=rng.randint(0, 20))),
+            )
+
+            self.assertEqual(
+                compute_metrics(algorithm.packed),
+                compute_metrics(algorithm),
+            )
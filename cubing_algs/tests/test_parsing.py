@@ -1,14 +1,22 @@
 """Tests for algorithm parsing functions."""
 
+import io
 import unittest
 
 from cubing_algs.exceptions import InvalidBracketError
 from cubing_algs.exceptions import InvalidMoveError
 from cubing_algs.exceptions import InvalidOperatorError
 from cubing_algs.move import Move
+from cubing_algs.parsing import ParseCache
+from cubing_algs.parsing import _parse_cache
 from cubing_algs.parsing import check_moves
 from cubing_algs.parsing import clean_moves
 from cubing_algs.parsing import clean_multiline_and_comments
+from cubing_algs.parsing import clear_parse_cache
+from cubing_algs.parsing import disable_parse_cache
+from cubing_algs.parsing import enable_parse_cache
+from cubing_algs.parsing import get_parse_cache_info
+from cubing_algs.parsing import iter_parse_moves
 from cubing_algs.parsing import parse_moves
 from cubing_algs.parsing import parse_moves_cfop
 from cubing_algs.parsing import split_moves
@@ -848,3 +856,186 @@ class ParseMovesMultilineIntegrationTestCase(unittest.TestCase):
         result = parse_moves(multiline_moves)
         expected = ['R', 'U', '.', "R'", "U'", "D'", 'R', 'D', '.']
         self.assertEqual(list(result), expected)
+
+
+class ParseMovesFallbackTestCase(unittest.TestCase):
+    """Tests for the notations parsed by the string expansions."""
+
+    def test_parse_moves_loose_separators(self) -> None:
+        """Test that stray separators are cleaned."""
+        result = parse_moves('R, U: F', secure=False)
+        self.assertEqual(list(result), ['R', 'U', 'F'])
+
+    def test_parse_moves_glued_parenthesis(self) -> None:
+        """Test that moves glued to parenthesis are split as before."""
+        result = parse_moves("R(U 2R)'", secure=False)
+        self.assertEqual(list(result), ['R2', "R'", "U'"])
+
+    def test_parse_moves_fallback_invalid(self) -> None:
+        """Test that invalid moves are still detected."""
+        with self.assertRaises(InvalidMoveError):
+            parse_moves('R, T', secure=False)
+
+
+class ParseCacheTestCase(unittest.TestCase):
+    """Tests for the cache of parsed algorithms."""
+
+    @staticmethod
+    def setUp() -> None:
+        """Set up test fixtures."""
+        clear_parse_cache()
+        enable_parse_cache()
+
+    @staticmethod
+    def tearDown() -> None:
+        """Clean up after tests."""
+        clear_parse_cache()
+        disable_parse_cache()
+
+    def test_cache_disabled_by_default(self) -> None:
+        """Test that parsing is not cached unless enabled."""
+        disable_parse_cache()
+        parse_moves("R U R' U'")
+
+        info = get_parse_cache_info()
+        self.assertFalse(info['enabled'])
+        self.assertEqual(info['cached'], 0)
+        self.assertEqual(info['misses'], 0)
+
+    def test_cache_hits_and_misses(self) -> None:
+        """Test the statistics of the cache."""
+        first = parse_moves("R U R' U'")
+        second = parse_moves("R U R' U'")
+        parse_moves("R U R' U'", secure=False)
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            get_parse_cache_info(),
+            {
+                'cached': 2, 'hits': 1, 'misses': 2,
+                'max_size': _parse_cache.max_size, 'enabled': True,
+            },
+        )
+
+        clear_parse_cache()
+        info = get_parse_cache_info()
+        self.assertEqual((info['cached'], info['hits'], info['misses']),
+                         (0, 0, 0))
+
+    def test_cache_returns_copies(self) -> None:
+        """Test that mutating a parsed algorithm does not alter the cache."""
+        first = parse_moves('[R, U]')
+        first.append('F')
+        second = parse_moves('[R, U]')
+
+        self.assertIsNot(first, second)
+        self.assertEqual(str(second), "R U R' U'")
+        second.pop()
+        self.assertEqual(str(parse_moves('[R, U]')), "R U R' U'")
+
+    def test_cache_errors_not_cached(self) -> None:
+        """Test that invalid notations still raise."""
+        for _ in range(2):
+            with self.assertRaises(InvalidMoveError):
+                parse_moves('R T', secure=False)
+
+        self.assertEqual(get_parse_cache_info()['cached'], 0)
+
+    def test_cache_eviction(self) -> None:
+        """Test that the least recently used algorithms are evicted."""
+        original_max_size = _parse_cache.max_size
+        _parse_cache.max_size = 2
+        self.addCleanup(setattr, _parse_cache, 'max_size', original_max_size)
+
+        parse_moves('R')
+        parse_moves('U')
+        parse_moves('R')
+        parse_moves('F')
+
+        self.assertEqual(
+            list(_parse_cache.algorithms),
+            [('R', True), ('F', True)],
+        )
+
+    def test_cache_without_size(self) -> None:
+        """Test that a cache without size caches nothing."""
+        cache = ParseCache(max_size=0)
+        cache.enable()
+        cache.set_algorithm('R', parse_moves('R'), secure=True)
+
+        self.assertIsNone(cache.get_algorithm('R', secure=True))
+        self.assertEqual(len(cache.algorithms), 0)
+
+    def test_cache_shrunk(self) -> None:
+        """Test that shrinking the cache evicts down to its size."""
+        original_max_size = _parse_cache.max_size
+        self.addCleanup(setattr, _parse_cache, 'max_size', original_max_size)
+
+        for moves in ('R', 'U', 'F', 'D'):
+            parse_moves(moves)
+        _parse_cache.max_size = 2
+        parse_moves('B')
+
+        self.assertEqual(
+            list(_parse_cache.algorithms),
+            [('D', True), ('B', True)],
+        )
+
+
+class IterParseMovesTestCase(unittest.TestCase):
+    """Tests for the iter_parse_moves function."""
+
+    lines = (
+        "R U R' U'\n"
+        '\n'
+        'R T\n'
+        '[R, U] // comment\r\n'
+        "F R2'"
+    )
+
+    def test_iter_parse_moves(self) -> None:
+        """Test parsing a file, skipping the invalid lines."""
+        result = [
+            (line_number, str(algorithm))
+            for line_number, algorithm in iter_parse_moves(
+                io.StringIO(self.lines),
+            )
+        ]
+
+        self.assertEqual(
+            result,
+            [(1, "R U R' U'"), (4, "R U R' U'"), (5, 'F R2')],
+        )
+
+    def test_iter_parse_moves_lazy(self) -> None:
+        """Test that lines are parsed one at a time."""
+        parsed = iter_parse_moves(iter(['R', 'T', 'U']), on_error='raise')
+
+        self.assertEqual(next(parsed), (1, ['R']))
+        with self.assertRaises(InvalidMoveError):
+            next(parsed)
+
+    def test_iter_parse_moves_collect(self) -> None:
+        """Test collecting the errors in place of the algorithms."""
+        result = list(
+            iter_parse_moves(self.lines.splitlines(), on_error='collect'),
+        )
+
+        self.assertEqual([line_number for line_number, _ in result],
+                         [1, 3, 4, 5])
+        self.assertIsInstance(result[1][1], InvalidMoveError)
+
+    def test_iter_parse_moves_shared_moves(self) -> None:
+        """Test that algorithms of different lines share their moves."""
+        (_, first), (_, second) = iter_parse_moves(["R U'", "U' R"])
+        assert not isinstance(first, InvalidMoveError)  # noqa: S101
+        assert not isinstance(second, InvalidMoveError)  # noqa: S101
+
+        self.assertIs(first[0], second[1])
+        self.assertIs(first[1], second[0])
+
+    def test_iter_parse_moves_secure(self) -> None:
+        """Test parsing lines without cleaning."""
+        result = list(iter_parse_moves(['R2 U'], secure=True))
+
+        self.assertEqual(result, [(1, ['R2', 'U'])])
@@ -1,5 +1,6 @@
 """Tests for scramble generation."""
 
+import itertools
 import time
 import unittest
 from collections import Counter
@@ -10,11 +11,20 @@ from statistics import stdev
 from cubing_algs.algorithm import Algorithm
 from cubing_algs.constants import FACE_ORDER
 from cubing_algs.constants import OPPOSITE_FACES
+from cubing_algs.packed import PackedAlgorithm
 from cubing_algs.scrambler import build_cube_move_set
+from cubing_algs.scrambler import build_successors
 from cubing_algs.scrambler import is_valid_next_move
+from cubing_algs.scrambler import random_cube
 from cubing_algs.scrambler import random_moves
 from cubing_algs.scrambler import scramble
 from cubing_algs.scrambler import scramble_easy_cross
+from cubing_algs.scrambler import scramble_random_state
+from cubing_algs.scrambler import scramble_random_state_2x2
+from cubing_algs.scrambler import scrambles
+from cubing_algs.solvers.pocket import STATE_COUNT
+from cubing_algs.solvers.pocket import TWIST_COUNT
+from cubing_algs.solvers.pocket import cube_coordinates
 from cubing_algs.vcube import VCube
 
 
@@ -669,6 +679,94 @@ class TestScramble(unittest.TestCase):
         )
 
 
+class TestScrambles(unittest.TestCase):
+    """Tests for bulk scramble generation."""
+
+    def test_build_successors(self) -> None:
+        """Test that the successors are the valid next moves."""
+        for cube_size in (2, 3, 5):
+            move_set = build_cube_move_set(cube_size, inner_layers=True)
+            successors = build_successors(move_set)
+
+            for previous, indexes in zip(move_set, successors, strict=True):
+                self.assertEqual(
+                    [move_set[index] for index in indexes],
+                    [
+                        move for move in move_set
+                        if is_valid_next_move(move, previous)
+                    ],
+                )
+
+    def test_build_successors_no_face(self) -> None:
+        """Test that moves without face have no successors."""
+        self.assertEqual(
+            build_successors(['R', 'x', 'U']),
+            [[2], [], [0]],
+        )
+
+    def test_scrambles_3x3x3(self) -> None:
+        """Test scrambles 3x3x3."""
+        move_set = build_cube_move_set(3)
+        algorithms = scrambles(3, 50, rng=Random(42))  # noqa: S311
+
+        self.assertEqual(len(algorithms), 50)
+        for algorithm in algorithms:
+            self.assertIsInstance(algorithm, Algorithm)
+            self.assertGreaterEqual(len(algorithm), 25)
+            self.assertLessEqual(len(algorithm), 30)
+            moves = [str(move) for move in algorithm]
+
+            self.assertTrue(set(moves) <= set(move_set))
+            for previous, move in itertools.pairwise(moves):
+                self.assertTrue(is_valid_next_move(move, previous))
+
+    def test_scrambles_iterations(self) -> None:
+        """Test scrambles with a number of moves."""
+        algorithms = scrambles(
+            5, 10, 7, inner_layers=True, rng=Random(42),  # noqa: S311
+        )
+
+        self.assertEqual([len(algorithm) for algorithm in algorithms], [7] * 10)
+
+    def test_scrambles_packed(self) -> None:
+        """Test that packed scrambles are drawn like the others."""
+        algorithms = scrambles(3, 20, rng=Random(42))  # noqa: S311
+        packed = scrambles(3, 20, packed=True, rng=Random(42))  # noqa: S311
+
+        for algorithm, packed_algorithm in zip(
+                algorithms, packed, strict=True,
+        ):
+            self.assertIsInstance(packed_algorithm, PackedAlgorithm)
+            self.assertEqual(str(packed_algorithm), str(algorithm))
+
+    def test_scrambles_deterministic_with_seed(self) -> None:
+        """Test that scrambles produce identical results with same seed."""
+        self.assertEqual(
+            scrambles(4, 5, rng=Random(42)),  # noqa: S311
+            scrambles(4, 5, rng=Random(42)),  # noqa: S311
+        )
+        self.assertNotEqual(
+            scrambles(4, 5, rng=Random(42)),  # noqa: S311
+            scrambles(4, 5, rng=Random(123)),  # noqa: S311
+        )
+
+    def test_scrambles_distribution(self) -> None:
+        """Test that the moves are equally likely after a move."""
+        counts = Counter(
+            str(algorithm[1])
+            for algorithm in scrambles(
+                3, 36000, 2, rng=Random(42),  # noqa: S311
+            )
+            if algorithm[0].base_move == 'R'
+        )
+
+        # 12 moves allowed after an R move, out of the R and L faces
+        self.assertEqual(len(counts), 12)
+        self.assertLess(
+            max(counts.values()) / min(counts.values()), 1.5,
+        )
+
+
 class TestScrambleEasyCross(unittest.TestCase):
     """Tests for easy cross scramble generation."""
 
@@ -687,6 +785,76 @@ class TestScrambleEasyCross(unittest.TestCase):
         )
 
 
+class TestScrambleRandomState(unittest.TestCase):
+    """Tests for random state scramble generation."""
+
+    def test_random_cube(self) -> None:
+        """Test that random cubes are legal and seeded."""
+        rng = Random(42)  # noqa: S311
+        states = {random_cube(rng).state for _ in range(20)}
+
+        self.assertEqual(len(states), 20)
+        for state in states:
+            self.assertTrue(VCube(state).check_integrity())
+
+        self.assertEqual(
+            random_cube(Random(42)).state,  # noqa: S311
+            random_cube(Random(42)).state,  # noqa: S311
+        )
+
+    def test_scramble_random_state(self) -> None:
+        """Test that the scramble reaches the random state."""
+        for seed in range(5):
+            moves = scramble_random_state(Random(seed))  # noqa: S311
+
+            cube = VCube()
+            cube.rotate(moves)
+
+            self.assertEqual(
+                cube.state,
+                random_cube(Random(seed)).state,  # noqa: S311
+            )
+            self.assertLessEqual(len(moves), 22)
+
+            for previous, current in itertools.pairwise(moves):
+                self.assertNotEqual(previous.base_move, current.base_move)
+
+    def test_scramble_random_state_max_length(self) -> None:
+        """Test the maximal length of the scramble."""
+        moves = scramble_random_state(
+            Random(42), max_length=25,  # noqa: S311
+        )
+
+        self.assertLessEqual(len(moves), 25)
+
+    def test_scramble_random_state_2x2(self) -> None:
+        """Test that the 2x2x2 scramble reaches the random state."""
+        for seed in range(20):
+            for metric, max_length in (('htm', 11), ('qtm', 14)):
+                moves = scramble_random_state_2x2(
+                    Random(seed), metric,  # noqa: S311
+                )
+
+                cube = VCube(size=2)
+                cube.rotate(moves)
+
+                self.assertEqual(
+                    cube_coordinates(cube),
+                    divmod(
+                        Random(seed).randrange(STATE_COUNT),  # noqa: S311
+                        TWIST_COUNT,
+                    ),
+                )
+                self.assertLessEqual(len(moves), max_length)
+                self.assertTrue(
+                    all(move.base_move in 'URF' for move in moves),
+                )
+                if metric == 'qtm':
+                    self.assertFalse(
+                        any(move.is_double for move in moves),
+                    )
+
+
 class TestScrambleEffectivenessByLength(unittest.TestCase):
     """
     Test suite measuring scramble effectiveness across different lengths.
@@ -0,0 +1,288 @@
+"""Tests for the optimal search of the last layer cases."""
+
+import unittest
+from random import Random
+
+from cubing_algs.cases import Case
+from cubing_algs.cases import get_case
+from cubing_algs.parsing import parse_moves
+from cubing_algs.solvers.last_layer import AUFS
+from cubing_algs.solvers.last_layer import FACE_MOVES_COUNT
+from cubing_algs.solvers.last_layer import MOVES
+from cubing_algs.solvers.last_layer import LastLayerSolution
+from cubing_algs.solvers.last_layer import auf_cycles
+from cubing_algs.solvers.last_layer import case_cube
+from cubing_algs.solvers.last_layer import cubies_coordinates
+from cubing_algs.solvers.last_layer import get_frame_moves
+from cubing_algs.solvers.last_layer import get_tables
+from cubing_algs.solvers.last_layer import optimal_case_data
+from cubing_algs.solvers.last_layer import search_case
+from cubing_algs.solvers.tables import EMPTY
+from cubing_algs.vcube import VCube
+
+ORIENTATION_COUNT = 24
+
+# Goals of the U layer pieces, solved up to an AUF for the PLL
+PLL_GOALS = 4
+OLL_GOALS = 24
+
+# Rotations bringing the centers back, by moving the U center then turning
+ROTATIONS = [
+    f'{ move } { turn }'.strip()
+    for move in ('', 'x', 'x2', "x'", 'z', "z'")
+    for turn in ('', 'y', 'y2', "y'")
+]
+
+
+def is_oriented(cube: VCube) -> bool:
+    """
+    Check that the first two layers are solved and the U face oriented.
+
+    Returns:
+        True if the OLL of the cube is solved.
+
+    """
+    state = cube.state
+
+    return all(
+        state[face * 9:face * 9 + 9] == state[face * 9 + 4] * 9
+        for face in (0, 3)
+    ) and all(
+        state[face * 9 + 3:face * 9 + 9] == state[face * 9 + 4] * 6
+        for face in (1, 2, 4, 5)
+    )
+
+
+def is_permuted(cube: VCube) -> bool:
+    """
+    Check that the cube is solved up to an adjustment of the U face.
+
+    Returns:
+        True if the PLL of the cube is solved.
+
+    """
+    for auf in AUFS:
+        adjusted = cube.copy()
+        adjusted.rotate(auf)
+        if adjusted.is_solved:
+            return True
+
+    return False
+
+
+class TablesTestCase(unittest.TestCase):
+    """Tests for the move and pruning tables."""
+
+    def test_frame_moves(self) -> None:
+        """Test that the cube is held in all the orientations."""
+        frame_moves = get_frame_moves()
+
+        self.assertEqual(len(frame_moves), ORIENTATION_COUNT)
+        self.assertEqual(
+            {frame for moves in frame_moves for _move, frame in moves},
+            set(range(ORIENTATION_COUNT)),
+        )
+        # Face moves do not change the orientation
+        self.assertEqual(
+            frame_moves[0][:FACE_MOVES_COUNT],
+            tuple((move, 0) for move in range(FACE_MOVES_COUNT)),
+        )
+
+    def test_moves(self) -> None:
+        """Test the move tables against the cubies."""
+        tables = get_tables('PLL', len(MOVES))
+        frame_moves = get_frame_moves()
+        stride = len(MOVES)
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(50):
+            moves = rng.choices(MOVES, k=rng.randint(1, 20))
+
+            cube = VCube()
+            coordinates = list(cubies_coordinates(cube.to_cubies))
+            frame = 0
+            for move in moves:
+                relative, frame = frame_moves[frame][MOVES.index(move)]
+                coordinates = [
+                    table[coordinate * stride + relative]
+                    for table, coordinate in zip(
+                        (tables.corner_moves, tables.corner_moves,
+                         tables.edge_moves, tables.edge_moves,
+                         tables.edge_moves),
+                        coordinates,
+                        strict=True,
+                    )
+                ]
+
+            cube.rotate(' '.join(moves))
+            for rotation in ROTATIONS:
+                held = cube.copy()
+                held.rotate(rotation)
+                if held.state[4::9] == VCube().state[4::9]:
+                    break
+
+            self.assertEqual(
+                tuple(coordinates), cubies_coordinates(held.to_cubies),
+            )
+
+    def test_pruning_tables(self) -> None:
+        """Test that the pruning tables are complete."""
+        for step, goals in (('OLL', OLL_GOALS), ('PLL', PLL_GOALS)):
+            tables = get_tables(step, FACE_MOVES_COUNT)
+
+            for table, goal_count in (
+                    (tables.u_corners_pruning, goals),
+                    (tables.d_corners_pruning, 1),
+                    (tables.u_edges_pruning, goals),
+                    (tables.d_edges_pruning, 1),
+                    (tables.e_edges_pruning, 1),
+            ):
+                distances = table.tobytes()
+
+                self.assertEqual(distances.count(0), goal_count)
+                self.assertNotIn(EMPTY, distances)
+
+
+class SearchTestCase(unittest.TestCase):
+    """Tests for the search of the algorithms of a case."""
+
+    def assert_solutions(self, case: Case,
+                         solutions: list[LastLayerSolution]) -> None:
+        """Assert that the solutions solve the case."""
+        solved = is_oriented if case.step == 'OLL' else is_permuted
+
+        self.assertTrue(solutions)
+        for auf, algorithm in solutions:
+            cube = case_cube(case)
+            cube.rotate(auf)
+            cube.rotate(algorithm)
+
+            self.assertTrue(solved(cube), (auf, algorithm))
+
+    def test_oll(self) -> None:
+        """Test the optimal algorithms of the Sune."""
+        case = get_case('OLL', 'OLL 27')
+        solutions = search_case(case)
+
+        self.assert_solutions(case, solutions)
+        self.assertEqual(
+            {len(algorithm) for _auf, algorithm in solutions}, {7},
+        )
+        self.assertIn(
+            parse_moves("R U R' U R U2 R'"),
+            [algorithm for _auf, algorithm in solutions],
+        )
+
+    def test_pll(self) -> None:
+        """Test the optimal algorithms of the Ua perm."""
+        case = get_case('PLL', 'PLL Ua')
+        solutions = search_case(case, 'RUM')
+
+        self.assert_solutions(case, solutions)
+        self.assertEqual(
+            solutions,
+            [
+                LastLayerSolution('', parse_moves("M2 U M U2 M' U M2")),
+                LastLayerSolution('U2', parse_moves("M2 U M' U2 M U M2")),
+            ],
+        )
+
+    def test_slice_moves(self) -> None:
+        """Test that slice moves shorten the algorithms."""
+        case = get_case('OLL', 'OLL 28')
+
+        self.assertEqual(len(search_case(case)[0].algorithm), 9)
+
+        solutions = search_case(case, 'RUFLDBMES')
+
+        self.assert_solutions(case, solutions)
+        self.assertEqual(len(solutions[0].algorithm), 7)
+
+    def test_slack(self) -> None:
+        """Test that longer algorithms are also searched."""
+        case = get_case('OLL', 'OLL 45')
+        solutions = search_case(case, slack=2)
+
+        self.assert_solutions(case, solutions)
+        # No algorithm of 7 moves, apart from the ones ending by a U move
+        self.assertEqual(
+            sorted({len(algorithm) for _auf, algorithm in solutions}),
+            [6, 8],
+        )
+        # Algorithms ending by a U move are the shorter ones
+        self.assertFalse(
+            [
+                algorithm for _auf, algorithm in solutions
+                if algorithm[-1].base_move == 'U'
+            ],
+        )
+
+    def test_skipped(self) -> None:
+        """Test that a skipped case needs no moves."""
+        self.assertEqual(
+            search_case(get_case('PLL', 'PLL Skipped')),
+            [LastLayerSolution('', parse_moves(''))],
+        )
+
+    def test_max_length(self) -> None:
+        """Test that too long algorithms are not searched."""
+        case = get_case('PLL', 'PLL Aa')
+
+        self.assertEqual(search_case(case, max_length=8), [])
+
+        with self.assertRaises(ValueError):
+            optimal_case_data(case, max_length=8)
+
+    def test_max_nodes(self) -> None:
+        """Test that the search gives up after the maximal nodes."""
+        case = get_case('PLL', 'PLL T')
+
+        with self.assertRaises(ValueError):
+            search_case(case, max_nodes=1000)
+
+        with self.assertRaises(ValueError):
+            optimal_case_data(case, max_nodes=1000)
+
+        self.assertEqual(
+            len(search_case(case, max_nodes=None)[0].algorithm), 10,
+        )
+
+    def test_unsupported(self) -> None:
+        """Test that unsupported cases and generators raise ValueError."""
+        with self.assertRaises(ValueError):
+            search_case(get_case('F2L', 'F2L 01'))
+
+        with self.assertRaises(ValueError):
+            search_case(get_case('OLL', 'OLL 27'), 'RU')
+
+
+class OptimalDataTestCase(unittest.TestCase):
+    """Tests for the optimal values of the cases."""
+
+    def test_auf_cycles(self) -> None:
+        """Test the cycles of algorithms up to an AUF."""
+        for moves, cycles in (
+                ('', 1),
+                ("R U R' U'", 6),
+                ("M2 U M U2 M' U M2", 3),
+                ("R U R' U R U2 R'", 6),
+        ):
+            self.assertEqual(auf_cycles(parse_moves(moves)), cycles, moves)
+
+    def test_optimal_case_data(self) -> None:
+        """Test that the optimal values of the data are found again."""
+        for collection, name in (
+                ('OLL', 'OLL 45'), ('OLL', 'OLL Skipped'),
+                ('PLL', 'PLL Ua'), ('PLL', 'PLL T'),
+        ):
+            case = get_case(collection, name)
+
+            self.assertEqual(
+                optimal_case_data(case),
+                {
+                    'optimal_cycles': case.optimal_cycles,
+                    'optimal_htm': case.optimal_htm,
+                    'optimal_stm': case.optimal_stm,
+                },
+                name,
+            )
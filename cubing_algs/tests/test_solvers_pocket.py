@@ -0,0 +1,119 @@
+"""Tests for the optimal solver of the 2x2x2 cube."""
+
+import unittest
+from collections import Counter
+from random import Random
+
+from cubing_algs.solvers.pocket import STATE_COUNT
+from cubing_algs.solvers.pocket import cube_coordinates
+from cubing_algs.solvers.pocket import get_distance_table
+from cubing_algs.solvers.pocket import solve
+from cubing_algs.solvers.pocket import solve_coordinates
+from cubing_algs.vcube import VCube
+
+# Number of states at each distance of the solved state
+HTM_DISTANCES = [
+    1, 9, 54, 321, 1847, 9992, 50136, 227536,
+    870072, 1887748, 623800, 2644,
+]
+
+QTM_DISTANCES = [
+    1, 6, 27, 120, 534, 2256, 8969, 33058, 114149,
+    360508, 930588, 1350852, 782536, 90280, 276,
+]
+
+MOVES_POOL = [
+    'U', "U'", 'U2', 'R', "R'", 'R2', 'F', "F'", 'F2',
+    'D', "L'", 'B2', 'x', "y'", 'z2',
+]
+
+
+class DistanceTableTestCase(unittest.TestCase):
+    """Tests for the distance tables."""
+
+    def test_htm(self) -> None:
+        """Test the number of states at each HTM distance."""
+        counts = Counter(get_distance_table('htm').tobytes())
+
+        self.assertEqual(
+            [counts[distance] for distance in range(len(counts))],
+            HTM_DISTANCES,
+        )
+        self.assertEqual(sum(HTM_DISTANCES), STATE_COUNT)
+
+    def test_qtm(self) -> None:
+        """Test the number of states at each QTM distance."""
+        counts = Counter(get_distance_table('qtm').tobytes())
+
+        self.assertEqual(
+            [counts[distance] for distance in range(len(counts))],
+            QTM_DISTANCES,
+        )
+        self.assertEqual(sum(QTM_DISTANCES), STATE_COUNT)
+
+
+class SolveTestCase(unittest.TestCase):
+    """Tests for the 2x2x2 solver."""
+
+    def test_solved(self) -> None:
+        """Test that solved cubes need no moves."""
+        self.assertEqual(solve(VCube(size=2)), [])
+
+        cube = VCube(size=2)
+        cube.rotate("x y'")
+
+        self.assertEqual(cube_coordinates(cube), (0, 0))
+        self.assertEqual(solve(cube), [])
+
+    def test_optimal(self) -> None:
+        """Test the length of optimal solutions."""
+        for moves, htm, qtm in (
+                ('R2', 1, 2),
+                ("R U R' U'", 4, 4),
+                ("D L'", 2, 2),
+                ("R U2 R' U' R U' R'", 7, 8),
+        ):
+            cube = VCube(size=2)
+            cube.rotate(moves)
+
+            self.assertEqual(len(solve(cube)), htm, moves)
+            self.assertEqual(len(solve(cube, 'qtm')), qtm, moves)
+
+    def test_random(self) -> None:
+        """Test the solutions of random algorithms."""
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(100):
+            moves = ' '.join(rng.choices(MOVES_POOL, k=25))
+
+            for metric in ('htm', 'qtm'):
+                cube = VCube(size=2)
+                cube.rotate(moves)
+                solution = solve(cube, metric)
+
+                cube.rotate(solution)
+                self.assertTrue(cube.is_solved, moves)
+
+    def test_solve_coordinates(self) -> None:
+        """Test the solutions of coordinates."""
+        self.assertEqual(solve_coordinates(0, 0), [])
+        self.assertEqual(len(solve_coordinates(1234, 567, 'htm')), 9)
+
+    def test_size(self) -> None:
+        """Test that only 2x2x2 cubes are solved."""
+        with self.assertRaises(ValueError):
+            solve(VCube())
+
+    def test_metric(self) -> None:
+        """Test that only HTM and QTM are supported."""
+        with self.assertRaises(ValueError):
+            solve(VCube(size=2), 'stm')
+
+    def test_unsolvable(self) -> None:
+        """Test that a twisted corner is not solved."""
+        state = list(VCube(size=2).state)
+        # Twist the URF corner
+        state[3], state[4], state[9] = state[9], state[3], state[4]
+
+        with self.assertRaises(ValueError):
+            solve(VCube(''.join(state), size=2, check=False))
@@ -0,0 +1,155 @@
+"""Tests for the persistent tables of the solvers."""
+
+import mmap
+import os
+import tempfile
+import unittest
+from array import array
+from pathlib import Path
+from unittest.mock import patch
+
+from cubing_algs.solvers.tables import CACHE_ENVIRONMENT
+from cubing_algs.solvers.tables import TABLES_VERSION
+from cubing_algs.solvers.tables import build_distance_table
+from cubing_algs.solvers.tables import get_cache_directory
+from cubing_algs.solvers.tables import load_table
+from cubing_algs.solvers.tables import map_table
+
+TABLE_SIZE = 1000
+
+SQUARES = [(i * i) % 65536 for i in range(TABLE_SIZE)]
+
+# A coordinate of 4 values and one of 3 values, each turned by a move
+MOVES_A = array('H', [value for a in range(4) for value in ((a + 1) % 4, a)])
+MOVES_B = array('H', [value for b in range(3) for value in (b, (b + 1) % 3)])
+
+
+class TablesTestCase(unittest.TestCase):
+    """Tests for the loading of the tables."""
+
+    def setUp(self) -> None:
+        """Use a temporary cache directory."""
+        self.cache = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache.cleanup)
+
+        environment = patch.dict(
+            os.environ, {CACHE_ENVIRONMENT: self.cache.name},
+        )
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        self.builds = 0
+
+    def build(self) -> 'array[int]':
+        """
+        Build a test table.
+
+        Returns:
+            The squares modulo 65536.
+
+        """
+        self.builds += 1
+
+        return array('H', SQUARES)
+
+    def test_cache_directory(self) -> None:
+        """Test that the cache directory is versioned."""
+        directory = get_cache_directory()
+
+        self.assertEqual(directory.parent, Path(self.cache.name))
+        self.assertTrue(
+            directory.name.startswith(f'tables-v{ TABLES_VERSION }-'),
+        )
+
+    def test_default_cache_directory(self) -> None:
+        """Test the cache directory of the user."""
+        xdg_cache = Path(self.cache.name, 'xdg')
+
+        with patch.dict(
+                os.environ,
+                {CACHE_ENVIRONMENT: '', 'XDG_CACHE_HOME': str(xdg_cache)},
+        ):
+            self.assertEqual(
+                get_cache_directory().parent, xdg_cache / 'cubing-algs',
+            )
+
+    def test_load_table(self) -> None:
+        """Test that the table is built once, then mapped."""
+        view = load_table('test', 'H', TABLE_SIZE, self.build)
+
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(view.tolist(), SQUARES)
+        self.assertTrue(view.readonly)
+        self.assertIsInstance(view.obj, mmap.mmap)
+        self.assertTrue((get_cache_directory() / 'test.bin').exists())
+
+        view = load_table('test', 'H', TABLE_SIZE, self.build)
+
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(view.tolist(), SQUARES)
+        self.assertEqual(
+            [path.name for path in get_cache_directory().iterdir()],
+            ['test.bin'],
+        )
+
+    def test_load_truncated_table(self) -> None:
+        """Test that a truncated table is built again."""
+        path = get_cache_directory() / 'test.bin'
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b'\x00' * 10)
+
+        self.assertIsNone(map_table(path, 'H', TABLE_SIZE))
+
+        view = load_table('test', 'H', TABLE_SIZE, self.build)
+
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(len(view), TABLE_SIZE)
+        self.assertEqual(path.stat().st_size, TABLE_SIZE * 2)
+
+    def test_load_table_not_writable(self) -> None:
+        """Test that the table is kept in memory without cache."""
+        # A file where the cache directory should be
+        Path(self.cache.name, 'file').write_bytes(b'')
+
+        with patch.dict(
+                os.environ,
+                {CACHE_ENVIRONMENT: str(Path(self.cache.name, 'file'))},
+        ):
+            view = load_table('test', 'H', TABLE_SIZE, self.build)
+
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(view.tolist(), SQUARES)
+        self.assertTrue(view.readonly)
+        self.assertNotIsInstance(view.obj, mmap.mmap)
+
+
+class DistanceTableTestCase(unittest.TestCase):
+    """Tests for the distance tables of pairs of coordinates."""
+
+    def test_build_distance_table(self) -> None:
+        """Test the distances of the pairs of coordinates."""
+        table = build_distance_table(
+            memoryview(MOVES_A), memoryview(MOVES_B), 3, 2,
+        )
+
+        self.assertEqual(
+            list(table), [a + b for a in range(4) for b in range(3)],
+        )
+
+    def test_build_distance_table_out_of_range(self) -> None:
+        """Test that a move table leading out of the table raises."""
+        moves_b = array('H', MOVES_B)
+        moves_b[1] = 3
+
+        with self.assertRaises(ValueError):
+            build_distance_table(
+                memoryview(MOVES_A), memoryview(moves_b), 3, 2,
+            )
+
+    def test_build_distance_table_typecode(self) -> None:
+        """Test that the move tables must hold unsigned integers."""
+        with self.assertRaises(TypeError):
+            build_distance_table(
+                memoryview(array('d', MOVES_A)),
+                memoryview(MOVES_B), 3, 2,
+            )
@@ -0,0 +1,243 @@
+"""Tests for the two-phase solver of the 3x3x3 cube."""
+
+import signal
+import threading
+import unittest
+from itertools import permutations
+from random import Random
+
+from cubing_algs.cubies import compute_moves_cubies
+from cubing_algs.exceptions import InvalidCubeStateError
+from cubing_algs.facelets import cubies_to_facelets
+from cubing_algs.solvers.tables import EMPTY
+from cubing_algs.solvers.two_phase import MOVES
+from cubing_algs.solvers.two_phase import PHASE2_MOVE_INDEXES
+from cubing_algs.solvers.two_phase import PHASE2_MOVES
+from cubing_algs.solvers.two_phase import SLICE_EDGES
+from cubing_algs.solvers.two_phase import TwoPhaseSearch
+from cubing_algs.solvers.two_phase import apply_moves
+from cubing_algs.solvers.two_phase import flip_coordinate
+from cubing_algs.solvers.two_phase import get_tables
+from cubing_algs.solvers.two_phase import orientations
+from cubing_algs.solvers.two_phase import permutation_coordinate
+from cubing_algs.solvers.two_phase import slice_coordinate
+from cubing_algs.solvers.two_phase import solve
+from cubing_algs.solvers.two_phase import solve_cubies
+from cubing_algs.solvers.two_phase import twist_coordinate
+from cubing_algs.vcube import VCube
+
+SOLVED = compute_moves_cubies('')
+
+MAX_LENGTH = 22
+
+
+class CoordinatesTestCase(unittest.TestCase):
+    """Tests for the coordinates of the cubies."""
+
+    def test_solved(self) -> None:
+        """Test that the solved cube has null coordinates."""
+        cp, co, ep, eo, _so = (list(values) for values in SOLVED)
+
+        self.assertEqual(twist_coordinate(co), 0)
+        self.assertEqual(flip_coordinate(eo), 0)
+        self.assertEqual(slice_coordinate(ep), 0)
+        self.assertEqual(permutation_coordinate(cp), 0)
+        self.assertEqual(permutation_coordinate(ep), 0)
+
+    def test_permutation_coordinate(self) -> None:
+        """Test that permutations are ranked in lexicographic order."""
+        for index, permutation in enumerate(permutations(range(5))):
+            self.assertEqual(permutation_coordinate(list(permutation)), index)
+
+    def test_orientations(self) -> None:
+        """Test the decoding of the orientation coordinates."""
+        for coordinate in range(0, 3 ** 7, 7):
+            values = orientations(coordinate, 3, 8)
+
+            self.assertEqual(twist_coordinate(values), coordinate)
+            self.assertEqual(sum(values) % 3, 0)
+
+        for coordinate in range(0, 2 ** 11, 7):
+            values = orientations(coordinate, 2, 12)
+
+            self.assertEqual(flip_coordinate(values), coordinate)
+            self.assertEqual(sum(values) % 2, 0)
+
+
+class TablesTestCase(unittest.TestCase):
+    """Tests for the move and pruning tables."""
+
+    def test_phase1_moves(self) -> None:
+        """Test the phase 1 move tables against the cubies."""
+        tables = get_tables()
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(50):
+            moves = rng.choices(range(len(MOVES)), k=rng.randint(1, 20))
+
+            twist = flip = slice_ = 0
+            for move in moves:
+                twist = tables.twist_moves[twist * 18 + move]
+                flip = tables.flip_moves[flip * 18 + move]
+                slice_ = tables.slice_moves[slice_ * 18 + move]
+
+            _cp, co, ep, eo = apply_moves(SOLVED, moves)
+
+            self.assertEqual(twist, twist_coordinate(co))
+            self.assertEqual(flip, flip_coordinate(eo))
+            self.assertEqual(slice_, slice_coordinate(ep))
+
+    def test_phase2_moves(self) -> None:
+        """Test the phase 2 move tables against the cubies."""
+        tables = get_tables()
+        rng = Random(42)  # noqa: S311
+        count = len(PHASE2_MOVES)
+
+        for _ in range(50):
+            moves = rng.choices(range(count), k=rng.randint(1, 20))
+
+            corner = edge = slice_permutation = 0
+            for move in moves:
+                corner = tables.corner_moves[corner * count + move]
+                edge = tables.edge_moves[edge * count + move]
+                slice_permutation = tables.slice_permutation_moves[
+                    slice_permutation * count + move
+                ]
+
+            cp, _co, ep, _eo = apply_moves(
+                SOLVED, [PHASE2_MOVE_INDEXES[move] for move in moves],
+            )
+
+            self.assertEqual(corner, permutation_coordinate(cp))
+            self.assertEqual(
+                edge, permutation_coordinate(ep[:SLICE_EDGES]),
+            )
+            self.assertEqual(
+                slice_permutation,
+                permutation_coordinate(
+                    [edge - SLICE_EDGES for edge in ep[SLICE_EDGES:]],
+                ),
+            )
+
+    def test_pruning_tables(self) -> None:
+        """Test that the pruning tables are complete."""
+        tables = get_tables()
+
+        for table in (
+                tables.twist_slice_pruning,
+                tables.flip_slice_pruning,
+                tables.corner_slice_pruning,
+                tables.edge_slice_pruning,
+        ):
+            distances = table.tobytes()
+
+            self.assertEqual(distances[0], 0)
+            self.assertEqual(distances.count(0), 1)
+            self.assertNotIn(EMPTY, distances)
+
+
+class SolveTestCase(unittest.TestCase):
+    """Tests for the two-phase solver."""
+
+    def assert_solves(self, cube: VCube, max_length: int = MAX_LENGTH,
+                      ) -> None:
+        """Assert that the solution found solves the cube."""
+        solution = solve(cube, max_length)
+
+        self.assertLessEqual(len(solution), max_length)
+
+        cube.rotate(solution)
+        self.assertTrue(cube.is_solved, solution)
+
+    def test_solved(self) -> None:
+        """Test that the solved cube needs no moves."""
+        self.assertEqual(solve(VCube()), [])
+
+    def test_short(self) -> None:
+        """Test the solutions of short algorithms."""
+        for moves, solution in (
+                ('R', "R'"),
+                ("U'", 'U'),
+                ('R U', "U' R'"),
+                ('F2 D', "D' F2"),
+        ):
+            cube = VCube()
+            cube.rotate(moves)
+
+            self.assertEqual(str(solve(cube)), solution)
+
+    def test_random(self) -> None:
+        """Test the solutions of random algorithms."""
+        rng = Random(42)  # noqa: S311
+
+        for _ in range(10):
+            cube = VCube()
+            cube.rotate(' '.join(rng.choices(MOVES, k=30)))
+
+            self.assert_solves(cube)
+
+    def test_rotated(self) -> None:
+        """Test that the solution is relative to the centers."""
+        cube = VCube()
+        cube.rotate("x R U y' F")
+
+        self.assert_solves(cube)
+
+    def test_superflip(self) -> None:
+        """Test the solution of the superflip, a 20 moves position."""
+        cube = VCube()
+        cube.rotate(
+            "U R2 F B R B2 R U2 L B2 R U' D' R2 F R' L B2 U2 F2",
+        )
+
+        self.assert_solves(cube, 24)
+
+    def test_no_solution(self) -> None:
+        """Test that a too short maximal length raises a ValueError."""
+        cube = VCube()
+        cube.rotate('R U F')
+
+        self.assertIsNone(
+            solve_cubies(compute_moves_cubies('R U F'), 2),
+        )
+        with self.assertRaises(ValueError):
+            solve(cube, 2)
+
+    def test_unsolvable(self) -> None:
+        """Test that the states which cannot be solved are rejected."""
+        cp, co, ep, eo, so = (list(values) for values in SOLVED)
+
+        for name, cubies in (
+                ('corner swap', ([1, 0, *cp[2:]], co, ep, eo)),
+                ('twisted corner', (cp, [1, *co[1:]], ep, eo)),
+                ('flipped edge', (cp, co, ep, [1, *eo[1:]])),
+        ):
+            with self.subTest(name=name):
+                with self.assertRaises(InvalidCubeStateError):
+                    solve_cubies(
+                        tuple(tuple(values) for values in (*cubies, so)),  # type: ignore[arg-type]
+                    )
+                with self.assertRaises(InvalidCubeStateError):
+                    solve(
+                        VCube(cubies_to_facelets(*cubies, so), check=False),
+                    )
+
+    def test_interrupted(self) -> None:
+        """Test that the signals interrupt a search without end."""
+        cp, co, ep, eo, so = SOLVED
+        search = TwoPhaseSearch(((1, 0, *cp[2:]), co, ep, eo, so), 30)
+
+        timer = threading.Timer(
+            0.2, signal.raise_signal, (signal.SIGINT,),
+        )
+        timer.start()
+        try:
+            with self.assertRaises(KeyboardInterrupt):
+                search.run()
+        finally:
+            timer.cancel()
+
+    def test_size(self) -> None:
+        """Test that only 3x3x3 cubes are solved."""
+        with self.assertRaises(ValueError):
+            solve(VCube(size=2))
@@ -0,0 +1,86 @@
+"""Tests for commuting axis transformation functions."""
+
+import unittest
+from random import Random
+
+from cubing_algs.packed import PackedAlgorithm
+from cubing_algs.parsing import parse_moves
+from cubing_algs.transform.axis import normalize_axis_moves
+from cubing_algs.transform.size import compress_moves
+from cubing_algs.vcube import VCube
+
+
+class TransformAxisTestCase(unittest.TestCase):
+    """Tests for the normalization of moves on the same axis."""
+
+    def test_normalize_axis_moves(self) -> None:
+        """Test normalize axis moves."""
+        for moves, expected in (
+                ("R L R'", 'L'),
+                ("U D U2 D'", "U'"),
+                ("F B' S F' B", 'S'),
+                ('L R', 'R L'),
+                ('D U', 'U D'),
+                ("x R L' x'", "R L'"),
+                ("M' R L'", "R L' M'"),
+                ("R U L R' U'", "R U R' L U'"),
+                ("R U D U' R'", "R D R'"),
+                ("R U D U' D' R'", ''),
+                ("R . L R'", "R . R' L"),
+                ('Rw r R2 2R l', '2R R2 Rw r l'),
+                ("R U R' U'", "R U R' U'"),
+                ('', ''),
+        ):
+            with self.subTest(moves=moves):
+                self.assertEqual(
+                    normalize_axis_moves(parse_moves(moves)),
+                    parse_moves(expected),
+                )
+
+    def test_normalize_axis_moves_timed(self) -> None:
+        """Test that timed moves keep a chronological order."""
+        self.assertEqual(
+            normalize_axis_moves(parse_moves("R@100 L@200 R'@300")),
+            parse_moves('L@200'),
+        )
+        self.assertEqual(
+            normalize_axis_moves(parse_moves('L@100 R@200 L@300')),
+            parse_moves('R@200 L2@300'),
+        )
+
+    def test_normalize_axis_moves_packed(self) -> None:
+        """Test that packed algorithms stay packed."""
+        result = normalize_axis_moves(parse_moves("R L R' U").packed)
+
+        self.assertIsInstance(result, PackedAlgorithm)
+        self.assertEqual(result, parse_moves('L U'))
+
+    def test_normalize_axis_moves_unchanged(self) -> None:
+        """Test that normalized algorithms are returned as is."""
+        for algo in (
+                parse_moves("R L U' D2 F"),
+                parse_moves("R L U' D2 F").packed,
+        ):
+            with self.subTest(algo=type(algo)):
+                self.assertIs(normalize_axis_moves(algo), algo)
+
+    def test_normalize_axis_moves_random(self) -> None:
+        """Test that random algorithms keep their effect."""
+        rng = Random(9)  # noqa: S311
+        pool = [
+            'R', "R'", 'R2', 'L', "L'", 'U', 'U2', "D'", 'M', "M'", 'x',
+            'Rw', "r'", '2R', 'l', 'E', 'y', 'F', "B'", 'S', 'z',
+        ]
+
+        for _ in range(200):
+            moves = parse_moves(' '.join(rng.choices(pool, k=20)))
+            normalized = normalize_axis_moves(moves)
+            cube = VCube(size=5)
+            cube.rotate(moves)
+            expected = VCube(size=5)
+            expected.rotate(normalized)
+
+            self.assertEqual(cube.state, expected.state)
+            self.assertLessEqual(len(normalized), len(compress_moves(moves)))
+            self.assertEqual(normalize_axis_moves(normalized), normalized)
+            self.assertEqual(normalize_axis_moves(moves.packed), normalized)
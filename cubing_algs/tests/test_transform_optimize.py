@@ -1,13 +1,18 @@
 """Tests for move optimization transformation functions."""
 
 import unittest
+from random import Random
 
 from cubing_algs.algorithm import Algorithm
+from cubing_algs.packed import PackedAlgorithm
 from cubing_algs.parsing import parse_moves
 from cubing_algs.transform.optimize import optimize_do_undo_moves
 from cubing_algs.transform.optimize import optimize_double_moves
 from cubing_algs.transform.optimize import optimize_repeat_three_moves
 from cubing_algs.transform.optimize import optimize_triple_moves
+from cubing_algs.transform.optimize import simplify_moves
+from cubing_algs.transform.size import compress_moves
+from cubing_algs.transform.timing import untime_moves
 
 
 class TransformOptimizeTestCase(unittest.TestCase):
@@ -500,3 +505,102 @@ class TransformOptimizeTestCase(unittest.TestCase):
             optimize_triple_moves(provide),
             expect,
         )
+
+    def test_optimize_triple_moves_same_layers(self) -> None:
+        """Test that only turns of the same layers are merged."""
+        for moves, expected in (
+                ('R2 Rw', 'R2 Rw'),
+                ('r R2', 'r R2'),
+                ('2R2 R', '2R2 R'),
+                ("M2 M' E", 'M E'),
+        ):
+            with self.subTest(moves=moves):
+                self.assertEqual(
+                    optimize_triple_moves(parse_moves(moves)),
+                    parse_moves(expected),
+                )
+
+
+class TransformSimplifyTestCase(unittest.TestCase):
+    """Tests for the single pass simplification of moves."""
+
+    def test_simplify_moves(self) -> None:
+        """Test simplify moves."""
+        for moves, expected in (
+                ("R R'", ''),
+                ('R R', 'R2'),
+                ("R' R'", 'R2'),
+                ('R R R', "R'"),
+                ('R R2', "R'"),
+                ("R2 R'", 'R'),
+                ('R2 R2', ''),
+                ("R U U' R", 'R2'),
+                ("R U2 F F' U2 R'", ''),
+                ('R Rw R2 r', 'R Rw R2 r'),
+                ('R . R', 'R . R'),
+                ("x x2 y y'", "x'"),
+                ("2-3Rw 2-3Rw' M2 M2", ''),
+                ('', ''),
+        ):
+            with self.subTest(moves=moves):
+                self.assertEqual(
+                    simplify_moves(parse_moves(moves)),
+                    parse_moves(expected),
+                )
+
+    def test_simplify_moves_timed(self) -> None:
+        """Test that merged timed moves keep the first time."""
+        self.assertEqual(
+            simplify_moves(parse_moves("R@100 R@200 U@300 U'@400 F@500")),
+            parse_moves('R2@100 F@500'),
+        )
+        self.assertEqual(
+            simplify_moves(parse_moves('R@10 R2')),
+            parse_moves("R'@10"),
+        )
+        self.assertEqual(
+            simplify_moves(parse_moves("R@10 U@20 U'@30 R2@40")),
+            parse_moves("R'@10"),
+        )
+        self.assertEqual(
+            simplify_moves(parse_moves('R@100 .@150 R@200')),
+            parse_moves('R@100 .@150 R@200'),
+        )
+
+    def test_simplify_moves_packed(self) -> None:
+        """Test that packed algorithms stay packed."""
+        result = simplify_moves(parse_moves("R U U' R F").packed)
+
+        self.assertIsInstance(result, PackedAlgorithm)
+        self.assertEqual(result, parse_moves('R2 F'))
+
+    def test_simplify_moves_matches_optimizers(self) -> None:
+        """Test simplify moves against the chained optimizers."""
+        rng = Random(1234)  # noqa: S311
+        pool = [
+            'R', "R'", 'R2', 'U', "U'", 'U2', 'F', 'F2', 'M', "M'",
+            'x', 'y2', "x'", '.', 'Rw', "Rw'", '2R', "r'", 'r2', 'E2',
+        ]
+
+        for _ in range(500):
+            moves = parse_moves(
+                ' '.join(
+                    rng.choices(
+                        pool[:rng.randint(2, len(pool))],
+                        k=rng.randint(0, 30),
+                    ),
+                ),
+            )
+            timed = parse_moves(
+                ' '.join(
+                    f'{ move }@{ i * 10 }' for i, move in enumerate(moves)
+                ),
+            )
+            expected = compress_moves(moves)
+
+            self.assertEqual(simplify_moves(moves), expected)
+            self.assertEqual(simplify_moves(moves.packed), expected)
+            self.assertEqual(
+                untime_moves(simplify_moves(timed)),
+                expected,
+            )
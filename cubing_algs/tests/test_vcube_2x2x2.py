@@ -3,6 +3,7 @@ import unittest
 
 from cubing_algs.exceptions import InvalidMoveError
 from cubing_algs.extensions.rotate_2x2x2 import rotate_move
+from cubing_algs.extensions.rotate_2x2x2 import rotate_moves
 from cubing_algs.initial_state import get_initial_state
 from cubing_algs.vcube import VCube
 
@@ -242,6 +243,58 @@ class Test2x2x2Sequences(unittest.TestCase):
         self.assertEqual(state, SOLVED_2X2X2)
 
 
+class Test2x2x2RotateMoves(unittest.TestCase):
+    """Test applying a sequence of moves in one call on 2x2x2."""
+
+    def test_string_sequence(self) -> None:
+        """Test that a string sequence equals successive moves."""
+        state = SOLVED_2X2X2
+        for move in ('R', 'U', "R'", "U'", 'F2', 'x'):
+            state = rotate_move(state, move)
+
+        self.assertEqual(
+            rotate_moves(SOLVED_2X2X2, "R U R' U' F2 x"),
+            state,
+        )
+
+    def test_list_sequence(self) -> None:
+        """Test that a list sequence equals a string sequence."""
+        self.assertEqual(
+            rotate_moves(SOLVED_2X2X2, ['R', 'U', "R'", "U'"]),
+            rotate_moves(SOLVED_2X2X2, "R U R' U'"),
+        )
+
+    def test_empty_sequence(self) -> None:
+        """Test that an empty sequence leaves the state untouched."""
+        self.assertEqual(rotate_moves(SOLVED_2X2X2, ''), SOLVED_2X2X2)
+        self.assertEqual(rotate_moves(SOLVED_2X2X2, []), SOLVED_2X2X2)
+
+    def test_slice_move_error(self) -> None:
+        """Test that slice moves are rejected in a sequence."""
+        with self.assertRaisesRegex(ValueError, 'M moves are only allowed'):
+            rotate_moves(SOLVED_2X2X2, "R U M'")
+
+    def test_invalid_state_length(self) -> None:
+        """Test that a state of the wrong length is rejected."""
+        with self.assertRaises(ValueError):
+            rotate_moves(SOLVED_2X2X2[:-1], 'R')
+
+    def test_double_and_prime_turns(self) -> None:
+        """Test that double and prime turns repeat the quarter turn."""
+        scrambled = rotate_moves(SOLVED_2X2X2, "R U' F2 R2 U F' R'")
+
+        for face in 'RLUDFB':
+            with self.subTest(face=face):
+                self.assertEqual(
+                    rotate_moves(scrambled, f'{ face }2'),
+                    rotate_moves(scrambled, f'{ face } { face }'),
+                )
+                self.assertEqual(
+                    rotate_moves(scrambled, f"{ face }'"),
+                    rotate_moves(scrambled, f'{ face } { face } { face }'),
+                )
+
+
 class Test2x2x2SliceMoveErrors(unittest.TestCase):
     """Test that slice moves properly fail on even cubes like 2x2x2."""
 
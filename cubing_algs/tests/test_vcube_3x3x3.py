@@ -5,6 +5,8 @@ from io import StringIO
 from unittest.mock import Mock
 from unittest.mock import patch
 
+from cubing_algs.compiled import CompiledAlgorithm
+from cubing_algs.compiled import compute_permutation
 from cubing_algs.constants import FACES
 from cubing_algs.exceptions import InvalidCubeStateError
 from cubing_algs.exceptions import InvalidFaceError
@@ -88,6 +90,18 @@ class VCubeTestCase(unittest.TestCase):  # noqa: PLR0904
 
         self.assertEqual(cube.history, ['R'])
 
+    def test_rotate_history_whitespace(self) -> None:
+        """Test that repeated whitespace records no empty moves."""
+        cube = VCube()
+        cube.rotate("R  U \tR'")
+
+        self.assertEqual(cube.history, ['R', 'U', "R'"])
+
+        moves = "F   D'"
+        cube.rotate(CompiledAlgorithm(compute_permutation(moves), moves=moves))
+
+        self.assertEqual(cube.history, ['R', 'U', "R'", 'F', "D'"])
+
     def test_rotate_move_history(self) -> None:
         """Test history tracking with rotate_move method."""
         cube = VCube()
@@ -1096,6 +1110,29 @@ class VCubeRotateTestCase(unittest.TestCase):
         )
 
 
+class VCubeRotateSequenceTestCase(unittest.TestCase):
+    """Test applying a sequence of moves in one call."""
+
+    def test_rotate_invalid_move_is_atomic(self) -> None:
+        """Test that an invalid move leaves the cube untouched."""
+        cube = VCube()
+        cube.rotate('F')
+        state = cube.state
+
+        with self.assertRaises(InvalidMoveError):
+            cube.rotate("R U T2 R'")
+
+        self.assertEqual(cube.state, state)
+        self.assertEqual(cube.history, ['F'])
+
+    def test_rotate_sequence_history(self) -> None:
+        """Test history tracking of a sequence of moves."""
+        cube = VCube()
+        cube.rotate("R U R' U'")
+
+        self.assertEqual(cube.history, ['R', 'U', "R'", "U'"])
+
+
 class VCubeRotateWideSiGNTestCase(unittest.TestCase):
     """Tests for wide move rotation using SiGN notation."""
 
@@ -2,6 +2,7 @@
 import unittest
 
 from cubing_algs.extensions.rotate_dynamic import rotate_move
+from cubing_algs.extensions.rotate_dynamic import rotate_moves
 from cubing_algs.initial_state import get_initial_state
 from cubing_algs.vcube import VCube
 
@@ -285,6 +286,41 @@ class Test4x4x4Sequences(unittest.TestCase):
         self.assertEqual(state, SOLVED_4X4X4)
 
 
+class Test4x4x4RotateMoves(unittest.TestCase):
+    """Test applying a sequence of moves in one call on 4x4x4."""
+
+    def test_string_sequence(self) -> None:
+        """Test that a string sequence equals successive moves."""
+        moves = ['R', "U'", '2Rw2', "3F'", 'x', 'Lw']
+        state = SOLVED_4X4X4
+        for move in moves:
+            state = rotate_move(state, move, size=4)
+
+        self.assertEqual(
+            rotate_moves(SOLVED_4X4X4, ' '.join(moves), size=4),
+            state,
+        )
+        self.assertEqual(
+            rotate_moves(SOLVED_4X4X4, moves, size=4),
+            state,
+        )
+
+    def test_invalid_move_in_sequence(self) -> None:
+        """Test that an invalid move in a sequence raises an error."""
+        with self.assertRaisesRegex(ValueError, 'Invalid move: Rq'):
+            rotate_moves(SOLVED_4X4X4, 'R U Rq', size=4)
+
+    def test_slice_move_in_sequence(self) -> None:
+        """Test that slice moves are rejected on even cubes."""
+        with self.assertRaises(ValueError):
+            rotate_moves(SOLVED_4X4X4, 'R M', size=4)
+
+    def test_too_long_move(self) -> None:
+        """Test that overlong tokens are rejected."""
+        with self.assertRaises(ValueError):
+            rotate_moves(SOLVED_4X4X4, 'R' * 100, size=4)
+
+
 class Test4x4x4StateLength(unittest.TestCase):
     """Test state length consistency."""
 
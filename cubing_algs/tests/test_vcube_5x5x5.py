@@ -673,3 +673,71 @@ class Test5x5x5SiGNNotation(unittest.TestCase):
         result_3r = rotate_move(SOLVED_5X5X5, '3r', size=5)
         result_3rw = rotate_move(SOLVED_5X5X5, '3Rw', size=5)
         self.assertEqual(result_3r, result_3rw, '3r should equal 3Rw')
+
+
+class Test5x5x5PermutationCache(unittest.TestCase):
+    """Test the per-size move permutation cache of the dynamic rotation."""
+
+    def test_repeated_move_is_stable(self) -> None:
+        """Test that a cached move gives the same result on each call."""
+        first = rotate_move(SOLVED_5X5X5, '2Rw', size=5)
+        second = rotate_move(SOLVED_5X5X5, '2Rw', size=5)
+        self.assertEqual(first, second)
+
+    def test_cached_move_on_scrambled_state(self) -> None:
+        """Test that a cached move is applied to the given state."""
+        state = rotate_move(SOLVED_5X5X5, 'F', size=5)
+        state = rotate_move(state, 'R', size=5)
+        expected = rotate_move(
+            rotate_move(SOLVED_5X5X5, 'R', size=5), 'F', size=5,
+        )
+        self.assertNotEqual(state, expected)
+
+        state = rotate_move(state, "R'", size=5)
+        state = rotate_move(state, "F'", size=5)
+        self.assertEqual(state, SOLVED_5X5X5)
+
+    def test_layers_are_not_shared(self) -> None:
+        """Test that moves on different layers use different tables."""
+        results = {
+            rotate_move(SOLVED_5X5X5, move, size=5)
+            for move in ('R', '2R', '3R', 'Rw', '3Rw', '2-3Rw')
+        }
+        self.assertEqual(len(results), 6)
+
+    def test_sizes_are_not_shared(self) -> None:
+        """Test that the same move is cached separately for each size."""
+        for size in range(2, 8):
+            with self.subTest(size=size):
+                cube = VCube(size=size)
+                cube.rotate("R U R' U'")
+                self.assertEqual(len(cube.state), 6 * size * size)
+                cube.rotate("U R U' R'")
+                self.assertTrue(cube.is_solved)
+
+    def test_quarter_turns_compose(self) -> None:
+        """Test that cached quarter, half and inverse turns agree."""
+        for move in ('R', 'Rw', '2R', 'M', 'E', 'S', 'x', 'y', 'z'):
+            with self.subTest(move=move):
+                twice = rotate_move(
+                    rotate_move(SOLVED_5X5X5, move, size=5), move, size=5,
+                )
+                self.assertEqual(
+                    twice, rotate_move(SOLVED_5X5X5, f'{ move }2', size=5),
+                )
+
+                three_times = rotate_move(twice, move, size=5)
+                self.assertEqual(
+                    three_times,
+                    rotate_move(SOLVED_5X5X5, f"{ move }'", size=5),
+                )
+
+    def test_errors_are_not_cached(self) -> None:
+        """Test that invalid moves keep raising after a valid one."""
+        rotate_move(get_initial_state(4), 'R', size=4)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                rotate_move(get_initial_state(4), 'M', size=4)
+            with self.assertRaises(ValueError):
+                rotate_move(get_initial_state(4), '5R', size=4)
@@ -0,0 +1,262 @@
+"""Tests for the vectorized batch of virtual cubes."""
+
+import unittest
+from importlib.util import find_spec
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.exceptions import InvalidCubeStateError
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.facelets import facelets_to_cubies
+from cubing_algs.facelets import python_facelets_to_cubies
+from cubing_algs.initial_state import get_initial_state
+from cubing_algs.vcube import VCube
+
+HAS_NUMPY = find_spec('numpy') is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+    from cubing_algs.vcube_batch import VCubeBatch
+    from cubing_algs.vcube_batch import move_permutation
+
+SCRAMBLES = [
+    "R U R' U'",
+    "F2 D' L B2 U R' F",
+    "x R2 D2 L' U2 B y'",
+    "M' U2 M E S'",
+    "z D L2 F' R U",
+]
+
+
+@unittest.skipUnless(HAS_NUMPY, 'NumPy is not installed')
+class VCubeBatchInitTestCase(unittest.TestCase):
+    """Tests for building batches of cubes."""
+
+    def test_solved(self) -> None:
+        """Test creating solved cubes."""
+        batch = VCubeBatch.solved(4)
+
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.states.shape, (4, 54))
+        self.assertEqual(batch.states.dtype, np.uint8)
+        self.assertEqual(batch.to_states(), [VCube().state] * 4)
+
+    def test_solved_sizes(self) -> None:
+        """Test creating solved cubes of other sizes."""
+        for size in (2, 4, 5):
+            with self.subTest(size=size):
+                batch = VCubeBatch.solved(2, size=size)
+
+                self.assertEqual(batch.states.shape, (2, 6 * size * size))
+                self.assertEqual(batch.state(1), VCube(size=size).state)
+
+    def test_from_states(self) -> None:
+        """Test creating a batch from facelet strings."""
+        cube = VCube()
+        cube.rotate(SCRAMBLES[1])
+        batch = VCubeBatch([VCube().state, cube.state])
+
+        self.assertEqual(batch.state(0), VCube().state)
+        self.assertEqual(batch.state(1), cube.state)
+
+    def test_from_matrix(self) -> None:
+        """Test creating a batch from an encoded matrix."""
+        batch = VCubeBatch(VCubeBatch.solved(3).states)
+
+        self.assertEqual(len(batch), 3)
+
+    def test_from_cubes(self) -> None:
+        """Test creating a batch from virtual cubes."""
+        cubes = []
+        for scramble in SCRAMBLES:
+            cube = VCube()
+            cube.rotate(scramble)
+            cubes.append(cube)
+
+        batch = VCubeBatch.from_cubes(cubes)
+
+        self.assertEqual(batch.to_states(), [cube.state for cube in cubes])
+        self.assertEqual(
+            [cube.state for cube in batch.to_cubes()],
+            [cube.state for cube in cubes],
+        )
+
+    def test_from_cubes_mixed_sizes(self) -> None:
+        """Test that cubes of different sizes are rejected."""
+        with self.assertRaises(InvalidCubeStateError):
+            VCubeBatch.from_cubes([VCube(), VCube(size=2)])
+
+    def test_invalid_length(self) -> None:
+        """Test that states of the wrong length are rejected."""
+        with self.assertRaises(InvalidCubeStateError):
+            VCubeBatch([VCube().state[:-1]])
+        with self.assertRaises(InvalidCubeStateError):
+            VCubeBatch(np.zeros((2, 24), dtype=np.uint8))
+
+    def test_invalid_facelets(self) -> None:
+        """Test that unknown facelets are rejected."""
+        with self.assertRaises(InvalidCubeStateError):
+            VCubeBatch(['X' * 54])
+        with self.assertRaises(InvalidCubeStateError):
+            VCubeBatch(['é' * 54])
+
+    def test_repr(self) -> None:
+        """Test the string representation."""
+        self.assertEqual(
+            repr(VCubeBatch.solved(3, size=4)),
+            'VCubeBatch(<3 cubes>, size=4)',
+        )
+
+
+@unittest.skipUnless(HAS_NUMPY, 'NumPy is not installed')
+class VCubeBatchRotateTestCase(unittest.TestCase):
+    """Tests for applying moves to batches of cubes."""
+
+    def test_rotate_matches_vcube(self) -> None:
+        """Test that every row matches a virtual cube."""
+        for size in (2, 3, 4, 5):
+            with self.subTest(size=size):
+                cubes = []
+                for scramble in ("R U' F2", 'x F R2 U', "B' L D2 y"):
+                    cube = VCube(size=size)
+                    cube.rotate(scramble)
+                    cubes.append(cube)
+
+                batch = VCubeBatch.from_cubes(cubes)
+                batch.rotate("R U R' U' F2")
+                for cube in cubes:
+                    cube.rotate("R U R' U' F2")
+
+                self.assertEqual(
+                    batch.to_states(),
+                    [cube.state for cube in cubes],
+                )
+
+    def test_rotate_algorithm_and_compiled(self) -> None:
+        """Test rotating with algorithms and compiled algorithms."""
+        algorithm = Algorithm.parse_moves("R U R' U'")
+        batch = VCubeBatch.solved(2)
+        compiled_batch = VCubeBatch.solved(2)
+
+        batch.rotate(algorithm)
+        compiled_batch.rotate(algorithm.compile())
+
+        self.assertTrue(np.array_equal(batch.states, compiled_batch.states))
+
+    def test_rotate_empty(self) -> None:
+        """Test that no moves leave the batch untouched."""
+        batch = VCubeBatch.solved(2)
+        batch.rotate('')
+
+        self.assertTrue(batch.is_solved.all())
+
+    def test_rotate_invalid_move(self) -> None:
+        """Test that invalid moves raise an error."""
+        batch = VCubeBatch.solved(2, size=2)
+
+        with self.assertRaises(InvalidMoveError):
+            batch.rotate('R M')
+        with self.assertRaises(InvalidMoveError):
+            batch.rotate(Algorithm.parse_moves('R').compile())
+
+        self.assertTrue(batch.is_solved.all())
+
+    def test_move_permutation_cached(self) -> None:
+        """Test that permutations are computed once and read-only."""
+        permutation = move_permutation("R U'", 3)
+
+        self.assertIs(move_permutation("R U'", 3), permutation)
+        self.assertFalse(permutation.flags.writeable)
+
+
+@unittest.skipUnless(HAS_NUMPY, 'NumPy is not installed')
+class VCubeBatchAnalysisTestCase(unittest.TestCase):
+    """Tests for the vectorized analysis of batches of cubes."""
+
+    def setUp(self) -> None:
+        """Build scrambled cubes and their batch."""
+        self.cubes = []
+        for scramble in SCRAMBLES:
+            cube = VCube()
+            cube.rotate(scramble)
+            self.cubes.append(cube)
+        self.cubes.append(VCube())
+        self.batch = VCubeBatch.from_cubes(self.cubes)
+
+    def test_is_solved(self) -> None:
+        """Test solved detection for every row."""
+        self.assertEqual(
+            self.batch.is_solved.tolist(),
+            [cube.is_solved for cube in self.cubes],
+        )
+
+    def test_is_solved_rotated(self) -> None:
+        """Test that a rotated solved cube is solved."""
+        batch = VCubeBatch.solved(1)
+        batch.rotate('x y')
+
+        self.assertTrue(batch.is_solved[0])
+
+    def test_orientation(self) -> None:
+        """Test the orientation of every row."""
+        self.assertEqual(
+            self.batch.orientation,
+            [cube.orientation for cube in self.cubes],
+        )
+
+    def test_orientation_even_sizes(self) -> None:
+        """Test the orientation on cubes without fixed centers."""
+        for size in (2, 4):
+            with self.subTest(size=size):
+                batch = VCubeBatch.solved(1, size=size)
+                batch.rotate("x y'")
+                cube = VCube(size=size)
+                cube.rotate("x y'")
+
+                self.assertEqual(batch.orientation, [cube.orientation])
+
+    def test_to_cubies(self) -> None:
+        """Test the cubie representation of every row."""
+        cp, co, ep, eo, so = self.batch.to_cubies
+
+        for index, cube in enumerate(self.cubes):
+            with self.subTest(index=index):
+                self.assertEqual(
+                    (
+                        cp[index].tolist(), co[index].tolist(),
+                        ep[index].tolist(), eo[index].tolist(),
+                        so[index].tolist(),
+                    ),
+                    cube.to_cubies,
+                )
+
+    def test_to_cubies_duplicated_centers(self) -> None:
+        """Test states with duplicated centers match facelets_to_cubies."""
+        states = [
+            state[:4] + center + state[5:22] + center + state[23:]
+            for state in (
+                    get_initial_state(3), self.cubes[1].state,
+            )
+            for center in ('U', 'R', 'B')
+        ]
+        cp, co, ep, eo, so = VCubeBatch(states).to_cubies
+
+        for index, state in enumerate(states):
+            with self.subTest(index=index):
+                self.assertEqual(
+                    (
+                        cp[index].tolist(), co[index].tolist(),
+                        ep[index].tolist(), eo[index].tolist(),
+                        so[index].tolist(),
+                    ),
+                    python_facelets_to_cubies(state),
+                )
+                self.assertEqual(
+                    python_facelets_to_cubies(state),
+                    facelets_to_cubies(state),
+                )
+
+    def test_to_cubies_other_sizes(self) -> None:
+        """Test that cubies are only available for 3x3x3."""
+        with self.assertRaises(InvalidCubeStateError):
+            _ = VCubeBatch.solved(1, size=4).to_cubies
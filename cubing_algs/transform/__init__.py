@@ -10,4 +10,8 @@ All transform functions follow the pattern:
 
 Transform functions can be chained using the Algorithm.transform() method:
     algorithm.transform(mirror_moves, compress_moves, optimize_moves)
+
+Transform functions never modify the algorithm they receive, and return it
+as is when they have nothing to change, letting Algorithm.transform() detect
+unchanged rounds without comparing the moves.
 """
@@ -0,0 +1,147 @@
+"""Commuting axis transformations for cancelling moves on the same axis."""
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.constants import AXIS_MOVES
+from cubing_algs.move import MOVE_TABLE
+from cubing_algs.move import Move
+from cubing_algs.packed import PackedAlgorithm
+
+MOVE_AXES = {
+    move: (axis, rank)
+    for axis, moves in AXIS_MOVES.items()
+    for rank, move in enumerate(moves)
+}
+
+
+@lru_cache(maxsize=1024)
+def move_axis(clockwise: int) -> tuple[str, int, str] | None:
+    """
+    Get the axis of a clockwise quarter turn and its canonical sort key.
+
+    Args:
+        clockwise: The id of the clockwise quarter turn.
+
+    Returns:
+        The axis, the rank of the move on its axis and the move string,
+        or None for moves without axis, like pauses.
+
+    """
+    if not MOVE_TABLE.quarter_turns(clockwise)[1]:
+        return None
+
+    axis = MOVE_AXES.get(MOVE_TABLE.base_move(clockwise))
+    if axis is None:
+        return None
+
+    return axis[0], axis[1], MOVE_TABLE.moves[clockwise].data
+
+
+def group_axis_moves(
+        moves: Iterable[tuple[int, str]],
+) -> list[tuple[int, str]]:
+    """
+    Merge and sort consecutive moves turning around the same axis.
+
+    Moves around the same axis commute, so each run of them is
+    reduced to one move per set of layers, summing their quarter
+    turns modulo four, and sorted in canonical order, or in
+    chronological order for timed moves.
+    A run cancelling out lets the runs around it merge.
+
+    Args:
+        moves: Move ids paired with their time information.
+
+    Returns:
+        The normalized move ids paired with their time information,
+        a merged move keeping the time of the last move merged into it.
+
+    """
+    stack: list[tuple[str | None, dict[int, tuple[int, str]]]] = []
+
+    for identifier, time in moves:
+        clockwise, turns = MOVE_TABLE.quarter_turns(identifier)
+        axis = move_axis(clockwise)
+        axis_name = axis[0] if axis else None
+
+        if axis_name is None:
+            stack.append((None, {identifier: (turns, time)}))
+            continue
+
+        if not stack or stack[-1][0] != axis_name:
+            stack.append((axis_name, {clockwise: (turns, time)}))
+            continue
+
+        group = stack[-1][1]
+        turns = (group.pop(clockwise, (0, ''))[0] + turns) % 4
+        if turns:
+            group[clockwise] = (turns, time)
+        elif not group:
+            stack.pop()
+
+    normalized: list[tuple[int, str]] = []
+    for axis_name, group in stack:
+        if axis_name is None:
+            normalized.extend(
+                (identifier, time)
+                for identifier, (_, time) in group.items()
+            )
+            continue
+
+        for clockwise, (turns, time) in sorted(
+                group.items(),
+                key=lambda item: (
+                    int(item[1][1][1:] or 0),
+                    move_axis(item[0]),
+                ),
+        ):
+            normalized.append(
+                (MOVE_TABLE.from_quarter_turns(clockwise, turns), time),
+            )
+
+    return normalized
+
+
+def normalize_axis_moves(old_moves: Algorithm) -> Algorithm:
+    """
+    R L R' --> L
+    U D U2 D' --> U'
+    L R --> R L.
+
+    Moves around the same axis, including wide, layered
+    and slice moves and rotations, commute with each other.
+    Each run of such moves is merged per set of layers and sorted
+    in a canonical order, outer faces then slices then rotations,
+    cancelling moves the adjacent optimizers cannot reach.
+
+    Args:
+        old_moves: Algorithm to normalize.
+
+    Returns:
+        Normalized algorithm.
+
+    """
+    if isinstance(old_moves, PackedAlgorithm):
+        ids = [
+            identifier
+            for identifier, _ in group_axis_moves(
+                (identifier, '') for identifier in old_moves.ids
+            )
+        ]
+        if ids == old_moves.ids.tolist():
+            return old_moves
+        return PackedAlgorithm.from_ids(ids)
+
+    pairs = [(move.id, move.time) for move in old_moves]
+    normalized = group_axis_moves(pairs)
+    if normalized == pairs:
+        return old_moves
+
+    moves: list[Move] = []
+    for identifier, time in normalized:
+        move = Move.from_id(identifier)
+        moves.append(Move(f'{ move }{ time }') if time else move)
+
+    return Algorithm(moves)
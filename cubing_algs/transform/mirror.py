@@ -3,6 +3,8 @@
 from typing import TYPE_CHECKING
 
 from cubing_algs.algorithm import Algorithm
+from cubing_algs.move import MOVE_TABLE
+from cubing_algs.packed import PackedAlgorithm
 
 if TYPE_CHECKING:
     from cubing_algs.move import Move  # pragma: no cover
@@ -22,6 +24,12 @@ def mirror_moves(old_moves: Algorithm) -> Algorithm:
         A new Algorithm that is the inverse of the input.
 
     """
+    if isinstance(old_moves, PackedAlgorithm):
+        return PackedAlgorithm.from_ids(
+            [MOVE_TABLE.inverted(identifier)
+             for identifier in reversed(old_moves.ids)],
+        )
+
     moves: list[Move] = [move.inverted for move in reversed(old_moves)]
 
     return Algorithm(moves)
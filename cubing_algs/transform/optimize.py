@@ -1,7 +1,159 @@
 """Move optimization functions for reducing algorithm length and complexity."""
 
+from array import array
+from itertools import starmap
+
 from cubing_algs.algorithm import Algorithm
 from cubing_algs.constants import MAX_ITERATIONS
+from cubing_algs.move import MOVE_TABLE
+from cubing_algs.move import Move
+from cubing_algs.packed import PAUSE_ID
+from cubing_algs.packed import PackedAlgorithm
+
+
+def optimize_repeat_three_ids(ids: 'array[int]', max_depth: int) -> bool:
+    """
+    R, R, R --> R' on an array of move ids, in place.
+
+    Args:
+        ids: Move ids to optimize.
+        max_depth: Maximum number of optimization passes.
+
+    Returns:
+        True if the ids were optimized.
+
+    """
+    optimized = False
+
+    for _ in range(max_depth):
+        i = 0
+        changed = False
+
+        while i < len(ids) - 2:
+            if ids[i] != PAUSE_ID and ids[i] == ids[i + 1] == ids[i + 2]:
+                ids[i:i + 3] = array(ids.typecode,
+                                     [MOVE_TABLE.inverted(ids[i])])
+                changed = True
+            else:
+                i += 1
+
+        if not changed:
+            break
+        optimized = True
+
+    return optimized
+
+
+def optimize_do_undo_ids(ids: 'array[int]', max_depth: int) -> bool:
+    """
+    R R' --> <nothing> on an array of move ids, in place.
+
+    Args:
+        ids: Move ids to optimize.
+        max_depth: Maximum number of optimization passes.
+
+    Returns:
+        True if the ids were optimized.
+
+    """
+    optimized = False
+
+    for _ in range(max_depth):
+        i = 0
+        changed = False
+
+        while i < len(ids) - 1:
+            if ids[i] != PAUSE_ID and (
+                    MOVE_TABLE.inverted(ids[i]) == ids[i + 1]
+                    or (ids[i] == ids[i + 1] and MOVE_TABLE.is_double(ids[i]))
+            ):
+                del ids[i:i + 2]
+                changed = True
+            else:
+                i += 1
+
+        if not changed:
+            break
+        optimized = True
+
+    return optimized
+
+
+def optimize_double_ids(ids: 'array[int]', max_depth: int) -> bool:
+    """
+    R, R --> R2 on an array of move ids, in place.
+
+    Args:
+        ids: Move ids to optimize.
+        max_depth: Maximum number of optimization passes.
+
+    Returns:
+        True if the ids were optimized.
+
+    """
+    optimized = False
+
+    for _ in range(max_depth):
+        i = 0
+        changed = False
+
+        while i < len(ids) - 1:
+            if (
+                ids[i] != PAUSE_ID
+                and ids[i] == ids[i + 1]
+                and not MOVE_TABLE.is_double(ids[i])
+            ):
+                ids[i:i + 2] = array(ids.typecode,
+                                     [MOVE_TABLE.doubled(ids[i])])
+                changed = True
+            else:
+                i += 1
+
+        if not changed:
+            break
+        optimized = True
+
+    return optimized
+
+
+def optimize_triple_ids(ids: 'array[int]', max_depth: int) -> bool:
+    """
+    R, R2 --> R' on an array of move ids, in place.
+
+    Args:
+        ids: Move ids to optimize.
+        max_depth: Maximum number of optimization passes.
+
+    Returns:
+        True if the ids were optimized.
+
+    """
+    optimized = False
+
+    for _ in range(max_depth):
+        i = 0
+        changed = False
+
+        while i < len(ids) - 1:
+            first, second = ids[i], ids[i + 1]
+            if (
+                MOVE_TABLE.quarter_turns(first)[0]
+                == MOVE_TABLE.quarter_turns(second)[0]
+                and MOVE_TABLE.is_double(first)
+                != MOVE_TABLE.is_double(second)
+            ):
+                single = second if MOVE_TABLE.is_double(first) else first
+                ids[i:i + 2] = array(ids.typecode,
+                                     [MOVE_TABLE.inverted(single)])
+                changed = True
+            else:
+                i += 1
+
+        if not changed:
+            break
+        optimized = True
+
+    return optimized
 
 
 def optimize_repeat_three_moves(
@@ -22,6 +174,12 @@ def optimize_repeat_three_moves(
     if max_depth <= 0:
         return old_moves
 
+    if isinstance(old_moves, PackedAlgorithm):
+        packed = old_moves.copy()
+        if optimize_repeat_three_ids(packed.ids, max_depth):
+            return packed
+        return old_moves
+
     i = 0
     changed = False
     moves = old_moves.copy()
@@ -39,7 +197,7 @@ def optimize_repeat_three_moves(
     if changed:
         return optimize_repeat_three_moves(moves, max_depth - 1)
 
-    return moves
+    return old_moves
 
 
 def optimize_do_undo_moves(
@@ -62,6 +220,12 @@ def optimize_do_undo_moves(
     if max_depth <= 0:
         return old_moves
 
+    if isinstance(old_moves, PackedAlgorithm):
+        packed = old_moves.copy()
+        if optimize_do_undo_ids(packed.ids, max_depth):
+            return packed
+        return old_moves
+
     i = 0
     changed = False
     moves = old_moves.copy()
@@ -83,7 +247,7 @@ def optimize_do_undo_moves(
     if changed:
         return optimize_do_undo_moves(moves, max_depth - 1)
 
-    return moves
+    return old_moves
 
 
 def optimize_double_moves(
@@ -104,6 +268,12 @@ def optimize_double_moves(
     if max_depth <= 0:
         return old_moves
 
+    if isinstance(old_moves, PackedAlgorithm):
+        packed = old_moves.copy()
+        if optimize_double_ids(packed.ids, max_depth):
+            return packed
+        return old_moves
+
     i = 0
     changed = False
     moves = old_moves.copy()
@@ -122,7 +292,7 @@ def optimize_double_moves(
     if changed:
         return optimize_double_moves(moves, max_depth - 1)
 
-    return moves
+    return old_moves
 
 
 def optimize_triple_moves(
@@ -145,12 +315,21 @@ def optimize_triple_moves(
     if max_depth <= 0:
         return old_moves
 
+    if isinstance(old_moves, PackedAlgorithm):
+        packed = old_moves.copy()
+        if optimize_triple_ids(packed.ids, max_depth):
+            return packed
+        return old_moves
+
     i = 0
     changed = False
     moves = old_moves.copy()
 
     while i < len(moves) - 1:
-        if moves[i].base_move == moves[i + 1].base_move:
+        if (
+            moves[i].layer == moves[i + 1].layer
+            and moves[i].raw_base_move == moves[i + 1].raw_base_move
+        ):
             if moves[i].is_double and not moves[i + 1].is_double:
                 moves[i:i + 2] = [moves[i + 1].inverted]
                 changed = True
@@ -165,4 +344,93 @@ def optimize_triple_moves(
     if changed:
         return optimize_triple_moves(moves, max_depth - 1)
 
-    return moves
+    return old_moves
+
+
+def simplify_ids(ids: 'array[int]') -> 'array[int]':
+    """
+    Merge consecutive turns of the same layers in an array of move ids.
+
+    Args:
+        ids: Move ids to simplify.
+
+    Returns:
+        The simplified move ids.
+
+    """
+    stack: list[tuple[int, int]] = []
+
+    for identifier in ids:
+        clockwise, turns = MOVE_TABLE.quarter_turns(identifier)
+
+        if turns and stack and stack[-1][0] == clockwise:
+            turns = (stack[-1][1] + turns) % 4
+            if turns:
+                stack[-1] = (clockwise, turns)
+            else:
+                stack.pop()
+        else:
+            stack.append((clockwise, turns))
+
+    return array(
+        ids.typecode,
+        starmap(MOVE_TABLE.from_quarter_turns, stack),
+    )
+
+
+def simplify_moves(old_moves: Algorithm) -> Algorithm:
+    """
+    R R' --> <nothing>
+    R R --> R2
+    R R2 --> R'
+    R U U' R --> R2.
+
+    Merges consecutive turns of the same layers modulo four turns
+    in a single pass, using a stack of the merged moves,
+    with the same results as chaining optimize_do_undo_moves,
+    optimize_repeat_three_moves, optimize_double_moves
+    and optimize_triple_moves until nothing changes.
+
+    Pauses are never merged. A merged timed move keeps
+    the time of the first move of the merge, when it started.
+    The chained optimizers are not consistent on times,
+    R@10 R2@20 gives R'@10 but R@10 R@20 gives R2@20,
+    so timed results can differ from them on their times only.
+
+    Args:
+        old_moves: Algorithm to simplify.
+
+    Returns:
+        Simplified algorithm.
+
+    """
+    if isinstance(old_moves, PackedAlgorithm):
+        ids = simplify_ids(old_moves.ids)
+        if len(ids) == len(old_moves):
+            return old_moves
+        return PackedAlgorithm.from_ids(ids)
+
+    stack: list[tuple[int, int, str]] = []
+
+    for move in old_moves:
+        clockwise, turns = MOVE_TABLE.quarter_turns(move.id)
+
+        if turns and stack and stack[-1][0] == clockwise:
+            turns = (stack[-1][1] + turns) % 4
+            if turns:
+                stack[-1] = (clockwise, turns, stack[-1][2])
+            else:
+                stack.pop()
+        else:
+            stack.append((clockwise, turns, move.time))
+
+    # Every merge removes moves
+    if len(stack) == len(old_moves):
+        return old_moves
+
+    moves: list[Move] = []
+    for clockwise, turns, time in stack:
+        move = Move.from_id(MOVE_TABLE.from_quarter_turns(clockwise, turns))
+        moves.append(Move(f'{ move }{ time }') if time else move)
+
+    return Algorithm(moves)
@@ -5,6 +5,8 @@ from collections.abc import Callable
 from cubing_algs.algorithm import Algorithm
 from cubing_algs.constants import PAUSE_CHAR
 from cubing_algs.move import Move
+from cubing_algs.packed import PAUSE_ID
+from cubing_algs.packed import PackedAlgorithm
 
 
 def unpause_moves(old_moves: Algorithm) -> Algorithm:
@@ -15,10 +17,21 @@ def unpause_moves(old_moves: Algorithm) -> Algorithm:
         old_moves: The algorithm to process.
 
     Returns:
-        A new Algorithm with all pause moves removed.
+        An Algorithm with all pause moves removed,
+        the same one if it had no pauses.
 
     """
+    if isinstance(old_moves, PackedAlgorithm):
+        if PAUSE_ID not in old_moves.ids:
+            return old_moves
+        return PackedAlgorithm.from_ids(
+            [identifier for identifier in old_moves.ids
+             if identifier != PAUSE_ID],
+        )
+
     moves: list[Move] = [move for move in old_moves if not move.is_pause]
+    if len(moves) == len(old_moves):
+        return old_moves
 
     return Algorithm(moves)
 
@@ -30,6 +30,9 @@ def remove_rotations(old_moves: Algorithm) -> Algorithm:
         if not move.is_rotation_move
     ]
 
+    if len(moves) == len(old_moves):
+        return old_moves
+
     return Algorithm(moves)
 
 
@@ -56,6 +59,9 @@ def remove_starting_rotations(old_moves: Algorithm) -> Algorithm:
         rotation = False
         moves.append(move)
 
+    if len(moves) == len(old_moves):
+        return old_moves
+
     return Algorithm(moves)
 
 
@@ -82,6 +88,9 @@ def remove_ending_rotations(old_moves: Algorithm) -> Algorithm:
         rotation = False
         moves.append(move)
 
+    if len(moves) == len(old_moves):
+        return old_moves
+
     return Algorithm(reversed(moves))
 
 
@@ -120,7 +129,7 @@ def optimize_triple_rotations(
     if changed:
         return optimize_triple_rotations(moves, max_depth - 1)
 
-    return moves
+    return old_moves
 
 
 def optimize_double_rotations(
@@ -164,7 +173,7 @@ def optimize_double_rotations(
     if changed:
         return optimize_double_moves(moves, max_depth - 1)
 
-    return moves
+    return old_moves
 
 
 def optimize_conjugate_rotations(
@@ -212,7 +221,7 @@ def optimize_conjugate_rotations(
     if changed:
         return optimize_double_moves(moves, max_depth - 1)
 
-    return moves
+    return old_moves
 
 
 def split_moves_ending_rotations(
@@ -269,7 +278,7 @@ def compress_rotations(
         Compressed algorithm with optimized rotations.
 
     """
-    moves = old_moves.copy()
+    moves = old_moves
 
     for _ in range(max_iterations):
         start_length = len(moves)
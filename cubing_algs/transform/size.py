@@ -26,7 +26,7 @@ def compress_moves(
         A compressed Algorithm with redundancies removed.
 
     """
-    moves = old_moves.copy()
+    moves = old_moves
 
     for _ in range(max_iterations):
         start_length = len(moves)
@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 from cubing_algs.algorithm import Algorithm
+from cubing_algs.packed import PackedAlgorithm
 
 if TYPE_CHECKING:
     from cubing_algs.move import Move  # pragma: no cover
@@ -16,9 +17,16 @@ def untime_moves(old_moves: Algorithm) -> Algorithm:
         old_moves: The algorithm to process.
 
     Returns:
-        A new Algorithm with timing information removed from all moves.
+        An Algorithm with timing information removed from all moves,
+        the same one if it had no timed moves.
 
     """
+    # Packed moves never hold time information
+    if isinstance(old_moves, PackedAlgorithm) or not any(
+            move.is_timed for move in old_moves
+    ):
+        return old_moves
+
     moves: list[Move] = [move.untimed for move in old_moves]
 
     return Algorithm(moves)
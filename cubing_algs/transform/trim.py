@@ -1,7 +1,6 @@
 """Move trimming transformations for removing moves from algorithm ends."""
 
 from collections.abc import Callable
-from itertools import dropwhile
 
 from cubing_algs.algorithm import Algorithm
 from cubing_algs.move import Move
@@ -38,8 +37,6 @@ def trim_moves(
         if not old_moves:
             return old_moves
 
-        moves = list(old_moves.copy())
-
         def should_trim(m: Move) -> bool:
             """
             Check if a move should be trimmed based on criteria.
@@ -53,20 +50,20 @@ def trim_moves(
             """
             return m.base_move == trim_move or m.is_pause
 
+        first = 0
+        last = len(old_moves)
+
         if start:
-            moves = list(
-                dropwhile(should_trim, moves),
-            )
+            while first < last and should_trim(old_moves[first]):
+                first += 1
 
         if end:
-            moves = list(
-                reversed(
-                    list(
-                        dropwhile(should_trim, reversed(moves)),
-                    ),
-                ),
-            )
-
-        return Algorithm(moves)
+            while last > first and should_trim(old_moves[last - 1]):
+                last -= 1
+
+        if first == 0 and last == len(old_moves):
+            return old_moves
+
+        return old_moves[first:last]
 
     return trimmer
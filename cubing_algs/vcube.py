@@ -1,5 +1,8 @@
 """Virtual cube implementation for simulating moves and tracking state."""
+from functools import partial
+
 from cubing_algs.algorithm import Algorithm
+from cubing_algs.compiled import CompiledAlgorithm
 from cubing_algs.constants import FACE_INDEXES
 from cubing_algs.constants import FACE_ORDER
 from cubing_algs.constants import OFFSET_ORIENTATION_MAP
@@ -181,11 +184,18 @@ class VCube(VCubeIntegrityChecker):  # noqa: PLR0904
 
         return self._state[top_center_index] + self._state[front_center_index]
 
-    def rotate(self, moves: Algorithm | Move | str, *,
+    def rotate(self, moves: Algorithm | CompiledAlgorithm | Move | str, *,
                history: bool = True) -> str:
         """
         Apply a sequence of moves to the cube.
 
+        The whole sequence is applied in a single call to the
+        rotation extension, so the cube is left untouched if
+        any of the moves is invalid.
+
+        A compiled algorithm is applied with a single permutation
+        of the facelets.
+
         Args:
             moves: The moves to apply to the cube.
             history: If True, record moves in the cube's history.
@@ -193,14 +203,62 @@ class VCube(VCubeIntegrityChecker):  # noqa: PLR0904
         Returns:
             The new state of the cube after applying the moves.
 
+        Raises:
+            InvalidMoveError: If a move is invalid.
+
         """
+        if isinstance(moves, CompiledAlgorithm):
+            return self.rotate_compiled(moves, history=history)
+
         moves_str = str(moves)
 
         if not moves_str:
             return self._state
 
-        for move in moves_str.split(' '):
-            self.rotate_move(move, history=history)
+        if self.size == 2:
+            rotate_moves = rotate_2x2x2.rotate_moves
+        elif self.size == 3:
+            rotate_moves = rotate_3x3x3.rotate_moves
+        else:
+            rotate_moves = partial(rotate_dynamic.rotate_moves, size=self.size)
+
+        try:
+            self._state = rotate_moves(self._state, moves_str)
+        except ValueError as e:
+            raise InvalidMoveError(str(e)) from e
+
+        if history:
+            self.history.extend(moves_str.split())
+        return self._state
+
+    def rotate_compiled(self, compiled: CompiledAlgorithm, *,
+                        history: bool = True) -> str:
+        """
+        Apply a compiled algorithm to the cube.
+
+        Args:
+            compiled: The compiled algorithm to apply.
+            history: If True, record its moves in the cube's history.
+
+        Returns:
+            The new state of the cube after applying the algorithm.
+
+        Raises:
+            InvalidMoveError: If the algorithm was compiled
+                for another cube size.
+
+        """
+        if compiled.size != self.size:
+            msg = (
+                f'Compiled algorithm is for size { compiled.size }, '
+                f'cube size is { self.size }'
+            )
+            raise InvalidMoveError(msg)
+
+        self._state = compiled.apply(self._state)
+
+        if history and compiled.moves:
+            self.history.extend(compiled.moves.split())
 
         return self._state
 
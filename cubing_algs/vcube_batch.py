@@ -0,0 +1,413 @@
+"""
+Vectorized batch of virtual cubes backed by NumPy.
+
+Stores many cube states as rows of a single uint8 matrix,
+where each facelet is encoded by its face index in URFDLB order,
+so that a move is applied to every cube with one gather.
+
+NumPy is an optional dependency, available with
+the ``numpy`` extra of the package.
+"""
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from cubing_algs.compiled import CompiledAlgorithm
+from cubing_algs.compiled import compute_permutation
+from cubing_algs.constants import CORNER_FACELET_MAP
+from cubing_algs.constants import EDGE_FACELET_MAP
+from cubing_algs.constants import FACES
+from cubing_algs.exceptions import InvalidCubeStateError
+from cubing_algs.exceptions import InvalidMoveError
+from cubing_algs.initial_state import get_initial_state
+from cubing_algs.vcube import VCube
+
+try:
+    import numpy as np
+    from numpy.typing import NDArray
+except ImportError as e:  # pragma: no cover
+    msg = 'VCubeBatch requires NumPy, install cubing-algs[numpy]'
+    raise ImportError(msg) from e
+
+if TYPE_CHECKING:
+    from cubing_algs.algorithm import Algorithm  # pragma: no cover
+    from cubing_algs.move import Move  # pragma: no cover
+
+INVALID_FACELET = 255
+
+
+def _build_encoding_table() -> NDArray[np.uint8]:
+    """
+    Build the table encoding facelet characters to face indexes.
+
+    Returns:
+        Array mapping each byte to its face index,
+        or INVALID_FACELET for unknown characters.
+
+    """
+    table = np.full(256, INVALID_FACELET, dtype=np.uint8)
+    for index, face in enumerate(FACES):
+        table[ord(face)] = index
+    return table
+
+
+def _build_corner_lookup_table() -> NDArray[np.int8]:
+    """
+    Build the table identifying corners by their two side colors.
+
+    Returns:
+        Array mapping (color1, color2) to corner piece indices,
+        or -1 for impossible pairs.
+
+    """
+    table = np.full((6, 6), -1, dtype=np.int8)
+    for j in range(8):
+        table[CORNER_FACELET_MAP[j][1] // 9, CORNER_FACELET_MAP[j][2] // 9] = j
+    return table
+
+
+def _build_edge_lookup_table() -> tuple[NDArray[np.int8], NDArray[np.int8]]:
+    """
+    Build the tables identifying edges by their two colors.
+
+    Returns:
+        Arrays mapping (color1, color2) to edge piece indices,
+        or -1 for impossible pairs, and to edge orientations.
+
+    """
+    pieces = np.full((6, 6), -1, dtype=np.int8)
+    orientations = np.zeros((6, 6), dtype=np.int8)
+    for j in range(12):
+        col1 = EDGE_FACELET_MAP[j][0] // 9
+        col2 = EDGE_FACELET_MAP[j][1] // 9
+        pieces[col1, col2] = j
+        pieces[col2, col1] = j
+        orientations[col2, col1] = 1
+    return pieces, orientations
+
+
+_ENCODING = _build_encoding_table()
+_DECODING = np.frombuffer(FACES.encode('ascii'), dtype=np.uint8)
+_CORNER_LOOKUP = _build_corner_lookup_table()
+_EDGE_LOOKUP, _EDGE_ORIENTATION_LOOKUP = _build_edge_lookup_table()
+_CORNER_FACELETS = np.array(CORNER_FACELET_MAP, dtype=np.intp)
+_EDGE_FACELETS = np.array(EDGE_FACELET_MAP, dtype=np.intp)
+_CENTER_FACELETS = np.arange(6, dtype=np.intp) * 9 + 4
+
+
+@lru_cache(maxsize=512)
+def move_permutation(moves: str, size: int = 3) -> NDArray[np.intp]:
+    """
+    Get the permutation index array of a sequence of moves.
+
+    Permutations are computed once by the rotation extensions
+    and kept in a cache, the returned array is read-only.
+
+    Args:
+        moves: Space separated moves.
+        size: Size of the cube.
+
+    Returns:
+        The gather permutation of the facelets.
+
+    """
+    permutation = np.array(compute_permutation(moves, size), dtype=np.intp)
+    permutation.setflags(write=False)
+
+    return permutation
+
+
+class VCubeBatch:
+    """
+    Batch of virtual cubes sharing the same size.
+
+    States are stored in an (N, 6 * size * size) uint8 matrix,
+    one row per cube, each facelet encoded by its face index.
+    """
+
+    def __init__(self, states: Iterable[str] | NDArray[np.uint8], *,
+                 size: int = 3) -> None:
+        """
+        Initialize a batch of cubes.
+
+        Args:
+            states: Facelet strings, or an already encoded
+                (N, 6 * size * size) matrix of face indexes.
+            size: Size of the cubes.
+
+        Raises:
+            InvalidCubeStateError: If a state does not match
+                the cube size, or has unknown facelets.
+
+        """
+        self.size = size
+        self.face_size = size * size
+        facelets_count = 6 * self.face_size
+
+        if isinstance(states, np.ndarray):
+            matrix = np.array(states, dtype=np.uint8, ndmin=2)
+        else:
+            matrix = self.encode(list(states), facelets_count)
+
+        if matrix.ndim != 2 or matrix.shape[1] != facelets_count:
+            msg = (
+                f'States must have { facelets_count } facelets '
+                f'for size { size }'
+            )
+            raise InvalidCubeStateError(msg)
+
+        if matrix.size and matrix.max() >= len(FACES):
+            msg = 'States contain unknown facelets'
+            raise InvalidCubeStateError(msg)
+
+        self.states: NDArray[np.uint8] = matrix
+
+    @staticmethod
+    def encode(states: list[str], facelets_count: int) -> NDArray[np.uint8]:
+        """
+        Encode facelet strings into a matrix of face indexes.
+
+        Args:
+            states: The facelet strings to encode.
+            facelets_count: The expected length of each state.
+
+        Returns:
+            The encoded matrix, unknown facelets are
+            encoded as INVALID_FACELET.
+
+        Raises:
+            InvalidCubeStateError: If a state does not have
+                the expected length.
+
+        """
+        if any(len(state) != facelets_count for state in states):
+            msg = f'States must have { facelets_count } facelets'
+            raise InvalidCubeStateError(msg)
+
+        raw = np.frombuffer(
+            ''.join(states).encode('ascii', errors='replace'),
+            dtype=np.uint8,
+        )
+
+        return _ENCODING[raw].reshape(len(states), facelets_count)
+
+    @staticmethod
+    def solved(count: int, size: int = 3) -> 'VCubeBatch':
+        """
+        Create a batch of solved cubes.
+
+        Args:
+            count: Number of cubes in the batch.
+            size: Size of the cubes.
+
+        Returns:
+            A batch of count solved cubes.
+
+        """
+        solved = VCubeBatch.encode([get_initial_state(size)], 6 * size * size)
+
+        return VCubeBatch(np.repeat(solved, count, axis=0), size=size)
+
+    @staticmethod
+    def from_cubes(cubes: Iterable[VCube]) -> 'VCubeBatch':
+        """
+        Create a batch from virtual cubes of the same size.
+
+        Args:
+            cubes: The cubes to gather, at least one is required.
+
+        Returns:
+            A batch holding the states of the cubes.
+
+        Raises:
+            InvalidCubeStateError: If the cubes do not share the same size.
+
+        """
+        cubes = list(cubes)
+        sizes = {cube.size for cube in cubes}
+
+        if len(sizes) != 1:
+            msg = 'Cubes must share the same size'
+            raise InvalidCubeStateError(msg)
+
+        return VCubeBatch([cube.state for cube in cubes], size=sizes.pop())
+
+    @property
+    def center_index(self) -> int:
+        """Index of the facelet used as center of each face."""
+        if self.size % 2:
+            return self.face_size // 2
+        if self.size == 2:
+            return 0
+        return self.size + 1
+
+    def rotate(self,
+               moves: 'Algorithm | CompiledAlgorithm | Move | str',
+               ) -> NDArray[np.uint8]:
+        """
+        Apply a sequence of moves to every cube of the batch.
+
+        Args:
+            moves: The moves to apply.
+
+        Returns:
+            The new states matrix.
+
+        Raises:
+            InvalidMoveError: If a move is invalid, or if the
+                algorithm was compiled for another cube size.
+
+        """
+        if isinstance(moves, CompiledAlgorithm):
+            if moves.size != self.size:
+                msg = (
+                    f'Compiled algorithm is for size { moves.size }, '
+                    f'cube size is { self.size }'
+                )
+                raise InvalidMoveError(msg)
+            permutation = np.array(moves.permutation, dtype=np.intp)
+        else:
+            moves_str = str(moves)
+            if not moves_str:
+                return self.states
+            permutation = move_permutation(moves_str, self.size)
+
+        self.states = self.states[:, permutation]
+
+        return self.states
+
+    @property
+    def is_solved(self) -> NDArray[np.bool_]:
+        """Whether each cube has every face of a single color."""
+        faces = self.states.reshape(len(self), 6, self.face_size)
+
+        return np.all(faces == faces[:, :, :1], axis=(1, 2))
+
+    @property
+    def orientation(self) -> list[str]:
+        """Orientation of each cube, from its top and front centers."""
+        top_center_index = self.center_index
+        front_center_index = 2 * self.face_size + top_center_index
+        top_front = self.states[:, [top_center_index, front_center_index]]
+
+        return [
+            row.tobytes().decode('ascii')
+            for row in _DECODING[top_front]
+        ]
+
+    @property
+    def to_cubies(self) -> tuple[  # noqa: PLR0914
+            NDArray[np.uint8], NDArray[np.uint8], NDArray[np.uint8],
+            NDArray[np.uint8], NDArray[np.uint8],
+    ]:
+        """
+        Convert every 3x3x3 state to cubie representation.
+
+        Follows the same rules as facelets_to_cubies,
+        one row per cube in each array.
+
+        Returns:
+            A tuple of (corner_permutation, corner_orientation,
+            edge_permutation, edge_orientation, center_orientation).
+
+        Raises:
+            InvalidCubeStateError: If the cubes are not 3x3x3.
+
+        """
+        if self.size != 3:
+            msg = 'Cubie representation is only available for 3x3x3 cubes'
+            raise InvalidCubeStateError(msg)
+
+        so = self.states[:, _CENTER_FACELETS]
+        # Inverted with a scatter keeping the last center of each face,
+        # as facelets_to_cubies does for states with duplicated centers
+        so_inv = np.zeros_like(so)
+        so_inv[np.arange(len(so))[:, None], so] = np.arange(6, dtype=np.uint8)
+        f = np.take_along_axis(so_inv, self.states.astype(np.intp), axis=1)
+
+        # Corners, oriented by their U or D facelet
+        corners = f[:, _CORNER_FACELETS]
+        vertical = (corners == 0) | (corners == 3)
+        ori = np.where(vertical.any(axis=2), vertical.argmax(axis=2), 2)
+        col1 = np.take_along_axis(corners, ((ori + 1) % 3)[..., None], axis=2)
+        col2 = np.take_along_axis(corners, ((ori + 2) % 3)[..., None], axis=2)
+        corner_pieces = _CORNER_LOOKUP[col1[..., 0], col2[..., 0]]
+        corner_found = corner_pieces >= 0
+        cp = np.where(corner_found, corner_pieces, 0)
+        co = np.where(corner_found, ori, 0)
+
+        # Edges
+        edges = f[:, _EDGE_FACELETS]
+        edge_pieces = _EDGE_LOOKUP[edges[..., 0], edges[..., 1]]
+        edge_found = edge_pieces >= 0
+        ep = np.where(edge_found, edge_pieces, 0)
+        eo = np.where(
+            edge_found,
+            _EDGE_ORIENTATION_LOOKUP[edges[..., 0], edges[..., 1]],
+            0,
+        )
+
+        return (
+            cp.astype(np.uint8), co.astype(np.uint8),
+            ep.astype(np.uint8), eo.astype(np.uint8),
+            so,
+        )
+
+    def state(self, index: int) -> str:
+        """
+        Get the facelet string of a cube of the batch.
+
+        Args:
+            index: Index of the cube in the batch.
+
+        Returns:
+            The facelet string of the cube.
+
+        """
+        return bytes(_DECODING[self.states[index]]).decode('ascii')
+
+    def to_states(self) -> list[str]:
+        """
+        Get the facelet strings of every cube of the batch.
+
+        Returns:
+            The facelet strings, one per cube.
+
+        """
+        return [
+            row.tobytes().decode('ascii')
+            for row in _DECODING[self.states]
+        ]
+
+    def to_cubes(self) -> list[VCube]:
+        """
+        Convert the batch into virtual cubes.
+
+        Returns:
+            One virtual cube per row, without history.
+
+        """
+        return [
+            VCube(state, size=self.size, check=False)
+            for state in self.to_states()
+        ]
+
+    def __len__(self) -> int:
+        """
+        Return the number of cubes in the batch.
+
+        Returns:
+            The number of rows of the states matrix.
+
+        """
+        return int(self.states.shape[0])
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the batch.
+
+        Returns:
+            The number and the size of the cubes.
+
+        """
+        return f'VCubeBatch(<{ len(self) } cubes>, size={ self.size })'